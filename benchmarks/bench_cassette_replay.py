@@ -0,0 +1,106 @@
+"""Benchmark explorer sweeps replayed from a recorded cassette.
+
+Records one ``analyze_all_maps`` sweep against ``FakeGatherServer`` (or
+loads a cassette recorded with ``gather-manager --record``), then replays
+it at full speed and with the original timing. Replays see byte-identical
+responses, so the numbers only change when the client or the analysis
+code does.
+
+Usage:
+    python benchmarks/bench_cassette_replay.py --maps 40 --latency 0.05
+    python benchmarks/bench_cassette_replay.py --cassette sweep.cassette \\
+        --space-id "abc\\My Space"
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+)
+
+from gather_manager.api.cassette import Cassette, CassettePlayer  # noqa: E402
+from gather_manager.api.client import GatherClient  # noqa: E402
+from gather_manager.api.fake_server import (  # noqa: E402
+    FakeGatherData,
+    FakeGatherServer,
+)
+from gather_manager.api.rate_limit import RateLimiter  # noqa: E402
+from gather_manager.services.explorer import PortalExplorer  # noqa: E402
+
+
+def sweep(client, space_id, output_dir):
+    explorer = PortalExplorer(client=client, output_dir=output_dir)
+    start = time.perf_counter()
+    results = explorer.analyze_all_maps(space_id)
+    connections = explorer._analyze_portal_connections(results)
+    return len(results), len(connections), time.perf_counter() - start
+
+
+def record(path, args, output_dir):
+    data = FakeGatherData.generate(
+        maps_per_space=args.maps, objects_per_map=args.objects
+    )
+    space_id = next(iter(data.spaces))
+    with GatherClient(
+        api_key="bench",
+        transport=FakeGatherServer(data, latency=args.latency),
+        record=path,
+        rate_limiter=RateLimiter.unlimited(),
+    ) as client:
+        sweep(client, space_id, output_dir)
+    return space_id
+
+
+def replay(cassette, space_id, output_dir, timing):
+    client = GatherClient(
+        api_key="bench",
+        transport=CassettePlayer(cassette, timing=timing),
+        rate_limiter=RateLimiter.unlimited(),
+    )
+    return sweep(client, space_id, output_dir)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cassette", type=Path, default=None)
+    parser.add_argument("--space-id", default=None)
+    parser.add_argument("--maps", type=int, default=40)
+    parser.add_argument("--objects", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)  # Per-map progress logs would dominate
+    if args.cassette and not args.space_id:
+        parser.error("--cassette requires --space-id")
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        path = args.cassette or Path(output_dir) / "sweep.cassette"
+        space_id = args.space_id or record(path, args, output_dir)
+        cassette = Cassette.load(path)
+        size = path.stat().st_size
+
+        fast = []
+        for _ in range(args.repeat):
+            maps, connections, seconds = replay(
+                cassette, space_id, output_dir, timing=0.0
+            )
+            fast.append(seconds)
+        *_, timed = replay(cassette, space_id, output_dir, timing=1.0)
+
+    print(f"cassette:                      {size:8d} bytes")
+    print(f"recorded responses:            {len(cassette):8d}")
+    print(f"maps analyzed:                 {maps:8d}")
+    print(f"portal connections:            {connections:8d}")
+    label = f"replay, best of {args.repeat}:"
+    print(f"{label:<31s}{min(fast):8.3f} s")
+    print(f"replay, original timing:       {timed:8.3f} s")
+
+
+if __name__ == "__main__":
+    main()
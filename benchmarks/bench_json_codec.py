@@ -0,0 +1,97 @@
+"""Benchmark the JSON codecs against the standard library path.
+
+Times the three JSON steps of a sweep over one large synthetic map:
+decoding the response body, writing the parsed map as an indented file
+(what ``PortalExplorer`` saves) and writing plain dictionaries (what
+``PortalService.export_portals`` saves). The baseline is the code before
+codecs existed: ``json.loads`` and ``json.dump(model_dump(), indent=2)``.
+
+Usage:
+    python benchmarks/bench_json_codec.py --objects 100000
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+)
+
+from gather_manager.api.fake_server import FakeGatherData  # noqa: E402
+from gather_manager.api.json_codec import (  # noqa: E402
+    JSON_CODECS,
+    get_codec,
+)
+from gather_manager.models.space import MapData  # noqa: E402
+from gather_manager.utils.exceptions import ConfigurationError  # noqa: E402
+
+
+def best_of(repeat, step):
+    """Return the fastest of several runs of step, in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        step()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def baseline_write(path, value):
+    with open(path, "w") as f:
+        json.dump(value, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    data = FakeGatherData.generate(
+        maps_per_space=2, objects_per_map=args.objects
+    )
+    space = next(iter(data.spaces.values()))
+    raw = next(iter(space.maps.values()))
+    body = json.dumps(raw).encode()
+    map_data = MapData.model_validate(raw)
+    details = [
+        {"id": obj["id"], "x": obj["x"], "y": obj["y"], "is_valid": True}
+        for obj in raw["objects"]
+    ]
+    del data, space, raw
+
+    steps = ("decode body", "write map models", "write dicts")
+    print(f"{'codec':<16s}" + "".join(f"{step:>18s}" for step in steps))
+    with tempfile.TemporaryDirectory() as output_dir:
+        path = os.path.join(output_dir, "out.json")
+        rows = {
+            "baseline": (
+                lambda: json.loads(body),
+                lambda: baseline_write(path, map_data.model_dump()),
+                lambda: baseline_write(path, details),
+            )
+        }
+        for name in JSON_CODECS:
+            try:
+                codec = get_codec(name)
+            except ConfigurationError:
+                continue
+            rows[name] = (
+                lambda codec=codec: codec.loads(body),
+                lambda codec=codec: codec.write(path, map_data),
+                lambda codec=codec: codec.write(path, details),
+            )
+
+        for name, row in rows.items():
+            seconds = [best_of(args.repeat, step) for step in row]
+            print(f"{name:<16s}" + "".join(f"{s:17.3f}s" for s in seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark parsing map data with each MapData.from_api validation mode.
+
+Builds synthetic maps of increasing size and times turning the decoded
+response into ``MapData``: ``model_validate`` as the client did before
+validation modes existed, then ``from_api`` in ``full``, ``strict`` and
+``lazy`` mode. For lazy mode it also times validating every object
+afterwards, the worst case for an analysis that touches all of them.
+
+Usage:
+    python benchmarks/bench_map_validation.py --sizes 10000,100000,1000000
+"""
+
+import argparse
+import copy
+import json
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+)
+
+from gather_manager.api.fake_server import FakeGatherData  # noqa: E402
+from gather_manager.models.space import MapData  # noqa: E402
+
+
+def make_body(size):
+    """Encode a map with ``size`` objects tiled from generated fixtures."""
+    data = FakeGatherData.generate(
+        maps_per_space=2, objects_per_map=min(size, 10_000)
+    )
+    space = next(iter(data.spaces.values()))
+    map_data = copy.deepcopy(next(iter(space.maps.values())))
+    template = map_data["objects"]
+    map_data["objects"] = [
+        {**template[i % len(template)], "id": f"obj-{i}"} for i in range(size)
+    ]
+    return json.dumps(map_data).encode()
+
+
+def timed(parse, body):
+    """Return the seconds to parse a freshly decoded body."""
+    raw = json.loads(body)
+    start = time.perf_counter()
+    parse(raw)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    modes = {
+        "model_validate": MapData.model_validate,
+        "full": lambda raw: MapData.from_api(raw, validate="full"),
+        "strict": lambda raw: MapData.from_api(raw, validate="strict"),
+        "lazy": lambda raw: MapData.from_api(raw, validate="lazy"),
+        "lazy + all objects": lambda raw: MapData.from_api(
+            raw, validate="lazy"
+        ).objects.materialize(),
+    }
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    print(f"{'objects':>10s}" + "".join(f"{mode:>20s}" for mode in modes))
+    for size in sizes:
+        body = make_body(size)
+        seconds = [timed(parse, body) for parse in modes.values()]
+        print(f"{size:10d}" + "".join(f"{s:19.3f}s" for s in seconds))
+        del body
+
+
+if __name__ == "__main__":
+    main()
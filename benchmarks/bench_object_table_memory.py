@@ -0,0 +1,93 @@
+"""Benchmark memory and speed of MapObjectTable vs. lists of Object models.
+
+Decodes one synthetic map body, keeps its objects either as ``Object``
+models (what ``get_map_objects`` returns) or as a ``MapObjectTable`` (what
+``get_map_table`` returns), and reports the memory retained once the
+decoded payload is dropped, the build time and the time to find portals.
+
+Usage:
+    python benchmarks/bench_object_table_memory.py --objects 100000
+"""
+
+import argparse
+import gc
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+)
+
+from gather_manager.api.client import GatherClient  # noqa: E402
+from gather_manager.api.fake_server import FakeGatherData  # noqa: E402
+from gather_manager.models.object_table import MapObjectTable  # noqa: E402
+from gather_manager.models.space import Object  # noqa: E402
+
+
+def build_objects(body):
+    return [Object.model_validate(obj) for obj in json.loads(body)["objects"]]
+
+
+def build_table(body):
+    return MapObjectTable.from_map_payload(json.loads(body))
+
+
+def measure(build, body):
+    """Return the built value, retained bytes and build seconds."""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    value = build(body)
+    seconds = time.perf_counter() - start
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, retained, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", type=int, default=100_000)
+    parser.add_argument("--portal-ratio", type=float, default=0.05)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    data = FakeGatherData.generate(
+        maps_per_space=2,
+        objects_per_map=args.objects,
+        portal_ratio=args.portal_ratio,
+    )
+    space = next(iter(data.spaces.values()))
+    body = json.dumps(next(iter(space.maps.values()))).encode()
+    del data, space
+
+    objects, objects_bytes, objects_build = measure(build_objects, body)
+    start = time.perf_counter()
+    portals = [obj for obj in objects if GatherClient.is_portal_object(obj)]
+    objects_scan = time.perf_counter() - start
+    del objects
+
+    table, table_bytes, table_build = measure(build_table, body)
+    start = time.perf_counter()
+    rows = table.portal_rows()
+    table_scan = time.perf_counter() - start
+    assert len(rows) == len(portals)
+
+    print(f"objects:                  {args.objects:12d}")
+    print(f"portals:                  {len(rows):12d}")
+    print(f"{'':26s}{'List[Object]':>14s}{'MapObjectTable':>16s}")
+    print(
+        f"{'retained MiB':26s}{objects_bytes / 2**20:14.1f}"
+        f"{table_bytes / 2**20:16.1f}"
+    )
+    print(f"{'build s':26s}{objects_build:14.3f}{table_build:16.3f}")
+    print(f"{'portal scan s':26s}{objects_scan:14.3f}{table_scan:16.3f}")
+    print(f"memory ratio:             {objects_bytes / table_bytes:11.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Benchmark converting portal lists between the two Portal models.
+
+Builds a list of ``gather_manager.models.space.Portal`` instances and times
+turning it into ``gather_manager.models.portal.Portal`` instances and back.
+The baseline dumps every model and validates a new one from the dump, as
+``space.Portal.from_object`` does. The record path reads each portal into a
+``PortalRecord`` and materializes the list with one validation call.
+Building the records alone is timed too, for callers that only read them,
+as is turning raw portal objects into the details ``PortalService``
+reports: by validating a ``Portal`` first, as the service used to, and by
+reading each object straight into a record.
+
+Usage:
+    python benchmarks/bench_portal_conversion.py --portals 100000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+)
+
+from gather_manager.models.portal import (  # noqa: E402
+    Portal,
+    PortalRecord,
+    to_portals,
+    to_records,
+    to_space_portals,
+)
+from gather_manager.models.space import Portal as SpacePortal  # noqa: E402
+
+
+def best_of(repeat, step):
+    """Return the fastest of several runs of step, in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        step()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def baseline_to_portals(space_portals):
+    portals = []
+    for space_portal in space_portals:
+        data = space_portal.model_dump()
+        data["properties"] = {
+            "targetMap": data.pop("targetMap"),
+            "targetX": data.pop("targetX"),
+            "targetY": data.pop("targetY"),
+        }
+        portals.append(Portal.model_validate(data))
+    return portals
+
+
+def baseline_to_space_portals(portals):
+    space_portals = []
+    for portal in portals:
+        data = portal.model_dump(by_alias=True)
+        data.update(data.pop("properties"))
+        space_portals.append(SpacePortal(**data))
+    return space_portals
+
+
+def baseline_details(raw_portals):
+    details = []
+    for raw in raw_portals:
+        portal = Portal.model_validate(raw)
+        details.append(PortalRecord.from_portal(portal, "map").to_dict())
+    return details
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--portals", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    space_portals = [
+        SpacePortal(
+            id=f"portal-{i}",
+            type=4,
+            x=i % 100,
+            y=i // 100 % 100,
+            targetMap=f"map-{i % 10}",
+            targetX=i % 50,
+            targetY=i % 70,
+        )
+        for i in range(args.portals)
+    ]
+    portals = to_portals(to_records(space_portals))
+    raw_portals = [portal.model_dump(by_alias=True) for portal in portals]
+
+    steps = {
+        "space -> portal": (
+            lambda: baseline_to_portals(space_portals),
+            lambda: to_portals(to_records(space_portals)),
+        ),
+        "portal -> space": (
+            lambda: baseline_to_space_portals(portals),
+            lambda: to_space_portals(to_records(portals)),
+        ),
+        "records only": (None, lambda: to_records(space_portals)),
+        "raw -> details": (
+            lambda: baseline_details(raw_portals),
+            lambda: [
+                PortalRecord.from_raw(raw, "map").to_dict()
+                for raw in raw_portals
+            ],
+        ),
+    }
+
+    print(
+        f"{'conversion':<18s}{'baseline':>12s}{'records':>12s}"
+        f"{'portals/s':>14s}"
+    )
+    for name, (baseline, records) in steps.items():
+        base = best_of(args.repeat, baseline) if baseline else None
+        seconds = best_of(args.repeat, records)
+        base_text = f"{base:11.3f}s" if base is not None else f"{'-':>12s}"
+        print(
+            f"{name:<18s}{base_text}{seconds:11.3f}s"
+            f"{args.portals / seconds:14,.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
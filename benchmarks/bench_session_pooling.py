@@ -0,0 +1,94 @@
+"""Benchmark request throughput with and without a pooled session.
+
+Starts a local HTTP/1.1 stand-in for the Gather.town API and measures
+requests-per-second for:
+
+1. the old path: one ``requests.request`` call (new connection) per request
+2. ``GatherClient`` with its pooled keep-alive session
+
+Usage:
+    python benchmarks/bench_session_pooling.py --requests 500
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+)
+
+from gather_manager.api.client import GatherClient  # noqa: E402
+
+MAPS_PAYLOAD = json.dumps(
+    [{"id": f"map-{i}", "name": f"Map {i}"} for i in range(20)]
+).encode()
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Serves a fixed maps list for every GET."""
+
+    protocol_version = "HTTP/1.1"  # Required for keep-alive
+    disable_nagle_algorithm = True  # Avoid delayed-ACK stalls on reuse
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(MAPS_PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(MAPS_PAYLOAD)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def bench_unpooled(base_url, n):
+    url = f"{base_url}/api/v2/spaces/bench/maps"
+    start = time.perf_counter()
+    for _ in range(n):
+        requests.request(
+            "GET", url, headers={"apiKey": "bench"}, params={"useV2Map": "true"}
+        ).json()
+    return n / (time.perf_counter() - start)
+
+
+def bench_pooled(base_url, n):
+    with GatherClient(api_key="bench", base_url=base_url) as client:
+        start = time.perf_counter()
+        for _ in range(n):
+            client.get_maps("bench")
+        return n / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    server, base_url = start_server()
+    try:
+        before = bench_unpooled(base_url, args.requests)
+        after = bench_pooled(base_url, args.requests)
+    finally:
+        server.shutdown()
+
+    print(f"requests.request (no pooling): {before:8.1f} req/s")
+    print(f"GatherClient (pooled session): {after:8.1f} req/s")
+    print(f"speedup:                       {after / before:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
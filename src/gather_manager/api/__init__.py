@@ -1,6 +1,41 @@
 # gather_manager/api/__init__.py
 """API clients for Gather.town."""
 
+from gather_manager.api.async_client import AsyncGatherClient
+from gather_manager.api.cassette import CassettePlayer, CassetteRecorder
+from gather_manager.api.circuit_breaker import CircuitBreaker
 from gather_manager.api.client import GatherClient
+from gather_manager.api.coalesce import RequestCoalescer
+from gather_manager.api.disk_cache import DiskCache
+from gather_manager.api.fake_server import FakeGatherData, FakeGatherServer
+from gather_manager.api.json_codec import JsonCodec, get_codec
+from gather_manager.api.metrics import EndpointMetrics
+from gather_manager.api.rate_limit import RateLimiter, TokenBucket
+from gather_manager.api.retry import RetryPolicy
+from gather_manager.api.tracing import ChromeTraceExporter, OpenTelemetryTracer
+from gather_manager.api.transport import Transport
+from gather_manager.api.user_id_cache import UserIdCache
+from gather_manager.api.write_buffer import MapWriteBuffer
 
-__all__ = ["GatherClient"]
+__all__ = [
+    "GatherClient",
+    "AsyncGatherClient",
+    "RateLimiter",
+    "TokenBucket",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "DiskCache",
+    "UserIdCache",
+    "RequestCoalescer",
+    "MapWriteBuffer",
+    "EndpointMetrics",
+    "ChromeTraceExporter",
+    "OpenTelemetryTracer",
+    "Transport",
+    "FakeGatherServer",
+    "FakeGatherData",
+    "CassetteRecorder",
+    "CassettePlayer",
+    "JsonCodec",
+    "get_codec",
+]
@@ -0,0 +1,290 @@
+"""Asyncio front-end for the Gather.town API client."""
+
+import asyncio
+import contextvars
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+
+from gather_manager.api.client import GatherClient
+from gather_manager.api.map_diff import MapWriteResult
+from gather_manager.models.object_table import MapObjectTable
+from gather_manager.models.space import (
+    Map,
+    MapData,
+    Object,
+    Portal,
+    PortalView,
+    Space,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncGatherClient:
+    """Asyncio client with the same surface as GatherClient.
+
+    Calls are delegated to a pooled GatherClient and run on a dedicated
+    thread pool, with an asyncio semaphore bounding how many requests are
+    in flight at once. This lets whole-space sweeps fetch maps concurrently
+    while reusing the sync client's session, error handling and models.
+    """
+
+    DEFAULT_MAX_CONCURRENCY = 10
+
+    def __init__(
+        self,
+        client: Optional[GatherClient] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        **client_kwargs: Any,
+    ):
+        """Initialize the async client.
+
+        Args:
+            client: GatherClient to delegate to. If not provided, one is
+                created from ``client_kwargs`` with a connection pool large
+                enough for ``max_concurrency`` requests.
+            max_concurrency: Maximum number of requests in flight at once.
+            **client_kwargs: Keyword arguments for the GatherClient created
+                when ``client`` is not provided.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self._owns_client = client is None
+        if client is None:
+            client_kwargs.setdefault(
+                "pool_maxsize",
+                max(max_concurrency, GatherClient.DEFAULT_POOL_MAXSIZE),
+            )
+            client = GatherClient(**client_kwargs)
+        self.client = client
+        self.max_concurrency = max_concurrency
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="gather-async"
+        )
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Get the concurrency semaphore for the running event loop.
+
+        Semaphores are bound to a loop, so a new one is created when the
+        client is reused across ``asyncio.run`` calls.
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def run(
+        self, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """Run a blocking client call under the concurrency limit.
+
+        Args:
+            func: Blocking callable, typically a GatherClient method
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The return value of func
+        """
+        async with self._get_semaphore():
+            loop = asyncio.get_running_loop()
+            context = contextvars.copy_context()
+            call = functools.partial(context.run, func, *args, **kwargs)
+            return await loop.run_in_executor(self._executor, call)
+
+    def close(self) -> None:
+        """Shut down the worker threads and close an owned client."""
+        self._executor.shutdown(wait=False)
+        if self._owns_client:
+            self.client.close()
+
+    async def aclose(self) -> None:
+        """Shut down the worker threads and close an owned client."""
+        self.close()
+
+    async def __aenter__(self) -> "AsyncGatherClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    # === Space Operations ===
+
+    async def create_space(
+        self,
+        name: str,
+        source_space: str,
+        reason: Optional[str] = None,
+        retry: bool = False,
+    ) -> Space:
+        """See GatherClient.create_space."""
+        return await self.run(
+            self.client.create_space,
+            name,
+            source_space,
+            reason=reason,
+            retry=retry,
+        )
+
+    async def get_space(self, space_id: str) -> Space:
+        """See GatherClient.get_space."""
+        return await self.run(self.client.get_space, space_id)
+
+    async def get_spaces(
+        self, role: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """See GatherClient.get_spaces."""
+        return await self.run(self.client.get_spaces, role=role)
+
+    # === Map Operations ===
+
+    async def get_maps(self, space_id: str) -> List[Map]:
+        """See GatherClient.get_maps."""
+        return await self.run(self.client.get_maps, space_id)
+
+    async def get_map_data(self, space_id: str, map_id: str) -> MapData:
+        """See GatherClient.get_map_data."""
+        return await self.run(self.client.get_map_data, space_id, map_id)
+
+    async def get_map_data_if_changed(
+        self, space_id: str, map_id: str
+    ) -> Optional[MapData]:
+        """See GatherClient.get_map_data_if_changed."""
+        return await self.run(
+            self.client.get_map_data_if_changed, space_id, map_id
+        )
+
+    async def update_map(
+        self,
+        space_id: str,
+        map_id: str,
+        map_data: Union[MapData, Dict[str, Any]],
+    ) -> MapData:
+        """See GatherClient.update_map."""
+        return await self.run(
+            self.client.update_map, space_id, map_id, map_data
+        )
+
+    async def update_map_background(
+        self, space_id: str, map_id: str, background: str
+    ) -> MapData:
+        """See GatherClient.update_map_background."""
+        return await self.run(
+            self.client.update_map_background, space_id, map_id, background
+        )
+
+    async def update_map_objects(
+        self, space_id: str, map_id: str, objects: List[Object]
+    ) -> MapData:
+        """See GatherClient.update_map_objects."""
+        return await self.run(
+            self.client.update_map_objects, space_id, map_id, objects
+        )
+
+    async def apply_map_objects(
+        self,
+        space_id: str,
+        map_id: str,
+        objects: List[Object],
+        base: Optional[MapData] = None,
+        merge_objects: bool = False,
+    ) -> MapWriteResult:
+        """See GatherClient.apply_map_objects."""
+        return await self.run(
+            self.client.apply_map_objects,
+            space_id,
+            map_id,
+            objects,
+            base,
+            merge_objects,
+        )
+
+    # === Object Operations ===
+
+    async def get_map_objects(
+        self, space_id: str, map_id: str
+    ) -> List[Object]:
+        """See GatherClient.get_map_objects."""
+        return await self.run(self.client.get_map_objects, space_id, map_id)
+
+    async def get_map_table(
+        self, space_id: str, map_id: str
+    ) -> MapObjectTable:
+        """See GatherClient.get_map_table."""
+        return await self.run(self.client.get_map_table, space_id, map_id)
+
+    async def get_portals(self, space_id: str, map_id: str) -> List[Object]:
+        """See GatherClient.get_portals."""
+        return await self.run(self.client.get_portals, space_id, map_id)
+
+    async def get_portal_objects(
+        self, space_id: str, map_id: str
+    ) -> List[Portal]:
+        """See GatherClient.get_portal_objects."""
+        return await self.run(self.client.get_portal_objects, space_id, map_id)
+
+    async def get_portal_views(
+        self, space_id: str, map_id: str
+    ) -> List[PortalView]:
+        """See GatherClient.get_portal_views."""
+        return await self.run(self.client.get_portal_views, space_id, map_id)
+
+    # === User Management ===
+
+    async def get_user_id_by_email(self, email: str) -> str:
+        """See GatherClient.get_user_id_by_email."""
+        return await self.run(self.client.get_user_id_by_email, email)
+
+    async def add_user_to_space(
+        self, space_id: str, email: str, role: str = GatherClient.ROLE_MEMBER
+    ) -> Dict[str, Any]:
+        """See GatherClient.add_user_to_space."""
+        return await self.run(
+            self.client.add_user_to_space, space_id, email, role=role
+        )
+
+    async def remove_user_from_space(
+        self, space_id: str, email: str
+    ) -> Dict[str, Any]:
+        """See GatherClient.remove_user_from_space."""
+        return await self.run(
+            self.client.remove_user_from_space, space_id, email
+        )
+
+    async def get_space_users(
+        self, space_id: str, role: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """See GatherClient.get_space_users."""
+        return await self.run(self.client.get_space_users, space_id, role=role)
+
+    # === Spawn Token Support ===
+
+    async def create_spawn_token(
+        self,
+        space_id: str,
+        map_id: str,
+        spawn_name: str,
+        expires_in_seconds: Optional[int] = None,
+        retry: bool = False,
+    ) -> Dict[str, Any]:
+        """See GatherClient.create_spawn_token."""
+        return await self.run(
+            self.client.create_spawn_token,
+            space_id,
+            map_id,
+            spawn_name,
+            expires_in_seconds=expires_in_seconds,
+            retry=retry,
+        )
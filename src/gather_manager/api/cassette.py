@@ -0,0 +1,369 @@
+"""Recording and replaying API traffic with compressed cassette files."""
+
+import base64
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+from gather_manager.api.transport import Transport, TransportResponse
+from gather_manager.utils.exceptions import (
+    CassetteMissError,
+    ConfigurationError,
+)
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_VERSION = 1
+
+# Response headers that describe the encoding on the wire; bodies are
+# stored decoded, and Transport sets the length of the replayed body
+_WIRE_HEADERS = frozenset(
+    ["content-encoding", "content-length", "transfer-encoding", "connection"]
+)
+
+
+def request_key(request: requests.PreparedRequest) -> str:
+    """Get the identity of a request within a cassette.
+
+    The key is the method, the decoded path, the sorted query and, for
+    requests with a body, a hash of the body's JSON content. Credentials
+    and other headers are not part of it.
+
+    Args:
+        request: The prepared request
+
+    Returns:
+        Key such as ``GET api/v2/spaces/abc/maps?useV2Map=true``
+    """
+    url = urlsplit(request.url or "")
+    key = f"{request.method} {unquote(url.path).strip('/')}"
+    query = sorted(parse_qsl(url.query, keep_blank_values=True))
+    if query:
+        key += "?" + "&".join(f"{name}={value}" for name, value in query)
+
+    # The client sends encoded bodies, never streamed ones
+    body = cast(Union[str, bytes, None], request.body)
+    if body:
+        if isinstance(body, str):
+            body = body.encode()
+        if request.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        try:
+            body = json.dumps(json.loads(body), sort_keys=True).encode()
+        except ValueError:
+            pass  # Hash non-JSON bodies as sent
+        key += " #" + hashlib.sha256(body).hexdigest()[:16]
+    return key
+
+
+class Cassette:
+    """Request/response pairs indexed by request key.
+
+    Responses to a key are kept in the order they were recorded. Bodies are
+    stored once per distinct content, so repeated reads of the same map
+    cost almost nothing, and the file is gzip-compressed JSON.
+    """
+
+    def __init__(self) -> None:
+        self.interactions: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self.bodies: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self.interactions.values())
+
+    def add(
+        self,
+        key: str,
+        status: int,
+        headers: Dict[str, str],
+        body: bytes,
+        elapsed: float,
+    ) -> None:
+        """Record a response.
+
+        Args:
+            key: Request key (see ``request_key``)
+            status: HTTP status code
+            headers: Response headers
+            body: Decoded response body
+            elapsed: Seconds from sending the request to the full body
+        """
+        digest = hashlib.sha256(body).hexdigest()[:32] if body else None
+        entry = {
+            "status": status,
+            "headers": {
+                name: value
+                for name, value in headers.items()
+                if name.lower() not in _WIRE_HEADERS
+            },
+            "body": digest,
+            "elapsed": round(elapsed, 6),
+        }
+        with self._lock:
+            if digest and digest not in self.bodies:
+                try:
+                    self.bodies[digest] = body.decode("utf-8")
+                except UnicodeDecodeError:
+                    self.bodies[digest] = "base64:" + base64.b64encode(
+                        body
+                    ).decode("ascii")
+            self.interactions[key].append(entry)
+
+    def body(self, digest: Optional[str]) -> bytes:
+        """Get a stored body by its digest.
+
+        Args:
+            digest: Digest from an interaction, or None for no body
+
+        Returns:
+            The body bytes
+        """
+        if digest is None:
+            return b""
+        text = self.bodies[digest]
+        if text.startswith("base64:"):
+            return base64.b64decode(text[len("base64:") :])
+        return text.encode("utf-8")
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write the cassette atomically.
+
+        Args:
+            path: Output file
+
+        Raises:
+            OSError: If the file cannot be written
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            document = {
+                "version": CASSETTE_VERSION,
+                "recorded_at": datetime.now(timezone.utc).isoformat(),
+                "interactions": dict(self.interactions),
+                "bodies": self.bodies,
+            }
+            encoded = gzip.compress(
+                json.dumps(document, separators=(",", ":")).encode()
+            )
+
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(encoded)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "Cassette":
+        """Read a cassette file.
+
+        Args:
+            path: Cassette file
+
+        Returns:
+            The cassette
+
+        Raises:
+            ConfigurationError: If the file is missing, corrupt or from an
+                unsupported version.
+        """
+        try:
+            with gzip.open(path, "rb") as f:
+                document = json.loads(f.read())
+        except (OSError, ValueError) as e:
+            raise ConfigurationError(
+                f"Failed to read cassette {path}: {str(e)}"
+            ) from e
+        if document.get("version") != CASSETTE_VERSION:
+            raise ConfigurationError(
+                f"Unsupported cassette version in {path}: "
+                f"{document.get('version')}"
+            )
+
+        cassette = cls()
+        cassette.interactions.update(document["interactions"])
+        cassette.bodies = document["bodies"]
+        return cassette
+
+
+class CassetteRecorder(Transport):
+    """Sends requests over a real adapter and records every response.
+
+    Call ``save()`` (or close the session it is mounted on) to write the
+    cassette.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        adapter: Optional[BaseAdapter] = None,
+        cassette: Optional[Cassette] = None,
+    ):
+        """Initialize the recorder.
+
+        Args:
+            path: Cassette file written by ``save()``
+            adapter: Adapter that actually sends requests. Defaults to a
+                new ``HTTPAdapter``.
+            cassette: Cassette to record into, so that several recorders
+                can share one. Defaults to a new cassette.
+        """
+        super().__init__()
+        self.path = Path(path)
+        self.adapter = adapter or HTTPAdapter()
+        self.cassette = cassette if cassette is not None else Cassette()
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Union[
+            None, float, Tuple[Optional[float], Optional[float]]
+        ] = None,
+        verify: Union[bool, str] = True,
+        cert: Optional[Union[str, Tuple[str, str]]] = None,
+        proxies: Optional[Mapping[str, str]] = None,
+    ) -> requests.Response:
+        """Send a request through the real adapter and record the response.
+
+        The body is read in full before it is returned, so streamed
+        responses are recorded too.
+
+        Args:
+            request: The prepared request
+            stream: Whether the caller reads the body incrementally
+            timeout: Connect and read timeouts for the real adapter
+            verify: TLS verification for the real adapter
+            cert: Client certificate for the real adapter
+            proxies: Proxies for the real adapter
+
+        Returns:
+            The response
+        """
+        started = time.perf_counter()
+        response = self.adapter.send(
+            request,
+            stream=stream,
+            timeout=timeout,
+            verify=verify,
+            cert=cert,
+            proxies=dict(proxies) if proxies is not None else None,
+        )
+        body = response.content
+        self.cassette.add(
+            request_key(request),
+            response.status_code,
+            dict(response.headers),
+            body,
+            time.perf_counter() - started,
+        )
+        return response
+
+    def save(self) -> Path:
+        """Write everything recorded so far.
+
+        Returns:
+            The cassette path
+        """
+        self.cassette.save(self.path)
+        logger.info(f"Recorded {len(self.cassette)} responses to {self.path}")
+        return self.path
+
+    def close(self) -> None:
+        """Save the cassette and close the real adapter."""
+        self.save()
+        self.adapter.close()
+
+
+class CassettePlayer(Transport):
+    """Answers requests from a cassette instead of the network.
+
+    Each key's responses are replayed in recorded order; once they run
+    out, the last one is repeated, so extra identical reads still succeed.
+    """
+
+    def __init__(
+        self,
+        cassette: Union[Cassette, str, Path],
+        timing: float = 0.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize the player.
+
+        Args:
+            cassette: A Cassette or the path of a cassette file
+            timing: Fraction of the recorded response time to wait before
+                answering: 0 replays at full speed, 1 emulates the original
+                timing
+            sleep: Function used to wait
+        """
+        super().__init__()
+        self.cassette = (
+            cassette
+            if isinstance(cassette, Cassette)
+            else Cassette.load(cassette)
+        )
+        self.timing = timing
+        self._sleep = sleep
+        self._positions: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def handle(self, request: requests.PreparedRequest) -> TransportResponse:
+        """Replay the recorded response to a request.
+
+        Args:
+            request: The prepared request
+
+        Returns:
+            Tuple of status code, headers and body bytes
+
+        Raises:
+            CassetteMissError: If the request was never recorded.
+        """
+        key = request_key(request)
+        responses = self.cassette.interactions.get(key)
+        if not responses:
+            raise CassetteMissError(f"No recorded response for {key}", key=key)
+
+        with self._lock:
+            position = self._positions[key]
+            self._positions[key] = position + 1
+        entry = responses[min(position, len(responses) - 1)]
+
+        if self.timing > 0 and entry["elapsed"] > 0:
+            self._sleep(entry["elapsed"] * self.timing)
+        return (
+            entry["status"],
+            entry["headers"],
+            self.cassette.body(entry["body"]),
+        )
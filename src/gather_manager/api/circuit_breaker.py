@@ -0,0 +1,226 @@
+"""Per-endpoint-class circuit breaking for the Gather.town API client."""
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from gather_manager.api.retry import RetryPolicy
+from gather_manager.utils.exceptions import CircuitOpenError, GatherApiError
+
+# Circuit states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+CIRCUIT_STATES = (CLOSED, OPEN, HALF_OPEN)
+
+
+class _Circuit:
+    """State of the circuit for one endpoint class."""
+
+    def __init__(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probes = 0
+
+
+class CircuitBreaker:
+    """Fails fast on endpoint classes that keep failing.
+
+    Each endpoint class (see ``endpoints``) has its own circuit. After
+    ``failure_threshold`` consecutive failed attempts the circuit opens and
+    requests are rejected with CircuitOpenError without being sent. Once
+    ``recovery_timeout`` has passed the circuit is half-open: up to
+    ``half_open_max_calls`` probe requests go through, and the first to
+    succeed closes the circuit while a failure opens it again.
+
+    Only signs of a degraded API count as failures: 5xx responses,
+    timeouts and connection errors. The methods that change state return
+    the new state so the caller can report the transition.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open a circuit
+            recovery_timeout: Seconds a circuit stays open before probing
+            half_open_max_calls: Probe requests allowed at once while
+                half-open
+            clock: Monotonic time source, in seconds
+
+        Raises:
+            ValueError: If failure_threshold or half_open_max_calls is less
+                than 1.
+        """
+        if failure_threshold < 1 or half_open_max_calls < 1:
+            raise ValueError(
+                "failure_threshold and half_open_max_calls must be at least 1"
+            )
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.enabled = True
+        self._clock = clock
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def disabled(cls) -> "CircuitBreaker":
+        """Create a circuit breaker that never opens."""
+        breaker = cls()
+        breaker.enabled = False
+        return breaker
+
+    def is_failure(self, error: GatherApiError) -> bool:
+        """Check whether an error means the API is degraded.
+
+        Args:
+            error: Error raised for a failed attempt
+
+        Returns:
+            True for 5xx responses, connection errors and timeouts
+        """
+        if error.status_code is not None:
+            return error.status_code >= 500
+        return isinstance(error.__cause__, RetryPolicy.TRANSIENT_EXCEPTIONS)
+
+    def _get(self, endpoint_class: str) -> _Circuit:
+        circuit = self._circuits.get(endpoint_class)
+        if circuit is None:
+            circuit = self._circuits[endpoint_class] = _Circuit()
+        return circuit
+
+    def before_request(self, endpoint_class: str) -> Optional[str]:
+        """Admit a request, or reject it while the circuit is open.
+
+        Args:
+            endpoint_class: Logical endpoint class of the request
+
+        Returns:
+            HALF_OPEN if admitting the request started probing, else None
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all
+                probes in flight.
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            circuit = self._get(endpoint_class)
+            now = self._clock()
+            transition = None
+            if circuit.state == OPEN:
+                remaining = circuit.opened_at + self.recovery_timeout - now
+                if remaining > 0:
+                    raise CircuitOpenError(
+                        f"Circuit for {endpoint_class} endpoints is open after "
+                        f"{circuit.failures} consecutive failures",
+                        endpoint_class=endpoint_class,
+                        retry_after=remaining,
+                    )
+                circuit.state = transition = HALF_OPEN
+                circuit.opened_at = now
+                circuit.probes = 0
+
+            if circuit.state == HALF_OPEN:
+                if now - circuit.opened_at >= self.recovery_timeout:
+                    # Probes that never reported back must not wedge it
+                    circuit.opened_at = now
+                    circuit.probes = 0
+                if circuit.probes >= self.half_open_max_calls:
+                    raise CircuitOpenError(
+                        f"Circuit for {endpoint_class} endpoints is half-open "
+                        "and waiting for a probe request",
+                        endpoint_class=endpoint_class,
+                    )
+                circuit.probes += 1
+            return transition
+
+    def record_success(self, endpoint_class: str) -> Optional[str]:
+        """Record an attempt that reached a healthy API.
+
+        Args:
+            endpoint_class: Logical endpoint class of the request
+
+        Returns:
+            CLOSED if the success closed a half-open circuit, else None
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            circuit = self._get(endpoint_class)
+            circuit.failures = 0
+            if circuit.state == CLOSED:
+                return None
+            circuit.state = CLOSED
+            circuit.probes = 0
+            return CLOSED
+
+    def record_failure(self, endpoint_class: str) -> Optional[str]:
+        """Record a failed attempt.
+
+        Args:
+            endpoint_class: Logical endpoint class of the request
+
+        Returns:
+            OPEN if the failure opened the circuit, else None
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            circuit = self._get(endpoint_class)
+            circuit.failures += 1
+            if circuit.state == OPEN:
+                return None
+            if (
+                circuit.state == HALF_OPEN
+                or circuit.failures >= self.failure_threshold
+            ):
+                circuit.state = OPEN
+                circuit.opened_at = self._clock()
+                circuit.probes = 0
+                return OPEN
+            return None
+
+    def state(self, endpoint_class: str) -> str:
+        """Get the state of an endpoint class's circuit.
+
+        Args:
+            endpoint_class: Logical endpoint class
+
+        Returns:
+            CLOSED, OPEN or HALF_OPEN
+        """
+        with self._lock:
+            circuit = self._circuits.get(endpoint_class)
+            return circuit.state if circuit else CLOSED
+
+    def reset(self) -> None:
+        """Close every circuit."""
+        with self._lock:
+            self._circuits.clear()
+
+    def metrics(self) -> Dict[str, Dict[str, object]]:
+        """Get the state of every circuit seen so far.
+
+        Returns:
+            Dictionary keyed by endpoint class with state and consecutive
+            failures
+        """
+        with self._lock:
+            return {
+                name: {"state": circuit.state, "failures": circuit.failures}
+                for name, circuit in self._circuits.items()
+            }
@@ -1,18 +1,80 @@
 """Client for interacting with the Gather.town API."""
 
+import copy
+import gzip
+import json
 import logging
 import os
-from typing import Any, Dict, List, Optional, Union
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from urllib.parse import quote
 
 import requests
+import pydantic
 from pydantic import BaseModel
-
-from gather_manager.models.space import Map, MapData, Object, Portal, Space
-from gather_manager.utils.exceptions import GatherApiError
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.utils import DEFAULT_ACCEPT_ENCODING
+
+from gather_manager.api.cassette import (
+    Cassette,
+    CassettePlayer,
+    CassetteRecorder,
+)
+from gather_manager.api.circuit_breaker import OPEN, CircuitBreaker
+from gather_manager.api.coalesce import RequestCoalescer
+from gather_manager.api.deadline import current_deadline
+from gather_manager.api.disk_cache import DiskCache
+from gather_manager.api.map_diff import (
+    WRITE_FULL,
+    MapWriteResult,
+    encoded_size,
+    estimate_full_size,
+    plan_map_write,
+)
+from gather_manager.api.endpoints import USER_ID, classify_endpoint
+from gather_manager.api.json_codec import JsonCodec, get_codec
+from gather_manager.api.metrics import (
+    STATUS_ERROR,
+    ClientMetrics,
+    EndpointMetrics,
+)
+from gather_manager.api.rate_limit import RateLimiter
+from gather_manager.api.retry import RetryPolicy, parse_retry_after
+from gather_manager.api.streaming import DEFAULT_CHUNK_SIZE, MapObjectStream
+from gather_manager.api.tracing import span
+from gather_manager.api.user_id_cache import UserIdCache
+from gather_manager.api.validator_cache import ValidatorCache, ValidatorEntry
+from gather_manager.models.object_table import MapObjectTable
+from gather_manager.models.space import (
+    VALIDATE_FULL,
+    VALIDATE_STRICT,
+    VALIDATION_MODES,
+    Map,
+    MapData,
+    Object,
+    Portal,
+    PortalView,
+    Space,
+)
+from gather_manager.utils.exceptions import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    GatherApiError,
+    ValidationError,
+)
 
 logger = logging.getLogger(__name__)
 
+# Revalidation headers, ignored when coalescing identical GETs
+_CONDITIONAL_HEADERS = frozenset(["If-None-Match", "If-Modified-Since"])
+
+# A single number applies to both phases; a pair is (connect, read)
+TimeoutType = Union[float, Tuple[float, float], None]
+
+# Marks options not passed to with_options (None is a valid timeout)
+_UNSET: Any = object()
+
 
 class GatherClient:
     """Client for interacting with the Gather.town API."""
@@ -29,28 +91,299 @@ class GatherClient:
     DEFAULT_BASE_URL = "https://api.gather.town"
     API_VERSION = "v2"
 
+    # Connection pool defaults
+    DEFAULT_POOL_CONNECTIONS = 10  # Number of per-host pools to keep
+    DEFAULT_POOL_MAXSIZE = 10  # Max connections kept alive per host
+
+    # Seconds to establish a connection and to wait between response bytes
+    DEFAULT_TIMEOUT = (10.0, 60.0)
+
+    # Request bodies smaller than this are not worth compressing
+    DEFAULT_COMPRESSION_THRESHOLD = 16 * 1024
+
     def __init__(
-        self, api_key: Optional[str] = None, base_url: str = DEFAULT_BASE_URL
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = DEFAULT_BASE_URL,
+        session: Optional[requests.Session] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        timeout: TimeoutType = DEFAULT_TIMEOUT,
+        validator_cache: Optional[ValidatorCache] = None,
+        disk_cache: Optional[DiskCache] = None,
+        user_id_cache: Optional[UserIdCache] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+        compress_requests: bool = False,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        endpoint_metrics: Optional[EndpointMetrics] = None,
+        transport: Optional[BaseAdapter] = None,
+        record: Optional[Union[str, Path]] = None,
+        cassette: Optional[Cassette] = None,
+        replay: Optional[Union[str, Path]] = None,
+        replay_timing: float = 0.0,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        map_validation: str = VALIDATE_FULL,
+        json_codec: Optional[JsonCodec] = None,
     ):
         """Initialize Gather.town API client.
 
+        All requests go through a single pooled ``requests.Session`` so that
+        TCP/TLS connections are reused across calls.
+
         Args:
             api_key: Gather.town API key. If not provided, looks for GATHER_API_KEY env var.
             base_url: Base URL for the API.
+            session: Optional pre-configured session. When given, the client
+                uses it as-is and does not close it on ``close()``.
+            pool_connections: Number of per-host connection pools to cache.
+            pool_maxsize: Maximum number of connections kept per host.
+            pool_block: Block when the per-host pool is exhausted instead of
+                opening (and discarding) extra connections.
+            keep_alive: Reuse connections between requests. Disable to send
+                ``Connection: close`` with every request.
+            rate_limiter: Limiter that paces requests before they are sent.
+                Share one instance between clients to pace them together.
+                Defaults to Gather's documented per-endpoint limits; use
+                ``RateLimiter.unlimited()`` to disable pacing.
+            retry_policy: Policy for retrying transient failures. Defaults
+                to ``RetryPolicy()``; use ``RetryPolicy.disabled()`` to fail
+                on the first error.
+            timeout: Socket timeout in seconds, either one value for both
+                phases or a ``(connect, read)`` pair. None waits forever.
+                Use ``with_options(timeout=...)`` for per-call overrides.
+            validator_cache: Cache of ETag/Last-Modified validators and
+                bodies used to revalidate map data with conditional GETs.
+                The default keeps at most ``ValidatorCache.DEFAULT_MAX_BYTES``
+                of bodies. Use ``ValidatorCache(max_entries=0)`` to disable
+                it.
+            disk_cache: Optional persistent cache of GET responses shared
+                across processes. Off unless provided.
+            user_id_cache: Optional persistent cache of email to user ID
+                lookups, consulted before the rate-limited user-id endpoint.
+            coalescer: Shares identical GETs that are in flight or completed
+                within its window. Defaults to ``RequestCoalescer()``; use
+                ``RequestCoalescer.disabled()`` to send every request.
+            compress_requests: Gzip request bodies of at least
+                ``compression_threshold`` bytes. Turned off automatically
+                if the server answers 415 Unsupported Media Type.
+            compression_threshold: Minimum body size to compress, in bytes
+            endpoint_metrics: Registry for per-endpoint call, latency and
+                traffic statistics. Pass one instance to several clients to
+                aggregate them. Defaults to a new registry.
+            transport: Adapter that carries requests to ``base_url``
+                instead of the network, such as a ``FakeGatherServer``.
+                It is mounted on the session, so every layer of the client
+                above the connection still runs.
+            record: Record every response to this cassette file, written
+                on ``close()`` or ``save_cassette()``
+            cassette: Cassette that ``record`` adds responses to, so that
+                several clients can record one session. Defaults to a new
+                cassette.
+            replay: Answer requests from this cassette file instead of the
+                network. Requests that were not recorded raise
+                CassetteMissError.
+            replay_timing: Fraction of the recorded response times to wait
+                when replaying; 1 emulates the original timing
+            circuit_breaker: Breaker that fails fast on endpoint classes
+                that keep failing. Defaults to opening after 5 consecutive
+                failures; pass ``CircuitBreaker.disabled()`` to turn it off.
+            map_validation: How map data read from the API is validated
+                (see ``MapData.from_api``). ``"lazy"`` defers validating
+                each object until it is accessed, for read-only analysis.
+            json_codec: Codec that decodes response bodies. Defaults to
+                ``get_codec()``, the fastest one installed.
 
         Raises:
-            ValueError: If no API key is provided or found in environment.
+            ValueError: If no API key is provided or found in environment,
+                if replay is combined with record or transport, or if the
+                map validation mode is unknown.
         """
         self.api_key = api_key or os.environ.get("GATHER_API_KEY")
         if not self.api_key:
             raise ValueError(
                 "API key is required. Provide it directly or set GATHER_API_KEY environment variable."
             )
+        if map_validation not in VALIDATION_MODES:
+            raise ValueError(
+                f"Unknown map validation mode '{map_validation}', expected "
+                f"one of {', '.join(VALIDATION_MODES)}"
+            )
+        self.map_validation = map_validation
+        self.json_codec = json_codec or get_codec()
 
         self.base_url = base_url
         self.headers = {
             "apiKey": self.api_key,
             "Content-Type": "application/json",
+            # Every encoding urllib3 can decode here (brotli/zstd if installed)
+            "Accept-Encoding": DEFAULT_ACCEPT_ENCODING,
+        }
+        if not keep_alive:
+            self.headers["Connection"] = "close"
+
+        self._owns_session = session is None
+        self.session = session or self._create_session(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        if replay is not None:
+            if record is not None or transport is not None:
+                raise ValueError(
+                    "replay cannot be combined with record or transport"
+                )
+            transport = CassettePlayer(replay, timing=replay_timing)
+        self.cassette_recorder: Optional[CassetteRecorder] = None
+        if record is not None:
+            self.cassette_recorder = transport = CassetteRecorder(
+                record,
+                adapter=transport or self.session.get_adapter(base_url),
+                cassette=cassette,
+            )
+        if transport is not None:
+            self.session.mount(self.base_url, transport)
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.timeout = timeout
+        self.validator_cache = (
+            validator_cache
+            if validator_cache is not None
+            else ValidatorCache()
+        )
+        self.disk_cache = disk_cache
+        self.user_id_cache = user_id_cache
+        self.coalescer = coalescer or RequestCoalescer()
+        self.compress_requests = compress_requests
+        self.compression_threshold = compression_threshold
+        self.metrics = ClientMetrics()
+        self.endpoint_metrics = endpoint_metrics or EndpointMetrics()
+
+    @staticmethod
+    def _create_session(
+        pool_connections: int, pool_maxsize: int, pool_block: bool
+    ) -> requests.Session:
+        """Create a session with a sized connection pool for both schemes.
+
+        Args:
+            pool_connections: Number of per-host connection pools to cache.
+            pool_maxsize: Maximum number of connections kept per host.
+            pool_block: Whether to block when a host's pool is exhausted.
+
+        Returns:
+            A configured requests.Session.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def with_options(
+        self,
+        timeout: TimeoutType = _UNSET,
+        retry_policy: Optional[RetryPolicy] = None,
+    ) -> "GatherClient":
+        """Get a copy of the client with different per-call options.
+
+        The copy shares the session, rate limiter and metrics with this
+        client, so it is cheap to create for a single call::
+
+            client.with_options(timeout=(2, 5)).get_map_data(space_id, map_id)
+
+        Args:
+            timeout: Socket timeout override (see ``__init__``)
+            retry_policy: Retry policy override
+
+        Returns:
+            A GatherClient sharing this client's connections
+        """
+        clone = copy.copy(self)
+        clone._owns_session = False
+        if timeout is not _UNSET:
+            clone.timeout = timeout
+        if retry_policy is not None:
+            clone.retry_policy = retry_policy
+        return clone
+
+    def _get_timeout(self, endpoint: str) -> Optional[Tuple[float, float]]:
+        """Get the socket timeouts for an attempt, capped by any deadline.
+
+        Args:
+            endpoint: API endpoint path, for the deadline error message
+
+        Returns:
+            (connect, read) timeouts, or None to wait forever
+
+        Raises:
+            DeadlineExceededError: If the active deadline has passed.
+        """
+        timeout = self.timeout
+        if isinstance(timeout, (int, float)):
+            timeout = (timeout, timeout)
+
+        active_deadline = current_deadline()
+        if active_deadline is None:
+            return timeout
+
+        # Read the clock once: a deadline expiring between a check and
+        # remaining() would give a zero timeout, which urllib3 rejects
+        remaining = active_deadline.remaining()
+        if remaining <= 0:
+            raise DeadlineExceededError(
+                f"Deadline of {active_deadline.seconds:g}s exceeded before "
+                f"requesting {endpoint}"
+            )
+        if timeout is None:
+            return (remaining, remaining)
+        return (min(timeout[0], remaining), min(timeout[1], remaining))
+
+    def save_cassette(self) -> Optional[Path]:
+        """Write the responses recorded so far, when recording.
+
+        Returns:
+            The cassette path, or None if the client is not recording
+        """
+        if self.cassette_recorder is None:
+            return None
+        return self.cassette_recorder.save()
+
+    def close(self) -> None:
+        """Release pooled connections and write any recorded cassette.
+
+        Sessions passed in by the caller are left open; they own them.
+        """
+        if self._owns_session:
+            self.session.close()  # Closing the recorder saves it
+        else:
+            self.save_cassette()
+
+    def __enter__(self) -> "GatherClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get a snapshot of the client's runtime metrics.
+
+        Returns:
+            Dictionary with request counters, per-endpoint statistics and
+            current rate limiter bucket fill
+        """
+        return {
+            "counters": self.metrics.snapshot(),
+            "endpoints": self.endpoint_metrics.to_dict(),
+            "rate_limiter": self.rate_limiter.metrics(),
+            "circuit_breaker": self.circuit_breaker.metrics(),
         }
 
     def _format_space_id(self, space_id: str) -> str:
@@ -74,32 +407,374 @@ class GatherClient:
         endpoint: str,
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
+        idempotent: Optional[bool] = None,
+        headers: Optional[Dict[str, str]] = None,
+        raw: bool = False,
+        stream: bool = False,
+        fresh: bool = False,
     ) -> Any:
-        """Make a request to the Gather.town API with enhanced error handling.
+        """Make a request to the Gather.town API, retrying transient failures.
+
+        Fresh GET responses are served from the disk cache when one is
+        configured, and identical GETs made close together share a single
+        request; writes invalidate the cached entries they affect.
 
         Args:
             method: HTTP method (GET, POST, etc)
             endpoint: API endpoint path
             data: Request body data
             params: Query parameters
+            idempotent: Whether the request is safe to retry. None infers it
+                from the method (GET and PUT are retried, POST is not).
+            headers: Extra request headers
+            raw: Return the requests.Response instead of its JSON body
+            stream: Return the response before its body is downloaded.
+                Implies raw and bypasses the disk cache and coalescing.
+            fresh: Send a GET to the server even if the disk cache or an
+                in-flight request could answer it. The response is still
+                stored in the disk cache.
 
         Returns:
-            Response data as JSON
+            Response data as JSON, or the response itself if raw is set
+
+        Raises:
+            GatherApiError: If the API request fails, with context-specific message
+        """
+        endpoint_class = classify_endpoint(endpoint)
+        self.endpoint_metrics.record_call(endpoint_class)
+        with span(
+            "gather.request",
+            **{
+                "http.request.method": method.upper(),
+                "url.path": endpoint,
+                "gather.endpoint": endpoint_class,
+            },
+        ) as trace_span:
+            if stream:
+                return self._send_with_retries(
+                    method, endpoint, data, params, idempotent, headers, stream
+                )
+
+            if self.disk_cache is not None and not fresh:
+                cached = self.disk_cache.get(
+                    method,
+                    endpoint,
+                    params,
+                    base_url=self.base_url,
+                    api_key=self.api_key,
+                )
+                if cached is not None:
+                    self.metrics.increment("disk_cache_hits")
+                    self.endpoint_metrics.record_cache_hit(
+                        endpoint_class, "disk"
+                    )
+                    trace_span.set_attribute("gather.cache", "disk")
+                    response = self._cached_response(*cached)
+                    return (
+                        response
+                        if raw
+                        else self._decode_json(response, endpoint)
+                    )
+                if self.disk_cache.is_cacheable(method, endpoint):
+                    self.metrics.increment("disk_cache_misses")
+
+            if method.upper() == "GET" and not fresh:
+                response = self._send_coalesced(endpoint, params, headers)
+            else:
+                response = self._send_with_retries(
+                    method, endpoint, data, params, idempotent, headers
+                )
+                if method.upper() != "GET":
+                    self.coalescer.clear()
+            trace_span.set_attribute(
+                "http.response.status_code", response.status_code
+            )
+
+            if self.disk_cache is not None:
+                if method.upper() != "GET":
+                    self.disk_cache.invalidate(
+                        endpoint, base_url=self.base_url
+                    )
+                elif response.status_code == 200:
+                    self.disk_cache.set(
+                        method,
+                        endpoint,
+                        params,
+                        response.content,
+                        response.headers,
+                        base_url=self.base_url,
+                        api_key=self.api_key,
+                    )
+
+            return response if raw else self._decode_json(response, endpoint)
+
+    def _send_coalesced(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        headers: Optional[Dict[str, str]],
+    ) -> requests.Response:
+        """Send a GET, sharing the response of an identical in-flight one.
+
+        Conditional headers are not part of the identity, so a revalidation
+        can reuse a full response fetched moments earlier. A shared 304 is
+        only meaningful for the validators it was sent with, so it is never
+        reused; the caller sends its own request instead.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query parameters
+            headers: Extra request headers
+
+        Returns:
+            The response
+        """
+        key = (
+            endpoint,
+            tuple(sorted((params or {}).items())),
+            tuple(
+                sorted(
+                    (name, value)
+                    for name, value in (headers or {}).items()
+                    if name not in _CONDITIONAL_HEADERS
+                )
+            ),
+        )
+        deadline = current_deadline()
+
+        def send() -> requests.Response:
+            return self._send_with_retries(
+                "GET", endpoint, None, params, None, headers
+            )
+
+        response: requests.Response
+        try:
+            response, shared = self.coalescer.do(
+                key,
+                send,
+                keep=lambda r: r.status_code != 304,
+                timeout=deadline.remaining() if deadline else None,
+            )
+        except TimeoutError:
+            # Only raised when a deadline bounds the wait
+            if deadline is not None:
+                deadline.check(f"GET {endpoint}")
+            raise
+
+        if shared:
+            if response.status_code == 304:
+                return send()
+            self.metrics.increment("coalesced_requests")
+            self.endpoint_metrics.record_cache_hit(
+                classify_endpoint(endpoint), "coalesced"
+            )
+        return response
+
+    def _send_with_retries(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        idempotent: Optional[bool],
+        headers: Optional[Dict[str, str]],
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send a request, retrying transient failures per the retry policy.
+
+        Args:
+            method: HTTP method (GET, POST, etc)
+            endpoint: API endpoint path
+            data: Request body data
+            params: Query parameters
+            idempotent: Whether the request is safe to retry
+            headers: Extra request headers
+            stream: Return before the response body is downloaded
+
+        Returns:
+            The successful response
+
+        Raises:
+            CircuitOpenError: If the endpoint class's circuit is open
+            GatherApiError: If the last attempt fails
+        """
+        retryable = self.retry_policy.is_retryable_method(method, idempotent)
+        endpoint_class = classify_endpoint(endpoint)
+        attempt = 1
+        while True:
+            self._admit(endpoint_class)
+            try:
+                response = self._send(
+                    method,
+                    endpoint,
+                    data=data,
+                    params=params,
+                    headers=headers,
+                    stream=stream,
+                )
+            except GatherApiError as e:
+                if self.circuit_breaker.is_failure(e):
+                    self._circuit_changed(
+                        endpoint_class,
+                        self.circuit_breaker.record_failure(endpoint_class),
+                    )
+                else:
+                    self._circuit_changed(
+                        endpoint_class,
+                        self.circuit_breaker.record_success(endpoint_class),
+                    )
+                if (
+                    not retryable
+                    or attempt >= self.retry_policy.max_attempts
+                    or not self.retry_policy.is_retryable_error(e)
+                ):
+                    if retryable and attempt > 1:
+                        self.metrics.increment("retries_exhausted")
+                    raise
+                if self.circuit_breaker.state(endpoint_class) == OPEN:
+                    # Backing off would only end in a rejection
+                    self.metrics.increment("retries_abandoned_circuit")
+                    raise
+
+                delay = self.retry_policy.get_backoff(attempt, e.retry_after)
+                active_deadline = current_deadline()
+                if (
+                    active_deadline is not None
+                    and delay >= active_deadline.remaining()
+                ):
+                    # Waiting would blow the budget; surface the real error
+                    self.metrics.increment("retries_abandoned_deadline")
+                    raise
+
+                logger.warning(
+                    f"Retrying {method} {endpoint} in {delay:.2f}s "
+                    f"(attempt {attempt + 1}/{self.retry_policy.max_attempts}): {e}"
+                )
+                self.metrics.increment("retries")
+                self.endpoint_metrics.record_retry(classify_endpoint(endpoint))
+                self.metrics.increment("retry_backoff_seconds", delay)
+                self.retry_policy.sleep(delay)
+                attempt += 1
+            else:
+                self._circuit_changed(
+                    endpoint_class,
+                    self.circuit_breaker.record_success(endpoint_class),
+                )
+                return response
+
+    def _admit(self, endpoint_class: str) -> None:
+        """Pass a request through the circuit breaker.
+
+        Args:
+            endpoint_class: Logical endpoint class of the request
+
+        Raises:
+            CircuitOpenError: If the circuit rejects the request
+        """
+        try:
+            transition = self.circuit_breaker.before_request(endpoint_class)
+        except CircuitOpenError:
+            self.metrics.increment("circuit_rejections")
+            self.endpoint_metrics.record_circuit_rejection(endpoint_class)
+            raise
+        self._circuit_changed(endpoint_class, transition)
+
+    def _circuit_changed(
+        self, endpoint_class: str, state: Optional[str]
+    ) -> None:
+        """Report a circuit breaker state change, if there was one.
+
+        Args:
+            endpoint_class: Logical endpoint class of the circuit
+            state: New state, or None if it did not change
+        """
+        if state is None:
+            return
+        log = logger.warning if state == OPEN else logger.info
+        log(f"Circuit for {endpoint_class} endpoints is now {state}")
+        self.metrics.increment(f"circuit_{state}")
+        self.endpoint_metrics.record_circuit_transition(endpoint_class, state)
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send a single request attempt with enhanced error handling.
+
+        Args:
+            method: HTTP method (GET, POST, etc)
+            endpoint: API endpoint path
+            data: Request body data
+            params: Query parameters
+            headers: Extra request headers
+            stream: Return before the response body is downloaded
+
+        Returns:
+            The successful response
 
         Raises:
             GatherApiError: If the API request fails, with context-specific message
         """
         url = f"{self.base_url}/{endpoint}"
 
+        waited = self.rate_limiter.acquire(endpoint)
+        if waited:
+            self.metrics.increment("rate_limit_waits")
+            self.metrics.increment("rate_limit_wait_seconds", waited)
+
+        timeout = self._get_timeout(endpoint)
+
+        body, body_headers = self._encode_body(data)
+        request_headers = {**self.headers, **body_headers, **(headers or {})}
+        endpoint_class = classify_endpoint(endpoint)
+        request_bytes = len(body) if body else 0
+
+        started = time.monotonic()
         try:
-            response = requests.request(
-                method=method,
-                url=url,
-                headers=self.headers,
-                json=data,
-                params=params,
+            try:
+                response = self.session.request(
+                    method=method,
+                    url=url,
+                    headers=request_headers,
+                    data=body,
+                    params=params,
+                    timeout=timeout,
+                    stream=stream,
+                )
+            except requests.exceptions.RequestException:
+                self.endpoint_metrics.record_request(
+                    endpoint_class,
+                    STATUS_ERROR,
+                    time.monotonic() - started,
+                    request_bytes,
+                )
+                raise
+
+            self.endpoint_metrics.record_request(
+                endpoint_class,
+                response.status_code,
+                time.monotonic() - started,
+                request_bytes,
+                0 if stream else self._record_response_bytes(response),
             )
 
+            if response.status_code == 415 and body_headers:
+                # The server does not accept compressed bodies; stop trying
+                logger.warning(
+                    "Server rejected a compressed request body; "
+                    "disabling request compression"
+                )
+                self.compress_requests = False
+                self.metrics.increment("request_compression_rejected")
+                return self._send(
+                    method, endpoint, data, params, headers, stream
+                )
+
             # Handle common error codes with specific messages
             if response.status_code == 404:
                 error_context = f"Resource not found at {method} {endpoint}"
@@ -128,17 +803,23 @@ class GatherClient:
                 )
 
             if response.status_code == 429:
+                # Back off everyone sharing this limiter, not just this call
+                self.rate_limiter.drain(endpoint)
+                self.metrics.increment("rate_limited_responses")
                 raise GatherApiError(
                     "429 Too Many Requests: Rate limit exceeded. Please reduce request frequency.",
                     status_code=429,
                     endpoint=endpoint,
+                    retry_after=parse_retry_after(
+                        response.headers.get("Retry-After")
+                    ),
                 )
 
             # For other errors, use response.raise_for_status() to get the default error
             response.raise_for_status()
 
             # If we've made it here, the request was successful
-            return response.json()
+            return response
 
         except requests.exceptions.HTTPError as e:
             # For any other HTTP errors not caught above
@@ -168,7 +849,14 @@ class GatherClient:
 
             logger.error(error_msg)
             raise GatherApiError(
-                error_msg, status_code=status_code, endpoint=endpoint
+                error_msg,
+                status_code=status_code,
+                endpoint=endpoint,
+                retry_after=parse_retry_after(
+                    e.response.headers.get("Retry-After")
+                    if e.response is not None
+                    else None
+                ),
             ) from e
 
         except requests.exceptions.ConnectionError as e:
@@ -190,10 +878,105 @@ class GatherClient:
             logger.error(error_msg)
             raise GatherApiError(error_msg, endpoint=endpoint) from e
 
+    def _encode_body(
+        self, data: Optional[Dict[str, Any]]
+    ) -> Tuple[Optional[bytes], Dict[str, str]]:
+        """Serialize a request body, gzipping it if large enough.
+
+        Args:
+            data: Request body data
+
+        Returns:
+            Tuple of the encoded body (None without data) and the headers
+            describing its encoding
+        """
+        if data is None:
+            return None, {}
+
+        body = json.dumps(data, allow_nan=False).encode()
+        headers = {}
+        self.metrics.increment("request_bytes_decoded", len(body))
+        if self.compress_requests and len(body) >= self.compression_threshold:
+            body = gzip.compress(body, compresslevel=6, mtime=0)
+            headers["Content-Encoding"] = "gzip"
+        self.metrics.increment("request_bytes_wire", len(body))
+        return body, headers
+
+    def _record_response_bytes(self, response: requests.Response) -> int:
+        """Count the bytes of a response body on the wire and decoded.
+
+        Args:
+            response: A response whose body has not been consumed elsewhere
+
+        Returns:
+            Bytes received on the wire
+        """
+        decoded = len(response.content)
+        try:
+            # urllib3 counts the (possibly compressed) bytes it read
+            wire = response.raw.tell() or int(
+                response.headers.get("Content-Length", decoded)
+            )
+        except (AttributeError, OSError, ValueError):
+            wire = decoded
+
+        self.metrics.increment("response_bytes_wire", wire)
+        self.metrics.increment("response_bytes_decoded", decoded)
+        if wire != decoded:
+            logger.debug(
+                f"{response.request.method if response.request else ''} "
+                f"{response.url}: {wire} bytes on the wire, "
+                f"{decoded} decoded"
+            )
+        return wire
+
+    def _decode_json(self, response: requests.Response, endpoint: str) -> Any:
+        """Decode a JSON response body.
+
+        Args:
+            response: Successful response
+            endpoint: API endpoint path, for error messages
+
+        Returns:
+            Response data as JSON
+
+        Raises:
+            GatherApiError: If the body is not valid JSON
+        """
+        try:
+            return self.json_codec.loads(response.content)
+        except ValueError as e:
+            error_msg = f"API request failed: {str(e)}"
+            logger.error(error_msg)
+            raise GatherApiError(error_msg, endpoint=endpoint) from e
+
+    @staticmethod
+    def _cached_response(
+        body: bytes, headers: Dict[str, str]
+    ) -> requests.Response:
+        """Build a response object for a body served from the disk cache.
+
+        Args:
+            body: Cached response body
+            headers: Cached response headers
+
+        Returns:
+            A 200 response with the cached body
+        """
+        response = requests.Response()
+        response.status_code = 200
+        response._content = body
+        response.headers.update(headers)
+        return response
+
     # === Space Operations ===
 
     def create_space(
-        self, name: str, source_space: str, reason: Optional[str] = None
+        self,
+        name: str,
+        source_space: str,
+        reason: Optional[str] = None,
+        retry: bool = False,
     ) -> Space:
         """Create a new Gather.town space by copying an existing template.
 
@@ -201,6 +984,8 @@ class GatherClient:
             name: Name for the new space
             source_space: ID of the source space to use as a template
             reason: Optional reason for creating the space
+            retry: Retry transient failures. Off by default because a retried
+                request may create a duplicate space.
 
         Returns:
             Space: The created space information
@@ -217,7 +1002,10 @@ class GatherClient:
             data["reason"] = reason
 
         response = self._request(
-            "POST", f"api/{self.API_VERSION}/spaces", data=data
+            "POST",
+            f"api/{self.API_VERSION}/spaces",
+            data=data,
+            idempotent=retry,
         )
         return Space.model_validate(response)
 
@@ -281,32 +1069,165 @@ class GatherClient:
         )
         return [Map.model_validate(map_data) for map_data in data]
 
-    def get_map_data(self, space_id: str, map_id: str) -> MapData:
+    def get_map_data(
+        self, space_id: str, map_id: str, fresh: bool = False
+    ) -> MapData:
         """Get detailed data for a specific map.
 
         Args:
             space_id: ID of the space
             map_id: ID of the map
+            fresh: Ask the server instead of answering from the disk cache
+                or an identical in-flight request. A conditional GET is
+                still sent when validators are known.
 
         Returns:
             Map data including objects
 
+        Raises:
+            GatherApiError: If the map data cannot be retrieved
+        """
+        map_data, _ = self._fetch_map_data(space_id, map_id, fresh)
+        return map_data
+
+    def get_map_data_if_changed(
+        self, space_id: str, map_id: str
+    ) -> Optional[MapData]:
+        """Get map data only if it changed since this client last fetched it.
+
+        Lets sweeps skip downstream work for maps that did not change.
+
+        Args:
+            space_id: ID of the space
+            map_id: ID of the map
+
+        Returns:
+            Map data, or None if the map is unchanged
+
+        Raises:
+            GatherApiError: If the map data cannot be retrieved
+        """
+        map_data, changed = self._fetch_map_data(space_id, map_id)
+        return map_data if changed else None
+
+    def _fetch_map_data(
+        self, space_id: str, map_id: str, fresh: bool = False
+    ) -> Tuple[MapData, bool]:
+        """Fetch and parse map data, revalidating against the validator cache.
+
+        Args:
+            space_id: ID of the space
+            map_id: ID of the map
+            fresh: Bypass the disk cache and request coalescing
+
+        Returns:
+            Tuple of the map data and whether it changed since the last fetch
+
+        Raises:
+            GatherApiError: If the map data cannot be retrieved
+        """
+        body, changed, endpoint = self._fetch_map_body(space_id, map_id, fresh)
+        return self._parse_map_data(body, endpoint), changed
+
+    def _fetch_map_body(
+        self, space_id: str, map_id: str, fresh: bool = False
+    ) -> Tuple[bytes, bool, str]:
+        """Fetch a map data body, revalidating against the validator cache.
+
+        Sends If-None-Match / If-Modified-Since when validators are known
+        and reuses the cached body on 304. When the server sends no
+        validators, a body identical to the cached one also counts as
+        unchanged.
+
+        Args:
+            space_id: ID of the space
+            map_id: ID of the map
+            fresh: Bypass the disk cache and request coalescing
+
+        Returns:
+            Tuple of the raw body, whether it changed since the last fetch
+            and the endpoint path
+
         Raises:
             GatherApiError: If the map data cannot be retrieved
         """
         formatted_space_id = self._format_space_id(space_id)
-        data = self._request(
+        endpoint = (
+            f"api/{self.API_VERSION}/spaces/{formatted_space_id}/maps/{map_id}"
+        )
+        cache_key = (space_id, map_id)
+        cached = self.validator_cache.get(cache_key)
+
+        response = self._request(
             "GET",
-            f"api/{self.API_VERSION}/spaces/{formatted_space_id}/maps/{map_id}",
+            endpoint,
             params={"useV2Map": "true"},
+            headers=cached.conditional_headers() if cached else None,
+            raw=True,
+            fresh=fresh,
+        )
+
+        if response.status_code == 304 and cached is not None:
+            self.metrics.increment("map_data_not_modified")
+            self.endpoint_metrics.record_cache_hit(
+                classify_endpoint(endpoint), "not_modified"
+            )
+            return cached.body, False, endpoint
+
+        entry = ValidatorEntry.from_response(
+            response.content, response.headers
+        )
+        changed = cached is None or cached.content_hash != entry.content_hash
+        if not changed:
+            self.metrics.increment("map_data_unchanged")
+        self.validator_cache.put(cache_key, entry)
+        return entry.body, changed, endpoint
+
+    def _decode_map_body(self, body: bytes, endpoint: str) -> Dict[str, Any]:
+        """Decode a map data response body.
+
+        Args:
+            body: Raw response body
+            endpoint: API endpoint path, for error messages
+
+        Returns:
+            Decoded JSON document
+
+        Raises:
+            GatherApiError: If the body is not valid JSON
+        """
+        try:
+            return self.json_codec.loads(body)
+        except ValueError as e:
+            raise GatherApiError(
+                f"Invalid JSON in map data response: {str(e)}",
+                endpoint=endpoint,
+            ) from e
+
+    def _parse_map_data(self, body: bytes, endpoint: str) -> MapData:
+        """Parse a map data response body.
+
+        Args:
+            body: Raw response body
+            endpoint: API endpoint path, for error messages
+
+        Returns:
+            Parsed map data, validated as set by ``map_validation``
+
+        Raises:
+            GatherApiError: If the body is not valid JSON
+        """
+        return MapData.from_api(
+            self._decode_map_body(body, endpoint),
+            validate=self.map_validation,
         )
-        return MapData.model_validate(data)
 
     def update_map(
         self,
         space_id: str,
         map_id: str,
         map_data: Union[MapData, Dict[str, Any]],
+        validate: bool = False,
     ) -> MapData:
         """Update a map with new data.
 
@@ -314,12 +1235,16 @@ class GatherClient:
             space_id: ID of the space
             map_id: ID of the map to update
             map_data: Either a MapData instance or a dictionary with map data
+            validate: Validate the content strictly, without type coercion,
+                before sending it
 
         Returns:
             Updated MapData object
 
         Raises:
             TypeError: If map_data is not a MapData instance or dictionary
+            ValidationError: If validate is set and the content fails strict
+                validation; nothing is sent
             GatherApiError: If the map cannot be updated
         """
         formatted_space_id = self._format_space_id(space_id)
@@ -334,14 +1259,30 @@ class GatherClient:
                 "map_data must be a MapData instance or a dictionary"
             )
 
+        if validate:
+            # Catch values that were coerced on read or set without
+            # validation before they reach the map
+            try:
+                MapData.from_api(
+                    {"id": map_id, **content}, validate=VALIDATE_STRICT
+                )
+            except pydantic.ValidationError as e:
+                raise ValidationError(
+                    f"Invalid content for map '{map_id}': {str(e)}"
+                ) from e
+
         # Wrap the data in a content field as per API docs
         data = {"content": content}
 
+        self.validator_cache.invalidate((space_id, map_id))
+
+        # Writing the same content twice is harmless, so retries are safe
         response = self._request(
             "POST",
             f"api/{self.API_VERSION}/spaces/{formatted_space_id}/maps/{map_id}",
             data=data,
             params={"useV2Map": "true"},
+            idempotent=True,
         )
         return MapData.model_validate(response)
 
@@ -366,11 +1307,13 @@ class GatherClient:
         # Wrap the data in a content field and use POST as per API docs
         data = {"content": {"background": background}}
 
+        self.validator_cache.invalidate((space_id, map_id))
         response = self._request(
             "POST",
             f"api/{self.API_VERSION}/spaces/{formatted_space_id}/maps/{map_id}",
             data=data,
             params={"useV2Map": "true"},
+            idempotent=True,
         )
         return MapData.model_validate(response)
 
@@ -379,6 +1322,10 @@ class GatherClient:
     ) -> MapData:
         """Update objects on a map without changing other map data.
 
+        Only the objects field is written, and nothing is sent if the
+        objects are unchanged; see ``apply_map_objects``. Both the read and
+        the write are bounded by the active ``deadline``.
+
         Args:
             space_id: ID of the space
             map_id: ID of the map
@@ -390,14 +1337,74 @@ class GatherClient:
         Raises:
             GatherApiError: If the map objects cannot be updated
         """
-        # First get the current map data
-        map_data = self.get_map_data(space_id, map_id)
+        return self.apply_map_objects(space_id, map_id, objects).map_data
+
+    def apply_map_objects(
+        self,
+        space_id: str,
+        map_id: str,
+        objects: List[Object],
+        base: Optional[MapData] = None,
+        merge_objects: bool = False,
+    ) -> MapWriteResult:
+        """Write a map's objects, sending only what changed.
+
+        The objects are diffed by ID against a base snapshot of the map and
+        the smallest content the map endpoint accepts is sent (see
+        ``map_diff.plan_map_write``). Bytes sent and saved compared with a
+        full-map write are added to the client metrics; the full-map size
+        is estimated from a sample of the objects (see
+        ``map_diff.estimate_full_size``).
 
-        # Update only the objects field
-        map_data.objects = objects
+        Args:
+            space_id: ID of the space
+            map_id: ID of the map
+            objects: Objects that should be on the map
+            base: Current map data, if the caller already has it. Fetched
+                (or revalidated) when not provided.
+            merge_objects: Send only added and changed objects when no
+                objects were removed. Relies on the endpoint merging objects
+                by ID.
 
-        # Send the updated map data
-        return self.update_map(space_id, map_id, map_data)
+        Returns:
+            MapWriteResult with the diff, write mode and byte counts
+
+        Raises:
+            GatherApiError: If the map cannot be read or written
+        """
+        if base is None:
+            base = self.get_map_data(space_id, map_id)
+
+        diff, mode, content = plan_map_write(base, objects, merge_objects)
+
+        if content is None:
+            logger.debug(f"Map {map_id} objects unchanged, skipping write")
+            map_data, bytes_sent = base.model_copy(deep=True), 0
+        else:
+            map_data = self.update_map(space_id, map_id, content)
+            bytes_sent = encoded_size(content)
+        full_bytes = (
+            bytes_sent
+            if mode == WRITE_FULL
+            else estimate_full_size(base, objects)
+        )
+
+        self.metrics.increment(f"map_writes_{mode}")
+        self.metrics.increment("map_write_bytes_sent", bytes_sent)
+        self.metrics.increment(
+            "map_write_bytes_saved", full_bytes - bytes_sent
+        )
+        logger.debug(
+            f"Map {map_id} write ({mode}): {diff.summary()}, "
+            f"sent {bytes_sent} of {full_bytes} bytes"
+        )
+        return MapWriteResult(
+            map_data=map_data,
+            diff=diff,
+            mode=mode,
+            bytes_sent=bytes_sent,
+            full_bytes=full_bytes,
+        )
 
     # === Object Operations ===
 
@@ -417,6 +1424,134 @@ class GatherClient:
         map_data = self.get_map_data(space_id, map_id)
         return map_data.objects
 
+    def get_map_table(self, space_id: str, map_id: str) -> MapObjectTable:
+        """Get the objects of a map as a columnar table.
+
+        The table is built straight from the response body, without parsing
+        an ``Object`` model per object, so large maps take a fraction of the
+        memory of ``get_map_objects``. Shares the validator cache with
+        ``get_map_data``.
+
+        Args:
+            space_id: ID of the space
+            map_id: ID of the map
+
+        Returns:
+            Table of the objects in the map
+
+        Raises:
+            GatherApiError: If the map cannot be retrieved or parsed
+        """
+        body, _, endpoint = self._fetch_map_body(space_id, map_id)
+        data = self._decode_map_body(body, endpoint)
+        try:
+            return MapObjectTable.from_map_payload(data)
+        except (TypeError, ValueError) as e:
+            raise GatherApiError(
+                f"Invalid map data for '{map_id}': {str(e)}",
+                endpoint=endpoint,
+            ) from e
+
+    def iter_map_objects(
+        self,
+        space_id: str,
+        map_id: str,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[Object]:
+        """Stream the objects of a map without loading the whole map.
+
+        The map is downloaded in chunks and each object is parsed as soon as
+        it is complete, so memory stays bounded by the largest object (see
+        ``MapObjectStream``). The request is not cached or shared with other
+        callers, and a failure after the first object cannot be retried.
+
+        Args:
+            space_id: ID of the space
+            map_id: ID of the map
+            chunk_size: Bytes read from the connection at a time
+
+        Yields:
+            Objects in the order they appear in the map
+
+        Raises:
+            GatherApiError: If the map cannot be retrieved or parsed
+        """
+        endpoint = (
+            f"api/{self.API_VERSION}/spaces/"
+            f"{self._format_space_id(space_id)}/maps/{map_id}"
+        )
+        response = self._request(
+            "GET",
+            endpoint,
+            params={"useV2Map": "true"},
+            raw=True,
+            stream=True,
+        )
+        try:
+            yield from MapObjectStream(response.iter_content(chunk_size))
+        except requests.exceptions.RequestException as e:
+            raise GatherApiError(
+                f"Connection lost while streaming map '{map_id}': {str(e)}",
+                endpoint=endpoint,
+            ) from e
+        except ValueError as e:
+            raise GatherApiError(
+                f"Invalid map data for '{map_id}': {str(e)}",
+                endpoint=endpoint,
+            ) from e
+        finally:
+            response.close()
+
+    def iter_portals(self, space_id: str, map_id: str) -> Iterator[Object]:
+        """Stream the portal objects of a map with bounded memory.
+
+        Args:
+            space_id: ID of the space
+            map_id: ID of the map
+
+        Yields:
+            Portal objects, detected as in ``get_portals``
+
+        Raises:
+            GatherApiError: If the map cannot be retrieved or parsed
+        """
+        for obj in self.iter_map_objects(space_id, map_id):
+            if self.is_portal_object(obj):
+                yield obj
+
+    @staticmethod
+    def is_portal_object(obj: Object) -> bool:
+        """Check whether a map object looks like a portal.
+
+        Args:
+            obj: Map object
+
+        Returns:
+            True if any of the portal detection rules match
+        """
+        # Case 1: Object has type "portal" (string)
+        if obj.type == "portal":
+            return True
+
+        # Case 2: Object has targetMap property (most reliable indicator of a portal)
+        if obj.targetMap is not None:
+            return True
+
+        # Case 3: Object has properties that suggest it's a portal
+        if obj.properties and any(
+            k in str(obj.properties).lower()
+            for k in ["portal", "target", "teleport", "warp"]
+        ):
+            return True
+
+        # Case 4: Object has a specific integer type that we've identified as portals
+        return isinstance(obj.type, int) and obj.type in [
+            4,
+            5,
+            6,
+            7,
+        ]  # Potential portal type values
+
     def get_portals(self, space_id: str, map_id: str) -> List[Object]:
         """Get all portal objects from a map.
 
@@ -431,37 +1566,11 @@ class GatherClient:
             GatherApiError: If the portals cannot be retrieved
         """
         objects = self.get_map_objects(space_id, map_id)
-
-        # Enhanced portal detection logic
-        portals = []
-        for obj in objects:
-            # Case 1: Object has type "portal" (string)
-            if obj.type == "portal":
-                portals.append(obj)
-                continue
-
-            # Case 2: Object has targetMap property (most reliable indicator of a portal)
-            if obj.targetMap is not None:
-                portals.append(obj)
-                continue
-
-            # Case 3: Object has properties that suggest it's a portal
-            if obj.properties and any(
-                k in str(obj.properties).lower()
-                for k in ["portal", "target", "teleport", "warp"]
-            ):
-                portals.append(obj)
-                continue
-
-            # Case 4: Object has a specific integer type that we've identified as portals
-            if isinstance(obj.type, int) and obj.type in [
-                4,
-                5,
-                6,
-                7,
-            ]:  # Potential portal type values
-                portals.append(obj)
-                continue
+        with span(
+            "gather.detect_portals", map_id=map_id, objects=len(objects)
+        ) as trace_span:
+            portals = [obj for obj in objects if self.is_portal_object(obj)]
+            trace_span.set_attribute("portals", len(portals))
 
         # Log the number of portals found with each detection method
         logger.debug(f"Found {len(portals)} potential portals in map {map_id}")
@@ -484,6 +1593,26 @@ class GatherClient:
         portal_objects = self.get_portals(space_id, map_id)
         return [Portal.from_object(obj) for obj in portal_objects]
 
+    def get_portal_views(self, space_id: str, map_id: str) -> List[PortalView]:
+        """Get all portal objects from a map as read-only portal views.
+
+        Unlike ``get_portal_objects``, nothing is copied or validated again,
+        and objects without a targetMap are kept (see
+        ``PortalView.is_valid``). Use ``PortalView.to_portal`` for a portal
+        that has to be changed or serialized.
+
+        Args:
+            space_id: ID of the space
+            map_id: ID of the map
+
+        Returns:
+            List of portal views
+
+        Raises:
+            GatherApiError: If the portal objects cannot be retrieved
+        """
+        return [PortalView(obj) for obj in self.get_portals(space_id, map_id)]
+
     # === User Management ===
 
     def get_user_id_by_email(self, email: str) -> str:
@@ -501,17 +1630,37 @@ class GatherClient:
             GatherApiError: If the user can't be found or other API errors occur
 
         Note:
-            This endpoint has strict rate limits (approximately 25 requests/5 minutes)
+            This endpoint has strict rate limits (approximately 25 requests/5 minutes).
+            Calls are paced by the client's rate limiter, so bursts beyond the
+            limit wait for capacity instead of failing. When a user ID cache
+            is configured, it is consulted first and updated with the result.
         """
+        if self.user_id_cache is not None:
+            entry = self.user_id_cache.get(email, base_url=self.base_url)
+            if entry is not None:
+                self.metrics.increment("user_id_cache_hits")
+                self.endpoint_metrics.record_call(USER_ID)
+                self.endpoint_metrics.record_cache_hit(
+                    USER_ID, "user_id_cache"
+                )
+                if not entry.found:
+                    raise GatherApiError(
+                        f"User ID not found for email: {email}",
+                        status_code=404,
+                    )
+                return entry.user_id
+            self.metrics.increment("user_id_cache_misses")
+
         try:
             data = self._request(
                 "GET",
                 f"api/{self.API_VERSION}/user-id",
                 params={"email": email},
             )
-            if not data or "userId" not in data:
-                raise GatherApiError(f"User ID not found for email: {email}")
-            return data["userId"]
+        except GatherApiError as e:
+            if e.status_code == 404:
+                self._cache_user_id(email, None)
+            raise
         except requests.exceptions.RequestException as e:
             if (
                 hasattr(e, "response")
@@ -524,6 +1673,17 @@ class GatherClient:
                 ) from e
             raise
 
+        if not data or "userId" not in data:
+            self._cache_user_id(email, None)
+            raise GatherApiError(f"User ID not found for email: {email}")
+        self._cache_user_id(email, data["userId"])
+        return data["userId"]
+
+    def _cache_user_id(self, email: str, user_id: Optional[str]) -> None:
+        """Remember a user-id lookup result if a cache is configured."""
+        if self.user_id_cache is not None:
+            self.user_id_cache.set(email, user_id, base_url=self.base_url)
+
     def add_user_to_space(
         self, space_id: str, email: str, role: str = ROLE_MEMBER
     ) -> Dict[str, Any]:
@@ -601,12 +1761,26 @@ class GatherClient:
         if role:
             params["role"] = role
 
-        return self._request(
+        users = self._request(
             "GET",
             f"api/{self.API_VERSION}/spaces/{formatted_space_id}/users",
             params=params,
         )
 
+        # Listing users is cheap; remember their IDs for later role changes
+        if self.user_id_cache is not None and isinstance(users, list):
+            self.user_id_cache.set_many(
+                {
+                    user["email"]: user["id"]
+                    for user in users
+                    if isinstance(user, dict)
+                    and user.get("email")
+                    and user.get("id")
+                },
+                base_url=self.base_url,
+            )
+        return users
+
     # === Spawn Token Support ===
 
     def create_spawn_token(
@@ -615,6 +1789,7 @@ class GatherClient:
         map_id: str,
         spawn_name: str,
         expires_in_seconds: Optional[int] = None,
+        retry: bool = False,
     ) -> Dict[str, Any]:
         """Create a spawn token for a specific spawn point in a map.
 
@@ -626,6 +1801,8 @@ class GatherClient:
             map_id: ID of the map containing the spawn point
             spawn_name: Name of the spawn point
             expires_in_seconds: Optional expiration time in seconds
+            retry: Retry transient failures. Off by default because a retried
+                request may mint a second token.
 
         Returns:
             Dict containing the spawn token information
@@ -645,6 +1822,7 @@ class GatherClient:
             "POST",
             f"api/{self.API_VERSION}/spaces/{formatted_space_id}/spawn-tokens",
             data=data,
+            idempotent=retry,
         )
 
         return response
@@ -0,0 +1,130 @@
+"""Single-flight coalescing of identical API reads."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _Call:
+    """An in-flight call whose result is shared with waiting callers."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class RequestCoalescer:
+    """Shares the result of identical calls made close together.
+
+    While a call for a key is in flight, other threads asking for the same
+    key wait for it instead of repeating it. Successful results are also
+    reused for ``window`` seconds after they complete. Errors are shared
+    with the callers that were waiting, but never reused afterwards.
+    AsyncGatherClient runs requests on worker threads, so async tasks are
+    coalesced the same way.
+    """
+
+    DEFAULT_WINDOW = 2.0
+
+    def __init__(
+        self,
+        window: float = DEFAULT_WINDOW,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the coalescer.
+
+        Args:
+            window: Seconds a completed result is reused. 0 only shares
+                calls that are in flight.
+            enabled: Coalesce calls at all
+            clock: Monotonic time source, in seconds
+        """
+        self.window = window
+        self.enabled = enabled
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, _Call] = {}
+        self._completed: "OrderedDict[Hashable, Tuple[float, Any]]" = (
+            OrderedDict()
+        )
+
+    @classmethod
+    def disabled(cls) -> "RequestCoalescer":
+        """Create a coalescer that always calls through."""
+        return cls(window=0, enabled=False)
+
+    def _prune(self, now: float) -> None:
+        """Drop completed results older than the window (lock held)."""
+        while self._completed:
+            key, (completed_at, _) = next(iter(self._completed.items()))
+            if now - completed_at < self.window:
+                break
+            del self._completed[key]
+
+    def do(
+        self,
+        key: Hashable,
+        func: Callable[[], Any],
+        keep: Callable[[Any], bool] = lambda result: True,
+        timeout: Optional[float] = None,
+    ) -> Tuple[Any, bool]:
+        """Call func, or share the result of an identical call.
+
+        Args:
+            key: Identity of the call
+            func: Function performing the call
+            keep: Whether a result may be reused within the window
+            timeout: Seconds to wait for an in-flight call, or None to wait
+                until it finishes
+
+        Returns:
+            Tuple of the result and whether it was shared with another call
+
+        Raises:
+            TimeoutError: If an in-flight call did not finish in time.
+        """
+        if not self.enabled:
+            return func(), False
+
+        with self._lock:
+            now = self._clock()
+            self._prune(now)
+            if key in self._completed:
+                return self._completed[key][1], True
+
+            call = self._in_flight.get(key)
+            leader = call is None
+            if call is None:
+                call = self._in_flight[key] = _Call()
+
+        if not leader:
+            if not call.done.wait(timeout):
+                raise TimeoutError(f"Timed out waiting for {key!r}")
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+                if (
+                    call.error is None
+                    and self.window > 0
+                    and keep(call.result)
+                ):
+                    self._completed[key] = (self._clock(), call.result)
+            call.done.set()
+        return call.result, False
+
+    def clear(self) -> None:
+        """Forget completed results, e.g. after a write."""
+        with self._lock:
+            self._completed.clear()
@@ -0,0 +1,86 @@
+"""Deadline budgets shared by all requests made within an operation."""
+
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from gather_manager.utils.exceptions import DeadlineExceededError
+
+_current_deadline: contextvars.ContextVar[
+    Optional["Deadline"]
+] = contextvars.ContextVar("gather_manager_deadline", default=None)
+
+
+class Deadline:
+    """A point in time by which an operation must finish."""
+
+    def __init__(self, seconds: float):
+        """Start a deadline that expires after the given budget.
+
+        Args:
+            seconds: Time budget in seconds
+        """
+        self.seconds = seconds
+        self.expires_at = time.monotonic() + seconds
+
+    def remaining(self) -> float:
+        """Get the time left before the deadline.
+
+        Returns:
+            Seconds remaining, never negative
+        """
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has passed."""
+        return time.monotonic() >= self.expires_at
+
+    def check(self, operation: str) -> None:
+        """Raise if the deadline has passed.
+
+        Args:
+            operation: Description of what was about to run, for the message
+
+        Raises:
+            DeadlineExceededError: If the deadline has passed.
+        """
+        if self.expired:
+            raise DeadlineExceededError(
+                f"Deadline of {self.seconds:g}s exceeded before {operation}"
+            )
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Get the deadline active in the current context, if any."""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[Optional[Deadline]]:
+    """Bound every API request made inside the block by a time budget.
+
+    The budget propagates through composite client operations, across
+    threads started with a copied context (as AsyncGatherClient does) and
+    into nested blocks. A nested deadline can only shorten the outer one.
+
+    Args:
+        seconds: Time budget in seconds, or None for no deadline
+
+    Yields:
+        The active Deadline, or the enclosing one when seconds is None
+    """
+    outer = current_deadline()
+    if seconds is None:
+        yield outer
+        return
+
+    inner = Deadline(seconds)
+    if outer is not None and outer.expires_at < inner.expires_at:
+        inner = outer
+    token = _current_deadline.set(inner)
+    try:
+        yield inner
+    finally:
+        _current_deadline.reset(token)
@@ -0,0 +1,280 @@
+"""Persistent on-disk cache for Gather.town API responses."""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from gather_manager.api import endpoints
+
+logger = logging.getLogger(__name__)
+
+# Response headers kept with a cached body
+_STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+class DiskCache:
+    """On-disk cache of GET response bodies with TTLs and an LRU size cap.
+
+    Entries are keyed by API base URL, endpoint, method, query parameters
+    and a hash of the API key, so a shared cache directory never serves a
+    response to another environment or to a key with other permissions.
+    They are stored one file per key, grouped in a directory per base URL
+    and endpoint so that a write can invalidate every cached variant of it,
+    for every API key. Files are written to a
+    temporary name and atomically renamed, so concurrent CLI invocations
+    never read a partial entry. Each endpoint class has its own TTL;
+    classes without a TTL are never cached. When the cache grows past
+    ``max_bytes``, the least recently used entries are removed.
+    """
+
+    DEFAULT_CACHE_DIR = Path.home() / ".gather-manager" / "cache"
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+    # Seconds an entry stays fresh, per endpoint class
+    DEFAULT_TTLS: Dict[str, float] = {
+        endpoints.SPACES: 3600,
+        endpoints.MAPS: 600,
+        endpoints.MAP_DATA: 600,
+        endpoints.USERS: 300,
+    }
+
+    def __init__(
+        self,
+        cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR,
+        ttls: Optional[Dict[str, float]] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        refresh: bool = False,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize the cache, creating the directory if needed.
+
+        Args:
+            cache_dir: Directory to store entries in
+            ttls: Seconds entries stay fresh, keyed by endpoint class
+                (see ``gather_manager.api.endpoints``). Defaults to
+                DEFAULT_TTLS.
+            max_bytes: Maximum total size of cached bodies
+            refresh: Ignore existing entries but still store new responses
+            clock: Wall-clock time source, in seconds
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttls = dict(self.DEFAULT_TTLS if ttls is None else ttls)
+        self.max_bytes = max_bytes
+        self.refresh = refresh
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._size = self._scan_size()
+
+    @staticmethod
+    def _digest(value: Any) -> str:
+        """Hash a JSON-serializable value into a file-safe name."""
+        encoded = json.dumps(value, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()[:32]
+
+    def _endpoint_dir(self, endpoint: str, base_url: str) -> Path:
+        return self.cache_dir / self._digest([base_url.rstrip("/"), endpoint])
+
+    def _entry_path(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        base_url: str,
+        api_key: Optional[str],
+    ) -> Path:
+        key_hash = (
+            hashlib.sha256(api_key.encode()).hexdigest()
+            if api_key is not None
+            else None
+        )
+        return self._endpoint_dir(endpoint, base_url) / (
+            self._digest([method.upper(), params or {}, key_hash]) + ".cache"
+        )
+
+    def _ttl_for(self, endpoint: str) -> float:
+        return self.ttls.get(endpoints.classify_endpoint(endpoint), 0)
+
+    def is_cacheable(self, method: str, endpoint: str) -> bool:
+        """Check whether responses for a request may be cached.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+
+        Returns:
+            True for GETs to endpoint classes with a positive TTL
+        """
+        return method.upper() == "GET" and self._ttl_for(endpoint) > 0
+
+    def get(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        base_url: str = "",
+        api_key: Optional[str] = None,
+    ) -> Optional[Tuple[bytes, Dict[str, str]]]:
+        """Get a fresh cached response.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            params: Query parameters
+            base_url: API base URL the request is sent to
+            api_key: API key the request is made with; only its hash is
+                used
+
+        Returns:
+            Tuple of body and stored headers, or None on a miss
+        """
+        if self.refresh or not self.is_cacheable(method, endpoint):
+            return None
+
+        path = self._entry_path(method, endpoint, params, base_url, api_key)
+        try:
+            with open(path, "rb") as f:
+                header_line, body = f.read().split(b"\n", 1)
+            meta = json.loads(header_line)
+        except (OSError, ValueError):
+            return None
+
+        now = self._clock()
+        if now - meta["stored_at"] > self._ttl_for(endpoint):
+            return None
+
+        try:
+            # Record the access for LRU eviction; mtime keeps the store time
+            os.utime(path, (now, meta["stored_at"]))
+        except OSError:
+            pass
+        return body, meta.get("headers", {})
+
+    def set(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        body: bytes,
+        headers: Optional[Dict[str, str]] = None,
+        base_url: str = "",
+        api_key: Optional[str] = None,
+    ) -> None:
+        """Store a response atomically.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            params: Query parameters
+            body: Raw response body
+            headers: Response headers; only validators and content type
+                are kept
+            base_url: API base URL the request was sent to
+            api_key: API key the request was made with; only its hash is
+                stored
+        """
+        if not self.is_cacheable(method, endpoint):
+            return
+
+        now = self._clock()
+        headers = headers or {}
+        meta = {
+            "endpoint": endpoint,
+            "stored_at": now,
+            "headers": {
+                name: headers[name]
+                for name in _STORED_HEADERS
+                if name in headers
+            },
+        }
+        path = self._entry_path(method, endpoint, params, base_url, api_key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        old_size = path.stat().st_size if path.exists() else 0
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(json.dumps(meta).encode() + b"\n")
+                f.write(body)
+            os.utime(tmp_path, (now, now))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write cache entry {path}: {str(e)}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            self._size += path.stat().st_size - old_size
+            over_budget = self._size > self.max_bytes
+        if over_budget:
+            self.evict()
+
+    def invalidate(self, endpoint: str, base_url: str = "") -> None:
+        """Remove every cached variant of an endpoint and of its parents.
+
+        Writes change the written resource and the collections that contain
+        it (e.g. a role PUT changes the space's user list). Entries cached
+        with any API key are removed.
+
+        Args:
+            endpoint: API endpoint path that was written to
+            base_url: API base URL the write was sent to
+        """
+        parts = endpoint.split("?", 1)[0].strip("/").split("/")
+        for end in range(len(parts), 0, -1):
+            endpoint_dir = self._endpoint_dir("/".join(parts[:end]), base_url)
+            if endpoint_dir.exists():
+                shutil.rmtree(endpoint_dir, ignore_errors=True)
+        with self._lock:
+            self._size = self._scan_size()
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        for child in self.cache_dir.iterdir():
+            if child.is_dir():
+                shutil.rmtree(child, ignore_errors=True)
+        with self._lock:
+            self._size = 0
+
+    def evict(self) -> None:
+        """Remove least recently used entries until under max_bytes."""
+        entries = []
+        for path in self.cache_dir.glob("*/*.cache"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_atime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                total -= size
+            except OSError:
+                continue
+
+        with self._lock:
+            self._size = total
+
+    def _scan_size(self) -> int:
+        """Get the total size of all entries on disk."""
+        total = 0
+        for path in self.cache_dir.glob("*/*.cache"):
+            try:
+                total += path.stat().st_size
+            except OSError:
+                continue
+        return total
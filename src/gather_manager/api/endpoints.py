@@ -0,0 +1,44 @@
+"""Logical classification of Gather.town API endpoints."""
+
+# Logical endpoint classes shared by rate limiting, caching and metrics
+SPACES = "spaces"
+MAPS = "maps"
+MAP_DATA = "map-data"
+USERS = "users"
+USER_ID = "user-id"
+SPAWN_TOKENS = "spawn-tokens"
+OTHER = "other"
+
+ENDPOINT_CLASSES = (SPACES, MAPS, MAP_DATA, USERS, USER_ID, SPAWN_TOKENS)
+
+
+def classify_endpoint(endpoint: str) -> str:
+    """Get the logical class of an API endpoint path.
+
+    Args:
+        endpoint: API endpoint path, e.g. ``api/v2/spaces/abc/maps/main``
+
+    Returns:
+        One of the endpoint class constants, or OTHER
+    """
+    parts = endpoint.split("?", 1)[0].strip("/").split("/")
+    if parts[:1] == ["api"]:
+        parts = parts[2:]  # Drop "api" and the version
+
+    if parts == ["user-id"]:
+        return USER_ID
+    if parts[:1] == ["users"]:
+        return SPACES  # users/me/spaces lists spaces
+    if parts[:1] != ["spaces"]:
+        return OTHER
+
+    rest = parts[2:]
+    if not rest:
+        return SPACES
+    if rest[0] == "maps":
+        return MAP_DATA if len(rest) > 1 else MAPS
+    if rest[0] == "users":
+        return USERS
+    if rest[0] == "spawn-tokens":
+        return SPAWN_TOKENS
+    return OTHER
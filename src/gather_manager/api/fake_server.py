@@ -0,0 +1,496 @@
+"""In-process fake of the Gather.town v2 API for offline load testing."""
+
+import copy
+import gzip
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import requests
+
+from gather_manager.api.endpoints import classify_endpoint
+from gather_manager.api.rate_limit import TokenBucket
+from gather_manager.api.transport import Transport, TransportResponse
+
+# Object types placed on synthetic maps besides portals
+_OBJECT_TYPES = ("image", "table", "chair", "plant", "whiteboard", "lamp")
+
+_ROUTES = [
+    ("GET", re.compile(r"users/me/spaces"), "list_spaces"),
+    ("POST", re.compile(r"spaces"), "create_space"),
+    ("GET", re.compile(r"spaces/(?P<space>[^/]+)"), "get_space"),
+    ("GET", re.compile(r"spaces/(?P<space>[^/]+)/maps"), "list_maps"),
+    (
+        "GET",
+        re.compile(r"spaces/(?P<space>[^/]+)/maps/(?P<map>[^/]+)"),
+        "get_map",
+    ),
+    (
+        "POST",
+        re.compile(r"spaces/(?P<space>[^/]+)/maps/(?P<map>[^/]+)"),
+        "update_map",
+    ),
+    ("GET", re.compile(r"user-id"), "get_user_id"),
+    ("GET", re.compile(r"spaces/(?P<space>[^/]+)/users"), "list_users"),
+    (
+        "PUT",
+        re.compile(r"spaces/(?P<space>[^/]+)/users/(?P<user>[^/]+)/roles"),
+        "set_roles",
+    ),
+    (
+        "POST",
+        re.compile(r"spaces/(?P<space>[^/]+)/spawn-tokens"),
+        "create_spawn_token",
+    ),
+]
+
+
+class _HttpError(Exception):
+    """Ends request handling with an error response."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+@dataclass
+class FakeSpace:
+    """State of one space on the fake server."""
+
+    id: str
+    name: str
+    maps: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    roles: Dict[str, List[str]] = field(default_factory=dict)
+
+
+@dataclass
+class FakeGatherData:
+    """Spaces, maps and users served by a FakeGatherServer."""
+
+    spaces: Dict[str, FakeSpace] = field(default_factory=dict)
+    users: Dict[str, str] = field(default_factory=dict)  # email -> user ID
+
+    @classmethod
+    def generate(
+        cls,
+        spaces: int = 1,
+        maps_per_space: int = 10,
+        objects_per_map: int = 200,
+        portal_ratio: float = 0.05,
+        map_size: Tuple[int, int] = (60, 40),
+        users: int = 50,
+        seed: int = 0,
+    ) -> "FakeGatherData":
+        """Build reproducible synthetic fixtures.
+
+        Maps have a collision grid and a mix of objects, of which about
+        ``portal_ratio`` are portals to other maps in the same space. About
+        half of the portals have a matching portal back. Every user is a
+        member of every space.
+
+        Args:
+            spaces: Number of spaces
+            maps_per_space: Maps in each space
+            objects_per_map: Objects on each map
+            portal_ratio: Fraction of objects that are portals
+            map_size: Width and height of every map, in tiles
+            users: Number of users
+            seed: Random seed; the same arguments always give the same data
+
+        Returns:
+            The generated data
+        """
+        rng = random.Random(seed)
+        width, height = map_size
+        data = cls()
+        for u in range(users):
+            data.users[f"user{u}@example.com"] = f"user-{u:05d}"
+
+        for s in range(spaces):
+            space = FakeSpace(
+                id=f"fake{s:04d}\\Fake Space {s}", name=f"Fake Space {s}"
+            )
+            map_ids = [f"map-{m}" for m in range(maps_per_space)]
+            for map_id in map_ids:
+                objects = []
+                for o in range(objects_per_map):
+                    obj: Dict[str, Any] = {
+                        "id": f"{map_id}-obj-{o}",
+                        "x": rng.randrange(width),
+                        "y": rng.randrange(height),
+                        "width": rng.choice((1, 1, 2, 3)),
+                        "height": rng.choice((1, 1, 2)),
+                        "normal": (
+                            f"https://cdn.example.com/{map_id}/{o}.png"
+                        ),
+                    }
+                    if len(map_ids) > 1 and rng.random() < portal_ratio:
+                        obj["type"] = "portal"
+                        obj["targetMap"] = rng.choice(
+                            [m for m in map_ids if m != map_id]
+                        )
+                        obj["targetX"] = rng.randrange(width)
+                        obj["targetY"] = rng.randrange(height)
+                    else:
+                        obj["type"] = rng.choice(_OBJECT_TYPES)
+                        obj["properties"] = {"zIndex": rng.randrange(10)}
+                    objects.append(obj)
+                space.maps[map_id] = {
+                    "id": map_id,
+                    "name": f"Map {map_id}",
+                    "dimensions": [width, height],
+                    "background": f"https://cdn.example.com/{map_id}/bg.png",
+                    "collisions": "".join(
+                        rng.choice("0001") for _ in range(width * height)
+                    ),
+                    "objects": objects,
+                }
+            # Give about half of the portals a matching portal back
+            for map_id in map_ids:
+                for obj in list(space.maps[map_id]["objects"]):
+                    if obj["type"] != "portal" or rng.random() < 0.5:
+                        continue
+                    target = space.maps[obj["targetMap"]]["objects"]
+                    target.append(
+                        {
+                            "id": f"{obj['id']}-return",
+                            "type": "portal",
+                            "x": obj["targetX"],
+                            "y": obj["targetY"],
+                            "targetMap": map_id,
+                            "targetX": obj["x"],
+                            "targetY": obj["y"],
+                        }
+                    )
+            space.roles = {
+                user_id: ["MEMBER"] for user_id in data.users.values()
+            }
+            data.spaces[space.id] = space
+        return data
+
+
+class FakeGatherServer(Transport):
+    """Serves the Gather.town v2 API from memory.
+
+    Mount it under a client with ``GatherClient(transport=server)``; no
+    sockets are opened. Writes change the in-memory data, so sweeps that
+    read, edit and re-read maps behave realistically.
+
+    Latency, bandwidth, server errors and 429s can be injected. Injected
+    failures are drawn from a seeded random generator, so a single-threaded
+    run fails the same requests every time.
+    """
+
+    def __init__(
+        self,
+        data: Optional[FakeGatherData] = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        bandwidth: Optional[float] = None,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: float = 1.0,
+        rate_limits: Optional[Mapping[str, Tuple[float, float]]] = None,
+        compress_responses: bool = True,
+        api_key: Optional[str] = None,
+        seed: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize the server.
+
+        Args:
+            data: Data to serve. Defaults to ``FakeGatherData.generate()``.
+            latency: Seconds added to every response
+            jitter: Maximum random seconds added on top of latency
+            bandwidth: Response bytes per second, or None for unlimited
+            error_rate: Fraction of requests answered 503
+            throttle_rate: Fraction of requests answered 429
+            retry_after: Retry-After seconds sent with injected 429s
+            rate_limits: Real limits per endpoint class, as (requests per
+                second, burst); requests beyond them are answered 429
+            compress_responses: Gzip responses when the client accepts it
+            api_key: Reject requests with a different apiKey header (401)
+            seed: Seed for injected latency jitter and failures
+            clock: Monotonic time source for rate limits, in seconds
+            sleep: Function used to wait out injected latency
+        """
+        super().__init__()
+        self.data = data if data is not None else FakeGatherData.generate()
+        self.latency = latency
+        self.jitter = jitter
+        self.bandwidth = bandwidth
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.compress_responses = compress_responses
+        self.api_key = api_key
+        self._sleep = sleep
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._buckets = {
+            endpoint_class: TokenBucket(rate, burst, clock=clock)
+            for endpoint_class, (rate, burst) in (rate_limits or {}).items()
+        }
+        self.requests: List[Tuple[str, str, int]] = []
+        self._token_count = 0
+
+    # === Transport ===
+
+    def handle(self, request: requests.PreparedRequest) -> TransportResponse:
+        """Route a request and produce its response.
+
+        Args:
+            request: The prepared request
+
+        Returns:
+            Tuple of status code, headers and body bytes
+        """
+        url = urlsplit(request.url or "")
+        path = url.path.strip("/")
+        if path.startswith("api/v2/"):
+            path = path[len("api/v2/") :]
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        headers: Dict[str, str] = {"Content-Type": "application/json"}
+
+        with self._lock:
+            delay = self.latency + self._rng.random() * self.jitter
+            try:
+                status, payload = self._dispatch(request, path, query, headers)
+            except _HttpError as e:
+                status, payload = e.status, {"error": e.message}
+            self.requests.append((request.method or "", unquote(path), status))
+
+        body = b"" if payload is None else json.dumps(payload).encode()
+        if (
+            body
+            and self.compress_responses
+            and "gzip" in request.headers.get("Accept-Encoding", "")
+        ):
+            body = gzip.compress(body, compresslevel=1)
+            headers["Content-Encoding"] = "gzip"
+
+        if self.bandwidth:
+            delay += len(body) / self.bandwidth
+        if delay > 0:
+            self._sleep(delay)
+        return status, headers, body
+
+    def _dispatch(
+        self,
+        request: requests.PreparedRequest,
+        path: str,
+        query: Dict[str, str],
+        headers: Dict[str, str],
+    ) -> Tuple[int, Any]:
+        """Apply auth and failure injection, then call the route (lock held)."""
+        if self.api_key and request.headers.get("apiKey") != self.api_key:
+            raise _HttpError(401, "Invalid API key")
+
+        bucket = self._buckets.get(classify_endpoint(path))
+        if bucket is not None:
+            tokens = bucket.tokens
+            if tokens < 1:
+                headers["Retry-After"] = str(
+                    math.ceil((1 - tokens) / bucket.rate)
+                )
+                raise _HttpError(429, "Too many requests")
+            bucket.reserve()
+
+        draw = self._rng.random()
+        if draw < self.error_rate:
+            raise _HttpError(503, "Injected server error")
+        if draw < self.error_rate + self.throttle_rate:
+            headers["Retry-After"] = f"{self.retry_after:g}"
+            raise _HttpError(429, "Injected rate limit")
+
+        for method, pattern, name in _ROUTES:
+            match = pattern.fullmatch(path)
+            if match and method == request.method:
+                params = {
+                    key: unquote(value)
+                    for key, value in match.groupdict().items()
+                }
+                route: Callable[..., Tuple[int, Any]] = getattr(
+                    self, f"_{name}"
+                )
+                return route(request, query, headers, **params)
+        raise _HttpError(404, f"No route for {request.method} /{path}")
+
+    @staticmethod
+    def _body(request: requests.PreparedRequest) -> Dict[str, Any]:
+        """Decode a JSON request body, gzipped or not."""
+        body = request.body or b"{}"
+        if isinstance(body, str):
+            body = body.encode()
+        if not isinstance(body, bytes):
+            raise _HttpError(400, "Streamed request bodies are not supported")
+        if request.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+        data: Dict[str, Any] = json.loads(body)
+        return data
+
+    def _space(self, space_id: str) -> FakeSpace:
+        space = self.data.spaces.get(space_id.replace("/", "\\"))
+        if space is None:
+            raise _HttpError(404, f"Space {space_id} not found")
+        return space
+
+    def _map(self, space_id: str, map_id: str) -> Dict[str, Any]:
+        map_data = self._space(space_id).maps.get(map_id)
+        if map_data is None:
+            raise _HttpError(404, f"Map {map_id} not found")
+        return map_data
+
+    # === Routes ===
+
+    def _list_spaces(
+        self,
+        request: requests.PreparedRequest,
+        query: Dict[str, str],
+        headers: Dict[str, str],
+    ) -> Tuple[int, Any]:
+        return 200, [
+            {"id": space.id, "name": space.name}
+            for space in self.data.spaces.values()
+        ]
+
+    def _create_space(
+        self,
+        request: requests.PreparedRequest,
+        query: Dict[str, str],
+        headers: Dict[str, str],
+    ) -> Tuple[int, Any]:
+        body = self._body(request)
+        source = self._space(body.get("sourceSpace", ""))
+        space_id = f"fake{len(self.data.spaces):04d}\\{body['name']}"
+        self.data.spaces[space_id] = FakeSpace(
+            id=space_id,
+            name=body["name"],
+            maps=copy.deepcopy(source.maps),
+        )
+        return 200, {"id": space_id, "name": body["name"]}
+
+    def _get_space(
+        self,
+        request: requests.PreparedRequest,
+        query: Dict[str, str],
+        headers: Dict[str, str],
+        space: str,
+    ) -> Tuple[int, Any]:
+        found = self._space(space)
+        return 200, {"id": found.id, "name": found.name}
+
+    def _list_maps(
+        self,
+        request: requests.PreparedRequest,
+        query: Dict[str, str],
+        headers: Dict[str, str],
+        space: str,
+    ) -> Tuple[int, Any]:
+        return 200, [
+            {"id": map_data["id"], "name": map_data.get("name")}
+            for map_data in self._space(space).maps.values()
+        ]
+
+    def _get_map(
+        self,
+        request: requests.PreparedRequest,
+        query: Dict[str, str],
+        headers: Dict[str, str],
+        space: str,
+        map: str,
+    ) -> Tuple[int, Any]:
+        map_data = self._map(space, map)
+        etag = '"{}"'.format(
+            hashlib.sha256(
+                json.dumps(map_data, sort_keys=True).encode()
+            ).hexdigest()[:32]
+        )
+        headers["ETag"] = etag
+        if request.headers.get("If-None-Match") == etag:
+            return 304, None
+        return 200, map_data
+
+    def _update_map(
+        self,
+        request: requests.PreparedRequest,
+        query: Dict[str, str],
+        headers: Dict[str, str],
+        space: str,
+        map: str,
+    ) -> Tuple[int, Any]:
+        map_data = self._map(space, map)
+        content = self._body(request).get("content", {})
+        for name, value in content.items():
+            if name == "objects" and isinstance(value, dict):
+                # Objects keyed by ID are merged into the existing ones
+                by_id = {obj.get("id"): obj for obj in map_data["objects"]}
+                for object_id, obj in value.items():
+                    by_id[object_id] = {**obj, "id": object_id}
+                map_data["objects"] = list(by_id.values())
+            else:
+                map_data[name] = value
+        return 200, map_data
+
+    def _get_user_id(
+        self,
+        request: requests.PreparedRequest,
+        query: Dict[str, str],
+        headers: Dict[str, str],
+    ) -> Tuple[int, Any]:
+        user_id = self.data.users.get(query.get("email", ""))
+        if user_id is None:
+            raise _HttpError(404, "User not found")
+        return 200, {"userId": user_id}
+
+    def _list_users(
+        self,
+        request: requests.PreparedRequest,
+        query: Dict[str, str],
+        headers: Dict[str, str],
+        space: str,
+    ) -> Tuple[int, Any]:
+        emails = {user_id: email for email, user_id in self.data.users.items()}
+        role = query.get("role")
+        return 200, [
+            {"id": user_id, "email": emails.get(user_id), "roles": roles}
+            for user_id, roles in self._space(space).roles.items()
+            if roles and (role is None or role in roles)
+        ]
+
+    def _set_roles(
+        self,
+        request: requests.PreparedRequest,
+        query: Dict[str, str],
+        headers: Dict[str, str],
+        space: str,
+        user: str,
+    ) -> Tuple[int, Any]:
+        roles = self._body(request).get("roles", [])
+        self._space(space).roles[user] = roles
+        return 200, {"id": user, "roles": roles}
+
+    def _create_spawn_token(
+        self,
+        request: requests.PreparedRequest,
+        query: Dict[str, str],
+        headers: Dict[str, str],
+        space: str,
+    ) -> Tuple[int, Any]:
+        body = self._body(request)
+        self._map(space, body.get("room", ""))
+        self._token_count += 1
+        return 200, {
+            "token": f"spawn-{self._token_count:06d}",
+            "room": body["room"],
+            "spawn": body.get("spawn"),
+        }
@@ -0,0 +1,195 @@
+"""Pluggable JSON codecs for API bodies, models and exported files.
+
+``JsonCodec`` is the standard library path. ``PydanticCodec`` decodes and
+encodes with pydantic-core, serializing models straight to JSON bytes
+without building dictionaries first, and ``OrjsonCodec`` uses orjson for
+plain data when it is installed. ``get_codec()`` picks the fastest one
+available.
+
+The fast codecs do not escape non-ASCII characters and write NaN and
+infinities as ``null``, so files written with them differ from
+``json.dump`` output. ``PortalService`` and ``PortalExplorer`` write
+their files with ``JsonCodec`` unless given another codec.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional, Type, Union
+
+import pydantic_core
+from pydantic import BaseModel
+
+from gather_manager.utils.exceptions import ConfigurationError
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None  # type: ignore[assignment]
+
+JsonInput = Union[bytes, bytearray, str]
+
+
+def _jsonable(value: Any) -> Any:
+    """Fallback encoder for values the JSON libraries do not know."""
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    raise TypeError(
+        f"Object of type {type(value).__name__} is not JSON serializable"
+    )
+
+
+def _is_models(value: Any) -> bool:
+    """Check whether a value is a model or a list of models."""
+    if isinstance(value, (list, tuple)):
+        return bool(value) and isinstance(value[0], BaseModel)
+    return isinstance(value, BaseModel)
+
+
+class JsonCodec:
+    """Encodes and decodes JSON with the standard library.
+
+    Output matches ``json.dump(value, f, indent=2)``, with models converted
+    through ``model_dump``. Subclasses replace the encoder and decoder.
+    """
+
+    name = "json"
+
+    def loads(self, data: JsonInput) -> Any:
+        """Decode a JSON document.
+
+        Args:
+            data: JSON text or UTF-8 bytes
+
+        Returns:
+            The decoded value
+
+        Raises:
+            ValueError: If the document is not valid JSON
+        """
+        return json.loads(data)
+
+    def dumps(self, value: Any, indent: bool = False) -> bytes:
+        """Encode a value, including any models in it.
+
+        Args:
+            value: Value to encode
+            indent: Indent nested values by two spaces
+
+        Returns:
+            UTF-8 encoded JSON
+
+        Raises:
+            TypeError: If the value contains something that is not
+                serializable
+        """
+        return json.dumps(
+            value, indent=2 if indent else None, default=_jsonable
+        ).encode()
+
+    def write(
+        self, path: Union[str, Path], value: Any, indent: bool = True
+    ) -> None:
+        """Write a value to a JSON file.
+
+        Args:
+            path: Output file
+            value: Value to encode
+            indent: Indent nested values by two spaces
+
+        Raises:
+            OSError: If the file cannot be written
+            TypeError: If the value contains something that is not
+                serializable
+        """
+        with open(path, "w") as f:
+            json.dump(
+                value, f, indent=2 if indent else None, default=_jsonable
+            )
+
+
+class PydanticCodec(JsonCodec):
+    """Encodes and decodes JSON with pydantic-core.
+
+    Models are serialized by their compiled serializers directly into the
+    output, without ``model_dump``.
+    """
+
+    name = "pydantic"
+
+    def loads(self, data: JsonInput) -> Any:
+        """See JsonCodec.loads."""
+        return pydantic_core.from_json(data)
+
+    def dumps(self, value: Any, indent: bool = False) -> bytes:
+        """See JsonCodec.dumps."""
+        try:
+            return pydantic_core.to_json(value, indent=2 if indent else None)
+        except pydantic_core.PydanticSerializationError as e:
+            raise TypeError(str(e)) from e
+
+    def write(
+        self, path: Union[str, Path], value: Any, indent: bool = True
+    ) -> None:
+        """See JsonCodec.write."""
+        encoded = self.dumps(value, indent)
+        with open(path, "wb") as f:
+            f.write(encoded)
+
+
+class OrjsonCodec(PydanticCodec):
+    """Encodes and decodes plain data with orjson.
+
+    Models, and lists of models, are still serialized by pydantic-core.
+    """
+
+    name = "orjson"
+
+    def loads(self, data: JsonInput) -> Any:
+        """See JsonCodec.loads."""
+        return orjson.loads(data)
+
+    def dumps(self, value: Any, indent: bool = False) -> bytes:
+        """See JsonCodec.dumps."""
+        if _is_models(value):
+            return super().dumps(value, indent)
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(value, default=_jsonable, option=option)
+
+
+JSON_CODECS: Dict[str, Type[JsonCodec]] = {
+    JsonCodec.name: JsonCodec,
+    PydanticCodec.name: PydanticCodec,
+    OrjsonCodec.name: OrjsonCodec,
+}
+
+
+def get_codec(name: Optional[str] = None) -> JsonCodec:
+    """Get a JSON codec by name.
+
+    Args:
+        name: One of ``JSON_CODECS``. Defaults to ``"orjson"`` when orjson
+            is installed and ``"pydantic"`` otherwise.
+
+    Returns:
+        A codec instance
+
+    Raises:
+        ConfigurationError: If the codec is unknown or needs a package that
+            is not installed
+    """
+    if name is None:
+        name = OrjsonCodec.name if orjson is not None else PydanticCodec.name
+    try:
+        codec_class = JSON_CODECS[name]
+    except KeyError:
+        raise ConfigurationError(
+            f"Unknown JSON codec '{name}', expected one of "
+            f"{', '.join(JSON_CODECS)}"
+        ) from None
+    if codec_class is OrjsonCodec and orjson is None:
+        raise ConfigurationError(
+            "The orjson codec requires the orjson package"
+        )
+    return codec_class()
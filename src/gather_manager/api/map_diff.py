@@ -0,0 +1,195 @@
+"""Diffing of map objects for minimal map writes."""
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from gather_manager.models.space import MapData, Object
+
+ObjectLike = Union[Object, Dict[str, Any]]
+
+# How a map write was sent
+WRITE_NONE = "none"  # Nothing changed; no request was sent
+WRITE_DELTA = "delta"  # Only added and changed objects, keyed by ID
+WRITE_OBJECTS = "objects"  # The complete objects field only
+WRITE_FULL = "full"  # The complete map
+WRITE_FIELDS = "fields"  # Top-level map fields other than objects
+
+# Objects encoded to estimate the size of a full-map write
+FULL_SIZE_SAMPLE = 32
+
+
+def _dump(obj: ObjectLike) -> Dict[str, Any]:
+    return obj.model_dump() if isinstance(obj, Object) else dict(obj)
+
+
+@dataclass
+class MapObjectDiff:
+    """Objects added, removed and changed between two versions of a map."""
+
+    added: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    removed: List[str] = field(default_factory=list)
+    changed: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    unchanged: int = 0
+    # False when the versions differ but objects without an ID prevent
+    # matching them, so only a full write is safe
+    keyed: bool = True
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether the versions are identical."""
+        return self.keyed and not (self.added or self.removed or self.changed)
+
+    def summary(self) -> Dict[str, int]:
+        """Get the number of objects in each category."""
+        return {
+            "added": len(self.added),
+            "removed": len(self.removed),
+            "changed": len(self.changed),
+            "unchanged": self.unchanged,
+        }
+
+
+def diff_map_objects(
+    base: Sequence[ObjectLike], updated: Sequence[ObjectLike]
+) -> MapObjectDiff:
+    """Compare two versions of a map's objects by ID.
+
+    Args:
+        base: Objects currently on the map
+        updated: Objects that should be on the map
+
+    Returns:
+        The differences. If objects without an ID differ, ``keyed`` is
+        False and no per-object differences are reported.
+    """
+    base_dumps = [_dump(obj) for obj in base]
+    updated_dumps = [_dump(obj) for obj in updated]
+    if any(not obj.get("id") for obj in base_dumps + updated_dumps):
+        if base_dumps == updated_dumps:
+            return MapObjectDiff(unchanged=len(base_dumps))
+        return MapObjectDiff(keyed=False)
+
+    base_by_id = {obj["id"]: obj for obj in base_dumps}
+    diff = MapObjectDiff()
+    for obj in updated_dumps:
+        previous = base_by_id.pop(obj["id"], None)
+        if previous is None:
+            diff.added[obj["id"]] = obj
+        elif previous != obj:
+            diff.changed[obj["id"]] = obj
+        else:
+            diff.unchanged += 1
+    diff.removed = list(base_by_id)
+    return diff
+
+
+def encoded_size(content: Any) -> int:
+    """Get the size of a request body as the client would send it.
+
+    Args:
+        content: Map content to wrap in ``{"content": ...}``
+
+    Returns:
+        Size in bytes of the JSON body
+    """
+    return len(json.dumps({"content": content}).encode())
+
+
+def full_map_content(
+    base: MapData, objects: Sequence[ObjectLike]
+) -> Dict[str, Any]:
+    """Get the complete map content with the objects replaced.
+
+    Args:
+        base: Current map data
+        objects: Objects that should be on the map
+
+    Returns:
+        Content for a full-map write
+    """
+    content = base.model_dump()
+    content["objects"] = [_dump(obj) for obj in objects]
+    return content
+
+
+def estimate_full_size(base: MapData, objects: Sequence[ObjectLike]) -> int:
+    """Estimate the size of a full-map write without encoding every object.
+
+    Encoding the whole map costs about as much as a full write, which is
+    what the smaller writes avoid. The other map fields are encoded and the
+    objects are counted at the average size of the first
+    ``FULL_SIZE_SAMPLE``; maps with no more objects than that are measured
+    exactly.
+
+    Args:
+        base: Current map data
+        objects: Objects that should be on the map
+
+    Returns:
+        Estimated size in bytes of the full-map request body
+    """
+    sample = [_dump(obj) for obj in objects[:FULL_SIZE_SAMPLE]]
+    content = base.model_dump(exclude={"objects"})
+    content["objects"] = sample
+    size = encoded_size(content)
+    if len(objects) > len(sample):
+        # Each object is followed by ", " in the encoded list
+        sample_bytes = len(json.dumps(sample)) - 2 + 2 * len(sample)
+        size += round(
+            sample_bytes / len(sample) * (len(objects) - len(sample))
+        )
+    return size
+
+
+def plan_map_write(
+    base: MapData,
+    objects: Sequence[ObjectLike],
+    merge_objects: bool = False,
+) -> Tuple[MapObjectDiff, str, Optional[Dict[str, Any]]]:
+    """Choose the smallest content that writes the new objects.
+
+    The v2 map endpoint merges the top-level fields of ``content`` into the
+    map, so replacing objects only needs the ``objects`` field. Sending just
+    the added and changed objects relies on the endpoint also merging
+    objects keyed by ID, so it is opt-in and never used when objects were
+    removed (a merge cannot delete them). Maps with objects lacking IDs are
+    written in full, as before.
+
+    Args:
+        base: Current map data
+        objects: Objects that should be on the map
+        merge_objects: Send only added and changed objects when possible
+
+    Returns:
+        Tuple of the diff, the write mode and the content to send (None
+        when nothing needs to be written)
+    """
+    diff = diff_map_objects(base.objects, objects)
+    if diff.is_empty:
+        return diff, WRITE_NONE, None
+
+    if not diff.keyed:
+        return diff, WRITE_FULL, full_map_content(base, objects)
+
+    if merge_objects and not diff.removed:
+        return diff, WRITE_DELTA, {"objects": {**diff.added, **diff.changed}}
+
+    return diff, WRITE_OBJECTS, {"objects": [_dump(obj) for obj in objects]}
+
+
+@dataclass
+class MapWriteResult:
+    """Outcome of a diff-based map write."""
+
+    map_data: MapData
+    diff: MapObjectDiff
+    mode: str
+    bytes_sent: int
+    # Estimated for large maps (see estimate_full_size)
+    full_bytes: int
+
+    @property
+    def bytes_saved(self) -> int:
+        """Bytes not sent compared with writing the complete map."""
+        return self.full_bytes - self.bytes_sent
@@ -0,0 +1,428 @@
+"""Runtime metrics collected by the Gather.town API client."""
+
+import json
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from gather_manager.api.circuit_breaker import CIRCUIT_STATES, CLOSED
+from gather_manager.api.endpoints import ENDPOINT_CLASSES, OTHER
+
+# Upper bounds of the latency histogram buckets, in seconds
+DEFAULT_LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+# Status recorded for attempts that got no HTTP response
+STATUS_ERROR = "error"
+
+
+class ClientMetrics:
+    """Thread-safe named counters for a GatherClient."""
+
+    def __init__(self) -> None:
+        self._counters: Dict[str, float] = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, amount: float = 1) -> None:
+        """Add to a counter.
+
+        Args:
+            name: Counter name
+            amount: Amount to add
+        """
+        with self._lock:
+            self._counters[name] += amount
+
+    def get(self, name: str) -> float:
+        """Get the current value of a counter.
+
+        Args:
+            name: Counter name
+
+        Returns:
+            Counter value, 0 if it was never incremented
+        """
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def snapshot(self) -> Dict[str, float]:
+        """Get a copy of all counters.
+
+        Returns:
+            Dictionary of counter names to values
+        """
+        with self._lock:
+            return dict(self._counters)
+
+    def reset(self) -> None:
+        """Reset all counters to zero."""
+        with self._lock:
+            self._counters.clear()
+
+
+class LatencyHistogram:
+    """Cumulative-bucket latency histogram in the Prometheus style.
+
+    Not thread-safe on its own; EndpointMetrics guards it with its lock.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        """Initialize the histogram.
+
+        Args:
+            buckets: Increasing bucket upper bounds, in seconds. An
+                unbounded bucket is always added.
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """Record one duration.
+
+        Args:
+            seconds: Duration in seconds
+        """
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile by interpolating within its bucket.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Estimated duration in seconds, or None without observations
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[i - 1] if i else 0.0
+                if i == len(self.buckets):
+                    return lower  # Nothing is known above the last bound
+                return lower + (self.buckets[i] - lower) * (
+                    (rank - seen) / count
+                )
+            seen += count
+        return self.buckets[-1]
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """Get (upper bound, observations at or below it) per bucket.
+
+        Returns:
+            Pairs ending with the unbounded bucket, as ``float("inf")``
+        """
+        pairs = []
+        total = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+
+class _EndpointStats:
+    """Everything recorded for one endpoint class."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.calls = 0
+        self.requests = 0
+        self.statuses: Dict[str, int] = defaultdict(int)
+        self.latency = LatencyHistogram(buckets)
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.retries = 0
+        self.cache_hits: Dict[str, int] = defaultdict(int)
+        self.circuit_state = CLOSED
+        self.circuit_transitions: Dict[str, int] = defaultdict(int)
+        self.circuit_rejections = 0
+
+
+class EndpointMetrics:
+    """Thread-safe per-endpoint call, latency and traffic statistics.
+
+    Statistics are kept per logical endpoint class (see ``endpoints``):
+    ``calls`` counts client calls including those answered from a cache,
+    ``requests`` counts HTTP attempts actually sent, and latency, status
+    codes and byte counts describe those attempts.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        """Initialize the registry.
+
+        Args:
+            buckets: Latency histogram bucket upper bounds, in seconds
+        """
+        self.buckets = tuple(buckets)
+        self._stats: Dict[str, _EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, endpoint_class: str) -> _EndpointStats:
+        stats = self._stats.get(endpoint_class)
+        if stats is None:
+            stats = self._stats[endpoint_class] = _EndpointStats(self.buckets)
+        return stats
+
+    # === Recording ===
+
+    def record_call(self, endpoint_class: str) -> None:
+        """Count a client call to an endpoint.
+
+        Args:
+            endpoint_class: Logical endpoint class
+        """
+        with self._lock:
+            self._get(endpoint_class).calls += 1
+
+    def record_request(
+        self,
+        endpoint_class: str,
+        status: Any,
+        seconds: float,
+        request_bytes: int = 0,
+        response_bytes: int = 0,
+    ) -> None:
+        """Record one HTTP attempt.
+
+        Args:
+            endpoint_class: Logical endpoint class
+            status: HTTP status code, or STATUS_ERROR without a response
+            seconds: Time until the response (or failure), in seconds
+            request_bytes: Request body bytes sent
+            response_bytes: Response body bytes received
+        """
+        with self._lock:
+            stats = self._get(endpoint_class)
+            stats.requests += 1
+            stats.statuses[str(status)] += 1
+            stats.latency.observe(seconds)
+            stats.request_bytes += request_bytes
+            stats.response_bytes += response_bytes
+
+    def record_retry(self, endpoint_class: str) -> None:
+        """Count a retried attempt.
+
+        Args:
+            endpoint_class: Logical endpoint class
+        """
+        with self._lock:
+            self._get(endpoint_class).retries += 1
+
+    def record_cache_hit(self, endpoint_class: str, source: str) -> None:
+        """Count a call answered without a full response from the API.
+
+        Args:
+            endpoint_class: Logical endpoint class
+            source: Which cache answered, e.g. ``disk`` or ``coalesced``
+        """
+        with self._lock:
+            self._get(endpoint_class).cache_hits[source] += 1
+
+    def record_circuit_transition(
+        self, endpoint_class: str, state: str
+    ) -> None:
+        """Record a circuit breaker state change.
+
+        Args:
+            endpoint_class: Logical endpoint class
+            state: State the circuit moved to
+        """
+        with self._lock:
+            stats = self._get(endpoint_class)
+            stats.circuit_state = state
+            stats.circuit_transitions[state] += 1
+
+    def record_circuit_rejection(self, endpoint_class: str) -> None:
+        """Count a call rejected by an open circuit without being sent.
+
+        Args:
+            endpoint_class: Logical endpoint class
+        """
+        with self._lock:
+            self._get(endpoint_class).circuit_rejections += 1
+
+    def reset(self) -> None:
+        """Forget all recorded statistics."""
+        with self._lock:
+            self._stats.clear()
+
+    # === Reporting ===
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Get the statistics of every endpoint class seen so far.
+
+        Returns:
+            Dictionary keyed by endpoint class, in the order of
+            ``ENDPOINT_CLASSES``
+        """
+        order = {name: i for i, name in enumerate(ENDPOINT_CLASSES + (OTHER,))}
+        with self._lock:
+            return {
+                name: {
+                    "calls": stats.calls,
+                    "requests": stats.requests,
+                    "statuses": dict(sorted(stats.statuses.items())),
+                    "retries": stats.retries,
+                    "cache_hits": dict(sorted(stats.cache_hits.items())),
+                    "circuit": {
+                        "state": stats.circuit_state,
+                        "transitions": dict(
+                            sorted(stats.circuit_transitions.items())
+                        ),
+                        "rejections": stats.circuit_rejections,
+                    },
+                    "request_bytes": stats.request_bytes,
+                    "response_bytes": stats.response_bytes,
+                    "latency": {
+                        "count": stats.latency.count,
+                        "sum": stats.latency.sum,
+                        "p50": stats.latency.quantile(0.5),
+                        "p95": stats.latency.quantile(0.95),
+                        "p99": stats.latency.quantile(0.99),
+                        "buckets": {
+                            _format_bound(bound): count
+                            for bound, count in stats.latency.cumulative()
+                        },
+                    },
+                }
+                for name, stats in sorted(
+                    self._stats.items(),
+                    key=lambda item: order.get(item[0], len(order)),
+                )
+            }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Serialize the statistics as JSON.
+
+        Args:
+            indent: JSON indentation, or None for a single line
+
+        Returns:
+            JSON text of ``to_dict()``
+        """
+        return json.dumps(self.to_dict(), indent=indent)
+
+    def to_prometheus(self, prefix: str = "gather_client") -> str:
+        """Render the statistics in the Prometheus text exposition format.
+
+        Args:
+            prefix: Metric name prefix
+
+        Returns:
+            Exposition text, one sample per line
+        """
+        data = self.to_dict()
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help_text: str) -> str:
+            metric = f"{prefix}_{name}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            return metric
+
+        for key, help_text in (
+            ("calls", "Client calls, including cache hits"),
+            ("requests", "HTTP attempts sent"),
+            ("retries", "Attempts that were retries"),
+            ("request_bytes", "Request body bytes sent"),
+            ("response_bytes", "Response body bytes received"),
+        ):
+            metric = family(f"{key}_total", "counter", help_text)
+            for endpoint, stats in data.items():
+                lines.append(f'{metric}{{endpoint="{endpoint}"}} {stats[key]}')
+
+        metric = family("responses_total", "counter", "Attempts by status")
+        for endpoint, stats in data.items():
+            for status, count in stats["statuses"].items():
+                lines.append(
+                    f'{metric}{{endpoint="{endpoint}",status="{status}"}} '
+                    f"{count}"
+                )
+
+        metric = family(
+            "cache_hits_total", "counter", "Calls served by a cache"
+        )
+        for endpoint, stats in data.items():
+            for source, count in stats["cache_hits"].items():
+                lines.append(
+                    f'{metric}{{endpoint="{endpoint}",source="{source}"}} '
+                    f"{count}"
+                )
+
+        metric = family(
+            "circuit_state",
+            "gauge",
+            "1 for the current circuit breaker state",
+        )
+        for endpoint, stats in data.items():
+            for state in CIRCUIT_STATES:
+                value = int(stats["circuit"]["state"] == state)
+                lines.append(
+                    f'{metric}{{endpoint="{endpoint}",state="{state}"}} '
+                    f"{value}"
+                )
+
+        metric = family(
+            "circuit_transitions_total",
+            "counter",
+            "Circuit breaker state changes",
+        )
+        for endpoint, stats in data.items():
+            for state, count in stats["circuit"]["transitions"].items():
+                lines.append(
+                    f'{metric}{{endpoint="{endpoint}",state="{state}"}} '
+                    f"{count}"
+                )
+
+        metric = family(
+            "circuit_rejections_total",
+            "counter",
+            "Calls rejected by an open circuit",
+        )
+        for endpoint, stats in data.items():
+            lines.append(
+                f'{metric}{{endpoint="{endpoint}"}} '
+                f'{stats["circuit"]["rejections"]}'
+            )
+
+        metric = family(
+            "request_duration_seconds", "histogram", "HTTP attempt latency"
+        )
+        for endpoint, stats in data.items():
+            latency = stats["latency"]
+            for bound, count in latency["buckets"].items():
+                lines.append(
+                    f'{metric}_bucket{{endpoint="{endpoint}",le="{bound}"}} '
+                    f"{count}"
+                )
+            lines.append(
+                f'{metric}_sum{{endpoint="{endpoint}"}} {latency["sum"]}'
+            )
+            lines.append(
+                f'{metric}_count{{endpoint="{endpoint}"}} {latency["count"]}'
+            )
+
+        return "\n".join(lines) + "\n"
+
+
+def _format_bound(bound: float) -> str:
+    """Format a bucket bound the way Prometheus labels it."""
+    return "+Inf" if bound == float("inf") else repr(bound)
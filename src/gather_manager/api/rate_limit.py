@@ -0,0 +1,212 @@
+"""Client-side rate limiting for the Gather.town API."""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from gather_manager.api import endpoints
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    ``acquire`` reserves tokens immediately (the balance may go negative)
+    and then sleeps off the deficit outside the lock, so waiting callers are
+    served in the order they arrived instead of racing for each refill.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size)
+            clock: Monotonic time source, in seconds
+            sleep: Function used to wait for tokens
+
+        Raises:
+            ValueError: If rate or capacity is not positive.
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last update."""
+        now = self._clock()
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take tokens now and return how long the caller must wait.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds to wait before the reserved tokens are available
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Take tokens, blocking until they are available.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def drain(self) -> None:
+        """Empty the bucket, e.g. after the server reported a rate limit."""
+        with self._lock:
+            self._refill()
+            self._tokens = min(self._tokens, 0.0)
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available (negative while callers are queued)."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+class RateLimiter:
+    """Paces requests through per-endpoint-class token buckets.
+
+    Every request takes a token from the ``global`` bucket. Requests to
+    endpoints with a stricter documented limit also take a token from
+    their class bucket. One instance can be shared by several clients
+    (and by the threads of an AsyncGatherClient) to pace them together.
+    """
+
+    GLOBAL = "global"
+    USER_ID = endpoints.USER_ID
+
+    # Conservative default for all endpoints; Gather does not publish one
+    DEFAULT_GLOBAL_RATE = 20.0  # Requests per second
+    DEFAULT_GLOBAL_BURST = 40
+    # api/v2/user-id allows approximately 25 requests per 5 minutes
+    DEFAULT_USER_ID_RATE = 25 / 300
+    DEFAULT_USER_ID_BURST = 25
+
+    def __init__(self, buckets: Optional[Dict[str, TokenBucket]] = None):
+        """Initialize the rate limiter.
+
+        Args:
+            buckets: Buckets keyed by endpoint class (``RateLimiter.GLOBAL``,
+                ``RateLimiter.USER_ID``). Missing classes are not limited.
+                If not provided, Gather's default limits are used.
+        """
+        if buckets is None:
+            buckets = {
+                self.GLOBAL: TokenBucket(
+                    self.DEFAULT_GLOBAL_RATE, self.DEFAULT_GLOBAL_BURST
+                ),
+                self.USER_ID: TokenBucket(
+                    self.DEFAULT_USER_ID_RATE, self.DEFAULT_USER_ID_BURST
+                ),
+            }
+        self.buckets = buckets
+
+    @classmethod
+    def unlimited(cls) -> "RateLimiter":
+        """Create a rate limiter that never waits."""
+        return cls(buckets={})
+
+    @staticmethod
+    def classify(endpoint: str) -> Optional[str]:
+        """Get the strict endpoint class for an endpoint, if any.
+
+        Args:
+            endpoint: API endpoint path
+
+        Returns:
+            Endpoint class name, or None if only the global limit applies
+        """
+        if endpoints.classify_endpoint(endpoint) == endpoints.USER_ID:
+            return RateLimiter.USER_ID
+        return None
+
+    def _buckets_for(self, endpoint: str) -> List[TokenBucket]:
+        """Get the buckets a request must draw from, strictest first."""
+        buckets = []
+        endpoint_class = self.classify(endpoint)
+        if endpoint_class in self.buckets:
+            buckets.append(self.buckets[endpoint_class])
+        if self.GLOBAL in self.buckets:
+            buckets.append(self.buckets[self.GLOBAL])
+        return buckets
+
+    def acquire(self, endpoint: str) -> float:
+        """Wait until a request to the endpoint may be sent.
+
+        The strict class bucket is waited on before the global one, so
+        queued user-id lookups do not hold global tokens while they wait.
+
+        Args:
+            endpoint: API endpoint path
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        for bucket in self._buckets_for(endpoint):
+            waited += bucket.acquire()
+        if waited:
+            logger.debug(f"Rate limiter delayed {endpoint} by {waited:.2f}s")
+        return waited
+
+    def drain(self, endpoint: str) -> None:
+        """Empty the buckets for an endpoint after the server returned 429.
+
+        Args:
+            endpoint: API endpoint path
+        """
+        for bucket in self._buckets_for(endpoint):
+            bucket.drain()
+
+    def metrics(self) -> Dict[str, Dict[str, float]]:
+        """Get the current fill of every bucket.
+
+        Returns:
+            Dictionary keyed by endpoint class with tokens, capacity, rate
+            and fill ratio
+        """
+        return {
+            name: {
+                "tokens": bucket.tokens,
+                "capacity": bucket.capacity,
+                "rate": bucket.rate,
+                "fill_ratio": max(0.0, bucket.tokens) / bucket.capacity,
+            }
+            for name, bucket in self.buckets.items()
+        }
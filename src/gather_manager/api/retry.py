@@ -0,0 +1,162 @@
+"""Retry policy for transient Gather.town API failures."""
+
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, FrozenSet, Iterable, Optional
+
+import requests
+
+from gather_manager.utils.exceptions import GatherApiError
+
+
+class RetryPolicy:
+    """Decides whether and when a failed request is retried.
+
+    Delays follow an exponential curve (``backoff_base * backoff_factor **
+    (attempt - 1)``, capped at ``max_backoff``) with full jitter, and are
+    stretched to honor a server-provided ``Retry-After``. Only idempotent
+    requests are retried unless the caller opts in for a specific call.
+    """
+
+    DEFAULT_RETRY_STATUSES: FrozenSet[int] = frozenset(
+        {429, 500, 502, 503, 504}
+    )
+    IDEMPOTENT_METHODS: FrozenSet[str] = frozenset(
+        {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+    )
+    TRANSIENT_EXCEPTIONS = (
+        requests.exceptions.ConnectionError,
+        requests.exceptions.Timeout,
+        requests.exceptions.ChunkedEncodingError,
+    )
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        backoff_base: float = 0.5,
+        backoff_factor: float = 2.0,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 120.0,
+        retry_statuses: Optional[Iterable[int]] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Callable[[], float] = random.random,
+    ):
+        """Initialize the retry policy.
+
+        Args:
+            max_attempts: Total attempts per request, including the first
+            backoff_base: Delay before the first retry, in seconds
+            backoff_factor: Multiplier applied to the delay for each retry
+            max_backoff: Upper bound for the computed backoff, in seconds
+            jitter: Randomize each delay between 0 and the computed backoff
+            respect_retry_after: Wait at least as long as the server's
+                ``Retry-After`` header asks
+            max_retry_after: Upper bound for an honored ``Retry-After``
+            retry_statuses: HTTP status codes treated as transient
+            sleep: Function used to wait between attempts
+            rng: Random source returning floats in [0, 1)
+
+        Raises:
+            ValueError: If max_attempts is less than 1.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.retry_statuses = frozenset(
+            self.DEFAULT_RETRY_STATUSES
+            if retry_statuses is None
+            else retry_statuses
+        )
+        self.sleep = sleep
+        self._rng = rng
+
+    @classmethod
+    def disabled(cls) -> "RetryPolicy":
+        """Create a policy that never retries."""
+        return cls(max_attempts=1)
+
+    def is_retryable_method(
+        self, method: str, idempotent: Optional[bool] = None
+    ) -> bool:
+        """Check whether a request may be retried at all.
+
+        Args:
+            method: HTTP method
+            idempotent: Explicit override; None infers it from the method
+
+        Returns:
+            True if the request is safe to send more than once
+        """
+        if idempotent is not None:
+            return idempotent
+        return method.upper() in self.IDEMPOTENT_METHODS
+
+    def is_retryable_error(self, error: GatherApiError) -> bool:
+        """Check whether an error is transient.
+
+        Args:
+            error: Error raised for a failed attempt
+
+        Returns:
+            True for retryable status codes, connection resets and timeouts
+        """
+        if error.status_code is not None:
+            return error.status_code in self.retry_statuses
+        return isinstance(error.__cause__, self.TRANSIENT_EXCEPTIONS)
+
+    def get_backoff(
+        self, attempt: int, retry_after: Optional[float] = None
+    ) -> float:
+        """Get the delay before the next attempt.
+
+        Args:
+            attempt: Number of the attempt that just failed, starting at 1
+            retry_after: Server-requested delay in seconds, if any
+
+        Returns:
+            Seconds to wait before retrying
+        """
+        delay = min(
+            self.max_backoff,
+            self.backoff_base * self.backoff_factor ** (attempt - 1),
+        )
+        if self.jitter:
+            delay *= self._rng()
+        if self.respect_retry_after and retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_retry_after))
+        return delay
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header value.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+
+    Returns:
+        Delay in seconds, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
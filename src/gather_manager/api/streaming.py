@@ -0,0 +1,177 @@
+"""Incremental parsing of large map payloads."""
+
+import codecs
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from gather_manager.models.space import Object
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Consumed text kept in the buffer before it is trimmed
+_TRIM_THRESHOLD = 1024 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+
+class MapObjectStream:
+    """Yields the objects of a map document as it is read.
+
+    The document is read chunk by chunk and each element of its ``objects``
+    member (a list, or a dict keyed by object ID) is parsed and validated on
+    its own, so memory is bounded by the largest single object rather than
+    the whole map. Each value is parsed with the C JSON decoder; only the
+    structure between values is scanned in Python.
+
+    Top-level fields other than ``objects`` are collected in ``fields``.
+    Fields that come after ``objects`` in the document are only available
+    once iteration has finished.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]):
+        """Initialize the stream.
+
+        Args:
+            chunks: Raw document bytes, in pieces of any size
+        """
+        self.fields: Dict[str, Any] = {}
+        self.objects_seen = 0
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._started = False
+
+    # === Buffer management ===
+
+    def _read_more(self, min_size: int = 1) -> None:
+        """Append at least min_size more characters, or all that is left.
+
+        Raises:
+            ValueError: If the input has already ended.
+        """
+        if self._eof:
+            raise ValueError("Unexpected end of map data")
+        if self._pos > _TRIM_THRESHOLD:
+            self._buf = self._buf[self._pos :]
+            self._pos = 0
+
+        parts = [self._buf]
+        added = 0
+        while added < min_size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                parts.append(self._decoder.decode(b"", final=True))
+                self._eof = True
+                break
+            text = self._decoder.decode(chunk)
+            parts.append(text)
+            added += len(text)
+        self._buf = "".join(parts)
+
+    def _peek(self) -> str:
+        """Skip whitespace and get the next character."""
+        while True:
+            while (
+                self._pos < len(self._buf)
+                and self._buf[self._pos] in _WHITESPACE
+            ):
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            self._read_more()
+
+    def _expect(self, chars: str) -> str:
+        char = self._peek()
+        if char not in chars:
+            raise ValueError(
+                f"Expected one of {chars!r} at offset {self._pos}, "
+                f"found {char!r}"
+            )
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        """Parse the next complete JSON value, reading more as needed."""
+        self._peek()
+        needed = DEFAULT_CHUNK_SIZE
+        while True:
+            try:
+                value, end = self._json.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            else:
+                # A number at the end of the buffer may continue in the
+                # next chunk
+                if end < len(self._buf) or self._eof:
+                    self._pos = end
+                    return value
+            # Grow geometrically so huge values are not reparsed per chunk
+            self._read_more(needed)
+            needed *= 2
+
+    # === Document structure ===
+
+    def _iter_members(self, close: str) -> Iterator[Optional[str]]:
+        """Iterate over the members of the container just opened.
+
+        Yields each member's key (None in arrays) with the buffer positioned
+        at its value, which the caller must consume before resuming.
+        """
+        if self._peek() == close:
+            self._pos += 1
+            return
+        while True:
+            key = None
+            if close == "}":
+                key = self._value()
+                self._expect(":")
+            yield key
+            if self._expect("," + close) == close:
+                return
+
+    def __iter__(self) -> Iterator[Object]:
+        if self._started:
+            raise RuntimeError("A MapObjectStream can only be iterated once")
+        self._started = True
+
+        self._expect("{")
+        for key in self._iter_members("}"):
+            if key != "objects":
+                self.fields[key] = self._value()
+                continue
+
+            opener = self._peek()
+            if opener not in "[{":
+                self.fields[key] = self._value()
+                continue
+
+            self._pos += 1
+            close = "]" if opener == "[" else "}"
+            for object_id in self._iter_members(close):
+                data = self._value()
+                if object_id and isinstance(data, dict):
+                    data.setdefault("id", object_id)
+                self.objects_seen += 1
+                yield Object.model_validate(data)
+
+    def batches(self, size: int = 1000) -> Iterator[List[Object]]:
+        """Yield objects in lists of up to ``size``.
+
+        Args:
+            size: Maximum objects per batch
+
+        Yields:
+            Lists of objects
+        """
+        batch: List[Object] = []
+        for obj in self:
+            batch.append(obj)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
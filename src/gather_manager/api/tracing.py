@@ -0,0 +1,301 @@
+"""Pluggable tracing spans around API calls and service phases."""
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
+
+from gather_manager.utils.exceptions import ConfigurationError
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Arguments of traced functions recorded as span attributes by default
+DEFAULT_TRACED_ARGUMENTS = ("space_id", "map_id")
+
+
+class Span:
+    """A timed operation. The base class records nothing."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        """Attach a key/value pair to the span.
+
+        Args:
+            key: Attribute name
+            value: Attribute value (str, bool, int or float)
+        """
+
+    def record_exception(self, exception: BaseException) -> None:
+        """Mark the span as failed with an exception.
+
+        Args:
+            exception: The exception that ended the span
+        """
+
+
+class Tracer:
+    """Creates spans. The base class is a no-op and costs almost nothing."""
+
+    _NOOP_SPAN = Span()
+
+    def start_span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> ContextManager[Span]:
+        """Time the enclosed block as a span.
+
+        Args:
+            name: Span name
+            attributes: Initial span attributes
+
+        Returns:
+            Context manager yielding the span, for adding attributes
+        """
+        return nullcontext(self._NOOP_SPAN)
+
+
+class OpenTelemetryTracer(Tracer):
+    """Reports spans to OpenTelemetry.
+
+    Spans go to whichever tracer provider the application configured, so
+    they nest under the caller's spans and share its exporters.
+    """
+
+    def __init__(self, tracer: Any = None):
+        """Initialize the tracer.
+
+        Args:
+            tracer: An ``opentelemetry.trace.Tracer``. Defaults to the
+                global provider's tracer for this package.
+
+        Raises:
+            ConfigurationError: If opentelemetry-api is not installed.
+        """
+        if tracer is None:
+            try:
+                from opentelemetry import trace
+            except ImportError as e:
+                raise ConfigurationError(
+                    "OpenTelemetry tracing requires the opentelemetry-api "
+                    "package"
+                ) from e
+            tracer = trace.get_tracer("gather_manager")
+        self._tracer = tracer
+
+    @contextmanager
+    def start_span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Span]:
+        """Time the enclosed block as an OpenTelemetry span.
+
+        Args:
+            name: Span name
+            attributes: Initial span attributes
+
+        Yields:
+            The OpenTelemetry span, which has the same methods as Span
+        """
+        with self._tracer.start_as_current_span(
+            name, attributes=attributes
+        ) as span:
+            yield span
+
+
+class _ChromeSpan(Span):
+    """A span recorded as a Chrome complete ("X") event."""
+
+    def __init__(self, name: str, attributes: Optional[Dict[str, Any]]):
+        self.name = name
+        self.args: Dict[str, Any] = dict(attributes or {})
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.args[key] = value
+
+    def record_exception(self, exception: BaseException) -> None:
+        self.args["error"] = f"{type(exception).__name__}: {exception}"
+
+
+class ChromeTraceExporter(Tracer):
+    """Records spans and writes them as a Chrome trace-event JSON file.
+
+    Open the file in ``chrome://tracing`` or https://ui.perfetto.dev to see
+    a run as a timeline, with one track per thread.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        """Initialize the exporter.
+
+        Args:
+            path: Default file written by ``write()``
+            clock: Monotonic time source, in seconds
+        """
+        self.path = Path(path) if path else None
+        self._clock = clock
+        self._origin = clock()
+        self._events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def start_span(
+        self, name: str, attributes: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Span]:
+        """Time the enclosed block as a trace event.
+
+        Args:
+            name: Span name; the part before the first dot is its category
+            attributes: Initial span attributes, shown as event args
+
+        Yields:
+            The span, for adding attributes
+        """
+        span = _ChromeSpan(name, attributes)
+        started = self._clock()
+        try:
+            yield span
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+        finally:
+            ended = self._clock()
+            event = {
+                "name": name,
+                "cat": name.split(".", 1)[0],
+                "ph": "X",
+                "ts": (started - self._origin) * 1e6,
+                "dur": (ended - started) * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": span.args,
+            }
+            with self._lock:
+                self._events.append(event)
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        """Copies of the events recorded so far, in completion order."""
+        with self._lock:
+            return [dict(event) for event in self._events]
+
+    def write(self, path: Optional[Union[str, Path]] = None) -> Path:
+        """Write the recorded events to a trace file.
+
+        Args:
+            path: Output file, defaults to the path given at construction
+
+        Returns:
+            The path written
+
+        Raises:
+            ValueError: If no path was given here or at construction.
+        """
+        path = Path(path) if path else self.path
+        if path is None:
+            raise ValueError("No trace file path given")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"traceEvents": self.events, "displayTimeUnit": "ms"},
+                f,
+                default=str,
+            )
+        return path
+
+
+_tracer: Tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer (a no-op Tracer unless one was set)."""
+    return _tracer
+
+
+def set_tracer(tracer: Optional[Tracer]) -> Tracer:
+    """Install the process-wide tracer.
+
+    Args:
+        tracer: Tracer to use, or None to go back to no tracing
+
+    Returns:
+        The previously installed tracer
+    """
+    global _tracer
+    previous = _tracer
+    _tracer = tracer or Tracer()
+    return previous
+
+
+def span(name: str, **attributes: Any) -> ContextManager[Span]:
+    """Start a span on the installed tracer.
+
+    Args:
+        name: Span name, e.g. ``gather.request``
+        **attributes: Initial span attributes; None values are left out
+
+    Returns:
+        Context manager yielding the span
+    """
+    return _tracer.start_span(
+        name,
+        {key: value for key, value in attributes.items() if value is not None},
+    )
+
+
+def traced(
+    name: str, arguments: Sequence[str] = DEFAULT_TRACED_ARGUMENTS
+) -> Callable[[F], F]:
+    """Decorate a function or coroutine function to run in a span.
+
+    Args:
+        name: Span name
+        arguments: Parameters recorded as span attributes when the
+            function has them
+
+    Returns:
+        The decorator
+    """
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+        recorded = [arg for arg in arguments if arg in signature.parameters]
+
+        def attributes(args: Any, kwargs: Any) -> Dict[str, Any]:
+            if not recorded:
+                return {}
+            bound = signature.bind_partial(*args, **kwargs).arguments
+            return {arg: bound.get(arg) for arg in recorded}
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with span(name, **attributes(args, kwargs)):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(name, **attributes(args, kwargs)):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
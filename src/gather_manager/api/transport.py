@@ -0,0 +1,70 @@
+"""In-process transports that stand in for the network under GatherClient."""
+
+import io
+from typing import Mapping, Optional, Tuple, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+# Status, headers and body of a response produced by a Transport
+TransportResponse = Tuple[int, Mapping[str, str], bytes]
+
+
+class Transport(HTTPAdapter):
+    """Base class for transports that answer requests in-process.
+
+    A transport is a ``requests`` adapter, so it is mounted on the client's
+    session (see ``GatherClient(transport=...)``) and everything above it,
+    from rate limiting and retries to compression and caching, runs exactly
+    as it does against the real API. Subclasses implement ``handle``.
+    """
+
+    def handle(self, request: requests.PreparedRequest) -> TransportResponse:
+        """Produce the response to a request.
+
+        Args:
+            request: The prepared request, with its body encoded
+
+        Returns:
+            Tuple of status code, headers and (possibly encoded) body bytes
+        """
+        raise NotImplementedError
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Union[
+            None, float, Tuple[Optional[float], Optional[float]]
+        ] = None,
+        verify: Union[bool, str] = True,
+        cert: Optional[Union[str, Tuple[str, str]]] = None,
+        proxies: Optional[Mapping[str, str]] = None,
+    ) -> requests.Response:
+        """Answer a request without opening a connection.
+
+        Args:
+            request: The prepared request
+            stream: Whether the caller reads the body incrementally
+            timeout: Ignored; transports decide their own timing
+            verify: Ignored
+            cert: Ignored
+            proxies: Ignored
+
+        Returns:
+            The response, with a urllib3 body so content decoding and
+            streaming behave as they do over the network
+        """
+        status, headers, body = self.handle(request)
+        headers = {"Content-Length": str(len(body)), **headers}
+        raw = HTTPResponse(
+            body=io.BytesIO(body),
+            headers=headers,
+            status=status,
+            preload_content=False,
+            decode_content=True,
+            request_method=request.method,
+            request_url=request.url,
+        )
+        return self.build_response(request, raw)
@@ -0,0 +1,244 @@
+"""Persistent cache of email to Gather user ID lookups."""
+
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Union
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class UserIdEntry:
+    """Cached result of a user-id lookup."""
+
+    email: str
+    user_id: Optional[str]
+    stored_at: float
+
+    @property
+    def found(self) -> bool:
+        """Whether the lookup found a user (False for negative entries)."""
+        return self.user_id is not None
+
+
+class UserIdCache:
+    """SQLite-backed cache of email to user ID lookups.
+
+    The api/v2/user-id endpoint allows only ~25 requests per 5 minutes, so
+    lookups are remembered across runs. Each operation opens its own
+    connection and SQLite serializes writers, so the cache can be shared by
+    threads and by concurrent CLI invocations. Lookups that found no user
+    are only cached when ``negative_ttl`` is set.
+
+    Entries are keyed by the API base URL as well as the email address, so
+    that IDs from different Gather deployments do not mix. If the database
+    cannot be created or opened, a warning is logged and the cache behaves
+    as if it were empty.
+    """
+
+    DEFAULT_PATH = Path.home() / ".gather-manager" / "user_ids.sqlite3"
+    DEFAULT_TTL = 30 * 24 * 3600  # User IDs do not change
+    BUSY_TIMEOUT = 30.0  # Seconds to wait for another process's write
+    SCHEMA_VERSION = 2  # Version 1 keyed entries by email alone
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_PATH,
+        ttl: Optional[float] = DEFAULT_TTL,
+        negative_ttl: Optional[float] = None,
+        refresh: bool = False,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize the cache. The database is created on first use.
+
+        Args:
+            path: SQLite database file
+            ttl: Seconds a found user ID stays valid, or None to keep it
+                forever
+            negative_ttl: Seconds a "user not found" result stays valid, or
+                None to not cache negative results
+            refresh: Ignore existing entries but still store new lookups
+            clock: Wall-clock time source, in seconds
+        """
+        self.path = Path(path).expanduser()
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.refresh = refresh
+        self._clock = clock
+        self._init_lock = threading.Lock()
+        self._initialized = False
+        self._unavailable = False
+
+    @staticmethod
+    def _normalize(email: str) -> str:
+        return email.strip().lower()
+
+    @staticmethod
+    def _normalize_url(base_url: str) -> str:
+        return base_url.rstrip("/")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, creating the database on first use.
+
+        Raises:
+            OSError: If the database directory cannot be created
+            sqlite3.Error: If the database cannot be opened or created
+        """
+        with self._init_lock:
+            if not self._initialized:
+                try:
+                    self._create()
+                except (OSError, sqlite3.Error):
+                    # Later operations skip the cache instead of failing
+                    self._unavailable = True
+                    raise
+                self._initialized = True
+
+        with closing(self._open()) as conn, conn:
+            yield conn
+
+    def _create(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._open()) as conn, conn:
+            (version,) = conn.execute("PRAGMA user_version").fetchone()
+            if version < self.SCHEMA_VERSION:
+                # Older entries have no base URL; they are only a cache
+                conn.execute("DROP TABLE IF EXISTS user_ids")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS user_ids ("
+                "base_url TEXT NOT NULL, "
+                "email TEXT NOT NULL, "
+                "user_id TEXT, "
+                "stored_at REAL NOT NULL, "
+                "PRIMARY KEY (base_url, email))"
+            )
+            conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+
+    def _open(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.path), timeout=self.BUSY_TIMEOUT)
+
+    def get(self, email: str, base_url: str = "") -> Optional[UserIdEntry]:
+        """Get a valid cached lookup.
+
+        Args:
+            email: Email address that was looked up
+            base_url: API base URL the lookup was sent to
+
+        Returns:
+            The cached entry (``user_id`` is None for a negative entry), or
+            None on a miss
+        """
+        if self.refresh or self._unavailable:
+            return None
+
+        email = self._normalize(email)
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT user_id, stored_at FROM user_ids "
+                    "WHERE base_url = ? AND email = ?",
+                    (self._normalize_url(base_url), email),
+                ).fetchone()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Failed to read user ID cache: {str(e)}")
+            return None
+        if row is None:
+            return None
+
+        user_id, stored_at = row
+        ttl = self.ttl if user_id is not None else self.negative_ttl
+        if user_id is None and ttl is None:
+            return None
+        if ttl is not None and self._clock() - stored_at > ttl:
+            return None
+        return UserIdEntry(email=email, user_id=user_id, stored_at=stored_at)
+
+    def set(
+        self, email: str, user_id: Optional[str], base_url: str = ""
+    ) -> None:
+        """Store a lookup result.
+
+        Args:
+            email: Email address that was looked up
+            user_id: The user's ID, or None if no user was found. Negative
+                results are ignored unless negative_ttl is set.
+            base_url: API base URL the lookup was sent to
+        """
+        if user_id is None and self.negative_ttl is None:
+            return
+
+        self.set_many({email: user_id}, base_url=base_url)
+
+    def set_many(
+        self, user_ids: Dict[str, Optional[str]], base_url: str = ""
+    ) -> None:
+        """Store several lookup results in one transaction.
+
+        Args:
+            user_ids: User IDs keyed by email address
+            base_url: API base URL the lookups were sent to
+        """
+        if not user_ids or self._unavailable:
+            return
+
+        base_url = self._normalize_url(base_url)
+        now = self._clock()
+        rows = [
+            (base_url, self._normalize(email), user_id, now)
+            for email, user_id in user_ids.items()
+        ]
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO user_ids "
+                    "(base_url, email, user_id, stored_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Failed to write user ID cache: {str(e)}")
+
+    def invalidate(self, email: str, base_url: Optional[str] = None) -> None:
+        """Forget the lookup for an email address.
+
+        Args:
+            email: Email address to forget
+            base_url: Only forget the lookup sent to this API base URL, or
+                None to forget it for every base URL
+        """
+        query = "DELETE FROM user_ids WHERE email = ?"
+        args = [self._normalize(email)]
+        if base_url is not None:
+            query += " AND base_url = ?"
+            args.append(self._normalize_url(base_url))
+        self._execute(query, args)
+
+    def clear(self) -> None:
+        """Forget every lookup."""
+        self._execute("DELETE FROM user_ids")
+
+    def _execute(self, query: str, args: Sequence[Any] = ()) -> None:
+        if self._unavailable:
+            return
+        try:
+            with self._connect() as conn:
+                conn.execute(query, args)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Failed to write user ID cache: {str(e)}")
+
+    def __len__(self) -> int:
+        if self._unavailable:
+            return 0
+        try:
+            with self._connect() as conn:
+                row = conn.execute("SELECT COUNT(*) FROM user_ids").fetchone()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Failed to read user ID cache: {str(e)}")
+            return 0
+        return int(row[0])
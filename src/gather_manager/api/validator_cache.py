@@ -0,0 +1,157 @@
+"""HTTP validator cache for conditional GETs of map data."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Hashable, Optional
+
+
+@dataclass(frozen=True)
+class ValidatorEntry:
+    """Validators and body of the last response seen for a resource."""
+
+    body: bytes
+    content_hash: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @classmethod
+    def from_response(
+        cls, body: bytes, headers: Dict[str, str]
+    ) -> "ValidatorEntry":
+        """Build an entry from a response body and its headers.
+
+        Args:
+            body: Raw response body
+            headers: Response headers (case-insensitive mapping)
+
+        Returns:
+            A ValidatorEntry for the response
+        """
+        return cls(
+            body=body,
+            content_hash=hash_content(body),
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Get the request headers that revalidate this entry.
+
+        Returns:
+            If-None-Match / If-Modified-Since headers; empty if the server
+            sent no validators
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def hash_content(body: bytes) -> str:
+    """Hash a response body to detect unchanged content.
+
+    Args:
+        body: Raw response body
+
+    Returns:
+        Hex digest of the body
+    """
+    return hashlib.sha256(body).hexdigest()
+
+
+class ValidatorCache:
+    """Thread-safe LRU of ValidatorEntry objects.
+
+    Entries keep the whole response body, so the cache is bounded by the
+    total size of the bodies as well as by their number.
+    """
+
+    DEFAULT_MAX_ENTRIES = 256
+    DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of resources to remember. 0 disables
+                the cache.
+            max_bytes: Maximum total size of the cached bodies. Bodies
+                larger than this are not cached.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, ValidatorEntry]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[ValidatorEntry]:
+        """Get the entry for a resource and mark it recently used.
+
+        Args:
+            key: Resource key, e.g. (space_id, map_id)
+
+        Returns:
+            The cached entry, or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Hashable, entry: ValidatorEntry) -> None:
+        """Store the entry for a resource, evicting the oldest if full.
+
+        Args:
+            key: Resource key, e.g. (space_id, map_id)
+            entry: Entry to store
+        """
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old.body)
+            if self.max_entries <= 0 or len(entry.body) > self.max_bytes:
+                return
+            self._entries[key] = entry
+            self._size += len(entry.body)
+            while (
+                len(self._entries) > self.max_entries
+                or self._size > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.body)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Forget a resource, e.g. after writing to it.
+
+        Args:
+            key: Resource key, e.g. (space_id, map_id)
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._size -= len(entry.body)
+
+    def clear(self) -> None:
+        """Forget all resources."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Total size of the cached bodies, in bytes."""
+        with self._lock:
+            return self._size
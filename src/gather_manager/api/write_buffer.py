@@ -0,0 +1,569 @@
+"""Write-behind buffer that coalesces map mutations into one write per map."""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from gather_manager.api.client import GatherClient
+from gather_manager.api.map_diff import (
+    WRITE_FIELDS,
+    WRITE_FULL,
+    WRITE_NONE,
+    MapWriteResult,
+    encoded_size,
+    estimate_full_size,
+    plan_map_write,
+)
+from gather_manager.models.space import MapData, Object
+from gather_manager.utils.exceptions import MapConflictError, MapFlushError
+
+logger = logging.getLogger(__name__)
+
+MapKey = Tuple[str, str]
+Mutation = Callable[[MapData], MapData]
+
+# What to do when a map changed after buffered edits were based on it
+CONFLICT_RAISE = "raise"  # Keep the edits buffered and raise
+CONFLICT_REBASE = "rebase"  # Replay the edits onto the current map
+CONFLICT_OVERWRITE = "overwrite"  # Replay onto the version first read
+
+
+def _fingerprint(map_data: MapData) -> str:
+    """Hash the content of a map to detect changes between reads."""
+    encoded = json.dumps(map_data.model_dump(), sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+@dataclass
+class _PendingMap:
+    """Buffered mutations for one map and the version they are based on."""
+
+    base: MapData
+    fingerprint: str
+    mutations: List[Mutation] = field(default_factory=list)
+    first_at: float = 0.0
+    # Set when a flush found the map changed; cleared by rebase()
+    conflicted: bool = False
+
+
+class MapWriteBuffer:
+    """Accumulates map mutations and writes each map once.
+
+    Mutations are queued per (space, map) and replayed in order at flush
+    time, so a batch of edits becomes a single POST containing only what
+    changed (see ``map_diff``). The map is read when its first mutation is
+    queued; before writing, it is read again (a cheap conditional GET) and
+    compared with that version to detect concurrent edits.
+
+    A map is flushed when it has ``max_mutations`` pending mutations, when a
+    mutation is queued more than ``max_delay`` seconds after its first one,
+    on ``flush()``/``flush_due()``, and when the buffer is used as a context
+    manager and the block exits without an error; if it raises, the pending
+    edits are discarded. ``max_delay`` is only checked at those points
+    unless ``flush_interval`` is set, which starts a background thread that
+    flushes maps past it, so that an idle buffer does not hold edits
+    indefinitely. Call ``close()`` to stop the thread.
+
+    With CONFLICT_RAISE, the edits to a map that changed stay buffered and
+    every flush of it raises until ``rebase()`` replays them onto the
+    current map or ``discard()`` drops them. The background thread logs
+    such a conflict once and then skips the map.
+    """
+
+    DEFAULT_MAX_MUTATIONS = 100
+    DEFAULT_MAX_DELAY = 5.0
+
+    def __init__(
+        self,
+        client: GatherClient,
+        max_mutations: int = DEFAULT_MAX_MUTATIONS,
+        max_delay: Optional[float] = DEFAULT_MAX_DELAY,
+        on_conflict: str = CONFLICT_RAISE,
+        merge_objects: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+        flush_interval: Optional[float] = None,
+    ):
+        """Initialize the buffer.
+
+        Args:
+            client: Client used to read and write maps
+            max_mutations: Pending mutations per map that trigger a flush
+            max_delay: Seconds after the first pending mutation of a map
+                after which it is flushed, or None for no time limit
+            on_conflict: CONFLICT_RAISE, CONFLICT_REBASE or
+                CONFLICT_OVERWRITE
+            merge_objects: Send only added and changed objects where
+                possible (see ``GatherClient.apply_map_objects``)
+            clock: Monotonic time source, in seconds
+            flush_interval: Seconds between background checks for maps
+                past max_delay, or None to check only when a mutation is
+                queued or ``flush_due()`` is called
+
+        Raises:
+            ValueError: If on_conflict is not a known policy, or
+                flush_interval is set without max_delay.
+        """
+        if on_conflict not in (
+            CONFLICT_RAISE,
+            CONFLICT_REBASE,
+            CONFLICT_OVERWRITE,
+        ):
+            raise ValueError(f"Unknown conflict policy: {on_conflict}")
+        if flush_interval is not None and max_delay is None:
+            raise ValueError("flush_interval requires a max_delay")
+
+        self.client = client
+        self.max_mutations = max_mutations
+        self.max_delay = max_delay
+        self.on_conflict = on_conflict
+        self.merge_objects = merge_objects
+        self._clock = clock
+        self._pending: Dict[MapKey, _PendingMap] = {}
+        # Guards _pending; never held across a request
+        self._lock = threading.RLock()
+        # One per map, held while it is read and written so that a map is
+        # not flushed twice at once
+        self._map_locks: Dict[MapKey, threading.Lock] = {}
+        self.flush_interval = flush_interval
+        self._closed = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if flush_interval is not None:
+            self._flusher = threading.Thread(
+                target=self._run_flusher,
+                name="map-write-buffer-flusher",
+                daemon=True,
+            )
+            self._flusher.start()
+
+    # === Mutations ===
+
+    def update_map(
+        self,
+        space_id: str,
+        map_id: str,
+        map_data: Union[MapData, Dict[str, Any]],
+    ) -> None:
+        """Queue setting top-level map fields.
+
+        Args:
+            space_id: ID of the space
+            map_id: ID of the map
+            map_data: A complete MapData, or a dictionary of fields to set
+        """
+        fields = (
+            map_data.model_dump()
+            if isinstance(map_data, MapData)
+            else dict(map_data)
+        )
+
+        def apply(current: MapData) -> MapData:
+            return MapData.model_validate({**current.model_dump(), **fields})
+
+        self._queue(space_id, map_id, apply)
+
+    def update_map_background(
+        self, space_id: str, map_id: str, background: str
+    ) -> None:
+        """Queue changing the background of a map.
+
+        Args:
+            space_id: ID of the space
+            map_id: ID of the map
+            background: New background identifier or URL
+        """
+        self.update_map(space_id, map_id, {"background": background})
+
+    def update_map_objects(
+        self, space_id: str, map_id: str, objects: List[Object]
+    ) -> None:
+        """Queue replacing all objects of a map.
+
+        Args:
+            space_id: ID of the space
+            map_id: ID of the map
+            objects: Objects that should be on the map
+        """
+        objects = [
+            obj if isinstance(obj, Object) else Object.model_validate(obj)
+            for obj in objects
+        ]
+
+        def apply(current: MapData) -> MapData:
+            return current.model_copy(update={"objects": objects})
+
+        self._queue(space_id, map_id, apply)
+
+    def upsert_object(
+        self, space_id: str, map_id: str, obj: Union[Object, Dict[str, Any]]
+    ) -> None:
+        """Queue adding an object, or replacing the object with its ID.
+
+        Args:
+            space_id: ID of the space
+            map_id: ID of the map
+            obj: Object with an ID
+
+        Raises:
+            ValueError: If the object has no ID.
+        """
+        obj = obj if isinstance(obj, Object) else Object.model_validate(obj)
+        if not obj.id:
+            raise ValueError("Buffered objects must have an id")
+
+        def apply(current: MapData) -> MapData:
+            objects = list(current.objects)
+            for i, existing in enumerate(objects):
+                if existing.id == obj.id:
+                    objects[i] = obj
+                    break
+            else:
+                objects.append(obj)
+            return current.model_copy(update={"objects": objects})
+
+        self._queue(space_id, map_id, apply)
+
+    def remove_object(
+        self, space_id: str, map_id: str, object_id: str
+    ) -> None:
+        """Queue removing an object by ID.
+
+        Args:
+            space_id: ID of the space
+            map_id: ID of the map
+            object_id: ID of the object to remove
+        """
+
+        def apply(current: MapData) -> MapData:
+            objects = [o for o in current.objects if o.id != object_id]
+            return current.model_copy(update={"objects": objects})
+
+        self._queue(space_id, map_id, apply)
+
+    def _queue(self, space_id: str, map_id: str, mutation: Mutation) -> None:
+        """Add a mutation, flushing the map if it reached a limit."""
+        key = (space_id, map_id)
+        base: Optional[MapData] = None
+        while True:
+            with self._lock:
+                pending = self._pending.get(key)
+                if pending is None and base is not None:
+                    pending = self._pending[key] = _PendingMap(
+                        base=base,
+                        fingerprint=_fingerprint(base),
+                        first_at=self._clock(),
+                    )
+                if pending is not None:
+                    pending.mutations.append(mutation)
+                    full = len(pending.mutations) >= self.max_mutations
+                    flush = full or self._is_due(pending)
+                    break
+            # Read the version the edits are based on without the lock held
+            base = self.client.get_map_data(space_id, map_id)
+
+        if flush:
+            self._flush_map(key)
+
+    def _is_due(self, pending: _PendingMap) -> bool:
+        return (
+            self.max_delay is not None
+            and self._clock() - pending.first_at >= self.max_delay
+        )
+
+    # === Flushing ===
+
+    def pending(self) -> Dict[MapKey, int]:
+        """Get the number of pending mutations per (space, map)."""
+        with self._lock:
+            return {
+                key: len(pending.mutations)
+                for key, pending in self._pending.items()
+            }
+
+    def flush(
+        self, space_id: Optional[str] = None, map_id: Optional[str] = None
+    ) -> Dict[MapKey, MapWriteResult]:
+        """Write pending mutations.
+
+        Args:
+            space_id: Only flush maps in this space
+            map_id: Only flush this map (with space_id)
+
+        Returns:
+            Write results keyed by (space, map)
+
+        Raises:
+            MapFlushError: If some maps could not be written, after all of
+                them were tried. Its ``errors`` hold the error of each such
+                map, and its ``results`` the maps that were written. The
+                mutations of a failed map stay buffered. A MapConflictError
+                means the map changed since it was first read and the policy
+                is CONFLICT_RAISE; call ``rebase()`` to apply the mutations
+                to the current map or ``discard()`` to drop them. A
+                GatherApiError means the map could not be read or written.
+        """
+        with self._lock:
+            keys = [
+                key
+                for key in self._pending
+                if (space_id is None or key[0] == space_id)
+                and (map_id is None or key[1] == map_id)
+            ]
+        return self._flush_maps(keys)
+
+    def flush_due(self) -> Dict[MapKey, MapWriteResult]:
+        """Write the maps whose oldest pending mutation is past max_delay.
+
+        Returns:
+            Write results keyed by (space, map)
+
+        Raises:
+            MapFlushError: If some maps could not be written (see
+                ``flush()``)
+        """
+        return self._flush_maps(self._due_keys())
+
+    def _flush_maps(self, keys: List[MapKey]) -> Dict[MapKey, MapWriteResult]:
+        """Flush each map, raising the errors once all were tried."""
+        results: Dict[MapKey, MapWriteResult] = {}
+        errors: Dict[MapKey, Exception] = {}
+        for key in keys:
+            try:
+                result = self._flush_map(key)
+            except Exception as e:
+                errors[key] = e
+                continue
+            if result is not None:
+                results[key] = result
+
+        if errors:
+            failed = ", ".join(
+                f"{map_id} ({e})" for (_, map_id), e in errors.items()
+            )
+            raise MapFlushError(
+                f"Failed to flush {len(errors)} of {len(keys)} maps: {failed}",
+                results=results,
+                errors=errors,
+            )
+        return results
+
+    def _due_keys(self) -> List[MapKey]:
+        """Get the maps whose oldest pending mutation is past max_delay."""
+        with self._lock:
+            return [
+                key
+                for key, pending in self._pending.items()
+                if self._is_due(pending)
+            ]
+
+    def discard(
+        self, space_id: Optional[str] = None, map_id: Optional[str] = None
+    ) -> Dict[MapKey, int]:
+        """Drop pending mutations without writing them.
+
+        Args:
+            space_id: Only discard edits to maps in this space
+            map_id: Only discard edits to this map (with space_id)
+
+        Returns:
+            Number of dropped mutations keyed by (space, map)
+        """
+        with self._lock:
+            keys = [
+                key
+                for key in self._pending
+                if (space_id is None or key[0] == space_id)
+                and (map_id is None or key[1] == map_id)
+            ]
+            return {key: len(self._pending.pop(key).mutations) for key in keys}
+
+    def rebase(self, space_id: str, map_id: str) -> None:
+        """Base a map's pending mutations on its current version.
+
+        The map is read again and the next flush replays the mutations onto
+        it, keeping changes made by others since the edits were queued.
+        Use this after a flush raised MapConflictError.
+
+        Args:
+            space_id: ID of the space
+            map_id: ID of the map
+
+        Raises:
+            GatherApiError: If the map cannot be read
+        """
+        key = (space_id, map_id)
+        with self._map_lock(key):
+            with self._lock:
+                if key not in self._pending:
+                    return
+            current = self.client.get_map_data(space_id, map_id, fresh=True)
+            with self._lock:
+                pending = self._pending.get(key)
+                if pending is not None:
+                    pending.base = current
+                    pending.fingerprint = _fingerprint(current)
+                    pending.conflicted = False
+
+    def _run_flusher(self) -> None:
+        """Flush due maps every flush_interval seconds until closed."""
+        while not self._closed.wait(self.flush_interval):
+            for key in self._due_keys():
+                try:
+                    self._flush_map(key, skip_conflicted=True)
+                except MapConflictError as e:
+                    # Retrying cannot help until the edits are rebased
+                    logger.error(
+                        f"Background flush of map {key[1]} failed: {str(e)}; "
+                        "call rebase() or discard() to resolve it"
+                    )
+                except Exception as e:
+                    # The edits stay buffered and are retried on the next tick
+                    logger.error(
+                        f"Background flush of map {key[1]} failed: {str(e)}"
+                    )
+
+    def close(self) -> None:
+        """Stop the background flush thread, if any.
+
+        Pending mutations stay buffered; call ``flush()`` first to write
+        them.
+        """
+        self._closed.set()
+        if self._flusher is not None:
+            self._flusher.join()
+            self._flusher = None
+
+    def _map_lock(self, key: MapKey) -> threading.Lock:
+        with self._lock:
+            return self._map_locks.setdefault(key, threading.Lock())
+
+    def _flush_map(
+        self, key: MapKey, skip_conflicted: bool = False
+    ) -> Optional[MapWriteResult]:
+        """Replay one map's mutations and write the result.
+
+        The pending state is copied under the lock and the map is read and
+        written without it, so that mutations can be queued meanwhile; they
+        stay buffered, based on the written version.
+
+        Returns:
+            The write result, or None if there was nothing to flush
+        """
+        space_id, map_id = key
+        with self._map_lock(key):
+            with self._lock:
+                pending = self._pending.get(key)
+                if pending is None or (skip_conflicted and pending.conflicted):
+                    return None
+                base = pending.base
+                fingerprint = pending.fingerprint
+                mutations = list(pending.mutations)
+
+            # Revalidate with the server, not a cached or shared read
+            current = self.client.get_map_data(space_id, map_id, fresh=True)
+            if _fingerprint(current) != fingerprint:
+                if self.on_conflict == CONFLICT_RAISE:
+                    with self._lock:
+                        pending.conflicted = True
+                    raise MapConflictError(
+                        f"Map '{map_id}' in space '{space_id}' changed since "
+                        f"{len(mutations)} buffered edits were based on it",
+                        space_id=space_id,
+                        map_id=map_id,
+                    )
+                logger.warning(
+                    f"Map {map_id} changed since it was read; "
+                    f"applying buffered edits with policy '{self.on_conflict}'"
+                )
+                if self.on_conflict == CONFLICT_REBASE:
+                    base = current
+
+            target = base.model_copy(deep=True)
+            for mutation in mutations:
+                target = mutation(target)
+
+            result = self._write(space_id, map_id, current, target)
+            with self._lock:
+                # The entry may have been discarded while it was written
+                if self._pending.get(key) is pending:
+                    del pending.mutations[: len(mutations)]
+                    if pending.mutations:
+                        pending.base = target
+                        pending.fingerprint = _fingerprint(target)
+                        pending.first_at = self._clock()
+                        pending.conflicted = False
+                    else:
+                        del self._pending[key]
+
+        self.client.metrics.increment(
+            "buffered_mutations_flushed", len(mutations)
+        )
+        return result
+
+    def _write(
+        self,
+        space_id: str,
+        map_id: str,
+        current: MapData,
+        target: MapData,
+    ) -> MapWriteResult:
+        """Send the difference between the current and target map."""
+        current_fields = current.model_dump(exclude={"objects"})
+        content = {
+            name: value
+            for name, value in target.model_dump(exclude={"objects"}).items()
+            if current_fields.get(name) != value
+        }
+        diff, mode, objects_content = plan_map_write(
+            current, target.objects, self.merge_objects
+        )
+        if mode == WRITE_FULL:
+            content = target.model_dump()
+        elif objects_content:
+            content.update(objects_content)
+        elif content:
+            mode = WRITE_FIELDS
+
+        if content:
+            map_data = self.client.update_map(space_id, map_id, content)
+            bytes_sent = encoded_size(content)
+        else:
+            map_data, bytes_sent, mode = target, 0, WRITE_NONE
+        full_bytes = (
+            bytes_sent
+            if mode == WRITE_FULL
+            else estimate_full_size(target, target.objects)
+        )
+
+        self.client.metrics.increment(f"map_writes_{mode}")
+        self.client.metrics.increment("map_write_bytes_sent", bytes_sent)
+        self.client.metrics.increment(
+            "map_write_bytes_saved", full_bytes - bytes_sent
+        )
+        return MapWriteResult(
+            map_data=map_data,
+            diff=diff,
+            mode=mode,
+            bytes_sent=bytes_sent,
+            full_bytes=full_bytes,
+        )
+
+    def __enter__(self) -> "MapWriteBuffer":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        try:
+            if exc_info[0] is None:
+                self.flush()
+            else:
+                discarded = self.discard()
+                if discarded:
+                    logger.warning(
+                        f"Discarding buffered edits for {len(discarded)} "
+                        "maps after an error"
+                    )
+        finally:
+            self.close()
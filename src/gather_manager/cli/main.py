@@ -53,18 +53,35 @@ def load_config():
 load_environment()
 load_config()
 
+import asyncio
+import json
 import logging
-from typing import List, Optional
+from typing import Any, ContextManager, Dict, List, Optional, TypeVar
+
+import click
 
 import typer
 from rich.console import Console
+from rich.live import Live
 from rich.logging import RichHandler
 from rich.prompt import Confirm, Prompt
 from rich.table import Table
 
 from gather_manager import __version__
+from gather_manager.api.cassette import Cassette, CassettePlayer
 from gather_manager.api.client import GatherClient
+from gather_manager.api.disk_cache import DiskCache
+from gather_manager.api.metrics import EndpointMetrics
+from gather_manager.api.tracing import ChromeTraceExporter, set_tracer, span
+from gather_manager.api.user_id_cache import UserIdCache
+from gather_manager.models.user import OperationStatus
 from gather_manager.services import PortalService
+from gather_manager.services.bulk_users import (
+    BulkUserService,
+    OperationJournal,
+    load_user_operations,
+)
+from gather_manager.services.crawler import CrawlProgress, SpaceCrawler
 from gather_manager.services.explorer import PortalExplorer
 from gather_manager.utils.exceptions import GatherApiError, GatherManagerError
 
@@ -85,6 +102,93 @@ portals_app = typer.Typer(help="Commands for analyzing portals")
 app.add_typer(portals_app, name="portals")
 
 
+# GatherClient options set by the global CLI flags, shared by every command
+client_options: Dict[str, Any] = {}
+
+
+def create_client(
+    api_key: Optional[str] = None, **kwargs: Any
+) -> GatherClient:
+    """
+    Create a GatherClient configured with the global CLI options.
+
+    Args:
+        api_key: Gather.town API key, or None to use GATHER_API_KEY
+        **kwargs: Additional GatherClient arguments
+    """
+    return GatherClient(api_key=api_key, **{**client_options, **kwargs})
+
+
+T = TypeVar("T")
+
+
+def command_resource(resource: ContextManager[T]) -> T:
+    """
+    Enter a resource that is closed when the running command finishes.
+
+    Args:
+        resource: Context manager, such as a service that owns threads
+    """
+    return click.get_current_context().with_resource(resource)
+
+
+# Formats accepted by --metrics-format
+METRICS_FORMATS = ("table", "json", "prometheus")
+
+
+def print_endpoint_metrics(
+    endpoint_metrics: EndpointMetrics, metrics_format: str = "table"
+) -> None:
+    """
+    Print per-endpoint API statistics to stderr.
+
+    Args:
+        endpoint_metrics: Statistics recorded by the command's clients
+        metrics_format: One of METRICS_FORMATS
+    """
+    err_console = Console(stderr=True)
+    if metrics_format == "json":
+        err_console.print_json(endpoint_metrics.to_json())
+        return
+    if metrics_format == "prometheus":
+        err_console.out(endpoint_metrics.to_prometheus(), end="")
+        return
+
+    def ms(seconds: Optional[float]) -> str:
+        return "-" if seconds is None else f"{seconds * 1000:.0f}"
+
+    table = Table(title="API metrics")
+    table.add_column("Endpoint", style="cyan")
+    table.add_column("Calls", justify="right")
+    table.add_column("Requests", justify="right")
+    table.add_column("Statuses")
+    table.add_column("Retries", justify="right")
+    table.add_column("Cache hits", justify="right")
+    table.add_column("Circuit")
+    table.add_column("p50 ms", justify="right")
+    table.add_column("p95 ms", justify="right")
+    table.add_column("Sent", justify="right")
+    table.add_column("Received", justify="right")
+    for endpoint, stats in endpoint_metrics.to_dict().items():
+        table.add_row(
+            endpoint,
+            str(stats["calls"]),
+            str(stats["requests"]),
+            ", ".join(
+                f"{status}: {count}"
+                for status, count in stats["statuses"].items()
+            ),
+            str(stats["retries"]),
+            str(sum(stats["cache_hits"].values())),
+            stats["circuit"]["state"],
+            ms(stats["latency"]["p50"]),
+            ms(stats["latency"]["p95"]),
+            str(stats["request_bytes"]),
+            str(stats["response_bytes"]),
+        )
+    err_console.print(table)
+
+
 def version_callback(value: bool):
     if value:
         console.print(f"gather-manager version {__version__}")
@@ -93,6 +197,7 @@ def version_callback(value: bool):
 
 @app.callback()
 def main(
+    ctx: typer.Context,
     version: bool = typer.Option(
         None,
         "--version",
@@ -100,12 +205,116 @@ def main(
         help="Show version and exit",
         callback=version_callback,
         is_eager=True,
-    )
+    ),
+    cache_dir: Optional[Path] = typer.Option(
+        None,
+        "--cache-dir",
+        envvar="GATHER_CACHE_DIR",
+        help="Cache API responses on disk in this directory",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Disable the on-disk response and user ID caches",
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        help="Ignore cached responses but store fresh ones",
+    ),
+    metrics: bool = typer.Option(
+        False,
+        "--metrics",
+        help="Print per-endpoint API call, latency and traffic statistics",
+    ),
+    metrics_format: str = typer.Option(
+        "table",
+        "--metrics-format",
+        help=f"Format of --metrics output: {', '.join(METRICS_FORMATS)}",
+    ),
+    trace: Optional[Path] = typer.Option(
+        None,
+        "--trace",
+        help="Write a Chrome trace-event timeline of the command to this file",
+    ),
+    record: Optional[Path] = typer.Option(
+        None,
+        "--record",
+        help="Record every API response to this cassette file",
+    ),
+    replay: Optional[Path] = typer.Option(
+        None,
+        "--replay",
+        help="Answer API requests from this cassette file, offline",
+    ),
+    replay_timing: float = typer.Option(
+        0.0,
+        "--replay-timing",
+        help="Fraction of recorded response times to wait when replaying "
+        "(1 emulates the original timing)",
+    ),
 ):
     """
     Gather.town API Explorer - Tool for analyzing portal structures in Gather.town spaces
     """
-    pass
+    client_options.clear()
+    if metrics:
+        if metrics_format not in METRICS_FORMATS:
+            raise typer.BadParameter(
+                f"Must be one of: {', '.join(METRICS_FORMATS)}",
+                param_hint="--metrics-format",
+            )
+        # One registry shared by every client the command creates
+        endpoint_metrics = EndpointMetrics()
+        client_options["endpoint_metrics"] = endpoint_metrics
+        ctx.call_on_close(
+            lambda: print_endpoint_metrics(endpoint_metrics, metrics_format)
+        )
+
+    if trace:
+        exporter = ChromeTraceExporter(trace)
+        previous_tracer = set_tracer(exporter)
+
+        def write_trace() -> None:
+            set_tracer(previous_tracer)
+            path = exporter.write()
+            Console(stderr=True).print(f"Wrote trace to {path}")
+
+        # Resources close in reverse order: the command span, then the file
+        ctx.call_on_close(write_trace)
+        ctx.with_resource(span(f"cli.{ctx.invoked_subcommand}"))
+
+    if record and replay:
+        raise typer.BadParameter(
+            "Cannot be combined with --record", param_hint="--replay"
+        )
+    # One cassette shared by every client the command creates
+    if replay:
+        try:
+            client_options["transport"] = CassettePlayer(
+                replay, timing=replay_timing
+            )
+        except GatherManagerError as e:
+            raise typer.BadParameter(str(e), param_hint="--replay")
+    if record:
+        # Each client records through its own pooled adapter
+        cassette = Cassette()
+        client_options["record"] = record
+        client_options["cassette"] = cassette
+        ctx.call_on_close(lambda: cassette.save(record))
+
+    if no_cache:
+        return
+
+    # User IDs never change, so lookups are always cached unless disabled
+    client_options["user_id_cache"] = UserIdCache(
+        cache_dir / UserIdCache.DEFAULT_PATH.name
+        if cache_dir
+        else UserIdCache.DEFAULT_PATH,
+        refresh=refresh,
+    )
+    if cache_dir:
+        client_options["disk_cache"] = DiskCache(cache_dir, refresh=refresh)
 
 
 @app.command()
@@ -126,12 +335,35 @@ def explore(
         "-p",
         help="Perform detailed analysis of portal properties",
     ),
+    concurrency: int = typer.Option(
+        1,
+        "--concurrency",
+        "-c",
+        min=1,
+        help="Number of maps to fetch concurrently when analyzing all maps",
+    ),
+    deadline: Optional[float] = typer.Option(
+        None,
+        "--deadline",
+        min=0,
+        help="Stop analyzing all maps after this many seconds and keep partial results",
+    ),
 ):
     """
     Explore and analyze portal structures in Gather.town spaces.
     """
     try:
-        explorer = PortalExplorer(output_dir=output_dir)
+        explorer = command_resource(
+            PortalExplorer(
+                client=create_client(
+                    pool_maxsize=max(
+                        concurrency, GatherClient.DEFAULT_POOL_MAXSIZE
+                    )
+                ),
+                output_dir=output_dir,
+                max_concurrency=concurrency,
+            )
+        )
 
         # Check access to the space first
         if not explorer.check_space_access(space_id):
@@ -153,7 +385,16 @@ def explore(
                     console.print(f"  [cyan]{key}:[/] {value}")
         else:
             console.print(f"[bold]Analyzing all maps in space:[/] {space_id}")
-            results = explorer.analyze_all_maps(space_id)
+            if concurrency > 1:
+                results = asyncio.run(
+                    explorer.analyze_all_maps_async(
+                        space_id, deadline_seconds=deadline
+                    )
+                )
+            else:
+                results = explorer.analyze_all_maps(
+                    space_id, deadline_seconds=deadline
+                )
             total_portals = sum(len(portals) for portals in results.values())
             console.print(
                 f"[green]Analyzed {len(results)} maps, found {total_portals} portals total[/]"
@@ -220,7 +461,7 @@ def list_maps(
     List all maps in a Gather.town space.
     """
     try:
-        client = GatherClient()
+        client = create_client()
         maps = client.get_maps(space_id)
 
         if not maps:
@@ -248,6 +489,25 @@ def list_maps(
         raise typer.Exit(code=1)
 
 
+def _resolve_role(role: Optional[str]) -> Optional[str]:
+    """Map a --role option to the client's role constant."""
+    if not role:
+        return None
+
+    role_constants = {
+        "ADMIN": GatherClient.ROLE_ADMIN,
+        "BUILDER": GatherClient.ROLE_BUILDER,
+        "MEMBER": GatherClient.ROLE_MEMBER,
+        "MODERATOR": GatherClient.ROLE_MODERATOR,
+    }
+    if role.upper() not in role_constants:
+        console.print(
+            f"[bold yellow]Warning:[/] Unknown role '{role}'. Using as-is."
+        )
+        return role
+    return role_constants[role.upper()]
+
+
 @app.command()
 def list_spaces(
     role: Optional[str] = typer.Option(
@@ -258,29 +518,8 @@ def list_spaces(
     List all spaces accessible with your API key.
     """
     try:
-        client = GatherClient()
-
-        # Map role string to role constant if provided
-        if role:
-            role_upper = role.upper()
-            role_constants = {
-                "ADMIN": client.ROLE_ADMIN,
-                "BUILDER": client.ROLE_BUILDER,
-                "MEMBER": client.ROLE_MEMBER,
-                "MODERATOR": client.ROLE_MODERATOR,
-            }
-
-            if role_upper not in role_constants:
-                console.print(
-                    f"[bold yellow]Warning:[/] Unknown role '{role}'. Using as-is."
-                )
-                role_to_use = role
-            else:
-                role_to_use = role_constants[role_upper]
-        else:
-            role_to_use = None
-
-        spaces = client.get_spaces(role=role_to_use)
+        client = create_client()
+        spaces = client.get_spaces(role=_resolve_role(role))
 
         if not spaces:
             console.print(
@@ -314,6 +553,132 @@ def list_spaces(
         raise typer.Exit(code=1)
 
 
+def render_crawl_dashboard(
+    progress: CrawlProgress, endpoint_metrics: EndpointMetrics
+) -> Table:
+    """Render the live throughput table of a running crawl."""
+    elapsed = progress.elapsed_seconds
+    requests = sum(
+        stats["requests"] for stats in endpoint_metrics.to_dict().values()
+    )
+
+    table = Table(title="Crawl", show_header=False)
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", justify="right")
+    table.add_row(
+        "Spaces", f"{progress.spaces_done} / {progress.spaces_total}"
+    )
+    table.add_row(
+        "Maps",
+        f"{progress.maps_done} / {progress.maps_total}"
+        + (
+            f" ([red]{progress.maps_failed} failed[/])"
+            if progress.maps_failed
+            else ""
+        ),
+    )
+    table.add_row("Objects", str(progress.objects))
+    table.add_row("Maps/s", f"{progress.maps_per_second:.1f}")
+    table.add_row("Objects/s", f"{progress.objects_per_second:.0f}")
+    table.add_row(
+        "Requests/s", f"{requests / elapsed:.1f}" if elapsed > 0 else "-"
+    )
+    table.add_row("Elapsed", f"{elapsed:.1f}s")
+    return table
+
+
+@app.command()
+def crawl(
+    role: Optional[str] = typer.Option(
+        None, help="Only crawl spaces where you have this role"
+    ),
+    space_ids: Optional[List[str]] = typer.Option(
+        None,
+        "--space-id",
+        help="Crawl this space instead of all accessible ones (repeatable)",
+    ),
+    output: Path = typer.Option(
+        Path("data") / "crawl.json",
+        "--output",
+        "-o",
+        help="Dataset file: .json, .json.gz, .csv or .parquet",
+    ),
+    report_path: Optional[Path] = typer.Option(
+        None, "--report", help="Write per-map results to this JSON file"
+    ),
+    concurrency: int = typer.Option(
+        SpaceCrawler.DEFAULT_MAX_CONCURRENCY,
+        "--concurrency",
+        "-c",
+        min=1,
+        help="Maximum requests in flight across all spaces",
+    ),
+    dashboard: bool = typer.Option(
+        True,
+        "--dashboard/--no-dashboard",
+        help="Show live throughput while crawling",
+    ),
+):
+    """
+    Crawl every map of all accessible spaces into one dataset.
+    """
+    try:
+        client = create_client(
+            pool_maxsize=max(concurrency, GatherClient.DEFAULT_POOL_MAXSIZE)
+        )
+        crawler = command_resource(
+            SpaceCrawler(client, max_concurrency=concurrency)
+        )
+
+        if dashboard:
+            with Live(
+                get_renderable=lambda: render_crawl_dashboard(
+                    crawler.progress, client.endpoint_metrics
+                ),
+                console=console,
+                refresh_per_second=4,
+            ):
+                crawl_report, dataset = crawler.crawl(
+                    role=_resolve_role(role), space_ids=space_ids
+                )
+        else:
+            crawl_report, dataset = crawler.crawl(
+                role=_resolve_role(role), space_ids=space_ids
+            )
+
+        for space_id, error in crawl_report.space_errors.items():
+            console.print(f"[yellow]Skipped space {space_id}:[/] {error}")
+        for result in crawl_report.failed_maps:
+            console.print(
+                f"[yellow]Skipped map {result.map_id} in space "
+                f"{result.space_id}:[/] {result.error}"
+            )
+
+        dataset.write(output)
+        console.print(
+            f"[green]Crawled {len(crawl_report.maps)} maps in "
+            f"{len(crawl_report.spaces)} spaces, {len(dataset)} objects[/] "
+            f"in {crawl_report.elapsed_seconds:.1f}s "
+            f"({crawl_report.maps_per_second:.2f} maps/s)"
+        )
+        console.print(f"[bold]Dataset written to:[/] {output}")
+        if report_path:
+            report_path.parent.mkdir(parents=True, exist_ok=True)
+            report_path.write_text(
+                json.dumps(crawl_report.to_dict(), indent=2),
+                encoding="utf-8",
+            )
+            console.print(f"Report written to {report_path}")
+
+    except GatherManagerError as e:
+        console.print(f"[bold red]Error:[/] {str(e)}")
+        raise typer.Exit(code=1)
+    except Exception as e:
+        console.print(f"[bold red]Unexpected error:[/] {str(e)}")
+        logger.exception("Unexpected error occurred")
+        raise typer.Exit(code=1)
+
+
 @app.command()
 def manage_users(
     space_id: str = typer.Option(
@@ -335,12 +700,43 @@ def manage_users(
         "MEMBER",
         help="Role to assign to the user (ADMIN, BUILDER, MEMBER, MODERATOR)",
     ),
+    bulk: Optional[Path] = typer.Option(
+        None,
+        "--bulk",
+        help="CSV or NDJSON file of users to add or remove (email, role, action)",
+    ),
+    journal: Optional[Path] = typer.Option(
+        None,
+        help="Journal used to resume an interrupted bulk run (default: <bulk file>.journal)",
+    ),
+    report: Optional[Path] = typer.Option(
+        None, help="Write a per-row bulk report to this CSV or JSON file"
+    ),
+    concurrency: int = typer.Option(
+        BulkUserService.DEFAULT_MAX_CONCURRENCY,
+        "--concurrency",
+        "-c",
+        min=1,
+        help="Maximum bulk operations in flight at once",
+    ),
 ):
     """
     Manage users in a Gather.town space.
     """
     try:
-        client = GatherClient()
+        client = create_client()
+
+        # Bulk add/remove from a file
+        if bulk:
+            _run_bulk_users(
+                client,
+                space_id,
+                bulk,
+                journal or bulk.with_name(bulk.name + ".journal"),
+                report,
+                concurrency,
+            )
+            return
 
         # Map role string to role constant
         role_upper = role.upper() if role else "MEMBER"
@@ -431,6 +827,69 @@ def manage_users(
         raise typer.Exit(code=1)
 
 
+def _run_bulk_users(
+    client: GatherClient,
+    space_id: str,
+    bulk: Path,
+    journal_path: Path,
+    report_path: Optional[Path],
+    concurrency: int,
+) -> None:
+    """Apply a bulk user file and print a summary of the results."""
+    operations, invalid = load_user_operations(bulk)
+    console.print(
+        f"[bold]Applying {len(operations)} user operations[/] from {bulk} "
+        f"to space {space_id}"
+    )
+    for result in invalid:
+        console.print(
+            f"[yellow]Skipping invalid row {result.row}:[/] {result.error}"
+        )
+
+    service = command_resource(
+        BulkUserService(client, max_concurrency=concurrency)
+    )
+    with OperationJournal(journal_path) as journal:
+        bulk_report = service.apply(space_id, operations, journal=journal)
+    bulk_report.results = sorted(
+        bulk_report.results + invalid, key=lambda result: result.row
+    )
+
+    failures = [
+        result
+        for result in bulk_report.results
+        if result.status == OperationStatus.FAILED
+    ]
+    if failures:
+        table = Table(title="Failed operations")
+        table.add_column("Row", style="dim")
+        table.add_column("Email")
+        table.add_column("Action")
+        table.add_column("Error", style="red")
+        for result in failures:
+            table.add_row(
+                str(result.row),
+                result.email,
+                result.action.value if result.action else "",
+                result.error or "",
+            )
+        console.print(table)
+
+    counts = bulk_report.counts()
+    console.print(
+        f"\n[green]{counts['succeeded']} succeeded[/], "
+        f"[red]{counts['failed']} failed[/], "
+        f"[yellow]{counts['invalid']} invalid[/], "
+        f"{counts['skipped']} already done "
+        f"in {bulk_report.elapsed_seconds:.1f}s "
+        f"({bulk_report.operations_per_second:.2f} ops/s)"
+    )
+    if report_path:
+        BulkUserService.write_report(bulk_report, report_path)
+        console.print(f"Report written to {report_path}")
+    console.print(f"Journal: {journal_path}")
+
+
 @app.command()
 def create_spawn_token(
     space_id: str = typer.Option(
@@ -448,7 +907,7 @@ def create_spawn_token(
     Create a spawn token for a specific spawn point in a map.
     """
     try:
-        client = GatherClient()
+        client = create_client()
 
         console.print(
             f"[bold]Creating spawn token for[/] {spawn_name} in map {map_id}"
@@ -489,10 +948,12 @@ def validate_portals(
 
     with console.status("Validating portals..."):
         # Create API client
-        api_client = GatherClient(api_key=api_key)
+        api_client = create_client(api_key=api_key)
 
         # Create portal service
-        portal_service = PortalService(api_client=api_client)
+        portal_service = command_resource(
+            PortalService(api_client=api_client, space_id=space_id)
+        )
 
         # Validate portals
         validation_result = portal_service.validate_portals()
@@ -554,10 +1015,12 @@ def analyze_connections(
 
     with console.status("Analyzing portal connections..."):
         # Create API client
-        api_client = GatherClient(api_key=api_key)
+        api_client = create_client(api_key=api_key)
 
         # Create portal service
-        portal_service = PortalService(api_client=api_client)
+        portal_service = command_resource(
+            PortalService(api_client=api_client, space_id=space_id)
+        )
 
         # Analyze connections
         connections = portal_service.analyze_connections()
@@ -604,10 +1067,12 @@ def portal_details(
 
     with console.status(f"Getting portal details for {map_id}..."):
         # Create API client
-        api_client = GatherClient(api_key=api_key)
+        api_client = create_client(api_key=api_key)
 
         # Create portal service
-        portal_service = PortalService(api_client=api_client)
+        portal_service = command_resource(
+            PortalService(api_client=api_client, space_id=space_id)
+        )
 
         # Get portal details
         portal_details = portal_service.get_portal_details(map_id=map_id)
@@ -663,10 +1128,12 @@ def export_portals(
         f"Exporting portal data to {format.upper()} format..."
     ):
         # Create API client
-        api_client = GatherClient(api_key=api_key)
+        api_client = create_client(api_key=api_key)
 
         # Create portal service
-        portal_service = PortalService(api_client=api_client)
+        portal_service = command_resource(
+            PortalService(api_client=api_client, space_id=space_id)
+        )
 
         # Export portals
         file_path = portal_service.export_portals(
@@ -2,7 +2,31 @@
 """
 Models for the Gather Manager.
 """
-from gather_manager.models.portal import Portal, PortalProperties
+from gather_manager.models.crawl import CrawlReport, MapCrawlResult
+from gather_manager.models.object_table import MapObjectTable
+from gather_manager.models.portal import (
+    Portal,
+    PortalProperties,
+    PortalRecord,
+)
 from gather_manager.models.space import Map, MapData, Space
+from gather_manager.models.user import (
+    BulkUserReport,
+    UserOperation,
+    UserOperationResult,
+)
 
-__all__ = ["Space", "Map", "MapData", "Portal", "PortalProperties"]
+__all__ = [
+    "Space",
+    "Map",
+    "MapData",
+    "Portal",
+    "PortalProperties",
+    "PortalRecord",
+    "UserOperation",
+    "UserOperationResult",
+    "BulkUserReport",
+    "MapCrawlResult",
+    "CrawlReport",
+    "MapObjectTable",
+]
@@ -0,0 +1,67 @@
+"""
+Models for multi-space crawls of Gather.town maps.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+
+class MapCrawlResult(BaseModel):
+    """Outcome of reading one map during a crawl."""
+
+    space_id: str
+    map_id: str
+    objects: int = 0
+    portals: int = 0
+    error: Optional[str] = None
+    duration_seconds: float = 0.0
+
+
+class CrawlReport(BaseModel):
+    """Per-map results and throughput of a crawl over many spaces."""
+
+    spaces: List[str] = []
+    maps: List[MapCrawlResult] = []
+    space_errors: Dict[str, str] = {}
+    elapsed_seconds: float = 0.0
+
+    @property
+    def failed_maps(self) -> List[MapCrawlResult]:
+        """Maps that could not be read."""
+        return [result for result in self.maps if result.error is not None]
+
+    @property
+    def objects(self) -> int:
+        """Objects read across all maps."""
+        return sum(result.objects for result in self.maps)
+
+    @property
+    def maps_per_second(self) -> float:
+        """Maps read per second of wall-clock time."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return len(self.maps) / self.elapsed_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the report to a JSON-serializable dictionary.
+
+        Returns:
+            Dict[str, Any]: Summary statistics, space errors and per-map
+            results.
+        """
+        return {
+            "summary": {
+                "spaces": len(self.spaces),
+                "spaces_failed": len(self.space_errors),
+                "maps": len(self.maps),
+                "maps_failed": len(self.failed_maps),
+                "objects": self.objects,
+                "portals": sum(result.portals for result in self.maps),
+                "elapsed_seconds": self.elapsed_seconds,
+                "maps_per_second": self.maps_per_second,
+            },
+            "space_errors": self.space_errors,
+            "maps": [result.model_dump(mode="json") for result in self.maps],
+        }
@@ -2,9 +2,22 @@
 Portal model for representing Gather.town portals.
 """
 
-from typing import Any, Dict, Optional
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Union,
+)
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+
+from gather_manager.models.space import Object
+from gather_manager.models.space import Portal as SpacePortal
+from gather_manager.models.space import PortalView
 
 
 class PortalProperties(BaseModel):
@@ -78,3 +91,313 @@ class Portal(BaseModel):
             "target_y": self.properties.target_y,
             "is_valid": self.is_valid(),
         }
+
+
+class PortalRecord(NamedTuple):
+    """Compact portal record shared by both portal models.
+
+    ``Portal`` here nests its target under ``properties`` and has an integer
+    type, while ``gather_manager.models.space.Portal`` keeps a flat
+    ``targetMap``. A record holds the fields the two have in common, so a
+    portal can be read, and converted to either model, without building the
+    other one. Building a record does no validation. Other object fields
+    (size, image, extra properties) are not carried over.
+    """
+
+    id: Optional[str]
+    type: Union[str, int]
+    x: int
+    y: int
+    target_map: Optional[str] = None
+    target_x: Optional[int] = None
+    target_y: Optional[int] = None
+    map_id: Optional[str] = None
+
+    @classmethod
+    def from_portal(
+        cls, portal: Portal, map_id: Optional[str] = None
+    ) -> "PortalRecord":
+        """
+        Build a record from a ``Portal``.
+
+        Args:
+            portal: The portal.
+            map_id: The ID of the map the portal is on.
+
+        Returns:
+            PortalRecord: The record.
+        """
+        properties = portal.properties
+        return cls(
+            portal.id,
+            portal.type,
+            portal.x,
+            portal.y,
+            properties.target_map,
+            properties.target_x,
+            properties.target_y,
+            map_id,
+        )
+
+    @classmethod
+    def from_raw(
+        cls, data: Mapping[str, Any], map_id: Optional[str] = None
+    ) -> "PortalRecord":
+        """
+        Build a record from a raw portal object, as returned by the API.
+
+        The object has the shape of ``Portal``, with the target under
+        ``properties``. Values are checked as they are read, without
+        building a model first.
+
+        Args:
+            data: The raw portal object.
+            map_id: The ID of the map the portal is on.
+
+        Returns:
+            PortalRecord: The record.
+
+        Raises:
+            ValueError: If a field is missing or has the wrong type.
+        """
+        properties = data.get("properties")
+        if not isinstance(properties, Mapping):
+            raise ValueError(
+                f"properties: expected a dictionary, got {properties!r}"
+            )
+        portal_id = data.get("id")
+        if not isinstance(portal_id, str):
+            raise ValueError(f"id: expected a string, got {portal_id!r}")
+        target_map = properties.get("targetMap")
+        if target_map is None:
+            target_map = properties.get("target_map")
+        if target_map is not None and not isinstance(target_map, str):
+            raise ValueError(
+                f"targetMap: expected a string, got {target_map!r}"
+            )
+
+        # Not part of the record, but Portal rejects what it cannot coerce
+        normal = properties.get("normal")
+        if normal is not None and type(normal) is not bool:
+            try:
+                _NORMAL.validate_python(normal)
+            except ValueError as e:
+                raise ValueError(
+                    f"normal: expected a boolean, got {normal!r}"
+                ) from e
+
+        # JSON numbers are almost always ints already; convert the rest
+        portal_type = data.get("type")
+        x = data.get("x")
+        y = data.get("y")
+        if type(portal_type) is not int:
+            portal_type = _required_int_field(data, "type")
+        if type(x) is not int:
+            x = _required_int_field(data, "x")
+        if type(y) is not int:
+            y = _required_int_field(data, "y")
+        target_x = properties.get("targetX")
+        if type(target_x) is not int:
+            target_x = _int_field(properties, "targetX", "target_x")
+        target_y = properties.get("targetY")
+        if type(target_y) is not int:
+            target_y = _int_field(properties, "targetY", "target_y")
+        return cls(
+            portal_id,
+            portal_type,
+            x,
+            y,
+            target_map,
+            target_x,
+            target_y,
+            map_id,
+        )
+
+    @classmethod
+    def from_object(
+        cls,
+        obj: Union[Object, PortalView],
+        map_id: Optional[str] = None,
+    ) -> "PortalRecord":
+        """
+        Build a record from a map object, ``space.Portal`` or ``PortalView``.
+
+        Args:
+            obj: The object.
+            map_id: The ID of the map the object is on.
+
+        Returns:
+            PortalRecord: The record.
+        """
+        return cls(
+            obj.id,
+            obj.type,
+            obj.x,
+            obj.y,
+            obj.targetMap,
+            obj.targetX,
+            obj.targetY,
+            map_id,
+        )
+
+    def is_valid(self) -> bool:
+        """
+        Check if the portal has all required properties to be valid.
+
+        Returns:
+            bool: True if the portal is valid, False otherwise.
+        """
+        return (
+            self.target_map is not None
+            and self.target_x is not None
+            and self.target_y is not None
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the record to the portal details used in exports.
+
+        Returns:
+            Dict[str, Any]: A dictionary representation of the portal.
+        """
+        return {
+            "id": self.id,
+            "map_id": self.map_id,
+            "x": self.x,
+            "y": self.y,
+            "target_map": self.target_map,
+            "target_x": self.target_x,
+            "target_y": self.target_y,
+            "is_valid": self.is_valid(),
+        }
+
+
+def _int_field(
+    data: Mapping[str, Any], name: str, alias: Optional[str] = None
+) -> Optional[int]:
+    """Read an optional integer field of a raw object.
+
+    Integral floats and numeric strings are converted, as Portal does.
+    """
+    value = data.get(name)
+    if value is None and alias is not None:
+        value = data.get(alias)
+    if value is None or type(value) is int:
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    raise ValueError(f"{name}: expected an integer, got {value!r}")
+
+
+def _required_int_field(data: Mapping[str, Any], name: str) -> int:
+    """Read an integer field of a raw object that must be present."""
+    value = _int_field(data, name)
+    if value is None:
+        raise ValueError(f"{name}: expected an integer, got None")
+    return value
+
+
+_NORMAL = TypeAdapter(Optional[bool])
+_PORTALS = TypeAdapter(List[Portal])
+_SPACE_PORTALS = TypeAdapter(List[SpacePortal])
+
+
+def to_records(
+    portals: Iterable[Union[Portal, Object, PortalView, Mapping[str, Any]]],
+    map_id: Optional[str] = None,
+) -> List[PortalRecord]:
+    """
+    Convert portals of either model, or raw portal objects, to records.
+
+    Args:
+        portals: ``Portal`` instances, map objects, ``space.Portal``
+            instances, ``PortalView``s or raw objects in the shape of
+            ``Portal`` (see ``PortalRecord.from_raw``).
+        map_id: The ID of the map the portals are on.
+
+    Returns:
+        List[PortalRecord]: The records, in order.
+
+    Raises:
+        ValueError: If a raw object has a missing or malformed field.
+    """
+    records = []
+    for portal in portals:
+        if isinstance(portal, Portal):
+            records.append(PortalRecord.from_portal(portal, map_id))
+        elif isinstance(portal, Mapping):
+            records.append(PortalRecord.from_raw(portal, map_id))
+        else:
+            records.append(PortalRecord.from_object(portal, map_id))
+    return records
+
+
+def to_portals(records: Iterable[PortalRecord]) -> List[Portal]:
+    """
+    Materialize records as ``Portal`` models.
+
+    The whole list is validated in one pydantic-core call.
+
+    Args:
+        records: The records.
+
+    Returns:
+        List[Portal]: The portals, in order.
+
+    Raises:
+        pydantic.ValidationError: If a record has no ID or a type that is
+            not an integer.
+    """
+    return _PORTALS.validate_python(
+        [
+            {
+                "id": record.id,
+                "type": record.type,
+                "x": record.x,
+                "y": record.y,
+                "properties": {
+                    "target_map": record.target_map,
+                    "target_x": record.target_x,
+                    "target_y": record.target_y,
+                },
+            }
+            for record in records
+        ]
+    )
+
+
+def to_space_portals(records: Iterable[PortalRecord]) -> List[SpacePortal]:
+    """
+    Materialize records as ``gather_manager.models.space.Portal`` models.
+
+    The whole list is validated in one pydantic-core call. As in
+    ``space.Portal`` validation, missing target coordinates become 0.
+
+    Args:
+        records: The records.
+
+    Returns:
+        List[SpacePortal]: The portals, in order.
+
+    Raises:
+        pydantic.ValidationError: If a record has no target map.
+    """
+    return _SPACE_PORTALS.validate_python(
+        [
+            {
+                "id": record.id,
+                "type": record.type,
+                "x": record.x,
+                "y": record.y,
+                "targetMap": record.target_map,
+                "targetX": record.target_x,
+                "targetY": record.target_y,
+            }
+            for record in records
+        ]
+    )
@@ -1,8 +1,32 @@
 """Data models for Gather.town spaces, maps, and objects."""
 
-from typing import Any, ClassVar, Dict, List, Optional, Union
-
-from pydantic import BaseModel, Field, field_validator, model_validator
+import sys
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    SupportsIndex,
+    Union,
+    overload,
+)
+
+from pydantic import (
+    BaseModel,
+    Field,
+    SerializerFunctionWrapHandler,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
+
+# Validation modes of MapData.from_api
+VALIDATE_FULL = "full"
+VALIDATE_LAZY = "lazy"
+VALIDATE_STRICT = "strict"
+VALIDATION_MODES = (VALIDATE_FULL, VALIDATE_LAZY, VALIDATE_STRICT)
 
 
 class Position(BaseModel):
@@ -38,6 +62,110 @@ class Object(BaseModel):
         extra = "allow"  # Allow additional properties to be captured
 
 
+class LazyObjectList(List[Object]):
+    """List of map objects that are validated on first access.
+
+    Holds the raw object dictionaries of a trusted API response and replaces
+    each with an ``Object`` the first time it is read, so an analysis that
+    only looks at some objects skips validating the rest. A malformed object
+    raises ``pydantic.ValidationError`` at that access instead of when the
+    map is parsed. Operations that need every object (comparison, search,
+    sorting, copying, serialization) validate them all first.
+    """
+
+    def _load(self, index: SupportsIndex) -> Object:
+        # Raw dictionaries until loaded, whatever the declared item type
+        item: Any = list.__getitem__(self, index)
+        if isinstance(item, Object):
+            return item
+        obj = Object.model_validate(item)
+        list.__setitem__(self, index, obj)
+        return obj
+
+    @property
+    def pending(self) -> int:
+        """Number of objects not validated yet."""
+        return sum(
+            not isinstance(item, Object) for item in list.__iter__(self)
+        )
+
+    def materialize(self) -> "LazyObjectList":
+        """Validate every object that has not been validated yet.
+
+        Returns:
+            This list
+        """
+        for index in range(len(self)):
+            self._load(index)
+        return self
+
+    @overload
+    def __getitem__(self, index: SupportsIndex) -> Object:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Object]:
+        ...
+
+    def __getitem__(
+        self, index: Union[SupportsIndex, slice]
+    ) -> Union[Object, List[Object]]:
+        if isinstance(index, slice):
+            return [self._load(i) for i in range(*index.indices(len(self)))]
+        return self._load(index)
+
+    def __iter__(self) -> Iterator[Object]:
+        for index in range(len(self)):
+            yield self._load(index)
+
+    def __reversed__(self) -> Iterator[Object]:
+        for index in range(len(self) - 1, -1, -1):
+            yield self._load(index)
+
+    def __contains__(self, item: object) -> bool:
+        return list.__contains__(self.materialize(), item)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyObjectList):
+            other.materialize()
+        return list.__eq__(self.materialize(), other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __add__(self, other: List[Any]) -> List[Any]:
+        return list.__add__(self.materialize(), other)
+
+    def __repr__(self) -> str:
+        return list.__repr__(self.materialize())
+
+    def pop(self, index: SupportsIndex = -1) -> Object:
+        self._load(index)
+        return list.pop(self, index)
+
+    def copy(self) -> List[Object]:
+        return list.copy(self.materialize())
+
+    def count(self, item: Object) -> int:
+        return list.count(self.materialize(), item)
+
+    def index(
+        self,
+        item: Object,
+        start: SupportsIndex = 0,
+        stop: SupportsIndex = sys.maxsize,
+    ) -> int:
+        return list.index(self.materialize(), item, start, stop)
+
+    def remove(self, item: Object) -> None:
+        list.remove(self.materialize(), item)
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        list.sort(self.materialize(), *args, **kwargs)
+
+
 class Portal(Object):
     """Portal object that connects different maps."""
 
@@ -84,6 +212,86 @@ class Portal(Object):
         return cls(**obj_dict)
 
 
+class PortalView:
+    """Read-only portal view over an existing ``Object``.
+
+    Wraps the object without copying or validating it again. The target
+    fields follow ``Portal.validate_portal``: the view is valid only with a
+    non-empty ``targetMap``, and a missing ``targetX`` or ``targetY`` reads
+    as 0. Every other attribute is read from the wrapped object. Call
+    ``to_portal`` for a ``Portal`` model to change or serialize.
+    """
+
+    __slots__ = ("_object",)
+    _object: Object
+
+    def __init__(self, obj: Object) -> None:
+        object.__setattr__(self, "_object", obj)
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "_object":
+            raise AttributeError(name)
+        return getattr(self._object, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(
+            "PortalView is read-only, use to_portal() to change it"
+        )
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(
+            "PortalView is read-only, use to_portal() to change it"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PortalView):
+            return self._object == other._object
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"PortalView({self._object!r})"
+
+    @property
+    def object(self) -> Object:
+        """The wrapped object."""
+        return self._object
+
+    @property
+    def targetMap(self) -> Optional[str]:
+        """ID of the map the portal leads to."""
+        return self._object.targetMap
+
+    @property
+    def targetX(self) -> int:
+        """X coordinate on the target map, 0 if not set."""
+        target_x = self._object.targetX
+        return 0 if target_x is None else target_x
+
+    @property
+    def targetY(self) -> int:
+        """Y coordinate on the target map, 0 if not set."""
+        target_y = self._object.targetY
+        return 0 if target_y is None else target_y
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether ``Portal`` validation would accept the object."""
+        return bool(self._object.targetMap)
+
+    def to_portal(self) -> Portal:
+        """Materialize the view as a ``Portal`` model.
+
+        Returns:
+            A new Portal, independent of the wrapped object
+
+        Raises:
+            ValueError: If the object has no targetMap
+        """
+        return Portal.from_object(self._object)
+
+
 class Map(BaseModel):
     """Map information."""
 
@@ -120,13 +328,67 @@ class MapData(BaseModel):
             for obj_id, obj_data in objects_dict.items():
                 # Add the ID to the object data if not present
                 if "id" not in obj_data and obj_id:
-                    obj_data["id"] = obj_id
+                    obj_data = {**obj_data, "id": obj_id}
                 objects_list.append(obj_data)
 
             data["objects"] = objects_list
 
         return data
 
+    @field_serializer("objects", mode="wrap")
+    def serialize_objects(
+        self, objects: List[Object], handler: SerializerFunctionWrapHandler
+    ) -> Any:
+        """Validate lazily loaded objects before they are serialized."""
+        if isinstance(objects, LazyObjectList):
+            objects.materialize()
+        return handler(objects)
+
+    @classmethod
+    def from_api(
+        cls, data: Dict[str, Any], validate: str = VALIDATE_FULL
+    ) -> "MapData":
+        """Build map data from a decoded API response.
+
+        Args:
+            data: Decoded map data
+            validate: How much to validate. ``"full"`` validates every
+                object now, like ``model_validate``. ``"lazy"`` trusts the
+                response for read-only use: the map fields are validated
+                now and each object when it is first accessed (see
+                ``LazyObjectList``). ``"strict"`` validates everything
+                without type coercion, for content about to be written.
+
+        Returns:
+            The map data
+
+        Raises:
+            ValueError: If the mode is unknown, or (as
+                ``pydantic.ValidationError``) if the data is invalid
+        """
+        if validate == VALIDATE_FULL:
+            return cls.model_validate(data)
+        if validate == VALIDATE_STRICT:
+            return cls.model_validate(data, strict=True)
+        if validate != VALIDATE_LAZY:
+            raise ValueError(
+                f"Unknown validation mode '{validate}', expected one of "
+                f"{', '.join(VALIDATION_MODES)}"
+            )
+
+        objects = data.get("objects") or []
+        if isinstance(objects, dict):
+            objects = [
+                {**obj, "id": obj_id} if "id" not in obj and obj_id else obj
+                for obj_id, obj in objects.items()
+            ]
+        map_data = cls.model_validate(
+            {name: value for name, value in data.items() if name != "objects"}
+        )
+        if objects:
+            map_data.objects = LazyObjectList(objects)
+        return map_data
+
     class Config:
         extra = "allow"
 
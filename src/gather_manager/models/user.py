@@ -0,0 +1,137 @@
+"""
+User management models for Gather.town spaces.
+"""
+
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, field_validator
+
+
+class UserAction(str, Enum):
+    """Operation to apply to a user's membership in a space."""
+
+    ADD = "add"
+    REMOVE = "remove"
+
+
+class OperationStatus(str, Enum):
+    """Outcome of a bulk user operation."""
+
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    INVALID = "invalid"
+    SKIPPED = "skipped"  # Completed by an earlier, interrupted run
+
+
+class UserOperation(BaseModel):
+    """One row of a bulk user management input file."""
+
+    row: int
+    email: str
+    action: UserAction = UserAction.ADD
+    role: str = "MEMBER"
+
+    @field_validator("email")
+    @classmethod
+    def validate_email(cls, v):
+        """Normalize the email and reject values that cannot be one."""
+        v = v.strip()
+        if "@" not in v:
+            raise ValueError(f"Invalid email address: '{v}'")
+        return v
+
+    @field_validator("action", mode="before")
+    @classmethod
+    def normalize_action(cls, v):
+        """Accept actions in any case; blank means add."""
+        if v is None or (isinstance(v, str) and not v.strip()):
+            return UserAction.ADD
+        return v.strip().lower() if isinstance(v, str) else v
+
+    @field_validator("role", mode="before")
+    @classmethod
+    def normalize_role(cls, v):
+        """Accept roles in any case; blank means MEMBER."""
+        if v is None or (isinstance(v, str) and not v.strip()):
+            return "MEMBER"
+        return v.strip().upper()
+
+    @property
+    def key(self) -> str:
+        """Identity of the operation in a journal."""
+        return (
+            f"{self.row}:{self.action.value}:{self.email.lower()}:{self.role}"
+        )
+
+
+class UserOperationResult(BaseModel):
+    """Result of applying (or skipping) one bulk user operation."""
+
+    row: int
+    email: str
+    action: Optional[UserAction] = None
+    role: Optional[str] = None
+    status: OperationStatus
+    error: Optional[str] = None
+    duration_seconds: float = 0.0
+
+
+class BulkUserReport(BaseModel):
+    """Per-row results and throughput of a bulk user management run."""
+
+    results: List[UserOperationResult] = []
+    elapsed_seconds: float = 0.0
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Count results by status.
+
+        Returns:
+            Dict[str, int]: Number of results for every status.
+        """
+        counts = {status.value: 0 for status in OperationStatus}
+        for result in self.results:
+            counts[result.status.value] += 1
+        return counts
+
+    @property
+    def sent(self) -> List[UserOperationResult]:
+        """Results of operations that were sent to the API in this run."""
+        return [
+            result
+            for result in self.results
+            if result.status
+            in (OperationStatus.SUCCEEDED, OperationStatus.FAILED)
+        ]
+
+    @property
+    def operations_per_second(self) -> float:
+        """Operations sent per second of wall-clock time."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return len(self.sent) / self.elapsed_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the report to a JSON-serializable dictionary.
+
+        Returns:
+            Dict[str, Any]: Summary statistics and per-row results.
+        """
+        durations = [result.duration_seconds for result in self.sent]
+        return {
+            "summary": {
+                **self.counts(),
+                "total": len(self.results),
+                "elapsed_seconds": self.elapsed_seconds,
+                "operations_per_second": self.operations_per_second,
+                "mean_duration_seconds": (
+                    sum(durations) / len(durations) if durations else 0.0
+                ),
+                "max_duration_seconds": max(durations, default=0.0),
+            },
+            "results": [
+                result.model_dump(mode="json") for result in self.results
+            ],
+        }
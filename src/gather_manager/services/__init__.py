@@ -1,7 +1,15 @@
 # gather_manager/services/__init__.py
 """Services for working with Gather.town."""
 
+from gather_manager.services.bulk_users import BulkUserService
+from gather_manager.services.crawler import MapObjectDataset, SpaceCrawler
 from gather_manager.services.explorer import PortalExplorer
 from gather_manager.services.portal_service import PortalService
 
-__all__ = ["PortalExplorer", "PortalService"]
+__all__ = [
+    "PortalExplorer",
+    "PortalService",
+    "BulkUserService",
+    "SpaceCrawler",
+    "MapObjectDataset",
+]
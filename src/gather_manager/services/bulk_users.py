@@ -0,0 +1,418 @@
+"""Service for adding and removing many users in a Gather.town space."""
+
+import asyncio
+import csv
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from pydantic import ValidationError
+
+from gather_manager.api.async_client import AsyncGatherClient
+from gather_manager.api.client import GatherClient
+from gather_manager.models.user import (
+    BulkUserReport,
+    OperationStatus,
+    UserAction,
+    UserOperation,
+    UserOperationResult,
+)
+from gather_manager.utils.exceptions import GatherManagerError
+
+logger = logging.getLogger(__name__)
+
+# Input file suffixes read as newline-delimited JSON; anything else is CSV
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+
+def load_user_operations(
+    path: Union[str, Path]
+) -> Tuple[List[UserOperation], List[UserOperationResult]]:
+    """Read bulk user operations from a CSV or NDJSON file.
+
+    Each row has an ``email`` and optionally a ``role`` (default MEMBER) and
+    an ``action`` (``add`` or ``remove``, default add). Rows are numbered by
+    their line in the file.
+
+    Args:
+        path: Input file; ``.ndjson``/``.jsonl`` files are read as JSON lines
+
+    Returns:
+        Tuple of valid operations and results for rows that failed validation
+
+    Raises:
+        GatherManagerError: If the file cannot be read
+    """
+    path = Path(path)
+    records: List[Tuple[int, Any]] = []
+    try:
+        with open(path, newline="", encoding="utf-8") as f:
+            if path.suffix.lower() in NDJSON_SUFFIXES:
+                for line_number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        records.append((line_number, json.loads(line)))
+                    except ValueError as e:
+                        records.append((line_number, str(e)))
+            else:
+                reader = csv.DictReader(f)
+                for record in reader:
+                    records.append(
+                        (
+                            reader.line_num,
+                            {
+                                (key or "").strip().lower(): value
+                                for key, value in record.items()
+                            },
+                        )
+                    )
+    except OSError as e:
+        raise GatherManagerError(
+            f"Failed to read user operations from {path}: {str(e)}"
+        ) from e
+
+    operations = []
+    invalid = []
+    for row, record in records:
+        if not isinstance(record, dict):
+            error = f"Invalid JSON: {record}"
+        else:
+            try:
+                operations.append(UserOperation(row=row, **record))
+                continue
+            except ValidationError as e:
+                error = "; ".join(
+                    f"{'.'.join(map(str, err['loc']))}: {err['msg']}"
+                    for err in e.errors()
+                )
+            except TypeError as e:
+                error = str(e)
+        email = record.get("email") if isinstance(record, dict) else None
+        invalid.append(
+            UserOperationResult(
+                row=row,
+                email=str(email or ""),
+                status=OperationStatus.INVALID,
+                error=error,
+            )
+        )
+    return operations, invalid
+
+
+class OperationJournal:
+    """Append-only write-ahead log of bulk user operations.
+
+    Every operation is logged as started before it is sent and as finished
+    once its result is known. Each line is flushed and fsynced, so after a
+    crash the journal shows exactly which rows completed; rows that were
+    started but never finished are run again (role updates are idempotent).
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Open the journal, loading any entries from an earlier run.
+
+        Args:
+            path: Journal file, created if missing
+        """
+        self.path = Path(path)
+        self._completed = self._load()
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Get the finished entry of every operation that succeeded."""
+        completed: Dict[str, Dict[str, Any]] = {}
+        if not self.path.exists():
+            return completed
+
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # Torn write from a crash
+                if entry.get("status") == OperationStatus.SUCCEEDED.value:
+                    completed[entry["key"]] = entry
+                else:
+                    completed.pop(entry.get("key"), None)
+        return completed
+
+    def is_completed(self, operation: UserOperation) -> bool:
+        """Check whether an operation succeeded in an earlier run."""
+        return operation.key in self._completed
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        with self._lock:
+            self._file.write(json.dumps(entry) + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def record_started(self, operation: UserOperation) -> None:
+        """Log that an operation is about to be sent.
+
+        Args:
+            operation: The operation
+        """
+        self._append(
+            {"key": operation.key, "status": "started", "time": time.time()}
+        )
+
+    def record_finished(
+        self, operation: UserOperation, result: UserOperationResult
+    ) -> None:
+        """Log the result of an operation.
+
+        Args:
+            operation: The operation
+            result: Its result
+        """
+        entry = {
+            "key": operation.key,
+            "status": result.status.value,
+            "error": result.error,
+            "time": time.time(),
+        }
+        self._append(entry)
+        if result.status == OperationStatus.SUCCEEDED:
+            self._completed[operation.key] = entry
+
+    def close(self) -> None:
+        """Close the journal file."""
+        self._file.close()
+
+    def __enter__(self) -> "OperationJournal":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class BulkUserService:
+    """Applies many user add/remove operations concurrently.
+
+    Operations on the same email run in file order; different emails run
+    concurrently. Rows whose user ID is already cached are scheduled first
+    and only a few lanes wait on the rate-limited user-id endpoint at once,
+    so cached rows keep flowing while uncached lookups are paced.
+    """
+
+    DEFAULT_MAX_CONCURRENCY = 4
+
+    def __init__(
+        self,
+        api_client: GatherClient,
+        async_client: Optional[AsyncGatherClient] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        """Initialize the service.
+
+        Args:
+            api_client: Client used to apply the operations
+            async_client: Async client that runs the operations. If not
+                provided, one is created around ``api_client`` on first use.
+            max_concurrency: Maximum operations in flight at once
+        """
+        self.api_client = api_client
+        self._async_client = async_client
+        self._owns_async_client = async_client is None
+        self.max_concurrency = max_concurrency
+
+    @property
+    def async_client(self) -> AsyncGatherClient:
+        """The async client that runs the operations."""
+        if self._async_client is None:
+            self._async_client = AsyncGatherClient(
+                client=self.api_client, max_concurrency=self.max_concurrency
+            )
+        return self._async_client
+
+    def close(self) -> None:
+        """Shut down the async client, if this service created it."""
+        if self._owns_async_client and self._async_client is not None:
+            self._async_client.close()
+            self._async_client = None
+
+    def __enter__(self) -> "BulkUserService":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _is_user_id_cached(self, email: str) -> bool:
+        cache = self.api_client.user_id_cache
+        if cache is None:
+            return False
+        entry = cache.get(email, base_url=self.api_client.base_url)
+        return entry is not None and entry.found
+
+    def schedule(
+        self, operations: List[UserOperation]
+    ) -> List[List[UserOperation]]:
+        """Group operations by email, cached user IDs first.
+
+        Args:
+            operations: Operations in file order
+
+        Returns:
+            Groups of operations for one email each, in file order within
+            the group
+        """
+        groups: "OrderedDict[str, List[UserOperation]]" = OrderedDict()
+        for operation in operations:
+            groups.setdefault(operation.email.lower(), []).append(operation)
+
+        cached, uncached = [], []
+        for email, group in groups.items():
+            (cached if self._is_user_id_cached(email) else uncached).append(
+                group
+            )
+        return cached + uncached
+
+    def _apply_one(
+        self, space_id: str, operation: UserOperation
+    ) -> UserOperationResult:
+        """Apply one operation, capturing any failure in the result."""
+        started = time.monotonic()
+        status, error = OperationStatus.SUCCEEDED, None
+        try:
+            if operation.action == UserAction.REMOVE:
+                self.api_client.remove_user_from_space(
+                    space_id, operation.email
+                )
+            else:
+                self.api_client.add_user_to_space(
+                    space_id, operation.email, role=operation.role
+                )
+        except GatherManagerError as e:
+            status, error = OperationStatus.FAILED, str(e)
+
+        return UserOperationResult(
+            row=operation.row,
+            email=operation.email,
+            action=operation.action,
+            role=operation.role,
+            status=status,
+            error=error,
+            duration_seconds=time.monotonic() - started,
+        )
+
+    async def apply_async(
+        self,
+        space_id: str,
+        operations: List[UserOperation],
+        journal: Optional[OperationJournal] = None,
+        on_result: Optional[Callable[[UserOperationResult], None]] = None,
+    ) -> BulkUserReport:
+        """Apply operations concurrently.
+
+        Args:
+            space_id: ID of the space
+            operations: Operations to apply
+            journal: Journal to log progress to; operations it records as
+                completed are skipped
+            on_result: Called with each result as it becomes available
+
+        Returns:
+            Report with a result per operation, in row order
+        """
+        started = time.monotonic()
+        lookup_lanes = asyncio.Semaphore(max(1, self.max_concurrency // 2))
+        results: List[UserOperationResult] = []
+
+        def record(result: UserOperationResult) -> None:
+            results.append(result)
+            if on_result:
+                on_result(result)
+
+        async def run_group(group: List[UserOperation]) -> None:
+            needs_lookup = not self._is_user_id_cached(group[0].email)
+            for operation in group:
+                if journal and journal.is_completed(operation):
+                    record(
+                        UserOperationResult(
+                            row=operation.row,
+                            email=operation.email,
+                            action=operation.action,
+                            role=operation.role,
+                            status=OperationStatus.SKIPPED,
+                        )
+                    )
+                    continue
+
+                if journal:
+                    journal.record_started(operation)
+                if needs_lookup:
+                    # The first call for an email resolves its user ID
+                    async with lookup_lanes:
+                        result = await self.async_client.run(
+                            self._apply_one, space_id, operation
+                        )
+                    needs_lookup = False
+                else:
+                    result = await self.async_client.run(
+                        self._apply_one, space_id, operation
+                    )
+                if journal:
+                    journal.record_finished(operation, result)
+                record(result)
+
+        await asyncio.gather(
+            *[run_group(group) for group in self.schedule(operations)]
+        )
+
+        return BulkUserReport(
+            results=sorted(results, key=lambda result: result.row),
+            elapsed_seconds=time.monotonic() - started,
+        )
+
+    def apply(
+        self,
+        space_id: str,
+        operations: List[UserOperation],
+        journal: Optional[OperationJournal] = None,
+        on_result: Optional[Callable[[UserOperationResult], None]] = None,
+    ) -> BulkUserReport:
+        """Apply operations concurrently from synchronous code.
+
+        Args:
+            space_id: ID of the space
+            operations: Operations to apply
+            journal: Journal to log progress to; operations it records as
+                completed are skipped
+            on_result: Called with each result as it becomes available
+
+        Returns:
+            Report with a result per operation, in row order
+        """
+        return asyncio.run(
+            self.apply_async(space_id, operations, journal, on_result)
+        )
+
+    @staticmethod
+    def write_report(report: BulkUserReport, path: Union[str, Path]) -> None:
+        """Write a per-row report as CSV, or JSON for a ``.json`` path.
+
+        Args:
+            report: Report to write
+            path: Output file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix.lower() == ".json":
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(report.to_dict(), f, indent=2)
+            return
+
+        fields = list(UserOperationResult.model_fields)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            for result in report.results:
+                writer.writerow(result.model_dump(mode="json"))
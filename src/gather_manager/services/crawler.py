@@ -0,0 +1,346 @@
+"""Service for crawling every map of many Gather.town spaces at once."""
+
+import asyncio
+import csv
+import gzip
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from gather_manager.api.async_client import AsyncGatherClient
+from gather_manager.api.client import GatherClient
+from gather_manager.api.json_codec import JsonCodec, get_codec
+from gather_manager.api.tracing import traced
+from gather_manager.models.crawl import CrawlReport, MapCrawlResult
+from gather_manager.models.space import Object
+from gather_manager.utils.exceptions import (
+    ConfigurationError,
+    GatherManagerError,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class MapObjectDataset:
+    """Map objects of many spaces stored column by column.
+
+    Each column is a list with one entry per object, so the dataset of a
+    whole organization stays compact and can be written as columnar JSON,
+    CSV or (with pyarrow installed) Parquet.
+    """
+
+    COLUMNS = (
+        "space_id",
+        "map_id",
+        "object_id",
+        "type",
+        "x",
+        "y",
+        "width",
+        "height",
+        "is_portal",
+        "target_map",
+        "target_x",
+        "target_y",
+    )
+
+    def __init__(self) -> None:
+        self.columns: Dict[str, List[Any]] = {
+            name: [] for name in self.COLUMNS
+        }
+
+    def __len__(self) -> int:
+        return len(self.columns["space_id"])
+
+    @classmethod
+    def from_objects(
+        cls, space_id: str, map_id: str, objects: Sequence[Object]
+    ) -> "MapObjectDataset":
+        """Build the columns for the objects of one map.
+
+        Args:
+            space_id: ID of the space
+            map_id: ID of the map
+            objects: Objects of the map
+
+        Returns:
+            Dataset with one row per object
+        """
+        dataset = cls()
+        columns = dataset.columns
+        columns["space_id"] = [space_id] * len(objects)
+        columns["map_id"] = [map_id] * len(objects)
+        for obj in objects:
+            columns["object_id"].append(obj.id)
+            columns["type"].append(str(obj.type))
+            columns["x"].append(obj.x)
+            columns["y"].append(obj.y)
+            columns["width"].append(obj.width)
+            columns["height"].append(obj.height)
+            columns["is_portal"].append(GatherClient.is_portal_object(obj))
+            columns["target_map"].append(obj.targetMap)
+            columns["target_x"].append(obj.targetX)
+            columns["target_y"].append(obj.targetY)
+        return dataset
+
+    def extend(self, other: "MapObjectDataset") -> None:
+        """Append the rows of another dataset.
+
+        Args:
+            other: Dataset to append
+        """
+        for name, values in other.columns.items():
+            self.columns[name].extend(values)
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the rows as dictionaries."""
+        for values in zip(*(self.columns[name] for name in self.COLUMNS)):
+            yield dict(zip(self.COLUMNS, values))
+
+    def write(
+        self, path: Union[str, Path], json_codec: Optional[JsonCodec] = None
+    ) -> Path:
+        """Write the dataset, choosing the format from the file suffix.
+
+        ``.csv`` writes one row per object, ``.parquet`` writes a Parquet
+        table and anything else writes columnar JSON (gzipped for ``.gz``).
+
+        Args:
+            path: Output file
+            json_codec: Codec for JSON output. Defaults to ``get_codec()``.
+
+        Returns:
+            The output path
+
+        Raises:
+            ConfigurationError: If Parquet is requested without pyarrow.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        suffix = path.suffix.lower()
+
+        if suffix == ".parquet":
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError as e:
+                raise ConfigurationError(
+                    "Writing Parquet requires the pyarrow package"
+                ) from e
+            pq.write_table(pa.table(self.columns), path)
+        elif suffix == ".csv":
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=self.COLUMNS)
+                writer.writeheader()
+                writer.writerows(self.rows())
+        else:
+            document = {"rows": len(self), "columns": self.columns}
+            encoded = (json_codec or get_codec()).dumps(document)
+            opener = gzip.open if suffix == ".gz" else open
+            with opener(path, "wb") as f:
+                f.write(encoded)
+        return path
+
+
+@dataclass
+class CrawlProgress:
+    """Live counters of a running crawl."""
+
+    spaces_total: int = 0
+    spaces_done: int = 0
+    maps_total: int = 0
+    maps_done: int = 0
+    maps_failed: int = 0
+    objects: int = 0
+    started: float = field(default_factory=time.monotonic)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """Seconds since the crawl started."""
+        return time.monotonic() - self.started
+
+    @property
+    def maps_per_second(self) -> float:
+        """Maps finished per second so far."""
+        elapsed = self.elapsed_seconds
+        return self.maps_done / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def objects_per_second(self) -> float:
+        """Objects read per second so far."""
+        elapsed = self.elapsed_seconds
+        return self.objects / elapsed if elapsed > 0 else 0.0
+
+
+class SpaceCrawler:
+    """Reads every map of many spaces concurrently into one dataset.
+
+    All spaces share one client, so a single session, rate limiter and
+    circuit breaker serve the whole crawl, and the async client's
+    ``max_concurrency`` bounds the requests in flight across all spaces.
+    """
+
+    DEFAULT_MAX_CONCURRENCY = 8
+
+    def __init__(
+        self,
+        api_client: GatherClient,
+        async_client: Optional[AsyncGatherClient] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        """Initialize the crawler.
+
+        Args:
+            api_client: Client used for every request
+            async_client: Async client that runs the requests. If not
+                provided, one is created around ``api_client`` on first use.
+            max_concurrency: Maximum requests in flight at once, across all
+                spaces
+        """
+        self.api_client = api_client
+        self._async_client = async_client
+        self._owns_async_client = async_client is None
+        self.max_concurrency = max_concurrency
+        self.progress = CrawlProgress()
+
+    @property
+    def async_client(self) -> AsyncGatherClient:
+        """The async client that runs the requests."""
+        if self._async_client is None:
+            self._async_client = AsyncGatherClient(
+                client=self.api_client, max_concurrency=self.max_concurrency
+            )
+        return self._async_client
+
+    def close(self) -> None:
+        """Shut down the async client, if this service created it."""
+        if self._owns_async_client and self._async_client is not None:
+            self._async_client.close()
+            self._async_client = None
+
+    def __enter__(self) -> "SpaceCrawler":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _read_map(self, space_id: str, map_id: str) -> MapObjectDataset:
+        """Fetch a map and convert its objects to columns."""
+        objects = self.api_client.get_map_objects(space_id, map_id)
+        return MapObjectDataset.from_objects(space_id, map_id, objects)
+
+    async def _crawl_map(
+        self, space_id: str, map_id: str
+    ) -> Tuple[MapCrawlResult, MapObjectDataset]:
+        """Read one map, capturing any failure in the result."""
+        started = time.monotonic()
+        result = MapCrawlResult(space_id=space_id, map_id=map_id)
+        try:
+            columns = await self.async_client.run(
+                self._read_map, space_id, map_id
+            )
+        except GatherManagerError as e:
+            logger.warning(
+                f"Skipping map {map_id} of space {space_id} due to error: "
+                f"{str(e)}"
+            )
+            result.error = str(e)
+            columns = MapObjectDataset()
+            self.progress.maps_failed += 1
+        else:
+            result.objects = len(columns)
+            result.portals = sum(columns.columns["is_portal"])
+            self.progress.objects += result.objects
+        result.duration_seconds = time.monotonic() - started
+        self.progress.maps_done += 1
+        return result, columns
+
+    @traced("crawler.crawl")
+    async def crawl_async(
+        self,
+        role: Optional[str] = None,
+        space_ids: Optional[Sequence[str]] = None,
+    ) -> Tuple[CrawlReport, MapObjectDataset]:
+        """Crawl every map of the accessible spaces concurrently.
+
+        Args:
+            role: Only crawl spaces where the API key has this role (see
+                ``GatherClient.get_spaces``)
+            space_ids: Crawl these spaces instead of listing them
+
+        Returns:
+            Tuple of the per-map report and the dataset of all objects
+
+        Raises:
+            GatherManagerError: If the list of spaces cannot be retrieved
+        """
+        self.progress = CrawlProgress()
+        dataset = MapObjectDataset()
+        report = CrawlReport()
+
+        if space_ids is None:
+            spaces = await self.async_client.get_spaces(role=role)
+            space_ids = [space["id"] for space in spaces]
+        report.spaces = list(space_ids)
+        self.progress.spaces_total = len(space_ids)
+        logger.info(f"Crawling {len(space_ids)} spaces")
+
+        async def crawl_space(
+            space_id: str,
+        ) -> List[Tuple[MapCrawlResult, MapObjectDataset]]:
+            try:
+                maps = await self.async_client.get_maps(space_id)
+            except GatherManagerError as e:
+                logger.warning(
+                    f"Skipping space {space_id} due to error: {str(e)}"
+                )
+                report.space_errors[space_id] = str(e)
+                self.progress.spaces_done += 1
+                return []
+
+            self.progress.maps_total += len(maps)
+            results = await asyncio.gather(
+                *(self._crawl_map(space_id, map_obj.id) for map_obj in maps)
+            )
+            self.progress.spaces_done += 1
+            return results
+
+        # Maps finish in any order; rows are merged in space and map order
+        for results in await asyncio.gather(
+            *(crawl_space(space_id) for space_id in space_ids)
+        ):
+            for result, columns in results:
+                report.maps.append(result)
+                dataset.extend(columns)
+        report.elapsed_seconds = self.progress.elapsed_seconds
+        return report, dataset
+
+    def crawl(
+        self,
+        role: Optional[str] = None,
+        space_ids: Optional[Sequence[str]] = None,
+    ) -> Tuple[CrawlReport, MapObjectDataset]:
+        """Crawl every map of the accessible spaces from synchronous code.
+
+        Args:
+            role: Only crawl spaces where the API key has this role
+            space_ids: Crawl these spaces instead of listing them
+
+        Returns:
+            Tuple of the per-map report and the dataset of all objects
+
+        Raises:
+            GatherManagerError: If the list of spaces cannot be retrieved
+        """
+        return asyncio.run(self.crawl_async(role, space_ids))
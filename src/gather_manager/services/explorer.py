@@ -1,14 +1,22 @@
 """Service for exploring and analyzing portal structures in Gather.town."""
 
-import json
+import asyncio
 import logging
 import os
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+from gather_manager.api.async_client import AsyncGatherClient
 from gather_manager.api.client import GatherClient
+from gather_manager.api.deadline import deadline
+from gather_manager.api.json_codec import JsonCodec
+from gather_manager.api.tracing import traced
 from gather_manager.models.space import Map, MapData, Object
-from gather_manager.utils.exceptions import GatherApiError, GatherManagerError
+from gather_manager.utils.exceptions import (
+    DeadlineExceededError,
+    GatherApiError,
+    GatherManagerError,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -17,20 +25,41 @@ class PortalExplorer:
     """Service for exploring and analyzing portal structures in Gather.town."""
 
     def __init__(
-        self, client: Optional[GatherClient] = None, output_dir: str = "data"
+        self,
+        client: Optional[GatherClient] = None,
+        output_dir: str = "data",
+        async_client: Optional[AsyncGatherClient] = None,
+        max_concurrency: int = AsyncGatherClient.DEFAULT_MAX_CONCURRENCY,
+        json_codec: Optional[JsonCodec] = None,
     ):
         """Initialize with optional client and output directory.
 
         Args:
             client: GatherClient instance or None to create a new one
             output_dir: Directory to store output data
+            async_client: AsyncGatherClient used by the ``*_async`` methods.
+                If not provided, one is created around ``client`` on first use.
+            max_concurrency: Maximum concurrent requests for the async client
+                created when ``async_client`` is not provided
+            json_codec: Codec that writes the output files. Defaults to
+                ``JsonCodec``, which writes what ``json.dump`` does; the
+                faster codecs change how non-ASCII and NaN are written.
 
         Raises:
             GatherManagerError: If there are issues initializing the client
         """
         try:
-            self.client = client or GatherClient()
+            self._owns_client = client is None
+            self.client = client or GatherClient(
+                pool_maxsize=max(
+                    max_concurrency, GatherClient.DEFAULT_POOL_MAXSIZE
+                )
+            )
             self.output_dir = output_dir
+            self._async_client = async_client
+            self._owns_async_client = async_client is None
+            self.max_concurrency = max_concurrency
+            self.json_codec = json_codec or JsonCodec()
 
             # Create timestamp for this exploration session
             self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -45,6 +74,7 @@ class PortalExplorer:
                 f"Failed to initialize PortalExplorer: {str(e)}"
             ) from e
 
+    @traced("explorer.analyze_map_portals")
     def analyze_map_portals(self, space_id: str, map_id: str) -> List[Object]:
         """Analyze portal structures in a specific map.
 
@@ -69,23 +99,15 @@ class PortalExplorer:
                 return []
 
             logger.info(f"Found {len(portals)} portals in map {map_id}")
-
-            # Save portals to file
-            self._save_to_json(
-                data=[p.model_dump(exclude_none=False) for p in portals],
-                filename=f"portals_{map_id}.json",
-                message=f"Saved {len(portals)} portals from map {map_id}",
-            )
+            self._save_portals(map_id, portals)
 
             # Get full map data for context
             map_data = self.client.get_map_data(space_id, map_id)
-            self._save_to_json(
-                data=map_data.model_dump(exclude_none=False),
-                filename=f"map_{map_id}.json",
-                message=f"Saved full map data for {map_id}",
-            )
+            self._save_map_data(map_id, map_data)
 
             return portals
+        except DeadlineExceededError:
+            raise
         except GatherApiError as e:
             logger.error(f"API error while analyzing map {map_id}: {str(e)}")
             raise GatherManagerError(
@@ -99,72 +121,58 @@ class PortalExplorer:
                 f"Failed to analyze map {map_id}: {str(e)}"
             ) from e
 
-    def analyze_all_maps(self, space_id: str) -> Dict[str, List[Object]]:
+    @traced("explorer.analyze_all_maps")
+    def analyze_all_maps(
+        self, space_id: str, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, List[Object]]:
         """Analyze portals in all maps of a space.
 
         Args:
             space_id: ID of the space
+            deadline_seconds: Optional time budget for the whole sweep. When
+                it runs out, maps analyzed so far are saved and returned.
 
         Returns:
             Dictionary mapping map IDs to lists of portal objects
 
         Raises:
             GatherManagerError: If there are issues retrieving or analyzing maps
+            DeadlineExceededError: If the deadline passes before the map list
+                is retrieved
         """
         logger.info(f"Analyzing all maps in space {space_id}")
 
         try:
-            # Get all maps in the space
-            maps = self.client.get_maps(space_id)
-            logger.info(f"Found {len(maps)} maps in space {space_id}")
-
-            # Save maps list
-            self._save_to_json(
-                data=[m.model_dump(exclude_none=False) for m in maps],
-                filename=f"maps_list_{space_id}.json",
-                message=f"Saved list of {len(maps)} maps",
-            )
-
-            # Analyze portals in each map
-            results = {}
-            for map_obj in maps:
-                map_id = map_obj.id
-                try:
-                    portals = self.analyze_map_portals(space_id, map_id)
-                    results[map_id] = portals
-                except GatherManagerError as e:
-                    logger.warning(
-                        f"Skipping map {map_id} due to error: {str(e)}"
-                    )
-                    results[map_id] = []
-
-            # Generate and save portal connections
-            connections = self._analyze_portal_connections(results)
-            self._save_to_json(
-                data=connections,
-                filename=f"portal_connections_{space_id}.json",
-                message=f"Saved portal connections analysis",
-            )
-
-            # Save summary
-            summary = {
-                "maps_count": len(maps),
-                "portals_by_map": {
-                    map_id: len(portals) for map_id, portals in results.items()
-                },
-                "total_portals": sum(
-                    len(portals) for portals in results.values()
-                ),
-                "connections": len(connections),
-            }
-
-            self._save_to_json(
-                data=summary,
-                filename=f"portal_summary_{space_id}.json",
-                message=f"Saved portal summary for all maps",
-            )
+            with deadline(deadline_seconds):
+                # Get all maps in the space
+                maps = self.client.get_maps(space_id)
+                logger.info(f"Found {len(maps)} maps in space {space_id}")
+                self._save_maps_list(space_id, maps)
+
+                # Analyze portals in each map
+                results = {}
+                for map_obj in maps:
+                    map_id = map_obj.id
+                    try:
+                        portals = self.analyze_map_portals(space_id, map_id)
+                        results[map_id] = portals
+                    except DeadlineExceededError:
+                        logger.warning(
+                            f"Deadline reached after {len(results)} of "
+                            f"{len(maps)} maps; returning partial results"
+                        )
+                        break
+                    except GatherManagerError as e:
+                        logger.warning(
+                            f"Skipping map {map_id} due to error: {str(e)}"
+                        )
+                        results[map_id] = []
+
+            self._save_space_analysis(space_id, maps, results)
 
             return results
+        except DeadlineExceededError:
+            raise
         except GatherApiError as e:
             logger.error(
                 f"API error while analyzing maps in space {space_id}: {str(e)}"
@@ -180,6 +188,213 @@ class PortalExplorer:
                 f"Failed to analyze maps in space {space_id}: {str(e)}"
             ) from e
 
+    @property
+    def async_client(self) -> AsyncGatherClient:
+        """AsyncGatherClient used by the ``*_async`` methods."""
+        if self._async_client is None:
+            self._async_client = AsyncGatherClient(
+                client=self.client, max_concurrency=self.max_concurrency
+            )
+        return self._async_client
+
+    def close(self) -> None:
+        """Shut down the clients this explorer created."""
+        if self._owns_async_client and self._async_client is not None:
+            self._async_client.close()
+            self._async_client = None
+        if self._owns_client:
+            self.client.close()
+
+    def __enter__(self) -> "PortalExplorer":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @traced("explorer.analyze_map_portals")
+    async def analyze_map_portals_async(
+        self, space_id: str, map_id: str
+    ) -> List[Object]:
+        """Async variant of analyze_map_portals.
+
+        Args:
+            space_id: ID of the space
+            map_id: ID of the map
+
+        Returns:
+            List of portal objects
+
+        Raises:
+            GatherManagerError: If there are issues retrieving portal information
+        """
+        logger.info(f"Analyzing portals in map {map_id} of space {space_id}")
+
+        try:
+            portals = await self.async_client.get_portals(space_id, map_id)
+
+            if not portals:
+                logger.info(f"No portals found in map {map_id}")
+                return []
+
+            logger.info(f"Found {len(portals)} portals in map {map_id}")
+            self._save_portals(map_id, portals)
+
+            map_data = await self.async_client.get_map_data(space_id, map_id)
+            self._save_map_data(map_id, map_data)
+
+            return portals
+        except DeadlineExceededError:
+            raise
+        except Exception as e:
+            logger.error(f"Error while analyzing map {map_id}: {str(e)}")
+            raise GatherManagerError(
+                f"Failed to analyze map {map_id}: {str(e)}"
+            ) from e
+
+    @traced("explorer.analyze_all_maps")
+    async def analyze_all_maps_async(
+        self, space_id: str, deadline_seconds: Optional[float] = None
+    ) -> Dict[str, List[Object]]:
+        """Async variant of analyze_all_maps that fetches maps concurrently.
+
+        Concurrency is bounded by the async client's ``max_concurrency``.
+
+        Args:
+            space_id: ID of the space
+            deadline_seconds: Optional time budget for the whole sweep. When
+                it runs out, maps analyzed so far are saved and returned.
+
+        Returns:
+            Dictionary mapping map IDs to lists of portal objects
+
+        Raises:
+            GatherManagerError: If there are issues retrieving or analyzing maps
+            DeadlineExceededError: If the deadline passes before the map list
+                is retrieved
+        """
+        logger.info(f"Analyzing all maps in space {space_id}")
+
+        async def analyze_or_skip(map_id: str) -> Optional[List[Object]]:
+            try:
+                return await self.analyze_map_portals_async(space_id, map_id)
+            except DeadlineExceededError:
+                return None
+            except GatherManagerError as e:
+                logger.warning(f"Skipping map {map_id} due to error: {str(e)}")
+                return []
+
+        try:
+            with deadline(deadline_seconds):
+                maps = await self.async_client.get_maps(space_id)
+                logger.info(f"Found {len(maps)} maps in space {space_id}")
+                self._save_maps_list(space_id, maps)
+
+                map_ids = [map_obj.id for map_obj in maps]
+                portal_lists = await asyncio.gather(
+                    *(analyze_or_skip(map_id) for map_id in map_ids)
+                )
+
+            # Maps cut off by the deadline are left out of the results
+            results = {
+                map_id: portals
+                for map_id, portals in zip(map_ids, portal_lists)
+                if portals is not None
+            }
+            if len(results) < len(maps):
+                logger.warning(
+                    f"Deadline reached after {len(results)} of "
+                    f"{len(maps)} maps; returning partial results"
+                )
+
+            self._save_space_analysis(space_id, maps, results)
+
+            return results
+        except DeadlineExceededError:
+            raise
+        except Exception as e:
+            logger.error(
+                f"Error while analyzing maps in space {space_id}: {str(e)}"
+            )
+            raise GatherManagerError(
+                f"Failed to analyze maps in space {space_id}: {str(e)}"
+            ) from e
+
+    def _save_portals(self, map_id: str, portals: List[Object]):
+        """Save the portals found in a map.
+
+        Args:
+            map_id: ID of the map
+            portals: Portal objects found in the map
+        """
+        self._save_to_json(
+            data=portals,
+            filename=f"portals_{map_id}.json",
+            message=f"Saved {len(portals)} portals from map {map_id}",
+        )
+
+    def _save_map_data(self, map_id: str, map_data: MapData):
+        """Save full map data for context.
+
+        Args:
+            map_id: ID of the map
+            map_data: Full map data
+        """
+        self._save_to_json(
+            data=map_data,
+            filename=f"map_{map_id}.json",
+            message=f"Saved full map data for {map_id}",
+        )
+
+    def _save_maps_list(self, space_id: str, maps: List[Map]):
+        """Save the list of maps in a space.
+
+        Args:
+            space_id: ID of the space
+            maps: Maps in the space
+        """
+        self._save_to_json(
+            data=maps,
+            filename=f"maps_list_{space_id}.json",
+            message=f"Saved list of {len(maps)} maps",
+        )
+
+    def _save_space_analysis(
+        self,
+        space_id: str,
+        maps: List[Map],
+        results: Dict[str, List[Object]],
+    ):
+        """Compute and save portal connections and the space summary.
+
+        Args:
+            space_id: ID of the space
+            maps: Maps in the space
+            results: Dictionary mapping map IDs to lists of portal objects
+        """
+        connections = self._analyze_portal_connections(results)
+        self._save_to_json(
+            data=connections,
+            filename=f"portal_connections_{space_id}.json",
+            message=f"Saved portal connections analysis",
+        )
+
+        summary = {
+            "maps_count": len(maps),
+            "maps_analyzed": len(results),
+            "portals_by_map": {
+                map_id: len(portals) for map_id, portals in results.items()
+            },
+            "total_portals": sum(len(portals) for portals in results.values()),
+            "connections": len(connections),
+        }
+
+        self._save_to_json(
+            data=summary,
+            filename=f"portal_summary_{space_id}.json",
+            message=f"Saved portal summary for all maps",
+        )
+
+    @traced("explorer.analyze_portal_connections")
     def _analyze_portal_connections(
         self, portal_map: Dict[str, List[Object]]
     ) -> List[Dict[str, Any]]:
@@ -262,11 +477,15 @@ class PortalExplorer:
 
         return connections
 
+    @traced("explorer.save_to_json", arguments=("filename",))
     def _save_to_json(
         self, data: Any, filename: str, message: Optional[str] = None
     ):
         """Save data to a JSON file in the session directory.
 
+        Models in the data are serialized by the codec directly, without
+        converting them to dictionaries first.
+
         Args:
             data: Data to save
             filename: Name of the file
@@ -277,8 +496,7 @@ class PortalExplorer:
         """
         filepath = os.path.join(self.session_dir, filename)
         try:
-            with open(filepath, "w") as f:
-                json.dump(data, f, indent=2)
+            self.json_codec.write(filepath, data)
 
             if message:
                 logger.info(f"{message} to {filepath}")
@@ -2,28 +2,167 @@
 Service for analyzing portals in Gather.town spaces.
 """
 
+import asyncio
 import csv
-import json
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
+from gather_manager.api.async_client import AsyncGatherClient
 from gather_manager.api.client import GatherClient
-from gather_manager.models.portal import Portal
+from gather_manager.api.json_codec import JsonCodec
+from gather_manager.api.tracing import traced
+from gather_manager.models.object_table import MapObjectTable
+from gather_manager.models.portal import PortalRecord
+
+# Map objects as returned by the API client, or as a columnar table
+MapObjects = Union[Dict[str, Any], MapObjectTable]
 
 
 class PortalService:
     """Service for analyzing portals in Gather.town spaces."""
 
-    def __init__(self, api_client: GatherClient):
+    def __init__(
+        self,
+        api_client: GatherClient,
+        async_client: Optional[AsyncGatherClient] = None,
+        json_codec: Optional[JsonCodec] = None,
+        space_id: Optional[str] = None,
+    ):
         """
         Initialize the PortalService.
 
         Args:
             api_client: The API client to use for accessing Gather.town data.
+            async_client: The async client used by the ``*_async`` methods.
+                If not provided, one is created around ``api_client`` on first use.
+            json_codec: Codec that writes JSON exports. Defaults to
+                ``JsonCodec``, which writes what ``json.dump`` does; the
+                faster codecs change how non-ASCII and NaN are written.
+            space_id: The ID of the space to analyze. When set, maps are
+                streamed with ``GatherClient.iter_map_objects`` and only
+                their portal objects are kept in memory.
         """
         self.api_client = api_client
+        self._async_client = async_client
+        self._owns_async_client = async_client is None
+        self.json_codec = json_codec or JsonCodec()
+        self.space_id = space_id
+
+    @property
+    def async_client(self) -> AsyncGatherClient:
+        """
+        The async client used by the ``*_async`` methods.
+
+        Returns:
+            AsyncGatherClient: The async client.
+        """
+        if self._async_client is None:
+            self._async_client = AsyncGatherClient(client=self.api_client)
+        return self._async_client
+
+    def close(self) -> None:
+        """Shut down the async client, if this service created it."""
+        if self._owns_async_client and self._async_client is not None:
+            self._async_client.close()
+            self._async_client = None
+
+    def __enter__(self) -> "PortalService":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _iter_map_objects(self) -> Iterable[Tuple[str, MapObjects]]:
+        """
+        Fetch the objects of every map in the space, one map at a time.
+
+        Returns:
+            Iterable[Tuple[str, MapObjects]]: Pairs of map ID and map objects.
+        """
+        # Get all maps in the space
+        for map_id in self._get_map_ids():
+            yield map_id, self._get_map_objects(map_id)
+
+    async def _gather_map_objects(self) -> List[Tuple[str, MapObjects]]:
+        """
+        Fetch the objects of every map in the space concurrently.
+
+        Returns:
+            List[Tuple[str, MapObjects]]: Pairs of map ID and map objects.
+        """
+        map_ids = await self.async_client.run(self._get_map_ids)
+        map_objects = await asyncio.gather(
+            *(
+                self.async_client.run(self._get_map_objects, map_id)
+                for map_id in map_ids
+            )
+        )
+        return list(zip(map_ids, map_objects))
+
+    def _get_map_ids(self) -> List[str]:
+        """
+        Get the IDs of the maps in the space.
+
+        Returns:
+            List[str]: The map IDs.
+        """
+        if self.space_id is None:
+            return [map_data["id"] for map_data in self.api_client.get_maps()]
+        return [
+            map_data.id for map_data in self.api_client.get_maps(self.space_id)
+        ]
+
+    def _get_map_objects(self, map_id: str) -> MapObjects:
+        """
+        Get the objects of a map.
+
+        Without a space ID the whole map is read with ``get_map_objects``.
+        With one, the map is streamed and only its portal objects (type 4)
+        are kept, so memory is bounded by the portals rather than the map.
+
+        Args:
+            map_id: The ID of the map.
+
+        Returns:
+            MapObjects: The map objects.
+        """
+        if self.space_id is None:
+            return self.api_client.get_map_objects(map_id)
+        return {
+            "objects": [
+                obj.model_dump(exclude_none=True)
+                for obj in self.api_client.iter_map_objects(
+                    self.space_id, map_id
+                )
+                if obj.type == 4
+            ]
+        }
+
+    @staticmethod
+    def _portal_objects(map_objects: MapObjects) -> List[Dict[str, Any]]:
+        """
+        Select the portal objects (type 4) of a map.
+
+        Args:
+            map_objects: The map objects as returned by the API client, or a
+                ``MapObjectTable``, whose portal rows are looked up by type
+                code instead of object by object.
+
+        Returns:
+            List[Dict[str, Any]]: The portal objects as dictionaries.
+        """
+        if isinstance(map_objects, MapObjectTable):
+            return [
+                map_objects.row(row) for row in map_objects.rows_of_type(4)
+            ]
+        return [
+            obj
+            for obj in map_objects.get("objects", [])
+            if obj.get("type") == 4
+        ]
 
+    @traced("portal_service.validate_portals")
     def validate_portals(self) -> Dict[str, List[Dict[str, Any]]]:
         """
         Validate all portals across all maps in the space.
@@ -31,65 +170,53 @@ class PortalService:
         Returns:
             Dict[str, List[Dict[str, Any]]]: A dictionary containing lists of valid and invalid portals.
         """
-        valid_portals = []
-        invalid_portals = []
+        return self._validate_map_objects(self._iter_map_objects())
 
-        # Get all maps in the space
-        maps = self.api_client.get_maps()
+    @traced("portal_service.validate_portals")
+    async def validate_portals_async(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Validate all portals across all maps, fetching maps concurrently.
 
-        # Process each map
-        for map_data in maps:
-            map_id = map_data["id"]
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: A dictionary containing lists of valid and invalid portals.
+        """
+        return self._validate_map_objects(await self._gather_map_objects())
+
+    def _validate_map_objects(
+        self, maps_objects: Iterable[Tuple[str, MapObjects]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Validate the portals found in the given maps.
 
-            # Get all objects in the map
-            map_objects = self.api_client.get_map_objects(map_id)
+        Args:
+            maps_objects: Pairs of map ID and map objects.
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: A dictionary containing lists of valid and invalid portals.
+        """
+        valid_portals = []
+        invalid_portals = []
 
+        # Process each map
+        for map_id, map_objects in maps_objects:
             # Filter for portal objects (type 4)
-            portal_objects = [
-                obj
-                for obj in map_objects.get("objects", [])
-                if obj.get("type") == 4
-            ]
+            portal_objects = self._portal_objects(map_objects)
 
             # Process each portal
             for portal_obj in portal_objects:
-                # Add map_id to the portal object
-                portal_obj["map_id"] = map_id
-
-                # Create a Portal model instance
+                # Read the portal into a record
                 try:
-                    portal = Portal.model_validate(portal_obj)
+                    record = PortalRecord.from_raw(portal_obj, map_id)
 
                     # Check if the portal is valid
-                    if portal.is_valid():
-                        valid_portals.append(
-                            {
-                                "id": portal.id,
-                                "map_id": map_id,
-                                "x": portal.x,
-                                "y": portal.y,
-                                "target_map": portal.properties.target_map,
-                                "target_x": portal.properties.target_x,
-                                "target_y": portal.properties.target_y,
-                                "is_valid": True,
-                            }
-                        )
+                    if record.is_valid():
+                        valid_portals.append(record.to_dict())
                     else:
                         # Determine the reason for invalidity
-                        reason = self._get_invalidity_reason(portal)
+                        reason = self._get_invalidity_reason(record)
 
                         invalid_portals.append(
-                            {
-                                "id": portal.id,
-                                "map_id": map_id,
-                                "x": portal.x,
-                                "y": portal.y,
-                                "target_map": portal.properties.target_map,
-                                "target_x": portal.properties.target_x,
-                                "target_y": portal.properties.target_y,
-                                "is_valid": False,
-                                "reason": reason,
-                            }
+                            {**record.to_dict(), "reason": reason}
                         )
                 except Exception as e:
                     # If the portal can't be validated, add it to the invalid list
@@ -107,6 +234,7 @@ class PortalService:
             "invalid_portals": invalid_portals,
         }
 
+    @traced("portal_service.analyze_connections")
     def analyze_connections(self) -> List[Dict[str, Any]]:
         """
         Analyze portal connections between maps.
@@ -114,37 +242,48 @@ class PortalService:
         Returns:
             List[Dict[str, Any]]: A list of connections between maps.
         """
-        connections = {}
+        return self._connections_from_map_objects(self._iter_map_objects())
 
-        # Get all maps in the space
-        maps = self.api_client.get_maps()
+    @traced("portal_service.analyze_connections")
+    async def analyze_connections_async(self) -> List[Dict[str, Any]]:
+        """
+        Analyze portal connections between maps, fetching maps concurrently.
 
-        # Process each map
-        for map_data in maps:
-            source_map_id = map_data["id"]
+        Returns:
+            List[Dict[str, Any]]: A list of connections between maps.
+        """
+        return self._connections_from_map_objects(
+            await self._gather_map_objects()
+        )
+
+    def _connections_from_map_objects(
+        self, maps_objects: Iterable[Tuple[str, MapObjects]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Count portal connections between the given maps.
 
-            # Get all objects in the map
-            map_objects = self.api_client.get_map_objects(source_map_id)
+        Args:
+            maps_objects: Pairs of map ID and map objects.
 
+        Returns:
+            List[Dict[str, Any]]: A list of connections between maps.
+        """
+        connections = {}
+
+        # Process each map
+        for source_map_id, map_objects in maps_objects:
             # Filter for portal objects (type 4)
-            portal_objects = [
-                obj
-                for obj in map_objects.get("objects", [])
-                if obj.get("type") == 4
-            ]
+            portal_objects = self._portal_objects(map_objects)
 
             # Process each portal
             for portal_obj in portal_objects:
-                # Add map_id to the portal object
-                portal_obj["map_id"] = source_map_id
-
-                # Create a Portal model instance
+                # Read the portal into a record
                 try:
-                    portal = Portal.model_validate(portal_obj)
+                    record = PortalRecord.from_raw(portal_obj, source_map_id)
 
                     # Check if the portal is valid
-                    if portal.is_valid():
-                        destination_map_id = portal.properties.target_map
+                    if record.is_valid():
+                        destination_map_id = record.target_map
 
                         # Create a connection key
                         connection_key = (
@@ -166,6 +305,7 @@ class PortalService:
 
         return list(connections.values())
 
+    @traced("portal_service.get_portal_details")
     def get_portal_details(self, map_id: str) -> List[Dict[str, Any]]:
         """
         Get detailed information about portals in a specific map.
@@ -176,40 +316,38 @@ class PortalService:
         Returns:
             List[Dict[str, Any]]: A list of portal details.
         """
-        portal_details = []
-
         # Get all objects in the map
-        map_objects = self.api_client.get_map_objects(map_id)
+        map_objects = self._get_map_objects(map_id)
+
+        return self._portal_details_from_objects(map_id, map_objects)
+
+    def _portal_details_from_objects(
+        self, map_id: str, map_objects: MapObjects
+    ) -> List[Dict[str, Any]]:
+        """
+        Build portal details from a map's objects.
+
+        Args:
+            map_id: The ID of the map the objects belong to.
+            map_objects: The map objects as returned by the API client, or
+                a ``MapObjectTable``.
+
+        Returns:
+            List[Dict[str, Any]]: A list of portal details.
+        """
+        portal_details = []
 
         # Filter for portal objects (type 4)
-        portal_objects = [
-            obj
-            for obj in map_objects.get("objects", [])
-            if obj.get("type") == 4
-        ]
+        portal_objects = self._portal_objects(map_objects)
 
         # Process each portal
         for portal_obj in portal_objects:
-            # Add map_id to the portal object
-            portal_obj["map_id"] = map_id
-
-            # Create a Portal model instance
+            # Read the portal into a record
             try:
-                portal = Portal.model_validate(portal_obj)
+                record = PortalRecord.from_raw(portal_obj, map_id)
 
                 # Add the portal details
-                portal_details.append(
-                    {
-                        "id": portal.id,
-                        "map_id": map_id,
-                        "x": portal.x,
-                        "y": portal.y,
-                        "target_map": portal.properties.target_map,
-                        "target_x": portal.properties.target_x,
-                        "target_y": portal.properties.target_y,
-                        "is_valid": portal.is_valid(),
-                    }
-                )
+                portal_details.append(record.to_dict())
             except Exception as e:
                 # If the portal can't be validated, add basic information
                 portal_details.append(
@@ -225,6 +363,7 @@ class PortalService:
 
         return portal_details
 
+    @traced("portal_service.export_portals", arguments=("format",))
     def export_portals(
         self, format: str = "json", output_dir: str = "data"
     ) -> str:
@@ -245,27 +384,63 @@ class PortalService:
         # Get all portals
         all_portals = []
 
-        # Get all maps in the space
-        maps = self.api_client.get_maps()
-
-        # Process each map
-        for map_data in maps:
-            map_id = map_data["id"]
-
+        # Process each map in the space
+        for map_id in self._get_map_ids():
             # Get portal details for this map
             portal_details = self.get_portal_details(map_id)
 
             # Add to the list of all portals
             all_portals.extend(portal_details)
 
+        return self._write_export(all_portals, format, output_path)
+
+    @traced("portal_service.export_portals", arguments=("format",))
+    async def export_portals_async(
+        self, format: str = "json", output_dir: str = "data"
+    ) -> str:
+        """
+        Export portal data to a file, fetching maps concurrently.
+
+        Args:
+            format: The format to export to ("json" or "csv").
+            output_dir: The directory to export to.
+
+        Returns:
+            str: The path to the exported file.
+        """
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        all_portals = []
+        for map_id, map_objects in await self._gather_map_objects():
+            all_portals.extend(
+                self._portal_details_from_objects(map_id, map_objects)
+            )
+
+        return self._write_export(all_portals, format, output_path)
+
+    @traced("portal_service.write_export", arguments=("format",))
+    def _write_export(
+        self, all_portals: List[Dict[str, Any]], format: str, output_path: Path
+    ) -> str:
+        """
+        Write portal details to a timestamped export file.
+
+        Args:
+            all_portals: The portal details to export.
+            format: The format to export to ("json" or "csv").
+            output_path: The directory to export to.
+
+        Returns:
+            str: The path to the exported file.
+        """
         # Generate a timestamp for the filename
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
         if format.lower() == "json":
             # Export to JSON
             file_path = output_path / f"portals_{timestamp}.json"
-            with open(file_path, "w") as f:
-                json.dump(all_portals, f, indent=2)
+            self.json_codec.write(file_path, all_portals)
         elif format.lower() == "csv":
             # Export to CSV
             file_path = output_path / f"portals_{timestamp}.csv"
@@ -305,7 +480,7 @@ class PortalService:
 
         return str(file_path)
 
-    def _get_invalidity_reason(self, portal: Portal) -> str:
+    def _get_invalidity_reason(self, portal: PortalRecord) -> str:
         """
         Get the reason why a portal is invalid.
 
@@ -315,11 +490,11 @@ class PortalService:
         Returns:
             str: The reason for invalidity.
         """
-        if portal.properties.target_map is None:
+        if portal.target_map is None:
             return "Missing target map"
-        elif portal.properties.target_x is None:
+        elif portal.target_x is None:
             return "Missing target X coordinate"
-        elif portal.properties.target_y is None:
+        elif portal.target_y is None:
             return "Missing target Y coordinate"
         else:
             return "Unknown reason"
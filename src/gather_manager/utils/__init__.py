@@ -2,9 +2,14 @@
 """Utility functions and classes."""
 
 from gather_manager.utils.exceptions import (
+    CassetteMissError,
+    CircuitOpenError,
     ConfigurationError,
+    DeadlineExceededError,
     GatherApiError,
     GatherManagerError,
+    MapConflictError,
+    MapFlushError,
     ValidationError,
 )
 
@@ -13,4 +18,9 @@ __all__ = [
     "GatherApiError",
     "ValidationError",
     "ConfigurationError",
+    "DeadlineExceededError",
+    "MapConflictError",
+    "MapFlushError",
+    "CassetteMissError",
+    "CircuitOpenError",
 ]
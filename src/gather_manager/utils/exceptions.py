@@ -1,6 +1,6 @@
 """Exceptions for the Gather Manager package."""
 
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
 
 
 class GatherManagerError(Exception):
@@ -20,9 +20,12 @@ class GatherApiError(GatherManagerError):
         status_code: Optional[int] = None,
         endpoint: Optional[str] = None,
         *args: Any,
+        retry_after: Optional[float] = None,
     ):
         self.status_code = status_code
         self.endpoint = endpoint
+        # Seconds the server asked us to wait (Retry-After), if any
+        self.retry_after = retry_after
 
         # Format detailed message if additional info provided
         detailed_message = message
@@ -44,3 +47,57 @@ class ConfigurationError(GatherManagerError):
     """Exception raised when there's an issue with configuration."""
 
     pass
+
+
+class DeadlineExceededError(GatherManagerError):
+    """Exception raised when an operation runs past its deadline budget."""
+
+    pass
+
+
+class MapConflictError(GatherManagerError):
+    """Exception raised when a map changed since buffered edits were based on it."""
+
+    def __init__(self, message: str, space_id: str, map_id: str, *args: Any):
+        self.space_id = space_id
+        self.map_id = map_id
+        super().__init__(message, *args)
+
+
+class MapFlushError(GatherManagerError):
+    """Exception raised when buffered edits could not be written to some maps."""
+
+    def __init__(
+        self,
+        message: str,
+        results: Dict[Tuple[str, str], Any],
+        errors: Dict[Tuple[str, str], Exception],
+        *args: Any,
+    ):
+        # Write results of the maps that were flushed, by (space, map)
+        self.results = results
+        # Error of each map that was not, by (space, map)
+        self.errors = errors
+        super().__init__(message, *args)
+
+
+class CassetteMissError(GatherManagerError):
+    """Exception raised when a replayed request was not in the cassette."""
+
+    def __init__(self, message: str, key: str, *args: Any):
+        self.key = key
+        super().__init__(message, *args)
+
+
+class CircuitOpenError(GatherApiError):
+    """Exception raised when a request is rejected by an open circuit."""
+
+    def __init__(
+        self,
+        message: str,
+        endpoint_class: str,
+        *args: Any,
+        retry_after: Optional[float] = None,
+    ):
+        self.endpoint_class = endpoint_class
+        super().__init__(message, *args, retry_after=retry_after)
@@ -0,0 +1,98 @@
+"""
+Unit tests for the AsyncGatherClient.
+
+Test Metadata:
+- Created: 2026-10-16
+- Last Updated: 2026-10-16
+- Status: Active
+- Owner: Development Team
+- Purpose: Validate async delegation and bounded concurrency
+- Lifecycle:
+  - Created: To ensure whole-space sweeps can run concurrently
+  - Active: Currently used to validate the async client surface
+  - Obsolescence Conditions:
+    1. When the async client is replaced by a native async transport
+- Last Validated: 2026-10-16
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from gather_manager.api.async_client import AsyncGatherClient
+from gather_manager.models.space import MapData
+
+
+class SlowClient:
+    """Fake sync client that records peak concurrency."""
+
+    def __init__(self, delay=0.02):
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def get_map_data(self, space_id, map_id):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        return MapData(id=map_id)
+
+
+class TestAsyncGatherClient:
+    """Tests for the AsyncGatherClient."""
+
+    def test_delegates_to_sync_client(self):
+        """Test that async methods call the wrapped client."""
+        sync_client = MagicMock()
+        sync_client.get_maps.return_value = ["map1"]
+        client = AsyncGatherClient(client=sync_client)
+
+        result = asyncio.run(client.get_maps("space"))
+
+        assert result == ["map1"]
+        sync_client.get_maps.assert_called_once_with("space")
+
+    def test_concurrency_is_bounded(self):
+        """Test that no more than max_concurrency calls run at once."""
+        sync_client = SlowClient()
+        client = AsyncGatherClient(client=sync_client, max_concurrency=3)
+
+        async def sweep():
+            return await asyncio.gather(
+                *(client.get_map_data("space", f"m{i}") for i in range(12))
+            )
+
+        results = asyncio.run(sweep())
+
+        assert [r.id for r in results] == [f"m{i}" for i in range(12)]
+        assert sync_client.peak == 3
+
+    def test_reusable_across_event_loops(self):
+        """Test that the client works across separate asyncio.run calls."""
+        sync_client = MagicMock()
+        sync_client.get_space.return_value = "space"
+        client = AsyncGatherClient(client=sync_client)
+
+        assert asyncio.run(client.get_space("a")) == "space"
+        assert asyncio.run(client.get_space("b")) == "space"
+
+    def test_errors_propagate(self):
+        """Test that exceptions from the sync client are re-raised."""
+        sync_client = MagicMock()
+        sync_client.get_maps.side_effect = RuntimeError("boom")
+        client = AsyncGatherClient(client=sync_client)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            asyncio.run(client.get_maps("space"))
+
+    def test_invalid_concurrency(self):
+        """Test that max_concurrency must be positive."""
+        with pytest.raises(ValueError):
+            AsyncGatherClient(client=MagicMock(), max_concurrency=0)
@@ -0,0 +1,220 @@
+"""
+Unit tests for recording and replaying API traffic.
+
+Test Metadata:
+- Created: 2026-10-17
+- Last Updated: 2026-10-17
+- Status: Active
+- Owner: Development Team
+- Purpose: Validate cassette recording, storage and offline replay
+- Lifecycle:
+  - Created: To make API-bound benchmarks and tests deterministic
+  - Active: Currently used to validate Cassette, CassetteRecorder and
+    CassettePlayer
+  - Obsolescence Conditions:
+    1. When an official Gather API sandbox replaces recorded traffic
+- Last Validated: 2026-10-17
+"""
+
+import gzip
+import json
+
+import pytest
+
+from gather_manager.api.cassette import (
+    Cassette,
+    CassettePlayer,
+    CassetteRecorder,
+)
+from gather_manager.api.client import GatherClient
+from gather_manager.api.coalesce import RequestCoalescer
+from gather_manager.api.fake_server import FakeGatherData, FakeGatherServer
+from gather_manager.api.rate_limit import RateLimiter
+from gather_manager.services.explorer import PortalExplorer
+from gather_manager.utils.exceptions import (
+    CassetteMissError,
+    ConfigurationError,
+)
+
+
+@pytest.fixture
+def data():
+    """Fixture to provide a small synthetic space."""
+    return FakeGatherData.generate(
+        maps_per_space=3, objects_per_map=30, portal_ratio=0.2, users=3
+    )
+
+
+@pytest.fixture
+def space_id(data):
+    """Fixture to provide the ID of the synthetic space."""
+    return next(iter(data.spaces))
+
+
+def make_client(**kwargs):
+    """Create a client without rate limiting or coalescing."""
+    return GatherClient(
+        api_key="test_api_key",
+        rate_limiter=RateLimiter.unlimited(),
+        coalescer=RequestCoalescer.disabled(),
+        **kwargs,
+    )
+
+
+def record(data, path, **server_options):
+    """Record a client session against the fake server."""
+    return make_client(
+        record=path,
+        transport=FakeGatherServer(data, **server_options),
+    )
+
+
+class TestCassetteRecorder:
+    """Tests for recording responses."""
+
+    def test_close_writes_compressed_cassette(self, data, space_id, tmp_path):
+        """Test that closing the client saves a gzip JSON cassette."""
+        path = tmp_path / "session.cassette"
+        client = record(data, path)
+
+        client.get_maps(space_id)
+        client.close()
+
+        document = json.loads(gzip.decompress(path.read_bytes()))
+        assert document["version"] == 1
+        assert list(document["interactions"]) == [
+            f"GET api/v2/spaces/{space_id}/maps?useV2Map=true"
+        ]
+
+    def test_identical_bodies_are_stored_once(self, data, space_id, tmp_path):
+        """Test that repeated reads share one stored body."""
+        client = record(data, tmp_path / "session.cassette")
+
+        for _ in range(3):
+            client.get_map_data(space_id, "map-0")
+
+        cassette = client.cassette_recorder.cassette
+        assert len(cassette) == 3
+        assert len(cassette.bodies) == 1
+
+    def test_credentials_are_not_recorded(self, data, space_id, tmp_path):
+        """Test that the API key never reaches the cassette file."""
+        path = tmp_path / "session.cassette"
+        with record(data, path) as client:
+            client.get_maps(space_id)
+
+        assert b"test_api_key" not in gzip.decompress(path.read_bytes())
+
+    def test_request_bodies_are_part_of_the_key(
+        self, data, space_id, tmp_path
+    ):
+        """Test that writes with different bodies are told apart."""
+        client = record(data, tmp_path / "session.cassette")
+
+        client.update_map_background(space_id, "map-0", "a.png")
+        client.update_map_background(space_id, "map-0", "b.png")
+
+        keys = [
+            key
+            for key in client.cassette_recorder.cassette.interactions
+            if key.startswith("POST")
+        ]
+        assert len(keys) == 2
+
+    def test_clients_share_a_cassette(self, data, space_id, tmp_path):
+        """Test that several clients can record into one cassette."""
+        path = tmp_path / "session.cassette"
+        cassette = Cassette()
+        server = FakeGatherServer(data)
+        clients = [
+            make_client(record=path, cassette=cassette, transport=server)
+            for _ in range(2)
+        ]
+
+        clients[0].get_maps(space_id)
+        clients[1].get_map_data(space_id, "map-0")
+        for client in clients:
+            client.close()
+
+        assert len(Cassette.load(path)) == 2
+
+
+class TestCassettePlayer:
+    """Tests for replaying responses."""
+
+    def test_replay_matches_recording(self, data, space_id, tmp_path):
+        """Test that an explorer sweep gives the same results offline."""
+        path = tmp_path / "session.cassette"
+        with record(data, path) as client:
+            recorded = PortalExplorer(
+                client=client, output_dir=str(tmp_path)
+            ).analyze_all_maps(space_id)
+
+        with make_client(replay=path) as client:
+            replayed = PortalExplorer(
+                client=client, output_dir=str(tmp_path)
+            ).analyze_all_maps(space_id)
+
+        assert replayed == recorded
+
+    def test_responses_replay_in_order(self, data, space_id, tmp_path):
+        """Test that each recorded response is used once, then the last."""
+        path = tmp_path / "session.cassette"
+        with record(data, path) as client:
+            client.get_map_data(space_id, "map-0")
+            client.update_map_background(space_id, "map-0", "new.png")
+            client.get_map_data(space_id, "map-0")
+
+        with make_client(replay=path) as client:
+            first = client.get_map_data(space_id, "map-0")
+            second = client.get_map_data(space_id, "map-0")
+            third = client.get_map_data(space_id, "map-0")
+
+        assert first.background != "new.png"
+        assert second.background == third.background == "new.png"
+
+    def test_unrecorded_request_raises(self, data, space_id, tmp_path):
+        """Test that a request missing from the cassette is an error."""
+        path = tmp_path / "session.cassette"
+        with record(data, path) as client:
+            client.get_maps(space_id)
+
+        with make_client(replay=path) as client:
+            with pytest.raises(CassetteMissError) as exc_info:
+                client.get_map_data(space_id, "map-0")
+
+        assert exc_info.value.key == (
+            f"GET api/v2/spaces/{space_id}/maps/map-0?useV2Map=true"
+        )
+
+    def test_timing_emulation(self, data, space_id, tmp_path):
+        """Test that replay waits a fraction of the recorded time."""
+        path = tmp_path / "session.cassette"
+        with record(data, path) as client:
+            client.get_maps(space_id)
+        cassette = Cassette.load(path)
+        (entry,) = next(iter(cassette.interactions.values()))
+        slept = []
+        player = CassettePlayer(cassette, timing=0.5, sleep=slept.append)
+
+        make_client(transport=player).get_maps(space_id)
+
+        assert slept == [pytest.approx(entry["elapsed"] * 0.5)]
+
+    def test_invalid_cassette(self, tmp_path):
+        """Test that an unreadable cassette is a configuration error."""
+        path = tmp_path / "broken.cassette"
+        path.write_bytes(b"not gzip")
+
+        with pytest.raises(ConfigurationError):
+            CassettePlayer(path)
+
+    def test_replay_excludes_record_and_transport(self, tmp_path):
+        """Test that replay cannot be combined with other transports."""
+        path = tmp_path / "session.cassette"
+        Cassette().save(path)
+
+        with pytest.raises(ValueError):
+            make_client(replay=path, record=tmp_path / "other.cassette")
+        with pytest.raises(ValueError):
+            make_client(replay=path, transport=CassetteRecorder(path))
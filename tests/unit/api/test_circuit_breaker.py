@@ -0,0 +1,233 @@
+"""
+Unit tests for the per-endpoint-class circuit breaker.
+
+Test Metadata:
+- Created: 2026-10-17
+- Last Updated: 2026-10-17
+- Status: Active
+- Owner: Development Team
+- Purpose: Validate failing fast while the Gather API is degraded
+- Lifecycle:
+  - Created: To stop sweeps from waiting out timeouts on every map
+  - Active: Currently used to validate CircuitBreaker and its client wiring
+  - Obsolescence Conditions:
+    1. When the client stops making calls per endpoint class
+- Last Validated: 2026-10-17
+"""
+
+import pytest
+import requests
+
+from gather_manager.api.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+)
+from gather_manager.api.client import GatherClient
+from gather_manager.api.coalesce import RequestCoalescer
+from gather_manager.api.fake_server import FakeGatherData, FakeGatherServer
+from gather_manager.api.rate_limit import RateLimiter
+from gather_manager.api.retry import RetryPolicy
+from gather_manager.utils.exceptions import CircuitOpenError, GatherApiError
+
+
+def api_error(status_code=None, cause=None):
+    """Create a GatherApiError as the client raises it."""
+    error = GatherApiError("failed", status_code=status_code)
+    error.__cause__ = cause
+    return error
+
+
+@pytest.fixture
+def data():
+    """Fixture to provide a small synthetic space."""
+    return FakeGatherData.generate(maps_per_space=3, objects_per_map=10)
+
+
+@pytest.fixture
+def space_id(data):
+    """Fixture to provide the ID of the synthetic space."""
+    return next(iter(data.spaces))
+
+
+def make_client(server, breaker, **kwargs):
+    """Create a client that sends every request to the fake server."""
+    return GatherClient(
+        api_key="test_api_key",
+        transport=server,
+        rate_limiter=RateLimiter.unlimited(),
+        coalescer=RequestCoalescer.disabled(),
+        retry_policy=kwargs.pop("retry_policy", RetryPolicy.disabled()),
+        circuit_breaker=breaker,
+        **kwargs,
+    )
+
+
+class TestCircuitBreaker:
+    """Tests for the circuit state machine."""
+
+    def test_opens_after_consecutive_failures(self, clock):
+        """Test that the threshold of consecutive failures opens it."""
+        breaker = CircuitBreaker(failure_threshold=3, clock=clock)
+
+        assert breaker.record_failure("maps") is None
+        assert breaker.record_failure("maps") is None
+        assert breaker.record_success("maps") is None
+        assert breaker.record_failure("maps") is None
+        assert breaker.record_failure("maps") is None
+        assert breaker.record_failure("maps") == OPEN
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.before_request("maps")
+        assert exc_info.value.endpoint_class == "maps"
+        assert exc_info.value.retry_after == 30.0
+        assert breaker.state("map-data") == CLOSED
+
+    def test_half_open_probe_closes(self, clock):
+        """Test that a successful probe after the timeout closes it."""
+        breaker = CircuitBreaker(
+            failure_threshold=1, recovery_timeout=10, clock=clock
+        )
+        breaker.record_failure("maps")
+
+        clock.now = 10
+        assert breaker.before_request("maps") == HALF_OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("maps")  # Only one probe at a time
+        assert breaker.record_success("maps") == CLOSED
+        assert breaker.before_request("maps") is None
+
+    def test_failed_probe_reopens(self, clock):
+        """Test that a failed probe opens the circuit for another timeout."""
+        breaker = CircuitBreaker(
+            failure_threshold=1, recovery_timeout=10, clock=clock
+        )
+        breaker.record_failure("maps")
+        clock.now = 10
+        breaker.before_request("maps")
+
+        assert breaker.record_failure("maps") == OPEN
+        clock.now = 19
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request("maps")
+
+    def test_lost_probe_does_not_wedge(self, clock):
+        """Test that a probe that never reports back is replaced."""
+        breaker = CircuitBreaker(
+            failure_threshold=1, recovery_timeout=10, clock=clock
+        )
+        breaker.record_failure("maps")
+        clock.now = 10
+        breaker.before_request("maps")
+
+        clock.now = 20
+        assert breaker.before_request("maps") is None
+        assert breaker.state("maps") == HALF_OPEN
+
+    def test_failure_classification(self):
+        """Test that only signs of a degraded API count as failures."""
+        breaker = CircuitBreaker()
+
+        assert breaker.is_failure(api_error(503))
+        assert breaker.is_failure(
+            api_error(cause=requests.exceptions.ConnectTimeout())
+        )
+        assert not breaker.is_failure(api_error(404))
+        assert not breaker.is_failure(api_error(429))
+
+    def test_disabled(self):
+        """Test that a disabled breaker never opens."""
+        breaker = CircuitBreaker.disabled()
+
+        for _ in range(10):
+            breaker.record_failure("maps")
+
+        assert breaker.before_request("maps") is None
+
+
+class TestClientCircuitBreaker:
+    """Tests for circuit breaking in GatherClient."""
+
+    def test_fails_fast_while_open(self, data, space_id, clock):
+        """Test that an open circuit stops requests reaching the API."""
+        server = FakeGatherServer(data, error_rate=1.0)
+        client = make_client(
+            server, CircuitBreaker(failure_threshold=2, clock=clock)
+        )
+
+        for _ in range(2):
+            with pytest.raises(GatherApiError):
+                client.get_map_data(space_id, "map-0")
+        with pytest.raises(CircuitOpenError):
+            client.get_map_data(space_id, "map-1")
+
+        assert len(server.requests) == 2
+        stats = client.endpoint_metrics.to_dict()["map-data"]["circuit"]
+        assert stats == {
+            "state": OPEN,
+            "transitions": {OPEN: 1},
+            "rejections": 1,
+        }
+
+    def test_retries_stop_when_circuit_opens(self, data, space_id, clock):
+        """Test that a call does not back off into an open circuit."""
+        slept = []
+        server = FakeGatherServer(data, error_rate=1.0)
+        client = make_client(
+            server,
+            CircuitBreaker(failure_threshold=2, clock=clock),
+            retry_policy=RetryPolicy(max_attempts=5, sleep=slept.append),
+        )
+
+        with pytest.raises(GatherApiError) as exc_info:
+            client.get_maps(space_id)
+
+        assert exc_info.value.status_code == 503
+        assert len(server.requests) == 2
+        assert len(slept) == 1
+        assert client.metrics.get("retries_abandoned_circuit") == 1
+
+    def test_recovers_through_probe(self, data, space_id, clock):
+        """Test that the circuit closes once the API answers again."""
+        server = FakeGatherServer(data, error_rate=1.0)
+        client = make_client(
+            server,
+            CircuitBreaker(
+                failure_threshold=1, recovery_timeout=5, clock=clock
+            ),
+        )
+        with pytest.raises(GatherApiError):
+            client.get_maps(space_id)
+
+        server.error_rate = 0.0
+        clock.now = 5
+        client.get_maps(space_id)
+
+        stats = client.endpoint_metrics.to_dict()["maps"]["circuit"]
+        assert stats["state"] == CLOSED
+        assert stats["transitions"] == {CLOSED: 1, HALF_OPEN: 1, OPEN: 1}
+        assert client.get_metrics()["circuit_breaker"]["maps"] == {
+            "state": CLOSED,
+            "failures": 0,
+        }
+
+    def test_prometheus_exposes_state(self, data, space_id, clock):
+        """Test that the circuit state is exported as a gauge."""
+        client = make_client(
+            FakeGatherServer(data, error_rate=1.0),
+            CircuitBreaker(failure_threshold=1, clock=clock),
+        )
+        with pytest.raises(GatherApiError):
+            client.get_maps(space_id)
+
+        text = client.endpoint_metrics.to_prometheus()
+
+        assert (
+            'gather_client_circuit_state{endpoint="maps",state="open"} 1'
+            in (text)
+        )
+        assert (
+            'gather_client_circuit_transitions_total{endpoint="maps",'
+            'state="open"} 1' in text
+        )
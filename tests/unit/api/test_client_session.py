@@ -0,0 +1,73 @@
+"""
+Unit tests for GatherClient connection pooling.
+
+Test Metadata:
+- Created: 2026-10-16
+- Last Updated: 2026-10-16
+- Status: Active
+- Owner: Development Team
+- Purpose: Validate that GatherClient reuses a pooled session
+- Lifecycle:
+  - Created: To ensure requests share one keep-alive session
+  - Active: Currently used to validate session ownership and pool sizing
+  - Obsolescence Conditions:
+    1. When the client stops using requests sessions
+- Last Validated: 2026-10-16
+"""
+
+from unittest.mock import MagicMock
+
+import requests
+import responses
+
+from gather_manager.api.client import GatherClient
+
+
+class TestClientSession:
+    """Tests for the pooled session owned by GatherClient."""
+
+    def test_pool_sizes_applied_to_adapters(self):
+        """Test that pool settings are applied to both schemes."""
+        client = GatherClient(
+            api_key="test_api_key", pool_connections=3, pool_maxsize=7
+        )
+
+        for prefix in ("https://", "http://"):
+            adapter = client.session.get_adapter(prefix + "example.com")
+            assert adapter._pool_connections == 3
+            assert adapter._pool_maxsize == 7
+
+    @responses.activate
+    def test_requests_go_through_session(self):
+        """Test that API calls are sent through the client's session."""
+        responses.add(
+            responses.GET,
+            "https://api.gather.town/api/v2/spaces/test-space/maps",
+            json=[{"id": "map1"}],
+            status=200,
+        )
+        client = GatherClient(api_key="test_api_key")
+        client.session.request = MagicMock(wraps=client.session.request)
+
+        maps = client.get_maps("test-space")
+
+        assert [m.id for m in maps] == ["map1"]
+        client.session.request.assert_called_once()
+
+    def test_keep_alive_disabled_sends_connection_close(self):
+        """Test that disabling keep-alive sets the Connection header."""
+        client = GatherClient(api_key="test_api_key", keep_alive=False)
+        assert client.headers["Connection"] == "close"
+
+    def test_context_manager_closes_owned_session(self):
+        """Test that the client closes a session it created."""
+        with GatherClient(api_key="test_api_key") as client:
+            client.session.close = MagicMock()
+        client.session.close.assert_called_once()
+
+    def test_external_session_left_open(self):
+        """Test that a caller-provided session is not closed."""
+        session = MagicMock(spec=requests.Session)
+        with GatherClient(api_key="test_api_key", session=session) as client:
+            assert client.session is session
+        session.close.assert_not_called()
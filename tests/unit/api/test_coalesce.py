@@ -0,0 +1,184 @@
+"""
+Unit tests for single-flight request coalescing.
+
+Test Metadata:
+- Created: 2026-10-17
+- Last Updated: 2026-10-17
+- Status: Active
+- Owner: Development Team
+- Purpose: Validate sharing of identical in-flight and recent GETs
+- Lifecycle:
+  - Created: To ensure repeated reads within an operation hit the API once
+  - Active: Currently used to validate RequestCoalescer and GatherClient
+  - Obsolescence Conditions:
+    1. When reads are deduplicated by a different layer
+- Last Validated: 2026-10-17
+"""
+
+import asyncio
+import threading
+
+import pytest
+import responses
+
+from gather_manager.api.async_client import AsyncGatherClient
+from gather_manager.api.client import GatherClient
+from gather_manager.api.coalesce import RequestCoalescer
+from gather_manager.api.rate_limit import RateLimiter
+
+MAP_URL = "https://api.gather.town/api/v2/spaces/test-space/maps/test-map"
+MAP_BODY = {"id": "test-map", "objects": [{"type": "portal", "x": 1, "y": 2}]}
+
+
+class TestRequestCoalescer:
+    """Tests for the RequestCoalescer."""
+
+    def test_in_flight_call_is_shared(self):
+        """Test that concurrent callers wait for a single call."""
+        coalescer = RequestCoalescer(window=0)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "result"
+
+        results = []
+        leader = threading.Thread(
+            target=lambda: results.append(coalescer.do("key", slow))
+        )
+        leader.start()
+        started.wait(5)
+        followers = [
+            threading.Thread(
+                target=lambda: results.append(coalescer.do("key", slow))
+            )
+            for _ in range(3)
+        ]
+        for follower in followers:
+            follower.start()
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join(5)
+
+        assert len(calls) == 1
+        assert sorted(results) == [
+            ("result", False),
+            ("result", True),
+            ("result", True),
+            ("result", True),
+        ]
+
+    def test_completed_result_reused_within_window(self, clock):
+        """Test that a result is reused until the window elapses."""
+        coalescer = RequestCoalescer(window=2, clock=clock)
+        values = iter(["first", "second"])
+
+        assert coalescer.do("key", lambda: next(values)) == ("first", False)
+        clock.now = 1.9
+        assert coalescer.do("key", lambda: next(values)) == ("first", True)
+        clock.now = 2.1
+        assert coalescer.do("key", lambda: next(values)) == ("second", False)
+
+    def test_errors_are_not_reused(self):
+        """Test that a failed call is retried by the next caller."""
+        coalescer = RequestCoalescer()
+
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            coalescer.do("key", fail)
+        assert coalescer.do("key", lambda: "ok") == ("ok", False)
+
+    def test_keep_and_clear(self):
+        """Test that rejected results and cleared results are not reused."""
+        coalescer = RequestCoalescer()
+
+        coalescer.do("rejected", lambda: 1, keep=lambda result: False)
+        assert coalescer.do("rejected", lambda: 2) == (2, False)
+
+        coalescer.clear()
+        assert coalescer.do("rejected", lambda: 3) == (3, False)
+
+    def test_disabled_always_calls(self):
+        """Test that a disabled coalescer never shares results."""
+        coalescer = RequestCoalescer.disabled()
+
+        assert coalescer.do("key", lambda: 1) == (1, False)
+        assert coalescer.do("key", lambda: 2) == (2, False)
+
+
+class TestClientCoalescing:
+    """Tests for GatherClient request coalescing."""
+
+    @pytest.fixture
+    def client(self):
+        """Fixture to provide a GatherClient without pacing."""
+        return GatherClient(
+            api_key="test_api_key", rate_limiter=RateLimiter.unlimited()
+        )
+
+    @responses.activate
+    def test_portals_then_map_data_fetches_once(self, client):
+        """Test the explorer's get_portals + get_map_data sequence."""
+        responses.add(
+            responses.GET, MAP_URL, json=MAP_BODY, headers={"ETag": '"v1"'}
+        )
+
+        portals = client.get_portals("test-space", "test-map")
+        map_data = client.get_map_data("test-space", "test-map")
+
+        assert len(portals) == 1
+        assert map_data.id == "test-map"
+        assert len(responses.calls) == 1
+        assert client.metrics.get("coalesced_requests") == 1
+
+    @responses.activate
+    def test_callers_get_independent_objects(self, client):
+        """Test that mutating one caller's result does not leak."""
+        responses.add(responses.GET, MAP_URL, json=MAP_BODY)
+
+        first = client.get_map_data("test-space", "test-map")
+        first.objects.clear()
+        second = client.get_map_data("test-space", "test-map")
+
+        assert len(second.objects) == 1
+
+    @responses.activate
+    def test_write_clears_recent_reads(self, client):
+        """Test that a read after a write goes to the API."""
+        responses.add(responses.GET, MAP_URL, json=MAP_BODY)
+        responses.add(responses.POST, MAP_URL, json=MAP_BODY)
+
+        client.get_map_data("test-space", "test-map")
+        client.update_map_background("test-space", "test-map", "bg.png")
+        client.get_map_data("test-space", "test-map")
+
+        assert [call.request.method for call in responses.calls] == [
+            "GET",
+            "POST",
+            "GET",
+        ]
+
+    @responses.activate
+    def test_async_tasks_are_coalesced(self, client):
+        """Test that concurrent async reads of one map share a request."""
+        responses.add(responses.GET, MAP_URL, json=MAP_BODY)
+
+        async def sweep():
+            async with AsyncGatherClient(client, max_concurrency=4) as api:
+                return await asyncio.gather(
+                    *[
+                        api.get_map_data("test-space", "test-map")
+                        for _ in range(4)
+                    ]
+                )
+
+        results = asyncio.run(sweep())
+
+        assert {result.id for result in results} == {"test-map"}
+        assert len(responses.calls) == 1
@@ -0,0 +1,149 @@
+"""
+Unit tests for response compression and compressed request bodies.
+
+Test Metadata:
+- Created: 2026-10-17
+- Last Updated: 2026-10-17
+- Status: Active
+- Owner: Development Team
+- Purpose: Validate compression negotiation and wire/decoded byte counts
+- Lifecycle:
+  - Created: To ensure large map payloads travel compressed when possible
+  - Active: Currently used to validate GatherClient body encoding
+  - Obsolescence Conditions:
+    1. When compression is handled outside the client
+- Last Validated: 2026-10-17
+"""
+
+import gzip
+import json
+
+import pytest
+import responses
+
+from gather_manager.api.client import GatherClient
+from gather_manager.api.coalesce import RequestCoalescer
+
+MAP_URL = "https://api.gather.town/api/v2/spaces/test-space/maps/test-map"
+LARGE_CONTENT = {"collisions": "0" * 50000}
+
+
+def make_client(**kwargs):
+    """Create a client that sends every request."""
+    return GatherClient(
+        api_key="test_api_key",
+        coalescer=RequestCoalescer.disabled(),
+        **kwargs,
+    )
+
+
+class TestResponseCompression:
+    """Tests for negotiating compressed responses."""
+
+    @responses.activate
+    def test_accept_encoding_is_sent(self):
+        """Test that requests advertise the encodings that can be decoded."""
+        responses.add(responses.GET, MAP_URL, json={"id": "test-map"})
+        client = make_client()
+
+        client.get_map_data("test-space", "test-map")
+
+        accept = responses.calls[0].request.headers["Accept-Encoding"]
+        assert "gzip" in accept
+
+    @responses.activate
+    def test_gzip_response_counts_wire_and_decoded_bytes(self):
+        """Test that compressed responses are decoded and both sizes kept."""
+        payload = json.dumps({"id": "test-map", **LARGE_CONTENT}).encode()
+        compressed = gzip.compress(payload)
+        responses.add(
+            responses.GET,
+            MAP_URL,
+            body=compressed,
+            headers={
+                "Content-Encoding": "gzip",
+                "Content-Type": "application/json",
+            },
+        )
+        client = make_client()
+
+        map_data = client.get_map_data("test-space", "test-map")
+
+        assert map_data.collisions == LARGE_CONTENT["collisions"]
+        assert client.metrics.get("response_bytes_decoded") == len(payload)
+        assert client.metrics.get("response_bytes_wire") == len(compressed)
+
+
+class TestRequestCompression:
+    """Tests for gzipping request bodies."""
+
+    @responses.activate
+    def test_bodies_are_not_compressed_by_default(self):
+        """Test that compression is opt-in."""
+        responses.add(responses.POST, MAP_URL, json={"id": "test-map"})
+        client = make_client()
+
+        client.update_map("test-space", "test-map", LARGE_CONTENT)
+
+        request = responses.calls[0].request
+        assert "Content-Encoding" not in request.headers
+        assert json.loads(request.body) == {"content": LARGE_CONTENT}
+
+    @responses.activate
+    def test_large_bodies_are_gzipped(self):
+        """Test that bodies over the threshold are sent compressed."""
+        responses.add(responses.POST, MAP_URL, json={"id": "test-map"})
+        client = make_client(compress_requests=True)
+
+        client.update_map("test-space", "test-map", LARGE_CONTENT)
+
+        request = responses.calls[0].request
+        assert request.headers["Content-Encoding"] == "gzip"
+        body = gzip.decompress(request.body)
+        assert json.loads(body) == {"content": LARGE_CONTENT}
+        assert client.metrics.get("request_bytes_decoded") == len(body)
+        assert client.metrics.get("request_bytes_wire") == len(request.body)
+        assert len(request.body) < len(body) // 10
+
+    @responses.activate
+    def test_small_bodies_are_sent_as_is(self):
+        """Test that bodies under the threshold are not compressed."""
+        responses.add(responses.POST, MAP_URL, json={"id": "test-map"})
+        client = make_client(compress_requests=True)
+
+        client.update_map("test-space", "test-map", {"background": "bg.png"})
+
+        request = responses.calls[0].request
+        assert "Content-Encoding" not in request.headers
+        assert client.metrics.get("request_bytes_wire") == len(request.body)
+
+    @responses.activate
+    def test_unsupported_media_type_disables_compression(self):
+        """Test that a 415 resends uncompressed and stops compressing."""
+        responses.add(responses.POST, MAP_URL, status=415)
+        responses.add(responses.POST, MAP_URL, json={"id": "test-map"})
+        responses.add(responses.POST, MAP_URL, json={"id": "test-map"})
+        client = make_client(compress_requests=True)
+
+        client.update_map("test-space", "test-map", LARGE_CONTENT)
+        client.update_map("test-space", "test-map", LARGE_CONTENT)
+
+        assert len(responses.calls) == 3
+        assert responses.calls[0].request.headers["Content-Encoding"] == "gzip"
+        for call in responses.calls[1:]:
+            assert "Content-Encoding" not in call.request.headers
+        assert client.compress_requests is False
+        assert client.metrics.get("request_compression_rejected") == 1
+
+    @pytest.mark.parametrize("threshold", [0, 10])
+    @responses.activate
+    def test_threshold_is_configurable(self, threshold):
+        """Test that a low threshold compresses small bodies too."""
+        responses.add(responses.POST, MAP_URL, json={"id": "test-map"})
+        client = make_client(
+            compress_requests=True, compression_threshold=threshold
+        )
+
+        client.update_map("test-space", "test-map", {"background": "bg.png"})
+
+        assert responses.calls[0].request.headers["Content-Encoding"] == "gzip"
@@ -0,0 +1,136 @@
+"""
+Unit tests for timeouts and deadline budgets.
+
+Test Metadata:
+- Created: 2026-10-17
+- Last Updated: 2026-10-17
+- Status: Active
+- Owner: Development Team
+- Purpose: Validate socket timeouts and deadline propagation
+- Lifecycle:
+  - Created: To ensure stalled requests cannot hang a worker forever
+  - Active: Currently used to validate deadline() and GatherClient timeouts
+  - Obsolescence Conditions:
+    1. When timeouts are handled by a separate transport layer
+- Last Validated: 2026-10-17
+"""
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+import responses
+
+from gather_manager.api.client import GatherClient
+from gather_manager.api.coalesce import RequestCoalescer
+from gather_manager.api.deadline import current_deadline, deadline
+from gather_manager.api.rate_limit import RateLimiter
+from gather_manager.api.retry import RetryPolicy
+from gather_manager.utils.exceptions import DeadlineExceededError
+
+MAPS_URL = "https://api.gather.town/api/v2/spaces/test-space/maps"
+
+
+@pytest.fixture
+def client():
+    """Fixture to provide a client with a mocked session."""
+    client = GatherClient(
+        api_key="test_api_key",
+        timeout=(3, 20),
+        rate_limiter=RateLimiter.unlimited(),
+        coalescer=RequestCoalescer.disabled(),
+    )
+    response = MagicMock(status_code=200, content=b"[]")
+    client.session = MagicMock()
+    client.session.request.return_value = response
+    return client
+
+
+class TestDeadline:
+    """Tests for the deadline context."""
+
+    def test_nested_deadline_cannot_extend_outer(self):
+        """Test that an inner deadline never outlives the outer one."""
+        with deadline(1) as outer:
+            with deadline(100) as inner:
+                assert inner is outer
+            assert current_deadline() is outer
+        assert current_deadline() is None
+
+    def test_none_keeps_enclosing_deadline(self):
+        """Test that deadline(None) is a no-op."""
+        with deadline(None) as active:
+            assert active is None
+
+
+class TestClientTimeouts:
+    """Tests for socket timeouts in GatherClient."""
+
+    def test_client_timeout_passed_to_session(self, client):
+        """Test that the client-wide timeout is sent with each request."""
+        client.get_maps("test-space")
+        assert client.session.request.call_args.kwargs["timeout"] == (3, 20)
+
+    def test_with_options_overrides_per_call(self, client):
+        """Test that with_options changes only the copy's timeout."""
+        client.with_options(timeout=1).get_maps("test-space")
+        assert client.session.request.call_args.kwargs["timeout"] == (1, 1)
+
+        client.get_maps("test-space")
+        assert client.session.request.call_args.kwargs["timeout"] == (3, 20)
+
+    def test_deadline_caps_timeout(self, client):
+        """Test that the remaining deadline caps the socket timeouts."""
+        with deadline(2):
+            client.get_maps("test-space")
+
+        connect, read = client.session.request.call_args.kwargs["timeout"]
+        assert connect <= 2 and read <= 2
+
+    def test_expired_deadline_fails_fast(self, client):
+        """Test that no request is sent once the deadline has passed."""
+        with deadline(0):
+            with pytest.raises(DeadlineExceededError):
+                client.get_maps("test-space")
+        client.session.request.assert_not_called()
+
+    def test_deadline_expiring_during_check_fails_fast(
+        self, client, monkeypatch
+    ):
+        """Test that a deadline with no time left never gives a 0 timeout."""
+        with deadline(10) as active:
+            monkeypatch.setattr(active, "remaining", lambda: 0.0)
+            with pytest.raises(DeadlineExceededError):
+                client.get_maps("test-space")
+        client.session.request.assert_not_called()
+
+    @responses.activate
+    def test_read_timeout_maps_to_api_error(self):
+        """Test that a read timeout surfaces as a timeout error."""
+        responses.add(
+            responses.GET, MAPS_URL, body=requests.exceptions.ReadTimeout()
+        )
+        client = GatherClient(
+            api_key="test_api_key", retry_policy=RetryPolicy.disabled()
+        )
+
+        with pytest.raises(Exception, match="Timeout while waiting"):
+            client.get_maps("test-space")
+
+    @responses.activate
+    def test_retry_abandoned_when_backoff_exceeds_deadline(self):
+        """Test that retries stop when the backoff would pass the deadline."""
+        responses.add(responses.GET, MAPS_URL, status=503)
+        client = GatherClient(
+            api_key="test_api_key",
+            retry_policy=RetryPolicy(backoff_base=10, jitter=False),
+        )
+
+        start = time.monotonic()
+        with deadline(1):
+            with pytest.raises(Exception, match="503"):
+                client.get_maps("test-space")
+
+        assert time.monotonic() - start < 1
+        assert client.metrics.get("retries_abandoned_deadline") == 1
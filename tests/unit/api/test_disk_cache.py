@@ -0,0 +1,239 @@
+"""
+Unit tests for the persistent disk cache.
+
+Test Metadata:
+- Created: 2026-10-17
+- Last Updated: 2026-10-17
+- Status: Active
+- Owner: Development Team
+- Purpose: Validate TTL expiry, LRU eviction and client cache integration
+- Lifecycle:
+  - Created: To ensure repeated CLI runs reuse cached API responses safely
+  - Active: Currently used to validate DiskCache and GatherClient caching
+  - Obsolescence Conditions:
+    1. When responses are cached by a different storage layer
+- Last Validated: 2026-10-17
+"""
+
+import pytest
+import responses
+
+from gather_manager.api.client import GatherClient
+from gather_manager.api.disk_cache import DiskCache
+
+BASE_URL = "https://api.gather.town/api/v2"
+MAPS_ENDPOINT = "api/v2/spaces/test-space/maps"
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    """Fixture to provide a DiskCache in a temporary directory."""
+    return DiskCache(tmp_path / "cache", clock=clock)
+
+
+class TestDiskCache:
+    """Tests for the DiskCache."""
+
+    def test_round_trip(self, cache):
+        """Test that a stored body and its validators are returned."""
+        cache.set(
+            "GET",
+            MAPS_ENDPOINT,
+            None,
+            b'["main"]',
+            {"ETag": '"v1"', "X-Request-Id": "abc"},
+        )
+
+        body, headers = cache.get("GET", MAPS_ENDPOINT)
+
+        assert body == b'["main"]'
+        assert headers == {"ETag": '"v1"'}
+
+    def test_params_are_part_of_the_key(self, cache):
+        """Test that different query parameters are cached separately."""
+        cache.set("GET", MAPS_ENDPOINT, {"page": 1}, b"1")
+
+        assert cache.get("GET", MAPS_ENDPOINT, {"page": 2}) is None
+        assert cache.get("GET", MAPS_ENDPOINT, {"page": 1})[0] == b"1"
+
+    def test_base_url_and_api_key_are_part_of_the_key(self, cache):
+        """Test that environments and API keys never share entries."""
+        cache.set(
+            "GET",
+            MAPS_ENDPOINT,
+            None,
+            b"prod",
+            base_url="https://api.gather.town",
+            api_key="key-a",
+        )
+
+        for base_url, api_key in [
+            ("https://api.gather.town", "key-b"),
+            ("https://staging.gather.town", "key-a"),
+            ("", None),
+        ]:
+            assert (
+                cache.get(
+                    "GET", MAPS_ENDPOINT, base_url=base_url, api_key=api_key
+                )
+                is None
+            )
+        assert cache.get(
+            "GET",
+            MAPS_ENDPOINT,
+            base_url="https://api.gather.town",
+            api_key="key-a",
+        )[0] == (b"prod")
+
+    def test_entries_expire_after_ttl(self, cache, clock):
+        """Test that entries older than their class TTL are misses."""
+        cache.set("GET", MAPS_ENDPOINT, None, b"[]")
+
+        clock.now += DiskCache.DEFAULT_TTLS["maps"] - 1
+        assert cache.get("GET", MAPS_ENDPOINT) is not None
+
+        clock.now += 2
+        assert cache.get("GET", MAPS_ENDPOINT) is None
+
+    @pytest.mark.parametrize(
+        "method,endpoint",
+        [
+            ("POST", MAPS_ENDPOINT),
+            ("GET", "api/v2/user-id"),
+        ],
+    )
+    def test_uncacheable_requests(self, cache, method, endpoint):
+        """Test that writes and classes without a TTL are never cached."""
+        cache.set(method, endpoint, None, b"{}")
+
+        assert cache.get(method, endpoint) is None
+
+    def test_refresh_ignores_existing_entries(self, tmp_path, clock):
+        """Test that refresh mode misses but still stores responses."""
+        DiskCache(tmp_path, clock=clock).set(
+            "GET", MAPS_ENDPOINT, None, b"old"
+        )
+
+        refreshing = DiskCache(tmp_path, refresh=True, clock=clock)
+        assert refreshing.get("GET", MAPS_ENDPOINT) is None
+        refreshing.set("GET", MAPS_ENDPOINT, None, b"new")
+
+        assert DiskCache(tmp_path, clock=clock).get("GET", MAPS_ENDPOINT)[
+            0
+        ] == (b"new")
+
+    def test_invalidate_removes_endpoint_and_parents(self, cache):
+        """Test that a write invalidates the resource and its collections."""
+        map_endpoint = f"{MAPS_ENDPOINT}/main"
+        other_endpoint = "api/v2/spaces/other-space/maps"
+        for endpoint in (MAPS_ENDPOINT, map_endpoint, other_endpoint):
+            cache.set("GET", endpoint, None, b"{}")
+
+        cache.invalidate(map_endpoint)
+
+        assert cache.get("GET", map_endpoint) is None
+        assert cache.get("GET", MAPS_ENDPOINT) is None
+        assert cache.get("GET", other_endpoint) is not None
+
+    def test_invalidate_removes_entries_for_every_key(self, cache):
+        """Test that a write through one key invalidates other keys too."""
+        for api_key in ("key-a", "key-b"):
+            cache.set("GET", MAPS_ENDPOINT, None, b"{}", api_key=api_key)
+
+        cache.invalidate(MAPS_ENDPOINT)
+
+        assert cache.get("GET", MAPS_ENDPOINT, api_key="key-a") is None
+        assert cache.get("GET", MAPS_ENDPOINT, api_key="key-b") is None
+
+    def test_evicts_least_recently_used(self, tmp_path, clock):
+        """Test that the cache stays under max_bytes by evicting LRU."""
+        cache = DiskCache(tmp_path, max_bytes=3500, clock=clock)
+        endpoints = [f"api/v2/spaces/s{i}/maps" for i in range(3)]
+        for endpoint in endpoints:
+            cache.set("GET", endpoint, None, b"x" * 1000)
+            clock.now += 1
+
+        # Touch the oldest entry so the second one becomes LRU
+        assert cache.get("GET", endpoints[0]) is not None
+        clock.now += 1
+        cache.set("GET", "api/v2/spaces/s3/maps", None, b"x" * 1000)
+
+        assert cache.get("GET", endpoints[0]) is not None
+        assert cache.get("GET", endpoints[1]) is None
+        assert cache._size <= 3500
+
+
+class TestClientDiskCache:
+    """Tests for GatherClient with a disk cache."""
+
+    @pytest.fixture
+    def client(self, cache):
+        """Fixture to provide a GatherClient with a disk cache."""
+        return GatherClient(api_key="test_api_key", disk_cache=cache)
+
+    @responses.activate
+    def test_second_get_is_served_from_disk(self, client):
+        """Test that a cached GET does not reach the network."""
+        responses.add(
+            responses.GET,
+            f"{BASE_URL}/spaces/test-space/maps",
+            json=[{"id": "main"}],
+            status=200,
+        )
+
+        assert client.get_maps("test-space")[0].id == "main"
+        assert client.get_maps("test-space")[0].id == "main"
+
+        assert len(responses.calls) == 1
+        counters = client.metrics.snapshot()
+        assert counters["disk_cache_hits"] == 1
+        assert counters["disk_cache_misses"] == 1
+
+    @responses.activate
+    def test_cache_survives_new_client(self, client, cache):
+        """Test that entries are shared across client instances."""
+        responses.add(
+            responses.GET,
+            f"{BASE_URL}/spaces/test-space/maps",
+            json=[{"id": "main"}],
+            status=200,
+        )
+        client.get_maps("test-space")
+
+        other = GatherClient(api_key="test_api_key", disk_cache=cache)
+        assert other.get_maps("test-space")[0].id == "main"
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_other_api_key_is_not_served_from_disk(self, client, cache):
+        """Test that a client with another API key refetches."""
+        responses.add(
+            responses.GET,
+            f"{BASE_URL}/spaces/test-space/maps",
+            json=[{"id": "main"}],
+            status=200,
+        )
+        client.get_maps("test-space")
+
+        other = GatherClient(api_key="other_api_key", disk_cache=cache)
+        other.get_maps("test-space")
+
+        assert len(responses.calls) == 2
+        assert responses.calls[1].request.headers["apiKey"] == "other_api_key"
+
+    @responses.activate
+    def test_write_invalidates_cached_map(self, client):
+        """Test that updating a map refetches it afterwards."""
+        url = f"{BASE_URL}/spaces/test-space/maps/main"
+        responses.add(responses.GET, url, json={"id": "main"}, status=200)
+        responses.add(responses.POST, url, json={"id": "main"}, status=200)
+
+        client.get_map_data("test-space", "main")
+        client.update_map("test-space", "main", {"objects": []})
+        client.get_map_data("test-space", "main")
+
+        assert [call.request.method for call in responses.calls] == [
+            "GET",
+            "POST",
+            "GET",
+        ]
@@ -0,0 +1,229 @@
+"""
+Unit tests for the transport layer and the in-process fake Gather server.
+
+Test Metadata:
+- Created: 2026-10-17
+- Last Updated: 2026-10-17
+- Status: Active
+- Owner: Development Team
+- Purpose: Validate offline serving of the v2 API and failure injection
+- Lifecycle:
+  - Created: To ensure throughput features can be benchmarked offline
+  - Active: Currently used to validate Transport and FakeGatherServer
+  - Obsolescence Conditions:
+    1. When an official Gather API sandbox replaces the fake server
+- Last Validated: 2026-10-17
+"""
+
+import pytest
+
+from gather_manager.api.circuit_breaker import CircuitBreaker
+from gather_manager.api.client import GatherClient
+from gather_manager.api.coalesce import RequestCoalescer
+from gather_manager.api.fake_server import FakeGatherData, FakeGatherServer
+from gather_manager.api.rate_limit import RateLimiter
+from gather_manager.api.retry import RetryPolicy
+from gather_manager.services.explorer import PortalExplorer
+from gather_manager.utils.exceptions import GatherApiError
+
+
+@pytest.fixture
+def data():
+    """Fixture to provide a small synthetic space."""
+    return FakeGatherData.generate(
+        maps_per_space=4, objects_per_map=40, portal_ratio=0.2, users=5
+    )
+
+
+@pytest.fixture
+def space_id(data):
+    """Fixture to provide the ID of the synthetic space."""
+    return next(iter(data.spaces))
+
+
+def make_client(server, **kwargs):
+    """Create a client that sends every request to the fake server."""
+    options = {
+        "rate_limiter": RateLimiter.unlimited(),
+        "coalescer": RequestCoalescer.disabled(),
+        **kwargs,
+    }
+    return GatherClient(api_key="test_api_key", transport=server, **options)
+
+
+class TestFakeGatherData:
+    """Tests for synthetic fixture generation."""
+
+    def test_generation_is_reproducible(self):
+        """Test that the same seed gives the same data."""
+        first = FakeGatherData.generate(objects_per_map=20, seed=3)
+        second = FakeGatherData.generate(objects_per_map=20, seed=3)
+        other = FakeGatherData.generate(objects_per_map=20, seed=4)
+
+        assert first == second
+        assert first != other
+
+    def test_portals_target_other_maps(self, data, space_id):
+        """Test that portals lead to maps in the same space."""
+        space = data.spaces[space_id]
+        portals = [
+            (map_id, obj)
+            for map_id, map_data in space.maps.items()
+            for obj in map_data["objects"]
+            if obj["type"] == "portal"
+        ]
+
+        assert portals
+        for map_id, portal in portals:
+            assert portal["targetMap"] in space.maps
+            assert portal["targetMap"] != map_id
+
+
+class TestFakeGatherServer:
+    """Tests for serving the API from memory."""
+
+    def test_reads(self, data, space_id):
+        """Test the space, map and user read endpoints."""
+        client = make_client(FakeGatherServer(data))
+
+        assert client.get_spaces()[0]["id"] == space_id
+        assert client.get_space(space_id).name == "Fake Space 0"
+        maps = client.get_maps(space_id)
+        assert [m.id for m in maps] == list(data.spaces[space_id].maps)
+        map_data = client.get_map_data(space_id, maps[0].id)
+        assert len(map_data.objects) >= 40
+        assert client.get_user_id_by_email("user1@example.com") == (
+            "user-00001"
+        )
+        assert len(client.get_space_users(space_id)) == 5
+
+    def test_writes_change_state(self, data, space_id):
+        """Test that role and map writes are visible to later reads."""
+        client = make_client(FakeGatherServer(data))
+
+        client.add_user_to_space(space_id, "user2@example.com", "ADMIN")
+        client.update_map_background(space_id, "map-0", "new.png")
+
+        admins = client.get_space_users(space_id, role="ADMIN")
+        assert [user["email"] for user in admins] == ["user2@example.com"]
+        assert client.get_map_data(space_id, "map-0").background == "new.png"
+        token = client.create_spawn_token(space_id, "map-0", "entrance")
+        assert token["room"] == "map-0"
+
+    def test_conditional_get(self, data, space_id):
+        """Test that map data carries an ETag and answers 304."""
+        server = FakeGatherServer(data)
+        client = make_client(server)
+
+        client.get_map_data(space_id, "map-0")
+        assert client.get_map_data_if_changed(space_id, "map-0") is None
+
+        assert [status for _, _, status in server.requests] == [200, 304]
+
+    def test_responses_are_compressed(self, data, space_id):
+        """Test that gzip is negotiated like a real server."""
+        client = make_client(FakeGatherServer(data))
+
+        client.get_map_data(space_id, "map-0")
+
+        counters = client.metrics.snapshot()
+        assert (
+            counters["response_bytes_wire"]
+            < counters["response_bytes_decoded"]
+        )
+
+    def test_unknown_resources(self, data, space_id):
+        """Test that unknown spaces and maps are 404s."""
+        client = make_client(FakeGatherServer(data))
+
+        with pytest.raises(GatherApiError) as exc_info:
+            client.get_map_data(space_id, "missing")
+        assert exc_info.value.status_code == 404
+        with pytest.raises(GatherApiError):
+            client.get_maps("missing-space")
+
+    def test_api_key_is_checked(self, data, space_id):
+        """Test that a configured API key is enforced."""
+        client = make_client(FakeGatherServer(data, api_key="secret"))
+
+        with pytest.raises(GatherApiError) as exc_info:
+            client.get_maps(space_id)
+        assert exc_info.value.status_code == 401
+
+    def test_explorer_runs_offline(self, data, space_id, tmp_path):
+        """Test that a full explorer sweep works on the fake server."""
+        explorer = PortalExplorer(
+            client=make_client(FakeGatherServer(data)),
+            output_dir=str(tmp_path),
+        )
+
+        results = explorer.analyze_all_maps(space_id)
+        connections = explorer._analyze_portal_connections(results)
+
+        assert sorted(results) == sorted(data.spaces[space_id].maps)
+        assert any(c["bidirectional"] for c in connections)
+
+
+class TestInjection:
+    """Tests for latency and failure injection."""
+
+    def test_latency_and_bandwidth(self, data, space_id, clock):
+        """Test that responses are delayed by latency plus transfer time."""
+        server = FakeGatherServer(
+            data,
+            latency=0.2,
+            bandwidth=1000,
+            compress_responses=False,
+            sleep=clock.sleep,
+        )
+        client = make_client(server)
+
+        client.get_maps(space_id)
+
+        body_size = client.metrics.get("response_bytes_wire")
+        assert clock.slept == [pytest.approx(0.2 + body_size / 1000)]
+
+    def test_error_injection_is_retried(self, data, space_id):
+        """Test that injected 503s exercise the retry path."""
+        server = FakeGatherServer(data, error_rate=0.5, seed=1)
+        client = make_client(
+            server,
+            retry_policy=RetryPolicy(max_attempts=10, sleep=lambda _: None),
+            circuit_breaker=CircuitBreaker.disabled(),
+        )
+
+        for _ in range(10):
+            client.get_maps(space_id)
+
+        statuses = [status for _, _, status in server.requests]
+        assert 503 in statuses
+        assert statuses.count(200) == 10
+
+    def test_throttle_injection_sends_retry_after(self, data, space_id):
+        """Test that injected 429s carry Retry-After."""
+        server = FakeGatherServer(data, throttle_rate=1.0, retry_after=7)
+        client = make_client(server, retry_policy=RetryPolicy.disabled())
+
+        with pytest.raises(GatherApiError) as exc_info:
+            client.get_maps(space_id)
+
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.retry_after == 7
+
+    def test_rate_limits(self, data, clock):
+        """Test that per-endpoint limits answer 429 once the burst is used."""
+        server = FakeGatherServer(
+            data, rate_limits={"user-id": (0.1, 2)}, clock=clock
+        )
+        client = make_client(server, retry_policy=RetryPolicy.disabled())
+
+        client.get_user_id_by_email("user0@example.com")
+        client.get_user_id_by_email("user1@example.com")
+        with pytest.raises(GatherApiError) as exc_info:
+            client.get_user_id_by_email("user2@example.com")
+        assert exc_info.value.retry_after == 10
+
+        clock.now += 10
+        assert client.get_user_id_by_email("user2@example.com") == (
+            "user-00002"
+        )
@@ -0,0 +1,137 @@
+"""
+Unit tests for the pluggable JSON codecs.
+
+Test Metadata:
+- Created: 2026-10-17
+- Last Updated: 2026-10-17
+- Status: Active
+- Owner: Development Team
+- Purpose: Validate that every codec reads and writes the same JSON
+- Lifecycle:
+  - Created: To take JSON encoding off the profile of large sweeps
+  - Active: Currently used to validate JsonCodec and its wiring
+  - Obsolescence Conditions:
+    1. When the standard library JSON module is fast enough for big spaces
+- Last Validated: 2026-10-17
+"""
+
+import json
+
+import pytest
+
+from gather_manager.api.client import GatherClient
+from gather_manager.api.coalesce import RequestCoalescer
+from gather_manager.api.fake_server import FakeGatherData, FakeGatherServer
+from gather_manager.api.json_codec import (
+    JSON_CODECS,
+    JsonCodec,
+    PydanticCodec,
+    get_codec,
+)
+from gather_manager.api.rate_limit import RateLimiter
+from gather_manager.models.space import Map, Object
+from gather_manager.utils.exceptions import ConfigurationError, GatherApiError
+
+VALUE = {
+    "maps": [Map(id="m1", name="Lobby")],
+    "objects": [Object(id="a", type=4, x=1, y=2, properties={"k": "é"})],
+    "counts": {1: 2},
+}
+
+
+def codec_or_skip(name):
+    """Get a codec, skipping the test when its package is missing."""
+    try:
+        return get_codec(name)
+    except ConfigurationError as e:
+        pytest.skip(str(e))
+
+
+class TestJsonCodec:
+    """Tests for encoding and decoding."""
+
+    @pytest.mark.parametrize("name", list(JSON_CODECS))
+    def test_codecs_agree(self, name):
+        """Test that every codec encodes models like the standard library."""
+        codec = codec_or_skip(name)
+        expected = json.loads(JsonCodec().dumps(VALUE))
+
+        assert codec.loads(codec.dumps(VALUE)) == expected
+        assert json.loads(codec.dumps(VALUE["objects"], indent=True)) == [
+            VALUE["objects"][0].model_dump()
+        ]
+
+    @pytest.mark.parametrize("name", list(JSON_CODECS))
+    def test_write(self, name, tmp_path):
+        """Test that files are written indented and readable as JSON."""
+        codec = codec_or_skip(name)
+        path = tmp_path / "out.json"
+
+        codec.write(path, VALUE["maps"])
+
+        text = path.read_text(encoding="utf-8")
+        assert text.startswith('[\n  {\n    "id": "m1"')
+        assert json.loads(text) == [VALUE["maps"][0].model_dump()]
+
+    @pytest.mark.parametrize("name", list(JSON_CODECS))
+    def test_invalid_input(self, name):
+        """Test that decoding errors are ValueErrors for every codec."""
+        codec = codec_or_skip(name)
+
+        with pytest.raises(ValueError):
+            codec.loads(b'{"id": ')
+        with pytest.raises(TypeError):
+            codec.dumps({"value": object()})
+
+    def test_write_matches_json_dump(self, tmp_path):
+        """Test that JsonCodec files are byte for byte json.dump output."""
+        value = {"name": "Caf\u00e9 \u2615", "v": float("nan"), "maps": []}
+        path = tmp_path / "out.json"
+        expected = tmp_path / "expected.json"
+
+        JsonCodec().write(path, {**value, "maps": VALUE["maps"]})
+        with open(expected, "w") as f:
+            json.dump(
+                {**value, "maps": [m.model_dump() for m in VALUE["maps"]]},
+                f,
+                indent=2,
+            )
+
+        assert path.read_bytes() == expected.read_bytes()
+
+    def test_get_codec(self):
+        """Test the default choice and unknown names."""
+        assert isinstance(get_codec(), PydanticCodec)
+        assert isinstance(get_codec("json"), JsonCodec)
+        with pytest.raises(ConfigurationError, match="Unknown JSON codec"):
+            get_codec("yaml")
+
+
+class TestClientJsonCodec:
+    """Tests for the codec used by GatherClient."""
+
+    @pytest.mark.parametrize("name", list(JSON_CODECS))
+    def test_responses_decode_the_same(self, name):
+        """Test that each codec gives the client identical results."""
+        data = FakeGatherData.generate(maps_per_space=2, objects_per_map=20)
+        space_id = next(iter(data.spaces))
+        client = GatherClient(
+            api_key="test_api_key",
+            transport=FakeGatherServer(data),
+            rate_limiter=RateLimiter.unlimited(),
+            coalescer=RequestCoalescer.disabled(),
+            json_codec=codec_or_skip(name),
+        )
+
+        assert [m.id for m in client.get_maps(space_id)] == ["map-0", "map-1"]
+        assert client.get_map_data(space_id, "map-0").objects == [
+            Object.model_validate(obj)
+            for obj in data.spaces[space_id].maps["map-0"]["objects"]
+        ]
+
+    def test_invalid_map_body(self):
+        """Test that undecodable map data raises GatherApiError."""
+        client = GatherClient(api_key="test_api_key")
+
+        with pytest.raises(GatherApiError, match="Invalid JSON"):
+            client._decode_map_body(b"{", "api/v2/spaces/s/maps/m")
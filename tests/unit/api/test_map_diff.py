@@ -0,0 +1,188 @@
+"""
+Unit tests for diff-based map object writes.
+
+Test Metadata:
+- Created: 2026-10-17
+- Last Updated: 2026-10-17
+- Status: Active
+- Owner: Development Team
+- Purpose: Validate object diffing and minimal map write content
+- Lifecycle:
+  - Created: To avoid uploading whole maps when a few objects change
+  - Active: Currently used to validate map_diff and apply_map_objects
+  - Obsolescence Conditions:
+    1. When Gather offers per-object map endpoints
+- Last Validated: 2026-10-17
+"""
+
+import json
+
+import pytest
+import responses
+
+from gather_manager.api.client import GatherClient
+from gather_manager.api.map_diff import (
+    WRITE_DELTA,
+    WRITE_FULL,
+    WRITE_NONE,
+    WRITE_OBJECTS,
+    diff_map_objects,
+    encoded_size,
+    estimate_full_size,
+    full_map_content,
+    plan_map_write,
+)
+from gather_manager.models.space import MapData, Object
+
+MAP_URL = "https://api.gather.town/api/v2/spaces/test-space/maps/test-map"
+
+
+def make_object(object_id, x=0, **kwargs):
+    """Build a map object."""
+    return Object(id=object_id, type="image", x=x, y=0, **kwargs)
+
+
+@pytest.fixture
+def base_map():
+    """Fixture to provide a map with three objects and a large field."""
+    return MapData(
+        id="test-map",
+        objects=[make_object("a"), make_object("b"), make_object("c")],
+        background="bg.png",
+        collisions="0" * 5000,
+    )
+
+
+class TestDiffMapObjects:
+    """Tests for diff_map_objects."""
+
+    def test_added_removed_changed(self, base_map):
+        """Test that objects are matched by ID."""
+        updated = [make_object("a"), make_object("b", x=5), make_object("d")]
+
+        diff = diff_map_objects(base_map.objects, updated)
+
+        assert list(diff.added) == ["d"]
+        assert diff.removed == ["c"]
+        assert list(diff.changed) == ["b"]
+        assert diff.unchanged == 1
+
+    def test_objects_without_ids(self):
+        """Test that unmatched objects without IDs are not diffed."""
+        base = [Object(type="image", x=0, y=0)]
+
+        assert diff_map_objects(base, list(base)).is_empty
+        assert not diff_map_objects(base, []).keyed
+
+
+class TestPlanMapWrite:
+    """Tests for choosing the map write content."""
+
+    def test_unchanged_objects_skip_write(self, base_map):
+        """Test that identical objects need no request."""
+        _, mode, content = plan_map_write(base_map, list(base_map.objects))
+
+        assert mode == WRITE_NONE
+        assert content is None
+
+    def test_objects_only_write(self, base_map):
+        """Test that only the objects field is sent by default."""
+        updated = [make_object("a", x=9)]
+
+        _, mode, content = plan_map_write(base_map, updated)
+
+        assert mode == WRITE_OBJECTS
+        assert list(content) == ["objects"]
+        assert [obj["id"] for obj in content["objects"]] == ["a"]
+
+    def test_delta_write(self, base_map):
+        """Test that merge mode sends only added and changed objects."""
+        updated = [*base_map.objects, make_object("d")]
+
+        _, mode, content = plan_map_write(
+            base_map, updated, merge_objects=True
+        )
+
+        assert mode == WRITE_DELTA
+        assert list(content["objects"]) == ["d"]
+
+    def test_delta_falls_back_when_objects_removed(self, base_map):
+        """Test that removals are written as the complete objects field."""
+        _, mode, _ = plan_map_write(
+            base_map, base_map.objects[:1], merge_objects=True
+        )
+
+        assert mode == WRITE_OBJECTS
+
+    def test_full_write_for_objects_without_ids(self):
+        """Test that maps whose objects cannot be matched are fully written."""
+        base = MapData(id="m", objects=[Object(type="image", x=0, y=0)])
+
+        _, mode, content = plan_map_write(base, [])
+
+        assert mode == WRITE_FULL
+        assert content["id"] == "m"
+
+
+class TestEstimateFullSize:
+    """Tests for estimate_full_size."""
+
+    def test_small_map_is_exact(self, base_map):
+        """Test that maps within the sample are measured exactly."""
+        objects = base_map.objects + [make_object("d")]
+
+        assert estimate_full_size(base_map, objects) == encoded_size(
+            full_map_content(base_map, objects)
+        )
+
+    def test_large_map_is_close(self, base_map):
+        """Test that a large map is estimated from a sample."""
+        objects = [make_object(f"o{i:05d}", x=i) for i in range(2000)]
+
+        exact = encoded_size(full_map_content(base_map, objects))
+
+        assert estimate_full_size(base_map, objects) == pytest.approx(
+            exact, rel=0.01
+        )
+
+
+class TestApplyMapObjects:
+    """Tests for GatherClient.apply_map_objects."""
+
+    @pytest.fixture
+    def client(self):
+        """Fixture to provide a GatherClient instance."""
+        return GatherClient(api_key="test_api_key")
+
+    @responses.activate
+    def test_write_reports_bytes_saved(self, client, base_map):
+        """Test that a small change sends far less than the full map."""
+        responses.add(responses.POST, MAP_URL, json={"id": "test-map"})
+        updated = [make_object("a", x=1), make_object("b"), make_object("c")]
+
+        result = client.apply_map_objects(
+            "test-space", "test-map", updated, base=base_map
+        )
+
+        sent = json.loads(responses.calls[0].request.body)
+        assert list(sent["content"]) == ["objects"]
+        assert result.bytes_sent == len(responses.calls[0].request.body)
+        assert result.bytes_saved > 5000
+        assert client.metrics.get("map_write_bytes_saved") == (
+            result.bytes_saved
+        )
+
+    @responses.activate
+    def test_update_map_objects_skips_noop(self, client, base_map):
+        """Test that writing unchanged objects only reads the map."""
+        responses.add(
+            responses.GET, MAP_URL, json=base_map.model_dump(), status=200
+        )
+
+        map_data = client.update_map_objects(
+            "test-space", "test-map", list(base_map.objects)
+        )
+
+        assert map_data.id == "test-map"
+        assert [call.request.method for call in responses.calls] == ["GET"]
+        assert client.metrics.get("map_writes_none") == 1
@@ -0,0 +1,186 @@
+"""
+Unit tests for per-endpoint client metrics.
+
+Test Metadata:
+- Created: 2026-10-17
+- Last Updated: 2026-10-17
+- Status: Active
+- Owner: Development Team
+- Purpose: Validate the endpoint metrics registry and its client hooks
+- Lifecycle:
+  - Created: To ensure API time and traffic can be attributed per endpoint
+  - Active: Currently used to validate EndpointMetrics and GatherClient
+  - Obsolescence Conditions:
+    1. When client instrumentation moves to an external metrics library
+- Last Validated: 2026-10-17
+"""
+
+import json
+
+import pytest
+import requests
+import responses
+
+from gather_manager.api.client import GatherClient
+from gather_manager.api.coalesce import RequestCoalescer
+from gather_manager.api.metrics import (
+    STATUS_ERROR,
+    EndpointMetrics,
+    LatencyHistogram,
+)
+from gather_manager.api.retry import RetryPolicy
+from gather_manager.utils.exceptions import GatherApiError
+
+BASE = "https://api.gather.town/api/v2"
+MAP_URL = f"{BASE}/spaces/test-space/maps/test-map"
+
+
+class TestLatencyHistogram:
+    """Tests for the LatencyHistogram."""
+
+    def test_observations_fall_in_buckets(self):
+        """Test that cumulative counts include every lower bucket."""
+        histogram = LatencyHistogram(buckets=(0.1, 1.0))
+
+        for seconds in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(seconds)
+
+        assert histogram.cumulative() == [
+            (0.1, 2),
+            (1.0, 3),
+            (float("inf"), 4),
+        ]
+        assert histogram.count == 4
+        assert histogram.sum == pytest.approx(3.65)
+
+    def test_quantile_interpolates_within_bucket(self):
+        """Test quantile estimates from bucket counts."""
+        histogram = LatencyHistogram(buckets=(1.0, 2.0))
+        for _ in range(4):
+            histogram.observe(1.5)
+
+        assert histogram.quantile(0.5) == pytest.approx(1.5)
+        assert LatencyHistogram().quantile(0.5) is None
+
+
+class TestEndpointMetrics:
+    """Tests for the EndpointMetrics registry."""
+
+    @pytest.fixture
+    def registry(self):
+        """Fixture to provide a registry with a few recorded attempts."""
+        registry = EndpointMetrics(buckets=(0.1, 1.0))
+        registry.record_call("map-data")
+        registry.record_request("map-data", 200, 0.05, 10, 1000)
+        registry.record_request("map-data", 503, 0.5)
+        registry.record_retry("map-data")
+        registry.record_cache_hit("map-data", "disk")
+        registry.record_call("spaces")
+        return registry
+
+    def test_to_dict(self, registry):
+        """Test the dictionary view of recorded statistics."""
+        data = registry.to_dict()
+
+        assert list(data) == ["spaces", "map-data"]
+        stats = data["map-data"]
+        assert stats["calls"] == 1
+        assert stats["requests"] == 2
+        assert stats["statuses"] == {"200": 1, "503": 1}
+        assert stats["retries"] == 1
+        assert stats["cache_hits"] == {"disk": 1}
+        assert stats["request_bytes"] == 10
+        assert stats["response_bytes"] == 1000
+        assert stats["latency"]["buckets"] == {"0.1": 1, "1.0": 2, "+Inf": 2}
+
+    def test_to_json_round_trips(self, registry):
+        """Test that the JSON output matches the dictionary view."""
+        assert json.loads(registry.to_json()) == registry.to_dict()
+
+    def test_to_prometheus(self, registry):
+        """Test the Prometheus text exposition output."""
+        text = registry.to_prometheus()
+
+        assert "# TYPE gather_client_requests_total counter" in text
+        assert 'gather_client_requests_total{endpoint="map-data"} 2' in text
+        assert (
+            'gather_client_responses_total{endpoint="map-data",status="503"} 1'
+            in text
+        )
+        assert (
+            'gather_client_request_duration_seconds_bucket{endpoint="map-data",'
+            'le="+Inf"} 2' in text
+        )
+        assert (
+            'gather_client_cache_hits_total{endpoint="map-data",source="disk"} 1'
+            in text
+        )
+        assert text.endswith("\n")
+
+
+class TestClientEndpointMetrics:
+    """Tests for endpoint metrics recorded by GatherClient."""
+
+    @pytest.fixture
+    def client(self):
+        """Fixture to provide a client that retries immediately."""
+        return GatherClient(
+            api_key="test_api_key",
+            retry_policy=RetryPolicy(max_attempts=2, sleep=lambda _: None),
+            coalescer=RequestCoalescer.disabled(),
+        )
+
+    @responses.activate
+    def test_requests_are_recorded_per_endpoint(self, client):
+        """Test that calls, statuses and bytes are attributed by endpoint."""
+        responses.add(responses.GET, f"{BASE}/spaces/test-space/maps", json=[])
+        responses.add(responses.GET, MAP_URL, json={"id": "test-map"})
+        responses.add(responses.POST, MAP_URL, json={"id": "test-map"})
+
+        client.get_maps("test-space")
+        client.get_map_data("test-space", "test-map")
+        client.update_map("test-space", "test-map", {"background": "bg"})
+
+        data = client.get_metrics()["endpoints"]
+        assert data["maps"]["calls"] == 1
+        assert data["map-data"]["calls"] == 2
+        assert data["map-data"]["statuses"] == {"200": 2}
+        assert data["map-data"]["request_bytes"] == len(
+            responses.calls[2].request.body
+        )
+        assert data["map-data"]["response_bytes"] > 0
+        assert data["map-data"]["latency"]["count"] == 2
+
+    @responses.activate
+    def test_retries_and_failures_are_recorded(self, client):
+        """Test that every attempt and retry is counted."""
+        responses.add(responses.GET, MAP_URL, status=503)
+        responses.add(
+            responses.GET,
+            MAP_URL,
+            body=requests.exceptions.ConnectionError("reset"),
+        )
+
+        with pytest.raises(GatherApiError):
+            client.get_map_data("test-space", "test-map")
+
+        stats = client.endpoint_metrics.to_dict()["map-data"]
+        assert stats["calls"] == 1
+        assert stats["requests"] == 2
+        assert stats["retries"] == 1
+        assert stats["statuses"] == {"503": 1, STATUS_ERROR: 1}
+
+    @responses.activate
+    def test_shared_registry_aggregates_clients(self):
+        """Test that clients given one registry record into it."""
+        responses.add(responses.GET, MAP_URL, json={"id": "test-map"})
+        registry = EndpointMetrics()
+        clients = [
+            GatherClient(api_key="test_api_key", endpoint_metrics=registry)
+            for _ in range(2)
+        ]
+
+        for client in clients:
+            client.get_map_data("test-space", "test-map")
+
+        assert registry.to_dict()["map-data"]["requests"] == 2
@@ -0,0 +1,125 @@
+"""
+Unit tests for client-side rate limiting.
+
+Test Metadata:
+- Created: 2026-10-16
+- Last Updated: 2026-10-16
+- Status: Active
+- Owner: Development Team
+- Purpose: Validate token-bucket pacing and per-endpoint classes
+- Lifecycle:
+  - Created: To ensure requests are paced instead of rejected with 429
+  - Active: Currently used to validate RateLimiter and TokenBucket
+  - Obsolescence Conditions:
+    1. When Gather.town enforces limits that the client can query directly
+- Last Validated: 2026-10-16
+"""
+
+import pytest
+import responses
+
+from gather_manager.api.client import GatherClient
+from gather_manager.api.rate_limit import RateLimiter, TokenBucket
+from gather_manager.api.retry import RetryPolicy
+from gather_manager.utils.exceptions import GatherApiError
+
+
+class TestTokenBucket:
+    """Tests for the TokenBucket."""
+
+    def test_burst_then_paced(self, clock):
+        """Test that a full bucket serves a burst, then waits per token."""
+        bucket = TokenBucket(
+            rate=2, capacity=3, clock=clock, sleep=clock.sleep
+        )
+
+        waits = [bucket.acquire() for _ in range(5)]
+
+        assert waits[:3] == [0, 0, 0]
+        assert waits[3] == pytest.approx(0.5)
+        assert clock.now == pytest.approx(1.0)
+
+    def test_refill_capped_at_capacity(self, clock):
+        """Test that idle time does not exceed the bucket capacity."""
+        bucket = TokenBucket(
+            rate=1, capacity=2, clock=clock, sleep=clock.sleep
+        )
+        clock.now = 100
+
+        assert bucket.tokens == 2
+
+    def test_drain(self, clock):
+        """Test that draining forces the next caller to wait."""
+        bucket = TokenBucket(
+            rate=1, capacity=5, clock=clock, sleep=clock.sleep
+        )
+        bucket.drain()
+
+        assert bucket.acquire() == pytest.approx(1.0)
+
+
+class TestRateLimiter:
+    """Tests for the RateLimiter."""
+
+    def test_classify_user_id(self):
+        """Test endpoint classification."""
+        assert RateLimiter.classify("api/v2/user-id") == RateLimiter.USER_ID
+        assert RateLimiter.classify("api/v2/spaces/abc/maps") is None
+
+    def test_user_id_uses_strict_and_global_buckets(self, clock):
+        """Test that user-id lookups draw from both buckets."""
+        strict = TokenBucket(1, 1, clock=clock, sleep=clock.sleep)
+        global_bucket = TokenBucket(100, 100, clock=clock, sleep=clock.sleep)
+        limiter = RateLimiter(
+            {RateLimiter.USER_ID: strict, RateLimiter.GLOBAL: global_bucket}
+        )
+
+        limiter.acquire("api/v2/user-id")
+        waited = limiter.acquire("api/v2/user-id")
+        limiter.acquire("api/v2/spaces/abc/maps")
+
+        assert waited == pytest.approx(1.0)
+        assert global_bucket.tokens == pytest.approx(98)
+
+    def test_metrics_report_fill(self, clock):
+        """Test that metrics expose bucket fill."""
+        bucket = TokenBucket(1, 4, clock=clock, sleep=clock.sleep)
+        limiter = RateLimiter({RateLimiter.GLOBAL: bucket})
+        limiter.acquire("api/v2/spaces")
+
+        metrics = limiter.metrics()["global"]
+
+        assert metrics["tokens"] == 3
+        assert metrics["fill_ratio"] == 0.75
+
+    def test_unlimited(self):
+        """Test that the unlimited limiter never waits."""
+        limiter = RateLimiter.unlimited()
+        assert all(limiter.acquire("api/v2/user-id") == 0 for _ in range(100))
+
+
+class TestClientRateLimiting:
+    """Tests for rate limiting inside GatherClient."""
+
+    @responses.activate
+    def test_429_drains_bucket_and_counts(self, clock):
+        """Test that a 429 drains the shared buckets."""
+        responses.add(
+            responses.GET,
+            "https://api.gather.town/api/v2/user-id",
+            status=429,
+        )
+        bucket = TokenBucket(1, 10, clock=clock, sleep=clock.sleep)
+        client = GatherClient(
+            api_key="test_api_key",
+            rate_limiter=RateLimiter({RateLimiter.USER_ID: bucket}),
+            retry_policy=RetryPolicy.disabled(),
+        )
+
+        with pytest.raises(GatherApiError):
+            client.get_user_id_by_email("a@example.com")
+
+        assert bucket.tokens <= 0
+        metrics = client.get_metrics()
+        assert metrics["counters"]["rate_limited_responses"] == 1
+        assert "user-id" in metrics["rate_limiter"]
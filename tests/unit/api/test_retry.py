@@ -0,0 +1,151 @@
+"""
+Unit tests for request retries.
+
+Test Metadata:
+- Created: 2026-10-16
+- Last Updated: 2026-10-16
+- Status: Active
+- Owner: Development Team
+- Purpose: Validate retry, backoff and Retry-After handling
+- Lifecycle:
+  - Created: To ensure transient API failures do not abort long sweeps
+  - Active: Currently used to validate RetryPolicy and GatherClient retries
+  - Obsolescence Conditions:
+    1. When retries move into a transport layer outside GatherClient
+- Last Validated: 2026-10-16
+"""
+
+import pytest
+import requests
+import responses
+
+from gather_manager.api.client import GatherClient
+from gather_manager.api.rate_limit import RateLimiter
+from gather_manager.api.retry import RetryPolicy, parse_retry_after
+from gather_manager.utils.exceptions import GatherApiError
+
+MAPS_URL = "https://api.gather.town/api/v2/spaces/test-space/maps"
+SPAWN_URL = "https://api.gather.town/api/v2/spaces/test-space/spawn-tokens"
+
+
+@pytest.fixture
+def sleeps():
+    """Fixture collecting the delays the retry policy slept for."""
+    return []
+
+
+@pytest.fixture
+def client(sleeps):
+    """Fixture to provide a client whose retries do not sleep."""
+    policy = RetryPolicy(max_attempts=3, jitter=False, sleep=sleeps.append)
+    return GatherClient(
+        api_key="test_api_key",
+        rate_limiter=RateLimiter.unlimited(),
+        retry_policy=policy,
+    )
+
+
+class TestRetryPolicy:
+    """Tests for the RetryPolicy."""
+
+    def test_exponential_backoff_capped(self):
+        """Test the backoff curve without jitter."""
+        policy = RetryPolicy(
+            backoff_base=1, backoff_factor=2, max_backoff=5, jitter=False
+        )
+        assert [policy.get_backoff(a) for a in (1, 2, 3, 4)] == [1, 2, 4, 5]
+
+    def test_full_jitter(self):
+        """Test that jitter scales the delay by the random source."""
+        policy = RetryPolicy(backoff_base=2, rng=lambda: 0.25)
+        assert policy.get_backoff(1) == 0.5
+
+    def test_retry_after_extends_delay(self):
+        """Test that Retry-After is honored and capped."""
+        policy = RetryPolicy(jitter=False, max_retry_after=10)
+        assert policy.get_backoff(1, retry_after=7) == 7
+        assert policy.get_backoff(1, retry_after=60) == 10
+
+    def test_method_idempotency(self):
+        """Test which methods are retried by default."""
+        policy = RetryPolicy()
+        assert policy.is_retryable_method("GET")
+        assert policy.is_retryable_method("PUT")
+        assert not policy.is_retryable_method("POST")
+        assert policy.is_retryable_method("POST", idempotent=True)
+
+    def test_parse_retry_after(self):
+        """Test parsing of Retry-After header values."""
+        assert parse_retry_after("3") == 3
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("not a date") is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+
+
+class TestClientRetries:
+    """Tests for retries inside GatherClient."""
+
+    @responses.activate
+    def test_get_retried_after_server_error(self, client, sleeps):
+        """Test that a GET succeeds after transient 503s."""
+        responses.add(responses.GET, MAPS_URL, status=503)
+        responses.add(responses.GET, MAPS_URL, json=[{"id": "m1"}])
+
+        maps = client.get_maps("test-space")
+
+        assert [m.id for m in maps] == ["m1"]
+        assert sleeps == [0.5]
+        assert client.get_metrics()["counters"]["retries"] == 1
+
+    @responses.activate
+    def test_429_honors_retry_after(self, client, sleeps):
+        """Test that Retry-After from a 429 sets the delay."""
+        responses.add(
+            responses.GET, MAPS_URL, status=429, headers={"Retry-After": "4"}
+        )
+        responses.add(responses.GET, MAPS_URL, json=[])
+
+        client.get_maps("test-space")
+
+        assert sleeps == [4]
+
+    @responses.activate
+    def test_connection_error_retried_until_exhausted(self, client, sleeps):
+        """Test that connection failures give up after max_attempts."""
+        responses.add(
+            responses.GET,
+            MAPS_URL,
+            body=requests.exceptions.ConnectionError("reset"),
+        )
+
+        with pytest.raises(GatherApiError):
+            client.get_maps("test-space")
+
+        assert len(responses.calls) == 3
+        assert client.get_metrics()["counters"]["retries_exhausted"] == 1
+
+    @responses.activate
+    def test_client_errors_not_retried(self, client, sleeps):
+        """Test that a 404 fails immediately."""
+        responses.add(responses.GET, MAPS_URL, status=404)
+
+        with pytest.raises(GatherApiError):
+            client.get_maps("test-space")
+
+        assert sleeps == []
+
+    @responses.activate
+    def test_spawn_token_retried_only_when_opted_in(self, client):
+        """Test that non-idempotent POSTs need an explicit opt-in."""
+        responses.add(responses.POST, SPAWN_URL, status=503)
+        responses.add(responses.POST, SPAWN_URL, status=503)
+        responses.add(responses.POST, SPAWN_URL, json={"spawnToken": "t"})
+
+        with pytest.raises(GatherApiError):
+            client.create_spawn_token("test-space", "map", "spawn")
+        result = client.create_spawn_token(
+            "test-space", "map", "spawn", retry=True
+        )
+
+        assert result == {"spawnToken": "t"}
+        assert len(responses.calls) == 3
@@ -0,0 +1,153 @@
+"""
+Unit tests for streaming map object parsing.
+
+Test Metadata:
+- Created: 2026-10-17
+- Last Updated: 2026-10-17
+- Status: Active
+- Owner: Development Team
+- Purpose: Validate incremental parsing of map payloads
+- Lifecycle:
+  - Created: To process very large maps with bounded memory
+  - Active: Currently used to validate MapObjectStream and iter_map_objects
+  - Obsolescence Conditions:
+    1. When map objects are served by a paginated endpoint
+- Last Validated: 2026-10-17
+"""
+
+import json
+
+import pytest
+import responses
+
+from gather_manager.api.client import GatherClient
+from gather_manager.api.streaming import MapObjectStream
+from gather_manager.utils.exceptions import GatherApiError
+
+MAP_URL = "https://api.gather.town/api/v2/spaces/test-space/maps/test-map"
+
+
+def make_map(count=50):
+    """Build a map document with objects before and after other fields."""
+    return {
+        "id": "test-map",
+        "name": "Café \U0001f600",
+        "objects": [
+            {"id": f"o{i}", "type": "image", "x": i, "y": 1234567}
+            for i in range(count)
+        ],
+        "dimensions": [40, 30],
+    }
+
+
+def chunked(data, size):
+    """Split bytes into chunks of the given size."""
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestMapObjectStream:
+    """Tests for the MapObjectStream parser."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64, 100_000])
+    def test_any_chunking_yields_all_objects(self, chunk_size):
+        """Test that chunk boundaries inside values and UTF-8 are handled."""
+        raw = json.dumps(make_map(), ensure_ascii=False).encode()
+
+        stream = MapObjectStream(chunked(raw, chunk_size))
+        objects = list(stream)
+
+        assert [obj.x for obj in objects] == list(range(50))
+        assert all(obj.y == 1234567 for obj in objects)
+        assert stream.fields == {
+            "id": "test-map",
+            "name": "Café \U0001f600",
+            "dimensions": [40, 30],
+        }
+
+    def test_objects_keyed_by_id(self):
+        """Test the v2 format where objects is a dict keyed by ID."""
+        raw = json.dumps(
+            {"objects": {"a": {"type": 1, "x": 1, "y": 2}}}
+        ).encode()
+
+        objects = list(MapObjectStream([raw]))
+
+        assert objects[0].id == "a"
+
+    def test_objects_are_yielded_incrementally(self):
+        """Test that objects are yielded before the whole map is read."""
+        raw = json.dumps(make_map(2000)).encode()
+        consumed = []
+
+        def chunks():
+            for chunk in chunked(raw, 1024):
+                consumed.append(len(chunk))
+                yield chunk
+
+        stream = MapObjectStream(chunks())
+        next(iter(stream))
+
+        assert sum(consumed) < len(raw) / 2
+
+    def test_batches(self):
+        """Test that objects can be consumed in fixed-size batches."""
+        raw = json.dumps(make_map(5)).encode()
+
+        sizes = [len(b) for b in MapObjectStream([raw]).batches(size=2)]
+
+        assert sizes == [2, 2, 1]
+
+    def test_truncated_document(self):
+        """Test that a truncated map raises ValueError."""
+        raw = json.dumps(make_map()).encode()[:-40]
+
+        with pytest.raises(ValueError):
+            list(MapObjectStream(chunked(raw, 64)))
+
+
+class TestClientStreaming:
+    """Tests for GatherClient map streaming."""
+
+    @pytest.fixture
+    def client(self):
+        """Fixture to provide a GatherClient instance."""
+        return GatherClient(api_key="test_api_key")
+
+    @responses.activate
+    def test_iter_portals(self, client):
+        """Test that portals are detected while streaming."""
+        body = {
+            "id": "test-map",
+            "objects": [
+                {"id": "p", "type": "portal", "x": 0, "y": 0},
+                {"id": "i", "type": "image", "x": 0, "y": 0},
+                {"id": "t", "type": 1, "x": 0, "y": 0, "targetMap": "m2"},
+            ],
+        }
+        responses.add(responses.GET, MAP_URL, json=body, stream=True)
+
+        portals = list(client.iter_portals("test-space", "test-map"))
+
+        assert [obj.id for obj in portals] == ["p", "t"]
+
+    @responses.activate
+    def test_requests_v2_map(self, client):
+        """Test that streaming asks for the same map format as get_map_data."""
+        responses.add(
+            responses.GET,
+            MAP_URL,
+            json={"id": "test-map", "objects": []},
+            stream=True,
+        )
+
+        list(client.iter_map_objects("test-space", "test-map"))
+
+        assert responses.calls[0].request.params == {"useV2Map": "true"}
+
+    @responses.activate
+    def test_invalid_body_raises_api_error(self, client):
+        """Test that malformed map data surfaces as a GatherApiError."""
+        responses.add(responses.GET, MAP_URL, body='{"objects": [1, }')
+
+        with pytest.raises(GatherApiError, match="Invalid map data"):
+            list(client.iter_map_objects("test-space", "test-map"))
@@ -0,0 +1,185 @@
+"""
+Unit tests for tracing spans and the Chrome trace exporter.
+
+Test Metadata:
+- Created: 2026-10-17
+- Last Updated: 2026-10-17
+- Status: Active
+- Owner: Development Team
+- Purpose: Validate span hooks in the client and services
+- Lifecycle:
+  - Created: To ensure runs can be inspected as a timeline
+  - Active: Currently used to validate tracing and its exporters
+  - Obsolescence Conditions:
+    1. When tracing is delegated entirely to OpenTelemetry
+- Last Validated: 2026-10-17
+"""
+
+import asyncio
+import json
+from contextlib import contextmanager
+
+import pytest
+import responses
+
+from gather_manager.api.client import GatherClient
+from gather_manager.api.tracing import (
+    ChromeTraceExporter,
+    OpenTelemetryTracer,
+    Tracer,
+    get_tracer,
+    set_tracer,
+    span,
+    traced,
+)
+from gather_manager.services.explorer import PortalExplorer
+
+MAP_URL = "https://api.gather.town/api/v2/spaces/test-space/maps/test-map"
+MAP_BODY = {
+    "id": "test-map",
+    "objects": [
+        {"id": "p1", "type": "portal", "x": 1, "y": 2, "targetMap": "other"}
+    ],
+}
+
+
+@pytest.fixture
+def exporter(clock):
+    """Fixture to install a Chrome trace exporter for one test."""
+    clock.tick = 1.0  # Every span lasts a whole number of seconds
+    exporter = ChromeTraceExporter(clock=clock)
+    previous = set_tracer(exporter)
+    yield exporter
+    set_tracer(previous)
+
+
+class TestTracer:
+    """Tests for the tracer registry and decorators."""
+
+    def test_default_tracer_is_noop(self):
+        """Test that spans are free of side effects by default."""
+        assert type(get_tracer()) is Tracer
+        with span("test.noop", key="value") as trace_span:
+            trace_span.set_attribute("other", 1)
+
+    def test_traced_records_named_arguments(self, exporter):
+        """Test that decorated functions run in a span with their IDs."""
+
+        @traced("test.work")
+        def work(space_id, map_id=None, other=None):
+            return "done"
+
+        assert work("s", map_id="m", other="x") == "done"
+
+        (event,) = exporter.events
+        assert event["name"] == "test.work"
+        assert event["args"] == {"space_id": "s", "map_id": "m"}
+
+    def test_traced_coroutine(self, exporter):
+        """Test that coroutine functions are traced until they finish."""
+
+        @traced("test.async_work")
+        async def work(space_id):
+            await asyncio.sleep(0)
+            return space_id
+
+        assert asyncio.run(work("s")) == "s"
+        assert [e["name"] for e in exporter.events] == ["test.async_work"]
+
+    def test_open_telemetry_tracer_delegates(self):
+        """Test that spans are started on the wrapped OpenTelemetry tracer."""
+        started = []
+
+        class FakeOtelTracer:
+            @contextmanager
+            def start_as_current_span(self, name, attributes=None):
+                started.append((name, attributes))
+                yield "otel-span"
+
+        tracer = OpenTelemetryTracer(FakeOtelTracer())
+        with tracer.start_span("test.span", {"key": "value"}) as trace_span:
+            assert trace_span == "otel-span"
+        assert started == [("test.span", {"key": "value"})]
+
+
+class TestChromeTraceExporter:
+    """Tests for the ChromeTraceExporter."""
+
+    def test_events_have_microsecond_timing(self, exporter):
+        """Test that spans become complete events relative to the origin."""
+        with span("outer.phase"):
+            with span("inner.phase", map_id="m"):
+                pass
+
+        inner, outer = exporter.events
+        assert inner["name"] == "inner.phase"
+        assert inner["cat"] == "inner"
+        assert inner["ph"] == "X"
+        assert inner["ts"] == 2e6
+        assert inner["dur"] == 1e6
+        assert outer["ts"] == 1e6
+        assert outer["dur"] == 3e6
+
+    def test_exceptions_are_recorded(self, exporter):
+        """Test that a failing span records the error and re-raises."""
+        with pytest.raises(ValueError):
+            with span("test.fail"):
+                raise ValueError("boom")
+
+        assert exporter.events[0]["args"]["error"] == "ValueError: boom"
+
+    def test_write(self, exporter, tmp_path):
+        """Test that the trace file is valid trace-event JSON."""
+        with span("test.phase"):
+            pass
+
+        path = exporter.write(tmp_path / "trace.json")
+
+        data = json.loads(path.read_text())
+        assert data["traceEvents"][0]["name"] == "test.phase"
+
+    def test_write_needs_a_path(self):
+        """Test that writing without any path is an error."""
+        with pytest.raises(ValueError):
+            ChromeTraceExporter().write()
+
+
+class TestInstrumentation:
+    """Tests for spans emitted by the client and services."""
+
+    @responses.activate
+    def test_client_request_span(self, exporter):
+        """Test that API calls are traced with their endpoint and status."""
+        responses.add(responses.GET, MAP_URL, json=MAP_BODY)
+        client = GatherClient(api_key="test_api_key")
+
+        client.get_portals("test-space", "test-map")
+
+        request, detect = exporter.events
+        assert request["name"] == "gather.request"
+        assert request["args"]["gather.endpoint"] == "map-data"
+        assert request["args"]["http.response.status_code"] == 200
+        assert detect["name"] == "gather.detect_portals"
+        assert detect["args"]["portals"] == 1
+
+    @responses.activate
+    def test_explorer_phases_nest(self, exporter, tmp_path):
+        """Test that explorer phases contain the requests they make."""
+        responses.add(responses.GET, MAP_URL, json=MAP_BODY)
+        explorer = PortalExplorer(
+            client=GatherClient(api_key="test_api_key"),
+            output_dir=str(tmp_path),
+        )
+
+        explorer.analyze_map_portals("test-space", "test-map")
+
+        events = {e["name"]: e for e in exporter.events}
+        phase = events["explorer.analyze_map_portals"]
+        assert phase["args"] == {
+            "space_id": "test-space",
+            "map_id": "test-map",
+        }
+        for name in ("gather.request", "explorer.save_to_json"):
+            event = events[name]
+            assert phase["ts"] < event["ts"]
+            assert event["ts"] + event["dur"] < phase["ts"] + phase["dur"]
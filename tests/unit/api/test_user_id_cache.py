@@ -0,0 +1,211 @@
+"""
+Unit tests for the persistent user ID cache.
+
+Test Metadata:
+- Created: 2026-10-17
+- Last Updated: 2026-10-17
+- Status: Active
+- Owner: Development Team
+- Purpose: Validate email to user ID caching for user management
+- Lifecycle:
+  - Created: To avoid repeated calls to the rate-limited user-id endpoint
+  - Active: Currently used to validate UserIdCache and client integration
+  - Obsolescence Conditions:
+    1. When Gather removes the rate limit on user-id lookups
+- Last Validated: 2026-10-17
+"""
+
+import sqlite3
+import threading
+from contextlib import closing
+
+import pytest
+import responses
+
+from gather_manager.api.client import GatherClient
+from gather_manager.api.rate_limit import RateLimiter
+from gather_manager.api.retry import RetryPolicy
+from gather_manager.api.user_id_cache import UserIdCache
+from gather_manager.utils.exceptions import GatherApiError
+
+BASE_URL = "https://api.gather.town/api/v2"
+USER_ID_URL = f"{BASE_URL}/user-id"
+ROLES_URL = f"{BASE_URL}/spaces/test-space/users/user-1/roles"
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    """Fixture to provide a UserIdCache with negative caching."""
+    return UserIdCache(
+        tmp_path / "user_ids.sqlite3", negative_ttl=60, clock=clock
+    )
+
+
+class TestUserIdCache:
+    """Tests for the UserIdCache."""
+
+    def test_round_trip_normalizes_email(self, cache):
+        """Test that lookups are case and whitespace insensitive."""
+        cache.set("Alice@Example.com ", "user-1")
+
+        entry = cache.get("alice@example.com")
+
+        assert entry.found
+        assert entry.user_id == "user-1"
+
+    def test_persists_across_instances(self, cache, tmp_path, clock):
+        """Test that entries are shared through the database file."""
+        cache.set("alice@example.com", "user-1")
+
+        other = UserIdCache(tmp_path / "user_ids.sqlite3", clock=clock)
+
+        assert other.get("alice@example.com").user_id == "user-1"
+
+    def test_entries_expire(self, cache, clock):
+        """Test that found and negative entries expire after their TTLs."""
+        cache.ttl = 3600
+        cache.set("alice@example.com", "user-1")
+        cache.set("nobody@example.com", None)
+
+        clock.now += 61
+        assert cache.get("alice@example.com") is not None
+        assert cache.get("nobody@example.com") is None
+
+        clock.now += 3600
+        assert cache.get("alice@example.com") is None
+
+    def test_negative_results_need_negative_ttl(self, tmp_path, clock):
+        """Test that negative results are not cached by default."""
+        cache = UserIdCache(tmp_path / "user_ids.sqlite3", clock=clock)
+        cache.set("nobody@example.com", None)
+
+        assert cache.get("nobody@example.com") is None
+        assert len(cache) == 0
+
+    def test_refresh_ignores_entries(self, cache, tmp_path):
+        """Test that refresh mode misses but still stores lookups."""
+        cache.set("alice@example.com", "user-1")
+        refreshing = UserIdCache(tmp_path / "user_ids.sqlite3", refresh=True)
+
+        assert refreshing.get("alice@example.com") is None
+        refreshing.set("alice@example.com", "user-2")
+        assert cache.get("alice@example.com").user_id == "user-2"
+
+    def test_concurrent_writers(self, cache):
+        """Test that threads can write to the cache at the same time."""
+        threads = [
+            threading.Thread(
+                target=cache.set, args=(f"user{i}@example.com", f"id-{i}")
+            )
+            for i in range(20)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(cache) == 20
+
+    def test_keyed_by_base_url(self, cache):
+        """Test that IDs from different deployments do not mix."""
+        cache.set("alice@example.com", "prod-1", base_url="https://prod/")
+        cache.set("alice@example.com", "staging-1", base_url="https://stg")
+
+        assert cache.get("alice@example.com", "https://prod").user_id == (
+            "prod-1"
+        )
+        assert cache.get("alice@example.com", "https://stg").user_id == (
+            "staging-1"
+        )
+        assert cache.get("alice@example.com") is None
+
+        cache.invalidate("alice@example.com", base_url="https://stg")
+        assert len(cache) == 1
+        cache.invalidate("alice@example.com")
+        assert len(cache) == 0
+
+    def test_replaces_unkeyed_entries(self, tmp_path, clock):
+        """Test that a database without base URLs is recreated."""
+        path = tmp_path / "user_ids.sqlite3"
+        with closing(sqlite3.connect(str(path))) as conn, conn:
+            conn.execute(
+                "CREATE TABLE user_ids (email TEXT PRIMARY KEY, "
+                "user_id TEXT, stored_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "INSERT INTO user_ids VALUES ('alice@example.com', 'u', 0)"
+            )
+        cache = UserIdCache(path, clock=clock)
+
+        assert cache.get("alice@example.com") is None
+        cache.set("alice@example.com", "user-1")
+        assert cache.get("alice@example.com").user_id == "user-1"
+
+    def test_unavailable_database(self, tmp_path):
+        """Test that an unusable path falls back to no caching."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        cache = UserIdCache(blocker / "user_ids.sqlite3")
+
+        assert cache.get("alice@example.com") is None
+        cache.set("alice@example.com", "user-1")
+        cache.invalidate("alice@example.com")
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestClientUserIdCache:
+    """Tests for GatherClient user-id lookups with a cache."""
+
+    @pytest.fixture
+    def client(self, cache):
+        """Fixture to provide a GatherClient with a user ID cache."""
+        return GatherClient(
+            api_key="test_api_key",
+            user_id_cache=cache,
+            rate_limiter=RateLimiter.unlimited(),
+            retry_policy=RetryPolicy.disabled(),
+        )
+
+    @responses.activate
+    def test_user_management_reuses_lookup(self, client):
+        """Test that adding then removing a user looks the email up once."""
+        responses.add(
+            responses.GET, USER_ID_URL, json={"userId": "user-1"}, status=200
+        )
+        responses.add(responses.PUT, ROLES_URL, json={}, status=200)
+
+        client.add_user_to_space("test-space", "alice@example.com")
+        client.remove_user_from_space("test-space", "alice@example.com")
+
+        lookups = [c for c in responses.calls if "user-id" in c.request.url]
+        assert len(lookups) == 1
+        counters = client.metrics.snapshot()
+        assert counters["user_id_cache_misses"] == 1
+        assert counters["user_id_cache_hits"] == 1
+
+    @responses.activate
+    def test_unknown_email_is_negatively_cached(self, client):
+        """Test that a not-found lookup is not repeated within its TTL."""
+        responses.add(responses.GET, USER_ID_URL, json={}, status=200)
+
+        for _ in range(2):
+            with pytest.raises(GatherApiError, match="User ID not found"):
+                client.get_user_id_by_email("nobody@example.com")
+
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_listing_users_primes_cache(self, client):
+        """Test that users listed in a space need no user-id lookup."""
+        responses.add(
+            responses.GET,
+            f"{BASE_URL}/spaces/test-space/users",
+            json=[{"id": "user-1", "email": "alice@example.com"}],
+            status=200,
+        )
+
+        client.get_space_users("test-space")
+
+        assert client.get_user_id_by_email("alice@example.com") == "user-1"
+        assert len(responses.calls) == 1
@@ -0,0 +1,119 @@
+"""
+Unit tests for conditional GETs of map data.
+
+Test Metadata:
+- Created: 2026-10-17
+- Last Updated: 2026-10-17
+- Status: Active
+- Owner: Development Team
+- Purpose: Validate ETag/Last-Modified revalidation and content hashing
+- Lifecycle:
+  - Created: To ensure unchanged maps are not downloaded or reprocessed
+  - Active: Currently used to validate ValidatorCache and get_map_data
+  - Obsolescence Conditions:
+    1. When map data is fetched through a different caching layer
+- Last Validated: 2026-10-17
+"""
+
+import pytest
+import responses
+
+from gather_manager.api.client import GatherClient
+from gather_manager.api.coalesce import RequestCoalescer
+from gather_manager.api.validator_cache import ValidatorCache, ValidatorEntry
+
+MAP_URL = "https://api.gather.town/api/v2/spaces/test-space/maps/test-map"
+MAP_BODY = {"id": "test-map", "objects": [{"type": "portal", "x": 1, "y": 2}]}
+
+
+@pytest.fixture
+def client():
+    """Fixture to provide a GatherClient that revalidates every read."""
+    return GatherClient(
+        api_key="test_api_key", coalescer=RequestCoalescer.disabled()
+    )
+
+
+class TestValidatorCache:
+    """Tests for the ValidatorCache."""
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = ValidatorCache(max_entries=2)
+        entry = ValidatorEntry.from_response(b"{}", {})
+        cache.put("a", entry)
+        cache.put("b", entry)
+        cache.get("a")
+        cache.put("c", entry)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is entry
+
+    def test_byte_limit(self):
+        """Test that entries are evicted to keep bodies under max_bytes."""
+        cache = ValidatorCache(max_bytes=10)
+        cache.put("a", ValidatorEntry.from_response(b"x" * 6, {}))
+        cache.put("b", ValidatorEntry.from_response(b"y" * 4, {}))
+        cache.put("a", ValidatorEntry.from_response(b"z" * 5, {}))
+        cache.put("big", ValidatorEntry.from_response(b"!" * 11, {}))
+
+        assert cache.get("big") is None
+        assert cache.get("b").body == b"yyyy"
+        assert cache.size == 9
+
+        cache.put("c", ValidatorEntry.from_response(b"c" * 3, {}))
+
+        assert cache.get("a") is None
+        assert cache.size == 7
+
+    def test_conditional_headers(self):
+        """Test that validators become conditional request headers."""
+        entry = ValidatorEntry.from_response(
+            b"{}", {"ETag": '"v1"', "Last-Modified": "yesterday"}
+        )
+        assert entry.conditional_headers() == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "yesterday",
+        }
+
+
+class TestConditionalMapData:
+    """Tests for conditional map data requests in GatherClient."""
+
+    @responses.activate
+    def test_304_returns_cached_map_data(self, client):
+        """Test that a 304 reuses the cached body."""
+        responses.add(
+            responses.GET, MAP_URL, json=MAP_BODY, headers={"ETag": '"v1"'}
+        )
+        responses.add(responses.GET, MAP_URL, status=304)
+
+        first = client.get_map_data("test-space", "test-map")
+        second = client.get_map_data("test-space", "test-map")
+
+        assert second == first
+        assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+        assert client.metrics.get("map_data_not_modified") == 1
+
+    @responses.activate
+    def test_if_changed_detects_identical_body(self, client):
+        """Test the content-hash fallback when no validators are sent."""
+        responses.add(responses.GET, MAP_URL, json=MAP_BODY)
+        responses.add(responses.GET, MAP_URL, json=MAP_BODY)
+
+        assert client.get_map_data_if_changed("test-space", "test-map")
+        assert client.get_map_data_if_changed("test-space", "test-map") is None
+        assert "If-None-Match" not in responses.calls[1].request.headers
+
+    @responses.activate
+    def test_update_map_invalidates_entry(self, client):
+        """Test that writing a map forgets its validators."""
+        responses.add(
+            responses.GET, MAP_URL, json=MAP_BODY, headers={"ETag": '"v1"'}
+        )
+        responses.add(responses.POST, MAP_URL, json=MAP_BODY)
+
+        client.get_map_data("test-space", "test-map")
+        client.update_map_background("test-space", "test-map", "bg.png")
+
+        assert len(client.validator_cache) == 0
@@ -0,0 +1,298 @@
+"""
+Unit tests for the map write buffer.
+
+Test Metadata:
+- Created: 2026-10-17
+- Last Updated: 2026-10-17
+- Status: Active
+- Owner: Development Team
+- Purpose: Validate coalescing, flush triggers and conflict detection
+- Lifecycle:
+  - Created: To ensure batch map edits become one write per map
+  - Active: Currently used to validate MapWriteBuffer
+  - Obsolescence Conditions:
+    1. When Gather offers transactional map edits
+- Last Validated: 2026-10-17
+"""
+
+import json
+import threading
+import time
+
+import pytest
+import responses
+
+from gather_manager.api.client import GatherClient
+from gather_manager.api.disk_cache import DiskCache
+from gather_manager.api.map_diff import WRITE_FIELDS, WRITE_NONE
+from gather_manager.api.write_buffer import (
+    CONFLICT_OVERWRITE,
+    CONFLICT_REBASE,
+    MapWriteBuffer,
+)
+from gather_manager.utils.exceptions import MapConflictError, MapFlushError
+
+MAP_URL = "https://api.gather.town/api/v2/spaces/test-space/maps/test-map"
+OTHER_URL = "https://api.gather.town/api/v2/spaces/test-space/maps/other-map"
+MAP_BODY = {
+    "id": "test-map",
+    "background": "old.png",
+    "objects": [
+        {"id": "a", "type": "image", "x": 0, "y": 0},
+        {"id": "b", "type": "image", "x": 1, "y": 1},
+    ],
+}
+
+
+@pytest.fixture
+def client():
+    """Fixture to provide a GatherClient instance."""
+    return GatherClient(api_key="test_api_key")
+
+
+def posted_content(call_index=-1):
+    """Get the content of a recorded map write."""
+    posts = [c for c in responses.calls if c.request.method == "POST"]
+    return json.loads(posts[call_index].request.body)["content"]
+
+
+class TestMapWriteBuffer:
+    """Tests for the MapWriteBuffer."""
+
+    @responses.activate
+    def test_mutations_coalesce_into_one_write(self, client):
+        """Test that several edits to one map are sent in one POST."""
+        responses.add(responses.GET, MAP_URL, json=MAP_BODY)
+        responses.add(responses.POST, MAP_URL, json={"id": "test-map"})
+
+        with MapWriteBuffer(client) as buffer:
+            buffer.update_map_background("test-space", "test-map", "new.png")
+            buffer.upsert_object(
+                "test-space",
+                "test-map",
+                {"id": "a", "type": "image", "x": 5, "y": 0},
+            )
+            buffer.remove_object("test-space", "test-map", "b")
+            buffer.upsert_object(
+                "test-space",
+                "test-map",
+                {"id": "c", "type": "image", "x": 2, "y": 2},
+            )
+            assert buffer.pending() == {("test-space", "test-map"): 4}
+
+        content = posted_content()
+        assert content["background"] == "new.png"
+        assert [obj["id"] for obj in content["objects"]] == ["a", "c"]
+        assert content["objects"][0]["x"] == 5
+        assert (
+            len([c for c in responses.calls if c.request.method == "POST"])
+            == 1
+        )
+
+    @responses.activate
+    def test_field_only_and_noop_writes(self, client):
+        """Test that unchanged maps are not written."""
+        responses.add(responses.GET, MAP_URL, json=MAP_BODY)
+        responses.add(responses.POST, MAP_URL, json={"id": "test-map"})
+        buffer = MapWriteBuffer(client)
+
+        buffer.update_map_background("test-space", "test-map", "old.png")
+        noop = buffer.flush()[("test-space", "test-map")]
+        buffer.update_map_background("test-space", "test-map", "new.png")
+        write = buffer.flush()[("test-space", "test-map")]
+
+        assert noop.mode == WRITE_NONE
+        assert write.mode == WRITE_FIELDS
+        assert posted_content() == {"background": "new.png"}
+
+    @responses.activate
+    def test_flushes_on_size_and_time(self, client, clock):
+        """Test that limits trigger a flush when a mutation is queued."""
+        responses.add(responses.GET, MAP_URL, json=MAP_BODY)
+        responses.add(responses.POST, MAP_URL, json={"id": "test-map"})
+        buffer = MapWriteBuffer(
+            client, max_mutations=2, max_delay=10, clock=clock
+        )
+
+        buffer.update_map_background("test-space", "test-map", "1.png")
+        buffer.update_map_background("test-space", "test-map", "2.png")
+        assert buffer.pending() == {}
+
+        buffer.update_map_background("test-space", "test-map", "3.png")
+        clock.now = 11
+        assert list(buffer.flush_due()) == [("test-space", "test-map")]
+
+    @responses.activate
+    def test_background_flush_of_idle_buffer(self, client, clock):
+        """Test that the flush thread writes maps past max_delay."""
+        responses.add(responses.GET, MAP_URL, json=MAP_BODY)
+        responses.add(responses.POST, MAP_URL, json={"id": "test-map"})
+        buffer = MapWriteBuffer(
+            client, max_delay=10, clock=clock, flush_interval=0.01
+        )
+
+        buffer.update_map_background("test-space", "test-map", "new.png")
+        time.sleep(0.05)
+        assert buffer.pending() == {("test-space", "test-map"): 1}
+
+        clock.now = 11
+        deadline = time.monotonic() + 5
+        while buffer.pending() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        buffer.close()
+
+        assert buffer.pending() == {}
+        assert posted_content() == {"background": "new.png"}
+
+    def test_flush_interval_requires_max_delay(self, client):
+        """Test that a flush thread without a time limit is rejected."""
+        with pytest.raises(ValueError, match="max_delay"):
+            MapWriteBuffer(client, max_delay=None, flush_interval=1)
+
+    @responses.activate
+    def test_conflict_raises_and_keeps_edits(self, client):
+        """Test that a concurrent change is detected before writing."""
+        changed = {**MAP_BODY, "background": "someone-else.png"}
+        responses.add(responses.GET, MAP_URL, json=MAP_BODY)
+        responses.add(responses.GET, MAP_URL, json=changed)
+        buffer = MapWriteBuffer(client)
+
+        buffer.remove_object("test-space", "test-map", "b")
+        with pytest.raises(MapFlushError) as excinfo:
+            buffer.flush()
+
+        error = excinfo.value.errors[("test-space", "test-map")]
+        assert isinstance(error, MapConflictError)
+        assert buffer.pending() == {("test-space", "test-map"): 1}
+        assert all(c.request.method == "GET" for c in responses.calls)
+
+    @responses.activate
+    def test_flush_tries_every_map(self, client):
+        """Test that one failing map does not stop the others."""
+        changed = {**MAP_BODY, "background": "someone-else.png"}
+        responses.add(responses.GET, MAP_URL, json=MAP_BODY)
+        responses.add(responses.GET, OTHER_URL, json=MAP_BODY)
+        responses.add(responses.GET, MAP_URL, json=changed)
+        responses.add(responses.POST, OTHER_URL, json={"id": "other-map"})
+        buffer = MapWriteBuffer(client)
+
+        buffer.remove_object("test-space", "test-map", "b")
+        buffer.remove_object("test-space", "other-map", "b")
+        with pytest.raises(MapFlushError) as excinfo:
+            buffer.flush()
+
+        assert list(excinfo.value.errors) == [("test-space", "test-map")]
+        assert list(excinfo.value.results) == [("test-space", "other-map")]
+        assert buffer.pending() == {("test-space", "test-map"): 1}
+
+    @responses.activate
+    def test_queue_during_write(self, client):
+        """Test that edits can be queued while a map is being written."""
+        buffer = MapWriteBuffer(client)
+
+        def write(request):
+            # Queue from another thread, which must not wait for the write
+            queued = threading.Thread(
+                target=buffer.update_map_background,
+                args=("test-space", "test-map", "newer.png"),
+            )
+            queued.start()
+            queued.join(timeout=5)
+            assert not queued.is_alive()
+            return 200, {}, json.dumps({"id": "test-map"})
+
+        responses.add(responses.GET, MAP_URL, json=MAP_BODY)
+        responses.add_callback(responses.POST, MAP_URL, callback=write)
+        buffer.update_map_background("test-space", "test-map", "new.png")
+        buffer.flush()
+
+        assert posted_content() == {"background": "new.png"}
+        assert buffer.pending() == {("test-space", "test-map"): 1}
+
+    @responses.activate
+    def test_conflict_resolved_by_rebase(self, client):
+        """Test that rebased edits are written on top of the other change."""
+        changed = {**MAP_BODY, "background": "someone-else.png"}
+        responses.add(responses.GET, MAP_URL, json=MAP_BODY)
+        responses.add(responses.GET, MAP_URL, json=changed)
+        responses.add(responses.POST, MAP_URL, json={"id": "test-map"})
+        buffer = MapWriteBuffer(client)
+
+        buffer.remove_object("test-space", "test-map", "b")
+        with pytest.raises(MapFlushError):
+            buffer.flush()
+        buffer.rebase("test-space", "test-map")
+        buffer.flush()
+
+        content = posted_content()
+        assert "background" not in content
+        assert [obj["id"] for obj in content["objects"]] == ["a"]
+        assert buffer.pending() == {}
+
+    @responses.activate
+    def test_discard(self, client):
+        """Test that discarded edits are dropped without a write."""
+        responses.add(responses.GET, MAP_URL, json=MAP_BODY)
+        buffer = MapWriteBuffer(client)
+
+        buffer.remove_object("test-space", "test-map", "b")
+        buffer.remove_object("test-space", "test-map", "a")
+
+        assert buffer.discard("other-space") == {}
+        assert buffer.discard() == {("test-space", "test-map"): 2}
+        assert buffer.flush() == {}
+        assert all(c.request.method == "GET" for c in responses.calls)
+
+    @responses.activate
+    def test_conflict_detected_with_disk_cache(self, tmp_path):
+        """Test that the revalidation read is not served from disk."""
+        client = GatherClient(
+            api_key="test_api_key", disk_cache=DiskCache(tmp_path)
+        )
+        changed = {**MAP_BODY, "background": "someone-else.png"}
+        responses.add(responses.GET, MAP_URL, json=MAP_BODY)
+        responses.add(responses.GET, MAP_URL, json=changed)
+        buffer = MapWriteBuffer(client)
+
+        buffer.remove_object("test-space", "test-map", "b")
+        with pytest.raises(MapFlushError):
+            buffer.flush()
+
+        assert len(responses.calls) == 2
+
+    @pytest.mark.parametrize(
+        "policy,background",
+        [
+            (CONFLICT_REBASE, None),
+            (CONFLICT_OVERWRITE, "old.png"),
+        ],
+    )
+    @responses.activate
+    def test_conflict_policies(self, client, policy, background):
+        """Test that rebase keeps others' edits and overwrite reverts them."""
+        changed = {**MAP_BODY, "background": "someone-else.png"}
+        responses.add(responses.GET, MAP_URL, json=MAP_BODY)
+        responses.add(responses.GET, MAP_URL, json=changed)
+        responses.add(responses.POST, MAP_URL, json={"id": "test-map"})
+        buffer = MapWriteBuffer(client, on_conflict=policy)
+
+        buffer.remove_object("test-space", "test-map", "b")
+        buffer.flush()
+
+        content = posted_content()
+        assert content.get("background") == background
+        assert [obj["id"] for obj in content["objects"]] == ["a"]
+
+    @responses.activate
+    def test_error_in_block_discards_edits(self, client):
+        """Test that edits are dropped when the with block raises."""
+        responses.add(responses.GET, MAP_URL, json=MAP_BODY)
+        buffer = MapWriteBuffer(client)
+
+        with pytest.raises(RuntimeError):
+            with buffer:
+                buffer.remove_object("test-space", "test-map", "b")
+                raise RuntimeError("boom")
+
+        assert buffer.pending() == {}
+        assert all(c.request.method == "GET" for c in responses.calls)
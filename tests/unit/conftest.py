@@ -0,0 +1,29 @@
+"""Shared fixtures for the unit tests."""
+
+import pytest
+
+
+class FakeClock:
+    """Manually advanced clock whose sleep advances time.
+
+    Pass ``tick`` to also advance it by that many seconds on every reading.
+    """
+
+    def __init__(self, now=0.0, tick=0.0):
+        self.now = now
+        self.tick = tick
+        self.slept = []
+
+    def __call__(self):
+        self.now += self.tick
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    """Fixture to provide a fake clock starting at zero."""
+    return FakeClock()
@@ -0,0 +1,160 @@
+"""
+Unit tests for MapData validation modes.
+
+Test Metadata:
+- Created: 2026-10-17
+- Last Updated: 2026-10-17
+- Status: Active
+- Owner: Development Team
+- Purpose: Validate lazy, full and strict parsing of map data
+- Lifecycle:
+  - Created: To skip validating objects that read-only analyses never use
+  - Active: Currently used to validate MapData.from_api and LazyObjectList
+  - Obsolescence Conditions:
+    1. When map objects are no longer parsed into pydantic models
+- Last Validated: 2026-10-17
+"""
+
+import copy
+
+import pytest
+from pydantic import ValidationError
+
+from gather_manager.api.client import GatherClient
+from gather_manager.api.coalesce import RequestCoalescer
+from gather_manager.api.fake_server import FakeGatherData, FakeGatherServer
+from gather_manager.api.rate_limit import RateLimiter
+from gather_manager.api.retry import RetryPolicy
+from gather_manager.models.space import LazyObjectList, MapData, Object
+from gather_manager.utils.exceptions import (
+    ValidationError as GatherValidationError,
+)
+
+RAW_MAP = {
+    "id": "m1",
+    "name": "Lobby",
+    "objects": {
+        "a": {"type": "chair", "x": 1, "y": 2},
+        "b": {"type": 4, "x": "3", "y": 4, "targetMap": "m2"},
+    },
+    "collisions": "0000",
+}
+
+
+def parse(validate):
+    """Parse a fresh copy of the raw map."""
+    return MapData.from_api(copy.deepcopy(RAW_MAP), validate=validate)
+
+
+class TestMapDataFromApi:
+    """Tests for the validation modes of MapData.from_api."""
+
+    def test_lazy_validates_on_access(self):
+        """Test that objects are validated only when first read."""
+        map_data = parse("lazy")
+
+        assert isinstance(map_data.objects, LazyObjectList)
+        assert map_data.objects.pending == 2
+        assert map_data.objects[1].x == 3
+        assert map_data.objects.pending == 1
+        assert map_data.objects[1] is map_data.objects[1]
+
+    def test_lazy_matches_full(self):
+        """Test that a lazy map compares and serializes like a full one."""
+        full = parse("full")
+
+        assert parse("lazy") == full
+        assert parse("lazy").model_dump() == full.model_dump()
+        assert parse("lazy").model_dump_json() == full.model_dump_json()
+        assert list(parse("lazy").objects) == full.objects
+        assert parse("lazy").objects[::-1] == full.objects[::-1]
+        assert full.objects[0] in parse("lazy").objects
+
+    def test_lazy_copy_and_mutation(self):
+        """Test that copies and list edits see validated objects."""
+        map_data = parse("lazy")
+
+        copied = map_data.model_copy(deep=True)
+        map_data.objects.append(Object(type="desk", x=0, y=0))
+        removed = map_data.objects.pop(0)
+
+        assert copied.objects.pending == 0
+        assert removed.id == "a"
+        assert [obj.type for obj in map_data.objects] == [4, "desk"]
+
+    def test_lazy_error_surfaces_on_access(self):
+        """Test that a malformed object raises when it is read."""
+        map_data = MapData.from_api(
+            {"id": "m", "objects": [{"type": 1, "x": "left", "y": 0}]},
+            validate="lazy",
+        )
+
+        with pytest.raises(ValidationError):
+            map_data.objects[0]
+
+    def test_strict_rejects_coercion(self):
+        """Test that strict mode refuses values full mode would coerce."""
+        assert parse("full").objects[1].x == 3
+
+        with pytest.raises(ValidationError, match="valid integer"):
+            parse("strict")
+
+    def test_unknown_mode(self):
+        """Test that an unknown mode is rejected."""
+        with pytest.raises(ValueError, match="Unknown validation mode"):
+            parse("eager")
+
+
+class TestClientMapValidation:
+    """Tests for map validation in GatherClient."""
+
+    @pytest.fixture
+    def data(self):
+        """Fixture to provide a small synthetic space."""
+        return FakeGatherData.generate(maps_per_space=1, objects_per_map=10)
+
+    def make_client(self, server, **kwargs):
+        """Create a client that sends every request to the fake server."""
+        return GatherClient(
+            api_key="test_api_key",
+            transport=server,
+            rate_limiter=RateLimiter.unlimited(),
+            retry_policy=RetryPolicy.disabled(),
+            coalescer=RequestCoalescer.disabled(),
+            **kwargs,
+        )
+
+    def test_lazy_client(self, data):
+        """Test that the client can parse map data lazily."""
+        space_id = next(iter(data.spaces))
+        server = FakeGatherServer(data)
+
+        lazy = self.make_client(server, map_validation="lazy")
+        full = self.make_client(server)
+
+        objects = lazy.get_map_objects(space_id, "map-0")
+        assert isinstance(objects, LazyObjectList)
+        assert objects == full.get_map_objects(space_id, "map-0")
+
+    def test_update_map_validates_strictly(self, data):
+        """Test that content failing strict validation is not sent."""
+        space_id = next(iter(data.spaces))
+        server = FakeGatherServer(data)
+        client = self.make_client(server)
+        content = {"objects": [{"type": 1, "x": "5", "y": 0}]}
+
+        with pytest.raises(GatherValidationError, match="map-0"):
+            client.update_map(space_id, "map-0", content, validate=True)
+
+        assert server.requests == []
+
+    def test_update_map_sends_unvalidated_content(self, data):
+        """Test that content is sent as given unless validation is asked."""
+        space_id = next(iter(data.spaces))
+        server = FakeGatherServer(data)
+        client = self.make_client(server)
+        content = {"objects": [{"type": "image", "x": 3.0, "y": "4"}]}
+
+        client.update_map(space_id, "map-0", content)
+
+        assert [method for method, _, _ in server.requests] == ["POST"]
@@ -0,0 +1,168 @@
+"""
+Unit tests for the columnar map object table.
+
+Test Metadata:
+- Created: 2026-10-17
+- Last Updated: 2026-10-17
+- Status: Active
+- Owner: Development Team
+- Purpose: Validate MapObjectTable and the analyses that run on it
+- Lifecycle:
+  - Created: To keep large maps out of per-object pydantic models
+  - Active: Currently used to validate MapObjectTable round trips
+  - Obsolescence Conditions:
+    1. When map objects are no longer analyzed in bulk
+- Last Validated: 2026-10-17
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from gather_manager.api.client import GatherClient
+from gather_manager.api.coalesce import RequestCoalescer
+from gather_manager.api.fake_server import FakeGatherData, FakeGatherServer
+from gather_manager.api.rate_limit import RateLimiter
+from gather_manager.models.object_table import NULL, MapObjectTable
+from gather_manager.models.space import Object
+from gather_manager.services.portal_service import PortalService
+
+RAW_OBJECTS = [
+    {"id": "a", "type": "chair", "x": 1, "y": 2},
+    {
+        "id": "b",
+        "type": "portal",
+        "x": 3,
+        "y": 4,
+        "width": 2,
+        "targetMap": "m2",
+        "targetX": 5,
+        "targetY": 6,
+        "orientation": 1,
+    },
+    {
+        "id": "c",
+        "type": 4,
+        "x": 7,
+        "y": 8,
+        "height": None,
+        "properties": {"targetMap": "m2", "targetX": 1, "targetY": 1},
+        "color": "red",
+    },
+    {"id": "d", "type": "chair", "x": 9, "y": 10, "targetMap": "m2"},
+]
+
+
+@pytest.fixture
+def data():
+    """Fixture to provide a space whose maps link to each other."""
+    return FakeGatherData.generate(
+        maps_per_space=4, objects_per_map=200, portal_ratio=0.2
+    )
+
+
+class TestMapObjectTable:
+    """Tests for building and reading the table."""
+
+    def test_columns(self):
+        """Test that values are split into typed and interned columns."""
+        table = MapObjectTable.from_raw(RAW_OBJECTS)
+
+        assert len(table) == 4
+        assert list(table.x) == [1, 3, 7, 9]
+        assert list(table.width) == [1, 2, 1, 1]
+        assert table.height[2] == NULL
+        assert table.types == ["chair", "portal", 4]
+        assert list(table.type_codes) == [0, 1, 2, 0]
+        assert table.target_maps == ["m2"]
+        assert list(table.target_map_codes) == [-1, 0, -1, 0]
+        assert list(table.property_codes) == [-1, -1, 0, -1]
+        assert table.extras == {1: {"orientation": 1}, 2: {"color": "red"}}
+
+    def test_round_trip_to_objects(self):
+        """Test that rows convert back to the objects the API describes."""
+        table = MapObjectTable.from_raw(RAW_OBJECTS)
+
+        assert table.to_objects() == [
+            Object.model_validate(obj) for obj in RAW_OBJECTS
+        ]
+        assert table.to_object(2).color == "red"
+
+    def test_from_keyed_objects(self):
+        """Test that objects keyed by ID get the key as their ID."""
+        table = MapObjectTable.from_raw({"k1": {"type": 1, "x": 0, "y": 0}})
+
+        assert table.id_of(0) == "k1"
+
+    def test_shares_repeated_values(self):
+        """Test that equal property dictionaries are stored once."""
+        table = MapObjectTable.from_raw(
+            [
+                {"id": str(i), "type": 1, "x": i, "y": 0, "properties": p}
+                for i, p in enumerate([{"z": 1}, {"z": 2}, {"z": 1}, None])
+            ]
+        )
+
+        assert table.property_values == [{"z": 1}, {"z": 2}]
+        assert list(table.property_codes) == [0, 1, 0, -1]
+        assert list(table.ids) == ["0", "1", "2", "3"]
+
+    def test_rejects_invalid_objects(self):
+        """Test that missing coordinates and non-integers are rejected."""
+        with pytest.raises(ValueError, match="missing x"):
+            MapObjectTable.from_raw([{"type": 1, "y": 0}])
+        with pytest.raises(ValueError, match="integer"):
+            MapObjectTable.from_raw([{"type": 1, "x": 1.5, "y": 0}])
+        with pytest.raises(ValueError, match="range"):
+            MapObjectTable.from_raw([{"type": 1, "x": 2**31, "y": 0}])
+        with pytest.raises(ValueError, match="string"):
+            MapObjectTable.from_raw([{"id": 5, "type": 1, "x": 0, "y": 0}])
+
+    def test_portal_rows_match_client_detection(self, data):
+        """Test that portal detection agrees with GatherClient."""
+        space = next(iter(data.spaces.values()))
+        raw = next(iter(space.maps.values()))["objects"]
+        table = MapObjectTable.from_raw(raw)
+
+        expected = [
+            row
+            for row, obj in enumerate(table.to_objects())
+            if GatherClient.is_portal_object(obj)
+        ]
+
+        assert expected
+        assert table.portal_rows() == expected
+        assert table.rows_of_type("missing") == []
+
+
+class TestTableAnalytics:
+    """Tests for the analyses that accept tables."""
+
+    def test_portal_service_accepts_tables(self):
+        """Test that portal validation gives the same result on tables."""
+        payload = {"objects": RAW_OBJECTS}
+        service = PortalService(api_client=MagicMock())
+
+        from_dicts = service._validate_map_objects(
+            [("m1", {"objects": [dict(obj) for obj in RAW_OBJECTS]})]
+        )
+        from_table = service._validate_map_objects(
+            [("m1", MapObjectTable.from_map_payload(payload))]
+        )
+
+        assert from_table == from_dicts
+        assert [p["id"] for p in from_table["valid_portals"]] == ["c"]
+
+    def test_client_get_map_table(self, data):
+        """Test that the client builds tables from the map response."""
+        space_id = next(iter(data.spaces))
+        client = GatherClient(
+            api_key="test_api_key",
+            transport=FakeGatherServer(data),
+            rate_limiter=RateLimiter.unlimited(),
+            coalescer=RequestCoalescer.disabled(),
+        )
+
+        table = client.get_map_table(space_id, "map-0")
+
+        assert table.to_objects() == client.get_map_objects(space_id, "map-0")
@@ -0,0 +1,169 @@
+"""
+Unit tests for PortalRecord and the portal model adapters.
+
+Test Metadata:
+- Created: 2026-10-17
+- Last Updated: 2026-10-17
+- Status: Active
+- Owner: Development Team
+- Purpose: Validate conversions between the two portal models via records
+- Lifecycle:
+  - Created: To convert portals between models without revalidating each
+  - Active: Currently used to validate PortalRecord, to_records, to_portals
+    and to_space_portals
+  - Obsolescence Conditions:
+    1. When the two Portal models are merged into one
+- Last Validated: 2026-10-17
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from gather_manager.models.portal import (
+    Portal,
+    PortalRecord,
+    to_portals,
+    to_records,
+    to_space_portals,
+)
+from gather_manager.models.space import Object, PortalView
+from gather_manager.models.space import Portal as SpacePortal
+
+
+@pytest.fixture
+def service_portal():
+    """Fixture to provide a portal with nested properties."""
+    return Portal.model_validate(
+        {
+            "id": "p1",
+            "type": 4,
+            "x": 3,
+            "y": 5,
+            "properties": {"targetMap": "m2", "targetX": 7, "targetY": 9},
+        }
+    )
+
+
+class TestPortalRecord:
+    """Tests for the PortalRecord class."""
+
+    def test_from_both_models(self, service_portal):
+        """Test that both models give the same record."""
+        space_portal = SpacePortal(
+            id="p1", type=4, x=3, y=5, targetMap="m2", targetX=7, targetY=9
+        )
+
+        record = PortalRecord.from_portal(service_portal, "m1")
+
+        assert record == PortalRecord("p1", 4, 3, 5, "m2", 7, 9, "m1")
+        assert PortalRecord.from_object(space_portal, "m1") == record
+
+    def test_from_raw_matches_portal(self, service_portal):
+        """Test that a raw object gives the record of its Portal model."""
+        raw = service_portal.model_dump(by_alias=True)
+        raw["x"] = "3"
+        raw["properties"] = {"target_map": "m2", "targetX": 7.0}
+
+        record = PortalRecord.from_raw(raw, "m1")
+
+        assert record == PortalRecord("p1", 4, 3, 5, "m2", 7, None, "m1")
+        assert to_records([raw], "m1") == [record]
+
+    @pytest.mark.parametrize(
+        "raw,field",
+        [
+            ({"id": "p", "type": 4, "x": 0, "y": 0}, "properties"),
+            ({"type": 4, "x": 0, "y": 0, "properties": {}}, "id"),
+            ({"id": "p", "x": 0, "y": 0, "properties": {}}, "type"),
+            (
+                {"id": "p", "type": 4, "x": 0.5, "y": 0, "properties": {}},
+                "x",
+            ),
+            (
+                {
+                    "id": "p",
+                    "type": 4,
+                    "x": 0,
+                    "y": 0,
+                    "properties": {"targetMap": 5},
+                },
+                "targetMap",
+            ),
+            (
+                {
+                    "id": "p",
+                    "type": 4,
+                    "x": 0,
+                    "y": 0,
+                    "properties": {"normal": "sideways"},
+                },
+                "normal",
+            ),
+        ],
+    )
+    def test_from_raw_rejects_malformed(self, raw, field):
+        """Test that missing or mistyped fields raise ValueError."""
+        with pytest.raises(ValueError, match=field):
+            PortalRecord.from_raw(raw)
+
+    @pytest.mark.parametrize("normal", [True, "false", 1, None])
+    def test_from_raw_accepts_what_portal_accepts(self, normal):
+        """Test that values Portal coerces are accepted by from_raw too."""
+        raw = {
+            "id": "p",
+            "type": 4,
+            "x": 0,
+            "y": 0,
+            "properties": {"normal": normal},
+        }
+
+        Portal.model_validate(raw)
+        assert PortalRecord.from_raw(raw) == PortalRecord("p", 4, 0, 0)
+
+    def test_to_dict_matches_portal(self, service_portal):
+        """Test that the details match those built from the Portal."""
+        details = PortalRecord.from_portal(service_portal, "m1").to_dict()
+
+        expected = service_portal.to_dict()
+        del expected["type"]
+        assert details == {**expected, "map_id": "m1"}
+
+    def test_validity(self):
+        """Test that validity requires the target map and coordinates."""
+        obj = Object(id="p1", type=4, x=0, y=0, targetMap="m2", targetX=1)
+
+        assert not PortalRecord.from_object(obj).is_valid()
+        assert PortalRecord.from_object(PortalView(obj)).is_valid()
+
+
+class TestAdapters:
+    """Tests for converting lists of portals."""
+
+    def test_round_trip(self, service_portal):
+        """Test converting to the other model and back."""
+        space_portals = to_space_portals(to_records([service_portal]))
+
+        assert space_portals == [
+            SpacePortal(
+                id="p1", type=4, x=3, y=5, targetMap="m2", targetX=7, targetY=9
+            )
+        ]
+        assert to_portals(to_records(space_portals)) == [service_portal]
+
+    def test_space_portal_defaults(self):
+        """Test that missing target coordinates become 0."""
+        obj = Object(id="p1", type="portal", x=0, y=0, targetMap="m2")
+
+        (portal,) = to_space_portals(to_records([obj]))
+
+        assert (portal.targetX, portal.targetY) == (0, 0)
+
+    def test_invalid_records(self):
+        """Test that records the models reject raise validation errors."""
+        no_target = PortalRecord("p1", 4, 0, 0)
+        string_type = PortalRecord("p1", "portal", 0, 0, "m2", 0, 0)
+
+        with pytest.raises(ValidationError, match="targetMap"):
+            to_space_portals([no_target])
+        with pytest.raises(ValidationError):
+            to_portals([string_type])
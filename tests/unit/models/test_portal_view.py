@@ -0,0 +1,107 @@
+"""
+Unit tests for the read-only PortalView.
+
+Test Metadata:
+- Created: 2026-10-17
+- Last Updated: 2026-10-17
+- Status: Active
+- Owner: Development Team
+- Purpose: Validate that portal views read like Portal models without copies
+- Lifecycle:
+  - Created: To stop dumping and revalidating every portal object
+  - Active: Currently used to validate PortalView and get_portal_views
+  - Obsolescence Conditions:
+    1. When Portal models are no longer built from Object models
+- Last Validated: 2026-10-17
+"""
+
+import pytest
+
+from gather_manager.api.client import GatherClient
+from gather_manager.api.coalesce import RequestCoalescer
+from gather_manager.api.fake_server import FakeGatherData, FakeGatherServer
+from gather_manager.api.rate_limit import RateLimiter
+from gather_manager.api.retry import RetryPolicy
+from gather_manager.models.space import Object, Portal, PortalView
+
+
+class TestPortalView:
+    """Tests for the PortalView class."""
+
+    def test_matches_portal(self):
+        """Test that a view reads the same values as the Portal model."""
+        obj = Object(
+            id="p1",
+            type=4,
+            x=3,
+            y=5,
+            targetMap="m2",
+            targetY=7,
+            properties={"zIndex": 1},
+        )
+        view = PortalView(obj)
+        portal = Portal.from_object(obj)
+
+        assert view.object is obj
+        assert view.is_valid
+        for name in ("id", "type", "x", "y", "targetMap", "targetX"):
+            assert getattr(view, name) == getattr(portal, name)
+        assert (view.targetX, view.targetY) == (0, 7)
+        assert view.properties is obj.properties
+        assert obj.targetX is None
+
+    def test_validity(self):
+        """Test that validity follows Portal validation."""
+        for target_map in (None, ""):
+            view = PortalView(
+                Object(type="portal", x=0, y=0, targetMap=target_map)
+            )
+
+            assert not view.is_valid
+            with pytest.raises(ValueError):
+                view.to_portal()
+
+    def test_read_only(self):
+        """Test that a view cannot be changed."""
+        obj = Object(type=4, x=0, y=0, targetMap="m2")
+        view = PortalView(obj)
+
+        with pytest.raises(AttributeError, match="read-only"):
+            view.targetX = 5
+        with pytest.raises(AttributeError, match="read-only"):
+            view.x = 5
+        assert obj.x == 0
+
+    def test_to_portal_is_independent(self):
+        """Test that a materialized portal can be changed on its own."""
+        obj = Object(type=4, x=0, y=0, targetMap="m2", properties={"a": 1})
+        portal = PortalView(obj).to_portal()
+
+        portal.x = 9
+        portal.properties["a"] = 2
+
+        assert isinstance(portal, Portal)
+        assert (obj.x, obj.properties) == (0, {"a": 1})
+        assert portal.model_dump()["targetX"] == 0
+
+
+class TestClientPortalViews:
+    """Tests for GatherClient.get_portal_views."""
+
+    def test_get_portal_views(self):
+        """Test that views wrap the detected portal objects."""
+        data = FakeGatherData.generate(maps_per_space=2, objects_per_map=50)
+        space_id = next(iter(data.spaces))
+        client = GatherClient(
+            api_key="test_api_key",
+            transport=FakeGatherServer(data),
+            rate_limiter=RateLimiter.unlimited(),
+            retry_policy=RetryPolicy.disabled(),
+            coalescer=RequestCoalescer.disabled(),
+        )
+
+        views = client.get_portal_views(space_id, "map-0")
+        portals = client.get_portal_objects(space_id, "map-0")
+
+        assert views
+        assert [view.to_portal() for view in views] == portals
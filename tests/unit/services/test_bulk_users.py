@@ -0,0 +1,241 @@
+"""
+Unit tests for bulk user management.
+
+Test Metadata:
+- Created: 2026-10-17
+- Last Updated: 2026-10-17
+- Status: Active
+- Owner: Development Team
+- Purpose: Validate bulk input parsing, scheduling, journaling and reports
+- Lifecycle:
+  - Created: To ensure large onboarding runs are concurrent and resumable
+  - Active: Currently used to validate BulkUserService
+  - Obsolescence Conditions:
+    1. When Gather offers a native bulk membership endpoint
+- Last Validated: 2026-10-17
+"""
+
+import csv
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from gather_manager.models.user import (
+    BulkUserReport,
+    OperationStatus,
+    UserAction,
+    UserOperation,
+)
+from gather_manager.services.bulk_users import (
+    BulkUserService,
+    OperationJournal,
+    load_user_operations,
+)
+from gather_manager.utils.exceptions import GatherApiError
+
+
+@pytest.fixture
+def mock_client():
+    """Fixture to provide a mock GatherClient that records calls."""
+    client = MagicMock()
+    client.user_id_cache = None
+    client.calls = []
+    lock = threading.Lock()
+
+    def add(space_id, email, role="MEMBER"):
+        if email.startswith("bad"):
+            raise GatherApiError("User ID not found", status_code=404)
+        with lock:
+            client.calls.append(("add", email, role))
+        return {}
+
+    def remove(space_id, email):
+        with lock:
+            client.calls.append(("remove", email, None))
+        return {}
+
+    client.add_user_to_space.side_effect = add
+    client.remove_user_from_space.side_effect = remove
+    return client
+
+
+def make_operations(*rows):
+    """Build operations from (email, action) pairs numbered from 2."""
+    return [
+        UserOperation(row=i, email=email, action=action)
+        for i, (email, action) in enumerate(rows, 2)
+    ]
+
+
+class TestLoadUserOperations:
+    """Tests for reading bulk input files."""
+
+    def test_csv(self, tmp_path):
+        """Test CSV rows with defaults, normalization and invalid rows."""
+        path = tmp_path / "users.csv"
+        path.write_text(
+            "Email,Role,Action\n"
+            "a@example.com,builder,add\n"
+            "b@example.com,,REMOVE\n"
+            "not-an-email,,add\n"
+            "c@example.com,,delete\n"
+        )
+
+        operations, invalid = load_user_operations(path)
+
+        assert [
+            (op.row, op.email, op.role, op.action) for op in operations
+        ] == [
+            (2, "a@example.com", "BUILDER", UserAction.ADD),
+            (3, "b@example.com", "MEMBER", UserAction.REMOVE),
+        ]
+        assert [result.row for result in invalid] == [4, 5]
+        assert all(r.status == OperationStatus.INVALID for r in invalid)
+
+    def test_ndjson(self, tmp_path):
+        """Test NDJSON lines, skipping blanks and reporting bad JSON."""
+        path = tmp_path / "users.ndjson"
+        path.write_text(
+            '{"email": "a@example.com", "action": "remove"}\n'
+            "\n"
+            "{not json\n"
+        )
+
+        operations, invalid = load_user_operations(path)
+
+        assert operations[0].action == UserAction.REMOVE
+        assert [result.row for result in invalid] == [3]
+
+
+class TestOperationJournal:
+    """Tests for the write-ahead journal."""
+
+    def test_only_succeeded_operations_are_completed(self, tmp_path):
+        """Test that started and failed operations are run again."""
+        ok, started, failed = make_operations(
+            ("a@example.com", "add"),
+            ("b@example.com", "add"),
+            ("c@example.com", "add"),
+        )
+        path = tmp_path / "run.journal"
+        with OperationJournal(path) as journal:
+            for operation in (ok, started, failed):
+                journal.record_started(operation)
+            journal.record_finished(
+                ok, MagicMock(status=OperationStatus.SUCCEEDED, error=None)
+            )
+            journal.record_finished(
+                failed, MagicMock(status=OperationStatus.FAILED, error="x")
+            )
+        with open(path, "a") as f:
+            f.write('{"key": "torn')  # Crash in the middle of a write
+
+        with OperationJournal(path) as journal:
+            assert journal.is_completed(ok)
+            assert not journal.is_completed(started)
+            assert not journal.is_completed(failed)
+
+
+class TestBulkUserService:
+    """Tests for the BulkUserService."""
+
+    def test_applies_all_operations(self, mock_client):
+        """Test that every row gets a result, in row order."""
+        operations = make_operations(
+            ("a@example.com", "add"),
+            ("bad@example.com", "add"),
+            ("b@example.com", "remove"),
+        )
+
+        report = BulkUserService(mock_client).apply("space", operations)
+
+        assert [r.status for r in report.results] == [
+            OperationStatus.SUCCEEDED,
+            OperationStatus.FAILED,
+            OperationStatus.SUCCEEDED,
+        ]
+        assert "User ID not found" in report.results[1].error
+        assert report.counts()["succeeded"] == 2
+
+    def test_same_email_runs_in_file_order(self, mock_client):
+        """Test that an add then remove of one user is not reordered."""
+        operations = make_operations(
+            ("a@example.com", "add"),
+            ("A@example.com", "remove"),
+            ("a@example.com", "add"),
+        )
+
+        BulkUserService(mock_client, max_concurrency=8).apply(
+            "space", operations
+        )
+
+        assert [call[0] for call in mock_client.calls] == [
+            "add",
+            "remove",
+            "add",
+        ]
+
+    def test_cached_user_ids_are_scheduled_first(self, mock_client):
+        """Test that rows needing no user-id lookup go first."""
+        mock_client.user_id_cache = MagicMock()
+        mock_client.user_id_cache.get.side_effect = lambda email, **_: (
+            MagicMock(found=True) if email.startswith("cached") else None
+        )
+        operations = make_operations(
+            ("new@example.com", "add"),
+            ("cached@example.com", "add"),
+        )
+
+        groups = BulkUserService(mock_client).schedule(operations)
+
+        assert [group[0].email for group in groups] == [
+            "cached@example.com",
+            "new@example.com",
+        ]
+
+    def test_resume_skips_completed_rows(self, mock_client, tmp_path):
+        """Test that a second run only sends rows not yet completed."""
+        operations = make_operations(
+            ("a@example.com", "add"),
+            ("bad@example.com", "add"),
+        )
+        path = tmp_path / "run.journal"
+        service = BulkUserService(mock_client)
+        with OperationJournal(path) as journal:
+            service.apply("space", operations, journal=journal)
+        mock_client.calls.clear()
+
+        with OperationJournal(path) as journal:
+            report = service.apply("space", operations, journal=journal)
+
+        assert mock_client.calls == []  # bad@ fails again before recording
+        assert [r.status for r in report.results] == [
+            OperationStatus.SKIPPED,
+            OperationStatus.FAILED,
+        ]
+        assert mock_client.add_user_to_space.call_count == 3
+
+    @pytest.mark.parametrize("suffix", [".csv", ".json"])
+    def test_write_report(self, mock_client, tmp_path, suffix):
+        """Test that reports list every row with summary statistics."""
+        report = BulkUserService(mock_client).apply(
+            "space", make_operations(("a@example.com", "add"))
+        )
+        path = tmp_path / f"report{suffix}"
+
+        BulkUserService.write_report(report, path)
+
+        if suffix == ".csv":
+            with open(path, newline="") as f:
+                rows = list(csv.DictReader(f))
+            assert rows[0]["status"] == "succeeded"
+        else:
+            data = json.loads(path.read_text())
+            assert data["summary"]["succeeded"] == 1
+            assert data["summary"]["operations_per_second"] > 0
+
+    def test_empty_report_throughput(self):
+        """Test that an empty report has zero throughput."""
+        assert BulkUserReport().operations_per_second == 0.0
@@ -0,0 +1,165 @@
+"""
+Unit tests for the multi-space crawler.
+
+Test Metadata:
+- Created: 2026-10-17
+- Last Updated: 2026-10-17
+- Status: Active
+- Owner: Development Team
+- Purpose: Validate fan-out over spaces and maps and the consolidated dataset
+- Lifecycle:
+  - Created: To replace one explore run per space with a single crawl
+  - Active: Currently used to validate SpaceCrawler and MapObjectDataset
+  - Obsolescence Conditions:
+    1. When Gather offers an organization-wide export endpoint
+- Last Validated: 2026-10-17
+"""
+
+import csv
+import gzip
+import json
+import threading
+import time
+
+import pytest
+
+from gather_manager.api.client import GatherClient
+from gather_manager.api.coalesce import RequestCoalescer
+from gather_manager.api.fake_server import FakeGatherData, FakeGatherServer
+from gather_manager.api.rate_limit import RateLimiter
+from gather_manager.models.space import Object
+from gather_manager.services.crawler import MapObjectDataset, SpaceCrawler
+
+
+@pytest.fixture
+def data():
+    """Fixture to provide three synthetic spaces."""
+    return FakeGatherData.generate(
+        spaces=3, maps_per_space=4, objects_per_map=20, portal_ratio=0.2
+    )
+
+
+def make_crawler(server, max_concurrency=4):
+    """Create a crawler whose client sends every request to the server."""
+    client = GatherClient(
+        api_key="test_api_key",
+        transport=server,
+        rate_limiter=RateLimiter.unlimited(),
+        coalescer=RequestCoalescer.disabled(),
+    )
+    return SpaceCrawler(client, max_concurrency=max_concurrency)
+
+
+class TestMapObjectDataset:
+    """Tests for the columnar dataset."""
+
+    def test_from_objects(self):
+        """Test that objects become one row each, column by column."""
+        objects = [
+            Object(id="a", type="chair", x=1, y=2),
+            Object(id="b", type="portal", x=3, y=4, targetMap="m2"),
+        ]
+
+        dataset = MapObjectDataset.from_objects("s", "m1", objects)
+
+        assert len(dataset) == 2
+        assert dataset.columns["map_id"] == ["m1", "m1"]
+        assert dataset.columns["is_portal"] == [False, True]
+        assert list(dataset.rows())[1]["target_map"] == "m2"
+
+    def test_write_formats(self, tmp_path):
+        """Test columnar JSON, gzipped JSON and CSV output."""
+        dataset = MapObjectDataset.from_objects(
+            "s", "m", [Object(id="a", type="chair", x=1, y=2)]
+        )
+
+        dataset.write(tmp_path / "objects.json")
+        dataset.write(tmp_path / "objects.json.gz")
+        dataset.write(tmp_path / "objects.csv")
+
+        document = json.loads((tmp_path / "objects.json").read_text())
+        assert document["rows"] == 1
+        assert document["columns"]["x"] == [1]
+        with gzip.open(tmp_path / "objects.json.gz", "rt") as f:
+            assert json.load(f) == document
+        with open(tmp_path / "objects.csv", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert rows[0]["object_id"] == "a"
+
+
+class TestSpaceCrawler:
+    """Tests for crawling many spaces."""
+
+    def test_crawls_all_accessible_spaces(self, data):
+        """Test that every map of every listed space is read once."""
+        server = FakeGatherServer(data)
+        crawler = make_crawler(server)
+
+        report, dataset = crawler.crawl()
+
+        assert report.spaces == list(data.spaces)
+        assert len(report.maps) == 12
+        assert not report.failed_maps
+        expected = sum(
+            len(map_data["objects"])
+            for space in data.spaces.values()
+            for map_data in space.maps.values()
+        )
+        assert len(dataset) == report.objects == expected
+        map_reads = [
+            path
+            for method, path, _ in server.requests
+            if "/maps/" in path and method == "GET"
+        ]
+        assert len(map_reads) == 12
+        assert crawler.progress.maps_done == crawler.progress.maps_total
+
+    def test_rows_are_in_space_and_map_order(self, data):
+        """Test that the dataset does not depend on completion order."""
+        report, dataset = make_crawler(FakeGatherServer(data)).crawl()
+
+        seen = []
+        for key in zip(dataset.columns["space_id"], dataset.columns["map_id"]):
+            if not seen or seen[-1] != key:
+                seen.append(key)
+        assert seen == [(r.space_id, r.map_id) for r in report.maps]
+
+    def test_selected_spaces_and_failures(self, data):
+        """Test that failing spaces are reported and the rest is crawled."""
+        first = next(iter(data.spaces))
+        crawler = make_crawler(FakeGatherServer(data))
+
+        report, dataset = crawler.crawl(space_ids=[first, "missing"])
+
+        assert list(report.space_errors) == ["missing"]
+        assert {result.space_id for result in report.maps} == {first}
+        assert set(dataset.columns["space_id"]) == {first}
+        assert report.to_dict()["summary"]["spaces_failed"] == 1
+
+    def test_concurrency_is_global(self, data):
+        """Test that one limit bounds requests across all spaces."""
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+
+        def sleep(seconds):
+            with lock:
+                in_flight.append(None)
+                peak.append(len(in_flight))
+            time.sleep(seconds)
+            with lock:
+                in_flight.pop()
+
+        server = FakeGatherServer(data, latency=0.01, sleep=sleep)
+        make_crawler(server, max_concurrency=2).crawl()
+
+        assert max(peak) == 2
+
+    def test_close_shuts_down_created_async_client(self, data):
+        """Test that closing the crawler stops the worker threads it made."""
+        with make_crawler(FakeGatherServer(data)) as crawler:
+            crawler.crawl()
+            executor = crawler.async_client._executor
+
+        assert executor._shutdown
+        assert crawler._async_client is None
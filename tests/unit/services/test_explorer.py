@@ -0,0 +1,113 @@
+"""
+Unit tests for the PortalExplorer service.
+
+Test Metadata:
+- Created: 2026-10-16
+- Last Updated: 2026-10-16
+- Status: Active
+- Owner: Development Team
+- Purpose: Validate PortalExplorer map analysis
+- Lifecycle:
+  - Created: To ensure sync and async space sweeps agree
+  - Active: Currently used to validate explorer analysis output
+  - Obsolescence Conditions:
+    1. When the PortalExplorer is significantly redesigned
+- Last Validated: 2026-10-16
+"""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from gather_manager.models.space import Map, MapData, Object
+from gather_manager.services.explorer import PortalExplorer
+from gather_manager.utils.exceptions import (
+    DeadlineExceededError,
+    GatherApiError,
+)
+
+
+@pytest.fixture
+def mock_client():
+    """Fixture to provide a mock GatherClient with two maps."""
+    client = MagicMock()
+    client.get_maps.return_value = [Map(id="map1"), Map(id="map2")]
+    portals = {
+        "map1": [
+            Object(
+                id="p1",
+                type="portal",
+                x=1,
+                y=2,
+                targetMap="map2",
+                targetX=3,
+                targetY=4,
+            )
+        ],
+        "map2": [],
+    }
+    client.get_portals.side_effect = lambda space_id, map_id: portals[map_id]
+    client.get_map_data.side_effect = lambda space_id, map_id: MapData(
+        id=map_id, objects=portals[map_id]
+    )
+    return client
+
+
+class TestPortalExplorer:
+    """Tests for the PortalExplorer service."""
+
+    def test_analyze_all_maps_async_matches_sync(self, mock_client, tmp_path):
+        """Test that the async sweep returns the same results as the sync one."""
+        explorer = PortalExplorer(client=mock_client, output_dir=str(tmp_path))
+
+        sync_results = explorer.analyze_all_maps("space")
+        async_results = asyncio.run(explorer.analyze_all_maps_async("space"))
+
+        assert async_results == sync_results
+        summary_path = tmp_path.joinpath(
+            f"exploration_{explorer.timestamp}", "portal_summary_space.json"
+        )
+        summary = json.loads(summary_path.read_text())
+        assert summary["total_portals"] == 1
+
+    def test_analyze_all_maps_async_skips_failed_maps(
+        self, mock_client, tmp_path
+    ):
+        """Test that a failing map is skipped rather than aborting the sweep."""
+        mock_client.get_portals.side_effect = GatherApiError("boom")
+        explorer = PortalExplorer(client=mock_client, output_dir=str(tmp_path))
+
+        results = asyncio.run(explorer.analyze_all_maps_async("space"))
+
+        assert results == {"map1": [], "map2": []}
+
+    @pytest.mark.parametrize("use_async", [False, True])
+    def test_deadline_returns_partial_results(
+        self, mock_client, tmp_path, use_async
+    ):
+        """Test that maps cut off by the deadline are left out."""
+
+        def get_portals(space_id, map_id):
+            if map_id == "map2":
+                raise DeadlineExceededError("out of time")
+            return []
+
+        mock_client.get_portals.side_effect = get_portals
+        explorer = PortalExplorer(client=mock_client, output_dir=str(tmp_path))
+
+        if use_async:
+            results = asyncio.run(
+                explorer.analyze_all_maps_async("space", deadline_seconds=60)
+            )
+        else:
+            results = explorer.analyze_all_maps("space", deadline_seconds=60)
+
+        assert results == {"map1": []}
+        summary_path = tmp_path.joinpath(
+            f"exploration_{explorer.timestamp}", "portal_summary_space.json"
+        )
+        summary = json.loads(summary_path.read_text())
+        assert summary["maps_count"] == 2
+        assert summary["maps_analyzed"] == 1
@@ -16,6 +16,7 @@ Test Metadata:
 - Last Validated: 2024-03-21
 """
 
+import asyncio
 import csv
 import json
 from pathlib import Path
@@ -25,6 +26,7 @@ import pytest
 
 from gather_manager.api.client import GatherClient
 from gather_manager.models.portal import Portal
+from gather_manager.models.space import Map, Object
 from gather_manager.services.portal_service import PortalService
 
 
@@ -195,7 +197,8 @@ class TestPortalService:
         self, mock_mkdir, mock_json_dump, mock_file_open, mock_api_client
     ):
         """Test the export_portals method with JSON format."""
-        # Create a PortalService with the mock API client
+        # Create a PortalService with the mock API client; its default
+        # codec writes through json.dump
         service = PortalService(api_client=mock_api_client)
 
         # Call the method
@@ -260,3 +263,48 @@ class TestPortalService:
 
         # Verify the result is the file path
         assert result.endswith(".csv")
+
+    def test_validate_portals_async_matches_sync(self, mock_api_client):
+        """Test that the async validation returns the sync results."""
+        service = PortalService(api_client=mock_api_client)
+
+        result = asyncio.run(service.validate_portals_async())
+
+        assert result == service.validate_portals()
+
+    def test_analyze_connections_async(self, mock_api_client):
+        """Test the analyze_connections_async method."""
+        service = PortalService(api_client=mock_api_client)
+
+        result = asyncio.run(service.analyze_connections_async())
+
+        mock_api_client.get_maps.assert_called_once()
+        assert mock_api_client.get_map_objects.call_count == 2
+        assert len(result) == 2
+
+    def test_space_id_streams_maps(self, mock_api_client):
+        """Test that a service with a space ID streams each map."""
+
+        def iter_map_objects(space_id, map_id):
+            for obj in mock_api_client.get_map_objects(map_id)["objects"]:
+                yield Object.model_validate(obj)
+            yield Object(id="chair", type=1, x=0, y=0)
+
+        streaming_client = MagicMock()
+        streaming_client.get_maps.return_value = [
+            Map(id="map1"),
+            Map(id="map2"),
+        ]
+        streaming_client.iter_map_objects.side_effect = iter_map_objects
+        service = PortalService(
+            api_client=streaming_client, space_id="test-space"
+        )
+
+        result = service.validate_portals()
+
+        streaming_client.get_maps.assert_called_once_with("test-space")
+        streaming_client.get_map_objects.assert_not_called()
+        assert (
+            result
+            == PortalService(api_client=mock_api_client).validate_portals()
+        )